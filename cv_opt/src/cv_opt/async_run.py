@@ -0,0 +1,332 @@
+"""
+Jobfull Resume Analyzer - Async Run Module
+
+This module lets a single asyncio process drive many resume optimizations at
+once, e.g. from a worker pool or a web service. Each run is awaited with
+run_async(), writes to its own output/<run_id>/ directory (see
+cv_opt.checkpoint) and returns an in-memory RunResult, so concurrent runs never
+overwrite each other's files.
+
+Concurrency:
+    Crew execution is blocking, so every run executes in a worker thread via
+    Crew.kickoff_async() (or asyncio.to_thread for the parallel scheduler).
+    An asyncio.Semaphore bounds how many runs execute at the same time; runs
+    beyond the limit wait without occupying a thread. Unless a semaphore is
+    passed explicitly, all runs on an event loop share one semaphore of
+    DEFAULT_ASYNC_CONCURRENCY slots.
+
+    The worker threads come from the event loop's default executor. To run
+    more than ~30 crews at once, give the loop a larger one:
+
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=64))
+
+Example:
+    import asyncio
+    from cv_opt.async_run import run_async, run_many_async
+
+    result = asyncio.run(run_async({"job_url": url, "company_name": "Acme"}))
+    print(result.run_id, result.outputs["analyze_job_task"])
+
+    results = asyncio.run(run_many_async(inputs_list, max_concurrency=16))
+
+    async for event in stream_run({"job_url": url, "company_name": "Acme"}):
+        print(event.type, event.task)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import asyncio
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from crewai.llms.base_llm import BaseLLM
+from pydantic import BaseModel, Field
+
+from .checkpoint import DEFAULT_RUNS_DIR, RunCheckpoints, new_run_id
+from .crew import ResumeCrew
+from .knowledge import CachedPDFKnowledgeSource
+from .profiles import DEFAULT_PROFILE
+from .progress import ProgressCallback, ProgressEvent, ProgressListener
+from .scheduler import DEFAULT_MAX_CONCURRENCY
+from .tracing import RunTrace
+
+# Default number of runs executing at once on one event loop
+DEFAULT_ASYNC_CONCURRENCY = 8
+
+# Shared default semaphore of each running event loop
+_loop_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class RunResult(BaseModel):
+    """
+    In-memory result of one asynchronous run.
+
+    Attributes:
+        run_id (str): Run identifier
+        run_dir (str): Directory holding the run's output files
+        status (str): "succeeded" or "failed"
+        duration (float): Time from start of execution to completion in
+            seconds, excluding time spent waiting for a semaphore slot
+        outputs (Dict[str, str]): Raw output of each completed task by name
+        overall_match (float, optional): Overall match score from job analysis
+        trace (RunTrace, optional): Per-task latency, token and cost metrics
+        error (str, optional): Error message of a failed run; completed tasks
+            are checkpointed, so the run can be resumed
+    """
+
+    run_id: str = Field(description="Run identifier")
+    run_dir: str = Field(description="Directory holding the run's output files")
+    status: str = Field(description="Run status: succeeded or failed")
+    duration: float = Field(description="Execution time (seconds)", default=0.0)
+    outputs: Dict[str, str] = Field(
+        description="Raw output of each completed task", default_factory=dict
+    )
+    overall_match: Optional[float] = Field(
+        description="Overall match score from the job analysis", default=None
+    )
+    trace: Optional[RunTrace] = Field(description="Run trace", default=None)
+    error: Optional[str] = Field(description="Error of a failed run", default=None)
+
+
+def default_semaphore() -> asyncio.Semaphore:
+    """
+    Return the semaphore shared by all runs on the running event loop.
+
+    Returns:
+        asyncio.Semaphore: Semaphore with DEFAULT_ASYNC_CONCURRENCY slots
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _loop_semaphores:
+        _loop_semaphores[loop] = asyncio.Semaphore(DEFAULT_ASYNC_CONCURRENCY)
+    return _loop_semaphores[loop]
+
+
+async def run_async(
+    inputs: Dict[str, Any],
+    run_id: Optional[str] = None,
+    parallel: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    split_research: bool = False,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    runs_dir: str = DEFAULT_RUNS_DIR,
+    llm: Optional[BaseLLM] = None,
+    embedder: Optional[Dict[str, Any]] = None,
+    resume_pdf: Optional[CachedPDFKnowledgeSource] = None,
+    on_event: Optional[ProgressCallback] = None,
+    stream: bool = False,
+    profile: str = DEFAULT_PROFILE,
+    llm_cache: bool = False,
+    routing: Optional[str] = None,
+    model_overrides: Optional[Dict[str, str]] = None,
+) -> RunResult:
+    """
+    Run the resume optimization workflow without blocking the event loop.
+
+    Failures do not raise: the returned result has status "failed" and the
+    error message, and the run can be continued with cv_opt.main.resume().
+
+    Args:
+        inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+        run_id (str, optional): ID of the run; generated if omitted
+        parallel (bool): Use the dependency-aware parallel task scheduler
+        max_concurrency (int): Tasks running at once within the run when
+            `parallel` is set
+        split_research (bool): Use split company research
+        semaphore (asyncio.Semaphore, optional): Bounds the runs executing at
+            once; defaults to the event loop's shared semaphore
+        runs_dir (str): Root directory of the per-run output directories
+        llm (BaseLLM, optional): LLM override passed to the ResumeCrew
+        embedder (Dict[str, Any], optional): Embedder of the resume index
+        resume_pdf (CachedPDFKnowledgeSource, optional): Already parsed
+            resume to optimize instead of the default resume PDF
+        on_event (ProgressCallback, optional): Receives task progress events
+            (from worker threads) and a final run_finished/run_failed event
+        stream (bool): Stream LLM responses so that on_event also receives
+            token deltas (ignored when `llm` is given)
+        profile (str): Output profile of the run (see cv_opt.profiles)
+        llm_cache (bool): Serve repeated LLM requests from the LLM response
+            cache (see cv_opt.llm_cache)
+        routing (str, optional): Model routing policy (see cv_opt.routing)
+        model_overrides (Dict[str, str], optional): Model by agent or task
+            name, overriding the routing policy
+
+    Returns:
+        RunResult: Outputs, match score and trace of the run
+
+    Raises:
+        ValueError: If job_url or company_name is missing
+    """
+    missing = [key for key in ("job_url", "company_name") if not inputs.get(key)]
+    if missing:
+        raise ValueError(f"Missing required input parameters: {missing}")
+
+    checkpoints = RunCheckpoints.create(
+        run_id or new_run_id(),
+        inputs,
+        options={
+            "split_research": split_research,
+            "parallel": parallel,
+            "max_concurrency": max_concurrency,
+            "profile": profile,
+            "llm_cache": llm_cache,
+            "routing": routing,
+            "model_overrides": model_overrides or {},
+        },
+        runs_dir=runs_dir,
+    )
+    result = RunResult(
+        run_id=checkpoints.run_id,
+        run_dir=str(checkpoints.run_dir),
+        status="failed",
+    )
+
+    callback = on_event or (lambda event: None)
+    progress = ProgressListener([], callback, run_id=checkpoints.run_id)
+    crew_instance: Optional[ResumeCrew] = None
+    async with semaphore or default_semaphore():
+        start = time.perf_counter()
+        try:
+            crew_instance = await asyncio.to_thread(
+                ResumeCrew,
+                split_research=split_research,
+                output_dir=str(checkpoints.run_dir),
+                llm=llm,
+                embedder=embedder,
+                resume_pdf=resume_pdf,
+                stream=stream,
+                profile=profile,
+                llm_cache=llm_cache,
+                routing=routing,
+                model_overrides=model_overrides,
+            )
+            tracer = crew_instance.tracer()
+            progress = ProgressListener(
+                crew_instance.workflow_tasks(), callback, run_id=checkpoints.run_id
+            )
+            with tracer, crew_instance.checkpointer(checkpoints), progress:
+                if parallel:
+                    await asyncio.to_thread(
+                        crew_instance.kickoff_parallel,
+                        inputs,
+                        max_concurrency=max_concurrency,
+                    )
+                else:
+                    await crew_instance.crew().kickoff_async(inputs=inputs)
+            result.status = "succeeded"
+        except Exception as e:
+            result.error = str(e)
+        result.duration = time.perf_counter() - start
+
+    if crew_instance is not None:
+        result.trace = tracer.trace
+        result.outputs = {
+            task.name: task.output.raw
+            for task in crew_instance.workflow_tasks()
+            if task.output is not None
+        }
+        job_analysis = crew_instance.analyze_job_task().output
+        match_score = getattr(
+            getattr(job_analysis, "pydantic", None), "match_score", None
+        )
+        result.overall_match = getattr(match_score, "overall_match", None)
+    if result.status == "succeeded":
+        progress.emit(
+            "run_finished",
+            duration=result.duration,
+            run_dir=result.run_dir,
+            overall_match=result.overall_match,
+        )
+    else:
+        progress.emit("run_failed", error=result.error)
+    return result
+
+
+async def run_many_async(
+    inputs_list: Sequence[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    **run_options: Any,
+) -> List[RunResult]:
+    """
+    Run the workflow for many inputs concurrently.
+
+    Args:
+        inputs_list (Sequence[Dict[str, Any]]): Kickoff inputs of each run
+        max_concurrency (int): Maximum number of runs executing at once
+        **run_options: Further keyword arguments for run_async(), except
+            `run_id` and `semaphore`
+
+    Returns:
+        List[RunResult]: Results in the order of `inputs_list`
+
+    Raises:
+        ValueError: If max_concurrency is not positive
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    return list(
+        await asyncio.gather(
+            *(
+                run_async(inputs, semaphore=semaphore, **run_options)
+                for inputs in inputs_list
+            )
+        )
+    )
+
+
+async def stream_run(
+    inputs: Dict[str, Any], **run_options: Any
+) -> AsyncIterator[ProgressEvent]:
+    """
+    Run the workflow and yield its progress events as they happen.
+
+    Yields task_started, token, tool_call, tool_result, field, field_error,
+    task_finished and task_result events (see cv_opt.progress), so a caller
+    can show e.g. the validated JobRequirements fields while the job analysis
+    is still being generated and the remaining tasks run. The last
+    event is run_finished or run_failed. LLM streaming is enabled unless
+    `stream=False` is passed.
+
+    Args:
+        inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+        **run_options: Further keyword arguments for run_async(), except
+            `on_event`
+
+    Yields:
+        ProgressEvent: Events of the run in the order they occurred
+
+    Raises:
+        ValueError: If job_url or company_name is missing
+
+    Example:
+        async for event in stream_run(inputs):
+            if event.type == "task_result" and event.data["model"] == "JobRequirements":
+                show_job_analysis(event.data["output"])
+    """
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    run_options.setdefault("stream", True)
+    run = asyncio.create_task(
+        run_async(
+            inputs,
+            on_event=lambda event: loop.call_soon_threadsafe(events.put_nowait, event),
+            **run_options,
+        )
+    )
+    # Wakes the loop below if run_async raises before its final event
+    run.add_done_callback(lambda task: events.put_nowait(None))
+    try:
+        while True:
+            event = await events.get()
+            if event is None:
+                run.result()
+                break
+            yield event
+            if event.type in ("run_finished", "run_failed"):
+                break
+    finally:
+        if not run.done():
+            run.cancel()
+        await asyncio.gather(run, return_exceptions=True)
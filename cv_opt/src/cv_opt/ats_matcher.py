@@ -0,0 +1,491 @@
+"""
+Jobfull Resume Analyzer - Deterministic ATS Keyword Matcher Module
+
+This module scores a resume against the ATS keywords of a job posting without
+any LLM calls. Given `JobRequirements.ats_keywords` and the extracted resume
+text, it counts exact, stemmed and synonym matches for every keyword, derives
+keyword densities and computes the weighted candidate score described in
+analyze_job_task:
+
+    Technical Skills 35% · Soft Skills 20% · Experience 25%
+    Education 10% · Industry Knowledge 10%
+
+The job analyzer still extracts the keywords and narrates strengths and gaps,
+but every number in `JobMatchScore` and `ATSOptimization.keyword_density` is
+computed here, so results are reproducible and can be benchmarked.
+
+Matching Rules:
+    - Exact: the keyword's token sequence appears verbatim (case-insensitive)
+    - Stemmed: the sequence matches after light suffix stripping
+      ("deploying models" ↔ "deployed model")
+    - Synonym: a known alternative form matches ("k8s" ↔ "kubernetes")
+
+Scoring:
+    Each keyword weighs importance × 1.5 when required (× 1.0 when preferred)
+    and earns credit for its best match type (exact 1.0, stemmed 0.9,
+    synonym 0.75). A dimension's score is its weighted credit share; a
+    dimension without keywords takes the overall keyword coverage.
+
+Example:
+    from cv_opt.ats_matcher import match_keywords
+
+    result = match_keywords(job_requirements.ats_keywords, resume_text)
+    print(result.match_score.overall_match, result.keyword_density)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .models import ATSKeyword, JobMatchScore, SkillScore
+
+# Weights of the scoring dimensions (see analyze_job_task STEP 3)
+SCORING_WEIGHTS: Dict[str, float] = {
+    "technical_skills": 0.35,
+    "soft_skills": 0.20,
+    "experience": 0.25,
+    "education": 0.10,
+    "industry": 0.10,
+}
+
+# Keyword categories mapped to scoring dimensions; unknown categories count
+# as technical skills
+CATEGORY_DIMENSIONS: Dict[str, str] = {
+    "technical": "technical_skills",
+    "tools": "technical_skills",
+    "soft": "soft_skills",
+    "experience": "experience",
+    "education": "education",
+    "certification": "education",
+    "certifications": "education",
+    "industry": "industry",
+    "domain": "industry",
+}
+
+# Credit earned by the best match type of a keyword
+MATCH_CREDIT: Dict[str, float] = {"exact": 1.0, "stemmed": 0.9, "synonym": 0.75}
+
+# Weight multiplier of required keywords
+REQUIRED_WEIGHT = 1.5
+
+# Groups of interchangeable terms; every member is a synonym of the others.
+# Two-letter aliases that are common words or abbreviations of something else
+# in resumes ("MS Office", "5 PM", "my CV", "DL" licenses) are left out.
+DEFAULT_SYNONYM_GROUPS: Tuple[Tuple[str, ...], ...] = (
+    ("machine learning", "ml"),
+    ("artificial intelligence", "ai"),
+    ("natural language processing", "nlp"),
+    ("large language models", "llms", "llm"),
+    ("kubernetes", "k8s"),
+    ("javascript", "js"),
+    ("postgresql", "postgres"),
+    ("amazon web services", "aws"),
+    ("google cloud platform", "gcp", "google cloud"),
+    ("microsoft azure", "azure"),
+    ("continuous integration", "ci/cd"),
+    ("user experience", "ux"),
+    ("user interface", "ui"),
+    ("project management", "project manager"),
+    ("bachelor", "bachelor's", "bsc", "b.sc", "b.s"),
+    ("master", "master's", "msc", "m.sc", "m.s"),
+    ("phd", "ph.d", "doctorate"),
+    ("communication", "communicating", "presentation"),
+    ("leadership", "led", "mentoring"),
+    ("collaboration", "teamwork", "cross-functional"),
+)
+
+# Suffixes stripped by the stemmer, longest first
+_SUFFIXES = (
+    "ational",
+    "ations",
+    "ation",
+    "ments",
+    "ment",
+    "ings",
+    "ing",
+    "ities",
+    "ity",
+    "ers",
+    "er",
+    "ed",
+    "es",
+    "s",
+)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./'-]*")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase tokens, keeping terms like "c++", "node.js".
+
+    Args:
+        text (str): Resume text or keyword phrase
+
+    Returns:
+        List[str]: Tokens in order of appearance
+    """
+    return [
+        token.rstrip(".'-/")
+        for token in _TOKEN_PATTERN.findall(text.lower())
+        if token.rstrip(".'-/")
+    ]
+
+
+def stem(token: str) -> str:
+    """
+    Strip one common English suffix from a token.
+
+    Short tokens (acronyms such as "aws" or "sql") and tokens with symbols
+    are returned unchanged.
+
+    Args:
+        token (str): Lowercase token
+
+    Returns:
+        str: Stemmed token
+    """
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[: -len(suffix)]
+    return token
+
+
+def _ngram_counts(tokens: Sequence[str], max_n: int) -> Counter:
+    """Count all token n-grams of length 1..max_n."""
+    counts: Counter = Counter()
+    for n in range(1, max_n + 1):
+        counts.update(tuple(tokens[i : i + n]) for i in range(len(tokens) - n + 1))
+    return counts
+
+
+def build_synonym_index(
+    groups: Iterable[Sequence[str]] = DEFAULT_SYNONYM_GROUPS,
+) -> Dict[Tuple[str, ...], List[Tuple[str, ...]]]:
+    """
+    Map each term's token tuple to the token tuples of its synonyms.
+
+    Args:
+        groups (Iterable[Sequence[str]]): Groups of interchangeable terms
+
+    Returns:
+        Dict[Tuple[str, ...], List[Tuple[str, ...]]]: Synonym lookup table
+    """
+    index: Dict[Tuple[str, ...], List[Tuple[str, ...]]] = {}
+    for group in groups:
+        terms = [tuple(tokenize(term)) for term in group]
+        for term in terms:
+            index.setdefault(term, []).extend(
+                other for other in terms if other != term
+            )
+    return index
+
+
+_DEFAULT_SYNONYMS = build_synonym_index()
+
+
+def count_term_matches(
+    term: Tuple[str, ...],
+    alternatives: Sequence[Tuple[str, ...]],
+    exact_counts: Counter,
+    stemmed_counts: Counter,
+) -> Tuple[int, int, int]:
+    """
+    Count exact, additional stemmed and synonym occurrences of a term.
+
+    Args:
+        term (Tuple[str, ...]): Tokens of the keyword
+        alternatives (Sequence[Tuple[str, ...]]): Tokens of its synonyms
+        exact_counts (Counter): N-gram counts of the resume tokens
+        stemmed_counts (Counter): N-gram counts of the stemmed resume tokens
+
+    Returns:
+        Tuple[int, int, int]: (exact, stemmed, synonym) occurrence counts
+    """
+    if not term:
+        return 0, 0, 0
+    stemmed_term = tuple(stem(token) for token in term)
+    exact = exact_counts[term]
+    stemmed = stemmed_counts[stemmed_term] - exact
+    synonym = sum(
+        stemmed_counts[alternative]
+        for alternative in synonym_terms(stemmed_term, alternatives)
+    )
+    return exact, stemmed, synonym
+
+
+def _contains(longer: Tuple[str, ...], shorter: Tuple[str, ...]) -> bool:
+    """Whether `shorter` occurs as a contiguous part of `longer`."""
+    n = len(shorter)
+    return any(longer[i : i + n] == shorter for i in range(len(longer) - n + 1))
+
+
+def synonym_terms(
+    stemmed_term: Tuple[str, ...], alternatives: Sequence[Tuple[str, ...]]
+) -> List[Tuple[str, ...]]:
+    """
+    Return the stemmed synonyms of a term whose occurrences are counted.
+
+    Alternatives that stem to the term or to each other ("llms", "llm") are
+    counted once, and alternatives containing the term or another counted
+    alternative ("google cloud platform" next to "google cloud") are
+    skipped, so a single mention never counts twice.
+
+    Args:
+        stemmed_term (Tuple[str, ...]): Stemmed tokens of the keyword
+        alternatives (Sequence[Tuple[str, ...]]): Tokens of its synonyms
+
+    Returns:
+        List[Tuple[str, ...]]: Distinct stemmed synonyms, shortest first
+    """
+    stemmed = {tuple(stem(token) for token in terms) for terms in alternatives}
+    stemmed.discard(stemmed_term)
+    counted: List[Tuple[str, ...]] = []
+    for alternative in sorted(stemmed, key=lambda terms: (len(terms), terms)):
+        if not any(
+            _contains(alternative, shorter) for shorter in (stemmed_term, *counted)
+        ):
+            counted.append(alternative)
+    return counted
+
+
+def keyword_dimension(category: str) -> str:
+    """Return the scoring dimension of a keyword category."""
+    return CATEGORY_DIMENSIONS.get(category.strip().lower(), "technical_skills")
+
+
+def keyword_weight(importance: int, required: bool) -> float:
+    """Return the scoring weight of a keyword."""
+    return importance * (REQUIRED_WEIGHT if required else 1.0)
+
+
+def match_credit(exact: int, stemmed: int, synonym: int) -> float:
+    """Return the credit of the best match type found for a keyword."""
+    if exact:
+        return MATCH_CREDIT["exact"]
+    if stemmed:
+        return MATCH_CREDIT["stemmed"]
+    if synonym:
+        return MATCH_CREDIT["synonym"]
+    return 0.0
+
+
+def resume_ngram_counts(tokens: Sequence[str], max_n: int) -> Tuple[Counter, Counter]:
+    """
+    Count the exact and stemmed n-grams of resume tokens.
+
+    Args:
+        tokens (Sequence[str]): Output of tokenize() for the resume text
+        max_n (int): Longest keyword or synonym length in tokens
+
+    Returns:
+        Tuple[Counter, Counter]: Exact and stemmed n-gram counts
+    """
+    return (
+        _ngram_counts(tokens, max_n),
+        _ngram_counts([stem(token) for token in tokens], max_n),
+    )
+
+
+# ========================================
+# MATCH RESULT MODELS
+# ========================================
+
+
+class KeywordMatch(BaseModel):
+    """
+    Match counts of one ATS keyword in the resume.
+
+    Attributes:
+        keyword (str): Keyword or phrase from the job analysis
+        category (str): Keyword category from the job analysis
+        dimension (str): Scoring dimension the keyword contributes to
+        importance (int): Importance level (1-5)
+        required (bool): Whether the keyword is required
+        exact (int): Verbatim occurrences
+        stemmed (int): Additional occurrences after stemming
+        synonym (int): Occurrences of synonyms
+        density (float): Occurrences per 100 resume words
+        credit (float): Credit of the best match type (0 when missing)
+    """
+
+    keyword: str = Field(description="Keyword or phrase from the job analysis")
+    category: str = Field(description="Keyword category from the job analysis")
+    dimension: str = Field(description="Scoring dimension of the keyword")
+    importance: int = Field(description="Importance level (1-5)")
+    required: bool = Field(description="Whether the keyword is required")
+    exact: int = Field(description="Verbatim occurrences", default=0)
+    stemmed: int = Field(description="Additional occurrences after stemming", default=0)
+    synonym: int = Field(description="Occurrences of synonyms", default=0)
+    density: float = Field(description="Occurrences per 100 resume words", default=0.0)
+    credit: float = Field(description="Credit of the best match type", default=0.0)
+
+    @property
+    def occurrences(self) -> int:
+        """Total occurrences of the keyword in any form."""
+        return self.exact + self.stemmed + self.synonym
+
+
+class ATSMatchResult(BaseModel):
+    """
+    Deterministic ATS scoring of a resume against one job's keywords.
+
+    Attributes:
+        word_count (int): Number of words in the resume
+        matches (List[KeywordMatch]): Per-keyword match counts in input order
+        keyword_density (Dict[str, float]): Keyword → density percentage
+        match_score (JobMatchScore): Dimension and overall scores
+    """
+
+    word_count: int = Field(description="Number of words in the resume")
+    matches: List[KeywordMatch] = Field(
+        description="Per-keyword match counts", default_factory=list
+    )
+    keyword_density: Dict[str, float] = Field(
+        description="Keyword density percentages", default_factory=dict
+    )
+    match_score: JobMatchScore = Field(description="Dimension and overall scores")
+
+
+# ========================================
+# MATCHING AND SCORING
+# ========================================
+
+
+def match_keywords(
+    keywords: Sequence[ATSKeyword],
+    resume_text: str,
+    synonyms: Optional[Dict[Tuple[str, ...], List[Tuple[str, ...]]]] = None,
+) -> ATSMatchResult:
+    """
+    Score a resume against ATS keywords.
+
+    Args:
+        keywords (Sequence[ATSKeyword]): Keywords from JobRequirements
+        resume_text (str): Extracted resume text
+        synonyms (Dict, optional): Synonym index from build_synonym_index();
+            defaults to DEFAULT_SYNONYM_GROUPS
+
+    Returns:
+        ATSMatchResult: Match counts, densities and JobMatchScore
+    """
+    synonyms = _DEFAULT_SYNONYMS if synonyms is None else synonyms
+    tokens = tokenize(resume_text)
+    word_count = len(tokens)
+
+    keyword_tokens = [tuple(tokenize(k.keyword)) for k in keywords]
+    synonym_tokens = [synonyms.get(t, []) for t in keyword_tokens]
+    all_terms = keyword_tokens + [term for group in synonym_tokens for term in group]
+    max_n = max((len(term) for term in all_terms), default=1)
+    exact_counts, stemmed_counts = resume_ngram_counts(tokens, max_n)
+
+    matches: List[KeywordMatch] = []
+    for keyword, term, alternatives in zip(keywords, keyword_tokens, synonym_tokens):
+        exact, stemmed, synonym = count_term_matches(
+            term, alternatives, exact_counts, stemmed_counts
+        )
+        credit = match_credit(exact, stemmed, synonym)
+        occurrences = exact + stemmed + synonym
+        matches.append(
+            KeywordMatch(
+                keyword=keyword.keyword,
+                category=keyword.category,
+                dimension=keyword_dimension(keyword.category),
+                importance=keyword.importance,
+                required=keyword.required,
+                exact=exact,
+                stemmed=stemmed,
+                synonym=synonym,
+                density=(
+                    round(100.0 * occurrences / word_count, 3) if word_count else 0.0
+                ),
+                credit=credit,
+            )
+        )
+
+    return ATSMatchResult(
+        word_count=word_count,
+        matches=matches,
+        keyword_density={m.keyword: m.density for m in matches},
+        match_score=score_matches(matches),
+    )
+
+
+def score_matches(matches: Sequence[KeywordMatch]) -> JobMatchScore:
+    """
+    Compute the weighted JobMatchScore of keyword matches.
+
+    Args:
+        matches (Sequence[KeywordMatch]): Output of match_keywords()
+
+    Returns:
+        JobMatchScore: Dimension scores, overall match, skill details,
+            strengths and ATS gaps
+    """
+    dimensions = list(SCORING_WEIGHTS)
+    weights = np.array(
+        [keyword_weight(m.importance, m.required) for m in matches], dtype=float
+    )
+    credits = np.array([m.credit for m in matches], dtype=float)
+    dimension_index = np.array(
+        [dimensions.index(m.dimension) for m in matches], dtype=int
+    )
+
+    total_weight = weights.sum()
+    coverage = 100.0 * (weights * credits).sum() / total_weight if total_weight else 0.0
+
+    earned = np.bincount(
+        dimension_index, weights=weights * credits, minlength=len(dimensions)
+    )
+    possible = np.bincount(dimension_index, weights=weights, minlength=len(dimensions))
+    scores = np.where(
+        possible > 0, 100.0 * earned / np.where(possible > 0, possible, 1), coverage
+    )
+    sub_scores = {name: round(float(s), 1) for name, s in zip(dimensions, scores)}
+    overall = sum(SCORING_WEIGHTS[name] * sub_scores[name] for name in dimensions)
+
+    ranked = sorted(matches, key=lambda m: (-m.importance, not m.required))
+    return JobMatchScore(
+        overall_match=round(overall, 1),
+        technical_skills_match=sub_scores["technical_skills"],
+        soft_skills_match=sub_scores["soft_skills"],
+        experience_match=sub_scores["experience"],
+        education_match=sub_scores["education"],
+        industry_match=sub_scores["industry"],
+        ats_compatibility=round(coverage, 1),
+        skill_details=[
+            SkillScore(
+                skill_name=m.keyword,
+                required=m.required,
+                match_level=m.credit,
+                ats_keyword_match=m.exact > 0,
+            )
+            for m in matches
+            if m.dimension == "technical_skills"
+        ],
+        strengths=[
+            f"'{m.keyword}' appears {m.occurrences}x ({m.density:.2f}% density)"
+            for m in ranked
+            if m.credit and m.importance >= 4
+        ],
+        gaps=[
+            f"Missing required keyword '{m.keyword}'"
+            for m in ranked
+            if m.required and not m.credit
+        ],
+        ats_gaps=[
+            f"Use the exact term '{m.keyword}'"
+            + (" (only a synonym was found)" if m.synonym else "")
+            for m in ranked
+            if not m.exact and not m.stemmed
+        ],
+        scoring_factors=dict(SCORING_WEIGHTS),
+    )
@@ -0,0 +1,442 @@
+"""
+Jobfull Resume Analyzer - Batch Processing Module
+
+This module optimizes one resume against many job postings in a single
+process. Instead of calling `cv_opt.main.run` once per posting (which builds a
+new ResumeCrew and parses the resume PDF every time), a batch run:
+
+    1. Parses the resume PDF once and shares it, and its resume index, with
+       every crew
+    2. Runs the job-independent resume format analysis once and injects it
+       into each job's optimize_resume_task context
+    3. Runs jobs concurrently, bounded by a job concurrency limit and an LLM
+       requests-per-minute limit shared by all crews of the batch
+    4. Writes every job to its own output directory plus a summary index
+
+Input Formats:
+    - CSV with a header row: job_url, company_name and an optional job_id
+    - JSONL with one object per line using the same keys
+
+Output Layout:
+    output/batch/
+        index.json                    # BatchSummary for the whole run
+        resume_format_analysis.json   # Shared resume format analysis
+        <job_id>/job_analysis.json    # Standard per-job output files
+        <job_id>/run_trace.json       # Per-job latency, token and cost trace
+        ...
+
+Example:
+    from cv_opt.batch import run_batch
+
+    summary = run_batch("jobs.csv", max_concurrency=4, requests_per_minute=60)
+    print(f"{summary.succeeded}/{summary.total} jobs completed")
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import csv
+import json
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
+
+from crewai import Task
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.events import LLMCallStartedEvent, crewai_event_bus
+from pydantic import BaseModel, Field
+
+from .crew import ResumeCrew
+from .profiles import DEFAULT_PROFILE
+from .scheduler import DEFAULT_MAX_CONCURRENCY, execute_single_task
+
+# Default root directory for batch outputs (relative to the working directory)
+DEFAULT_BATCH_OUTPUT_DIR = "output/batch"
+
+# Default number of jobs processed at the same time
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+# ========================================
+# BATCH DATA MODELS
+# ========================================
+
+
+class BatchJob(BaseModel):
+    """
+    A single job posting to optimize the resume against.
+
+    Attributes:
+        job_id (str): Identifier used for the job's output directory
+        job_url (str): URL of the job posting
+        company_name (str): Name of the hiring company
+    """
+
+    job_id: str = Field(description="Identifier used for the job's output directory")
+    job_url: str = Field(description="URL of the job posting")
+    company_name: str = Field(description="Name of the hiring company")
+
+
+class BatchJobResult(BaseModel):
+    """
+    Outcome of one job in a batch run.
+
+    Attributes:
+        job_id (str): Identifier of the job
+        job_url (str): URL of the job posting
+        company_name (str): Name of the hiring company
+        status (str): "succeeded" or "failed"
+        output_dir (str): Directory holding the job's output files
+        duration (float): Job processing time in seconds
+        overall_match (float, optional): Overall match score from job analysis
+        error (str, optional): Error message for failed jobs
+    """
+
+    job_id: str = Field(description="Identifier of the job")
+    job_url: str = Field(description="URL of the job posting")
+    company_name: str = Field(description="Name of the hiring company")
+    status: str = Field(description="Job status: succeeded or failed")
+    output_dir: str = Field(description="Directory holding the job's output files")
+    duration: float = Field(description="Job processing time (seconds)")
+    overall_match: Optional[float] = Field(
+        description="Overall match score from the job analysis", default=None
+    )
+    error: Optional[str] = Field(
+        description="Error message for failed jobs", default=None
+    )
+
+
+class BatchSummary(BaseModel):
+    """
+    Summary index of a batch run, written to <output_dir>/index.json.
+
+    Attributes:
+        jobs_file (str): Path of the CSV/JSONL input file
+        started_at (str): ISO timestamp of the batch start
+        wall_time (float): Total batch time in seconds
+        total (int): Number of jobs in the batch
+        succeeded (int): Number of jobs completed successfully
+        failed (int): Number of failed jobs
+        resume_format_analysis (str, optional): Path of the shared analysis
+        results (List[BatchJobResult]): Per-job results in input order
+        embedding_stats (Dict[str, int]): Chunk and query embeddings computed
+            by the shared resume index during the batch
+    """
+
+    jobs_file: str = Field(description="Path of the CSV/JSONL input file")
+    started_at: str = Field(description="ISO timestamp of the batch start")
+    wall_time: float = Field(description="Total batch time (seconds)", default=0.0)
+    total: int = Field(description="Number of jobs in the batch", default=0)
+    succeeded: int = Field(description="Number of successful jobs", default=0)
+    failed: int = Field(description="Number of failed jobs", default=0)
+    resume_format_analysis: Optional[str] = Field(
+        description="Path of the shared resume format analysis", default=None
+    )
+    results: List[BatchJobResult] = Field(
+        description="Per-job results in input order", default_factory=list
+    )
+    embedding_stats: Dict[str, int] = Field(
+        description="Embeddings computed by the shared resume index",
+        default_factory=dict,
+    )
+
+
+# ========================================
+# JOB FILE LOADING
+# ========================================
+
+
+def _slugify(value: str) -> str:
+    """Convert a string into a safe directory name."""
+    return re.sub(r"[^A-Za-z0-9_-]+", "-", value).strip("-").lower()
+
+
+def load_jobs(jobs_path: str) -> List[BatchJob]:
+    """
+    Load batch jobs from a CSV or JSONL file.
+
+    Files ending in .jsonl or .json are read as one JSON object per line; all
+    other files are read as CSV with a header row. Jobs without a job_id get
+    one derived from their position and company name.
+
+    Args:
+        jobs_path (str): Path of the jobs file
+
+    Returns:
+        List[BatchJob]: Jobs in file order
+
+    Raises:
+        FileNotFoundError: If the jobs file does not exist
+        ValueError: If a row is missing job_url/company_name or job IDs repeat
+    """
+    path = Path(jobs_path)
+    with path.open("r", encoding="utf-8") as file:
+        if path.suffix.lower() in (".jsonl", ".json"):
+            rows = [json.loads(line) for line in file if line.strip()]
+        else:
+            rows = list(csv.DictReader(file))
+
+    jobs: List[BatchJob] = []
+    for index, row in enumerate(rows, start=1):
+        missing = [key for key in ("job_url", "company_name") if not row.get(key)]
+        if missing:
+            raise ValueError(f"Job {index} in {jobs_path} is missing {missing}")
+
+        job_id = _slugify(str(row.get("job_id") or ""))
+        if not job_id:
+            job_id = f"{index:03d}-{_slugify(row['company_name'])}"
+        jobs.append(
+            BatchJob(
+                job_id=job_id,
+                job_url=row["job_url"].strip(),
+                company_name=row["company_name"].strip(),
+            )
+        )
+
+    job_ids = [job.job_id for job in jobs]
+    duplicates = sorted({job_id for job_id in job_ids if job_ids.count(job_id) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate job_id values in {jobs_path}: {duplicates}")
+
+    return jobs
+
+
+# ========================================
+# GLOBAL RATE LIMITING
+# ========================================
+
+
+class RateLimiter:
+    """
+    Thread-safe sliding-window limiter for LLM requests per minute.
+
+    A single limiter is shared by every crew in a batch. It is applied to the
+    LLM calls of the batch's tasks through CrewAI's LLMCallStartedEvent,
+    which is emitted in the calling thread right before the request is sent.
+    Concurrent batches each have their own limiter.
+
+    Attributes:
+        requests_per_minute (int): Maximum number of requests in any 60s window
+        task_ids (Set[str]): IDs of the tasks whose LLM calls are limited
+    """
+
+    def __init__(self, requests_per_minute: int) -> None:
+        if requests_per_minute < 1:
+            raise ValueError("requests_per_minute must be at least 1")
+        self.requests_per_minute = requests_per_minute
+        self.task_ids: Set[str] = set()
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def track(self, tasks: Iterable[Task]) -> None:
+        """
+        Limit the LLM calls of the given tasks.
+
+        Args:
+            tasks (Iterable[Task]): Tasks of a crew in the batch
+        """
+        with self._lock:
+            self.task_ids.update(str(task.id) for task in tasks)
+
+    def acquire(self) -> None:
+        """Block until a request slot is available, then claim it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= 60.0:
+                    self._calls.popleft()
+                if len(self._calls) < self.requests_per_minute:
+                    self._calls.append(now)
+                    return
+                wait_time = 60.0 - (now - self._calls[0])
+            time.sleep(wait_time)
+
+
+# Limiters of the rate-limited batches currently running
+_active_limiters: List[RateLimiter] = []
+_limiter_handler_registered = False
+_limiter_registration_lock = threading.Lock()
+
+
+def _throttle_llm_call(source: Any, event: LLMCallStartedEvent) -> None:
+    """Event handler applying the rate limit of the calling task's batch."""
+    # Calls answered from the LLM response cache send no provider request
+    if getattr(event, "from_cache", False):
+        return
+    task_id = str(event.task_id or "")
+    for limiter in list(_active_limiters):
+        if task_id in limiter.task_ids:
+            limiter.acquire()
+            return
+
+
+def _register_rate_limit_handler() -> None:
+    """Register the LLM throttling handler on the CrewAI event bus once."""
+    global _limiter_handler_registered
+    with _limiter_registration_lock:
+        if not _limiter_handler_registered:
+            crewai_event_bus.register_handler(LLMCallStartedEvent, _throttle_llm_call)
+            _limiter_handler_registered = True
+
+
+# ========================================
+# BATCH EXECUTION
+# ========================================
+
+
+def run_batch(
+    jobs_path: str,
+    output_dir: str = DEFAULT_BATCH_OUTPUT_DIR,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    requests_per_minute: Optional[int] = None,
+    parallel: bool = False,
+    task_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    split_research: bool = False,
+    llm: Optional[BaseLLM] = None,
+    embedder: Optional[Dict[str, Any]] = None,
+    profile: str = DEFAULT_PROFILE,
+    llm_cache: bool = False,
+    routing: Optional[str] = None,
+    model_overrides: Optional[Dict[str, str]] = None,
+    llms: Optional[Dict[str, BaseLLM]] = None,
+) -> BatchSummary:
+    """
+    Optimize the resume against every job in a CSV/JSONL file.
+
+    Args:
+        jobs_path (str): CSV/JSONL file with job_url, company_name and an
+            optional job_id per job
+        output_dir (str): Root directory for batch outputs, relative to the
+            working directory. Each job writes to <output_dir>/<job_id>/.
+        max_concurrency (int): Maximum number of jobs processed at once
+        requests_per_minute (int, optional): Global LLM request limit shared
+            by all jobs. No limit when None.
+        parallel (bool): Run each job's tasks with the parallel scheduler
+        task_concurrency (int): Task concurrency per job when `parallel` is set
+        split_research (bool): Use split company research for every job
+        llm (BaseLLM, optional): LLM override passed to every ResumeCrew
+        embedder (Dict[str, Any], optional): Embedder configuration of the
+            shared resume index
+        profile (str): Output profile of every job (see cv_opt.profiles)
+        llm_cache (bool): Serve repeated LLM requests of every job from the
+            LLM response cache (see cv_opt.llm_cache)
+        routing (str, optional): Model routing policy of every job (see
+            cv_opt.routing)
+        model_overrides (Dict[str, str], optional): Model by agent or task
+            name, overriding the routing policy
+        llms (Dict[str, BaseLLM], optional): LLM instances replacing named
+            models of the routing table
+
+    Returns:
+        BatchSummary: Per-job results, also written to <output_dir>/index.json
+
+    Raises:
+        ValueError: If the jobs file is invalid or limits are not positive
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    jobs = load_jobs(jobs_path)
+    summary = BatchSummary(
+        jobs_file=jobs_path,
+        started_at=datetime.now().isoformat(timespec="seconds"),
+        total=len(jobs),
+    )
+    batch_start = time.perf_counter()
+
+    limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+    if limiter is not None:
+        _register_rate_limit_handler()
+        _active_limiters.append(limiter)
+
+    try:
+        # Parse the resume PDF once; every crew shares the parsed source and
+        # its read-only resume index
+        format_crew = ResumeCrew(
+            output_dir=output_dir,
+            llm=llm,
+            embedder=embedder,
+            profile=profile,
+            llm_cache=llm_cache,
+            routing=routing,
+            model_overrides=model_overrides,
+            llms=llms,
+        )
+        resume_pdf = format_crew.resume_pdf
+
+        print(f"📄 Analyzing resume format once for {len(jobs)} jobs...")
+        format_task = format_crew.analyze_resume_format_task()
+        if limiter is not None:
+            limiter.track([format_task])
+        execute_single_task(format_task, inputs={})
+        summary.resume_format_analysis = format_task.output_file
+
+        def process(job: BatchJob) -> BatchJobResult:
+            job_dir = f"{output_dir}/{job.job_id}"
+            inputs = {"job_url": job.job_url, "company_name": job.company_name}
+            job_start = time.perf_counter()
+            try:
+                crew_instance = ResumeCrew(
+                    split_research=split_research,
+                    output_dir=job_dir,
+                    resume_pdf=resume_pdf,
+                    resume_format_task=format_task,
+                    llm=llm,
+                    embedder=embedder,
+                    profile=profile,
+                    llm_cache=llm_cache,
+                    routing=routing,
+                    model_overrides=model_overrides,
+                    llms=llms,
+                )
+                if limiter is not None:
+                    limiter.track(crew_instance.workflow_tasks())
+                with crew_instance.tracer():
+                    if parallel:
+                        crew_instance.kickoff_parallel(
+                            inputs, max_concurrency=task_concurrency
+                        )
+                    else:
+                        crew_instance.crew().kickoff(inputs=inputs)
+
+                job_analysis = crew_instance.analyze_job_task().output
+                match_score = getattr(job_analysis.pydantic, "match_score", None)
+                print(f"✅ {job.job_id} completed")
+                return BatchJobResult(
+                    **job.model_dump(),
+                    status="succeeded",
+                    output_dir=job_dir,
+                    duration=time.perf_counter() - job_start,
+                    overall_match=getattr(match_score, "overall_match", None),
+                )
+            except Exception as e:
+                print(f"❌ {job.job_id} failed: {str(e)}")
+                return BatchJobResult(
+                    **job.model_dump(),
+                    status="failed",
+                    output_dir=job_dir,
+                    duration=time.perf_counter() - job_start,
+                    error=str(e),
+                )
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            summary.results = list(executor.map(process, jobs))
+    finally:
+        if limiter is not None:
+            _active_limiters.remove(limiter)
+
+    summary.wall_time = time.perf_counter() - batch_start
+    summary.embedding_stats = format_crew.embedding_stats()
+    summary.succeeded = sum(r.status == "succeeded" for r in summary.results)
+    summary.failed = summary.total - summary.succeeded
+
+    index_path = Path(output_dir) / "index.json"
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index_path.write_text(summary.model_dump_json(indent=2), encoding="utf-8")
+
+    return summary
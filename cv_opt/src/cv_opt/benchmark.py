@@ -0,0 +1,921 @@
+"""
+Jobfull Resume Analyzer - Offline Benchmark Module
+
+This module measures the performance of the ResumeCrew pipeline without any
+OpenAI or Serper calls, so regressions in orchestration overhead, startup
+time and memory can be caught offline, e.g. in CI.
+
+Offline Components:
+    - StubLLM: A deterministic LLM that answers every task with a canned,
+      schema-valid response (generated from the task's output_pydantic model
+      or taken from the markdown fixtures) after a configurable latency. Agents
+      with tools first issue the same tool calls a real model would.
+    - HashEmbeddingFunction: A local embedding function for the resume index
+    - Recorded fixtures (fixtures/benchmark.json): a job posting page and
+      Serper search results, seeded into the scrape and search caches so the
+      real cached tools serve them without network I/O
+
+Measurements:
+    - import_time: Interpreter start plus `import cv_opt.crew` (subprocess)
+    - startup_time / warm_startup_time: Building a ResumeCrew with cold and
+      warm knowledge caches (resume parsing and indexing)
+    - Per batch size (1/10/100 jobs by default): end-to-end wall time, mean
+      and p95 job latency, orchestration overhead per job (job latency minus
+      time spent inside the LLM, taken from each job's run trace) and the
+      process memory high-water mark
+    - Per output profile (optional, e.g. full/standard/fast): latency and
+      prompt/completion tokens of one job, and the reduction against the
+      first profile. Set a per-token latency so that shorter answers also
+      finish sooner, like with a real model.
+    - Per model routing policy (optional, e.g. strong/mini/hybrid): latency,
+      LLM calls, escalations and estimated cost of one job. Every LLM model
+      of the routing table is replaced by a stub reporting that model's name,
+      so costs use its pricing; pure-Python extractors run for real on the
+      recorded job posting.
+
+Example:
+    from cv_opt.benchmark import run_benchmark
+
+    report = run_benchmark(sizes=(1, 10), latency=0.05)
+    print(report.summary())
+
+    # Command line; exits with status 1 on regressions against a baseline
+    cv_opt benchmark --sizes 1 10 100 --baseline benchmark_baseline.json
+
+    # Token and latency reduction of the output profiles
+    cv_opt benchmark --sizes 1 --profiles full standard fast --token-latency 0.005
+
+    # Latency and cost of the model routing policies
+    cv_opt benchmark --sizes 1 --routing-policies strong mini hybrid
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from chromadb import Documents, EmbeddingFunction, Embeddings
+from crewai import Task
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMStreamChunkEvent,
+    crewai_event_bus,
+)
+from crewai.utilities.events.llm_events import LLMCallType
+from pydantic import BaseModel, Field
+
+from .batch import BatchJob, BatchJobResult, run_batch
+from .cache import CACHE_DIR_ENV, atomic_write_text
+from .crew import ResumeCrew
+from .routing import load_routing_table
+from .tools import CachedScrapeWebsiteTool, CachedSerperDevTool, get_scrape_cache
+from .tools.serper_cache import classify_query
+from .tracing import CHARS_PER_TOKEN, DEFAULT_TRACE_NAME, RunTrace
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Recorded scrape/search fixtures and canned markdown deliverables
+DEFAULT_FIXTURES_PATH = Path(__file__).parent / "fixtures" / "benchmark.json"
+
+# Batch sizes benchmarked by default
+DEFAULT_BENCHMARK_SIZES = (1, 10, 100)
+
+# Root directory for benchmark outputs (relative to the working directory)
+DEFAULT_BENCHMARK_OUTPUT_DIR = "output/benchmark"
+
+# Relative increase of a metric tolerated before it counts as a regression
+DEFAULT_REGRESSION_TOLERANCE = 0.25
+
+# Companies the benchmark jobs are spread across
+BENCHMARK_COMPANIES = ("NVIDIA", "Acme Robotics", "Globex")
+
+# Latency of the stubbed models relative to the configured stub latency in
+# routing runs; GPT-4o answers at roughly half the speed of GPT-4o-mini
+STUB_MODEL_LATENCY_FACTORS = {"gpt-4o": 2.0}
+
+
+# ========================================
+# FIXTURES
+# ========================================
+
+
+class SearchFixture(BaseModel):
+    """
+    A recorded Serper search.
+
+    Attributes:
+        query (str): Query template; "{company_name}" is replaced per company
+        results (Dict[str, Any]): Serper results for the query
+    """
+
+    query: str = Field(description="Query template with {company_name}")
+    results: Dict[str, Any] = Field(description="Recorded Serper results")
+
+
+class BenchmarkFixtures(BaseModel):
+    """
+    Recorded tool responses and canned deliverables for offline runs.
+
+    Attributes:
+        job_page (str): Cleaned text of a job posting page
+        search (List[SearchFixture]): Searches issued by the research agent
+        markdown (Dict[str, str]): Task name → markdown answer for tasks
+            without an output_pydantic model
+    """
+
+    job_page: str = Field(description="Cleaned text of a job posting page")
+    search: List[SearchFixture] = Field(
+        description="Recorded research searches", default_factory=list
+    )
+    markdown: Dict[str, str] = Field(
+        description="Markdown answers by task name", default_factory=dict
+    )
+
+
+def load_fixtures(path: Optional[str] = None) -> BenchmarkFixtures:
+    """Load benchmark fixtures, by default the ones shipped with cv_opt."""
+    fixtures_path = Path(path) if path else DEFAULT_FIXTURES_PATH
+    return BenchmarkFixtures.model_validate_json(
+        fixtures_path.read_text(encoding="utf-8")
+    )
+
+
+def _for_company(value: Any, company: str) -> Any:
+    """Substitute the company name into a JSON-serializable fixture."""
+    return json.loads(json.dumps(value).replace("{company_name}", company))
+
+
+def seed_tool_caches(fixtures: BenchmarkFixtures, jobs: Sequence[BatchJob]) -> None:
+    """
+    Store the recorded fixtures in the scrape and search caches.
+
+    Every job URL serves the recorded job page, and every company gets the
+    recorded searches, so the cached tools never reach the network.
+
+    Args:
+        fixtures (BenchmarkFixtures): Recorded tool responses
+        jobs (Sequence[BatchJob]): Jobs whose URLs and companies are seeded
+    """
+    scrape_cache = get_scrape_cache()
+    for job in jobs:
+        scrape_cache.put(job.job_url, fixtures.job_page)
+
+    search_tool = CachedSerperDevTool()
+    for company in {job.company_name for job in jobs}:
+        for fixture in fixtures.search:
+            query = _for_company(fixture.query, company)
+            search_tool.cache.store(
+                company.strip().lower(),
+                search_tool.query_key(query, search_tool.search_type),
+                query,
+                classify_query(query, search_tool.search_type),
+                _for_company(fixture.results, company),
+            )
+
+
+# ========================================
+# STUB LLM AND EMBEDDINGS
+# ========================================
+
+
+def schema_example(
+    schema: Dict[str, Any],
+    definitions: Optional[Dict[str, Any]] = None,
+    list_items: int = 2,
+) -> Any:
+    """
+    Build a value that validates against a pydantic JSON schema.
+
+    Numbers take the midpoint of their bounds, strings their title, lists get
+    `list_items` entries and optional values use their first non-null option.
+
+    Args:
+        schema (Dict[str, Any]): JSON schema, e.g. Model.model_json_schema()
+        definitions (Dict[str, Any], optional): Shared `$defs` of the schema
+        list_items (int): Number of entries generated for every list
+
+    Returns:
+        Any: JSON-serializable example value
+    """
+    definitions = schema.get("$defs", {}) if definitions is None else definitions
+    if "$ref" in schema:
+        schema = definitions[schema["$ref"].split("/")[-1]]
+    if "anyOf" in schema:
+        options = [option for option in schema["anyOf"] if option.get("type") != "null"]
+        return schema_example(options[0], definitions, list_items) if options else None
+    if "enum" in schema:
+        return schema["enum"][0]
+
+    schema_type = schema.get("type", "object")
+    if schema_type == "object":
+        return {
+            name: schema_example(field, definitions, list_items)
+            for name, field in schema.get("properties", {}).items()
+        }
+    if schema_type == "array":
+        return [
+            schema_example(schema.get("items", {}), definitions, list_items)
+            for _ in range(list_items)
+        ]
+    if schema_type in ("integer", "number"):
+        low = schema.get("minimum", schema.get("exclusiveMinimum", 0))
+        high = schema.get("maximum", schema.get("exclusiveMaximum", low + 1))
+        middle = (low + high) / 2
+        return int(round(middle)) if schema_type == "integer" else middle
+    if schema_type == "boolean":
+        return True
+    return schema.get("title", "benchmark")
+
+
+class HashEmbeddingFunction(EmbeddingFunction):
+    """
+    Deterministic local embeddings derived from a hash of the text.
+
+    Attributes:
+        dimensions (int): Length of the embedding vectors
+    """
+
+    def __init__(self, dimensions: int = 64) -> None:
+        self.dimensions = dimensions
+
+    def __call__(self, input: Documents) -> Embeddings:
+        vectors = []
+        for document in input:
+            seed = int.from_bytes(hashlib.sha256(document.encode()).digest()[:8], "big")
+            vector = np.random.default_rng(seed).standard_normal(self.dimensions)
+            vectors.append((vector / np.linalg.norm(vector)).astype(np.float32))
+        return vectors
+
+    def __repr__(self) -> str:
+        return f"HashEmbeddingFunction(dimensions={self.dimensions})"
+
+
+def stub_embedder(dimensions: int = 64) -> Dict[str, Any]:
+    """Return a CrewAI embedder configuration using HashEmbeddingFunction."""
+    return {
+        "provider": "custom",
+        "config": {"embedder": HashEmbeddingFunction(dimensions)},
+    }
+
+
+class StubLLM(BaseLLM):
+    """
+    Deterministic offline LLM returning canned, schema-valid task answers.
+
+    The first calls of an agent with a scrape or search tool return ReAct
+    tool actions (the job URL of the task, then every recorded search query)
+    so that the tool path of the pipeline is exercised. Afterwards every call
+    returns a Final Answer: a generated JSON document for tasks with an
+    output_pydantic model, otherwise the task's markdown fixture. LLM call
+    events are emitted like for real LLMs, so rate limiting and run tracing
+    behave the same. With `stream=True` every response is also emitted as
+    word-sized LLMStreamChunkEvents, like a streaming provider.
+
+    Attributes:
+        latency (float): Seconds each call sleeps to simulate the provider
+        token_latency (float): Additional seconds per generated token
+            (estimated from the response length), i.e. the decoding time
+        fixtures (BenchmarkFixtures): Search queries and markdown answers
+        list_items (int): Entries generated for every list in JSON answers
+        calls (int): Number of calls served
+        llm_time (float): Total seconds spent inside call()
+        stream (bool): Emit stream chunk events for every response
+        model (str): Model name reported to traces, e.g. "gpt-4o-mini" so
+            that costs are estimated with that model's pricing
+
+    Example:
+        llm = StubLLM(latency=0.05)
+        crew = ResumeCrew(llm=llm, embedder=stub_embedder())
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        fixtures: Optional[BenchmarkFixtures] = None,
+        list_items: int = 2,
+        stream: bool = False,
+        token_latency: float = 0.0,
+        model: str = "stub",
+    ) -> None:
+        super().__init__(model=model)
+        self.latency = latency
+        self.token_latency = token_latency
+        self.stream = stream
+        self.fixtures = fixtures or load_fixtures()
+        self.list_items = list_items
+        self.calls = 0
+        self.llm_time = 0.0
+        self._answers: Dict[type, str] = {}
+        self._lock = threading.Lock()
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        crewai_event_bus.emit(
+            self,
+            LLMCallStartedEvent(
+                messages=messages, from_task=from_task, from_agent=from_agent
+            ),
+        )
+        started = time.perf_counter()
+        response = self._tool_action(messages, from_task) or (
+            "Thought: I now know the final answer\n"
+            f"Final Answer: {self.final_answer(from_task)}"
+        )
+        delay = self.latency + self.token_latency * len(response) / CHARS_PER_TOKEN
+        if delay:
+            time.sleep(delay)
+        if self.stream:
+            for chunk in re.findall(r"\S+\s*", response):
+                crewai_event_bus.emit(
+                    self,
+                    LLMStreamChunkEvent(
+                        chunk=chunk, from_task=from_task, from_agent=from_agent
+                    ),
+                )
+        with self._lock:
+            self.calls += 1
+            self.llm_time += time.perf_counter() - started
+        crewai_event_bus.emit(
+            self,
+            LLMCallCompletedEvent(
+                response=response,
+                call_type=LLMCallType.LLM_CALL,
+                from_task=from_task,
+                from_agent=from_agent,
+            ),
+        )
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 128000
+
+    def final_answer(self, task: Optional[Task]) -> str:
+        """Return the canned final answer for a task."""
+        if task is None:
+            return "{}"
+        model = task.output_pydantic or task.output_json
+        if model is None:
+            return self.fixtures.markdown.get(task.name, f"# {task.name}\n")
+        with self._lock:
+            if model not in self._answers:
+                example = schema_example(
+                    model.model_json_schema(), list_items=self.list_items
+                )
+                answer = model.model_validate(example).model_dump()
+                self._answers[model] = json.dumps(answer)
+            return self._answers[model]
+
+    def _tool_action(self, messages: Any, task: Optional[Task]) -> Optional[str]:
+        """Return the next ReAct tool action for a task, if any is left."""
+        if task is None or task.agent is None or not task.agent.tools:
+            return None
+        tool = task.agent.tools[0]
+        if isinstance(tool, CachedScrapeWebsiteTool):
+            urls = re.findall(r"https?://[^\s\"'<>]+", task.description)
+            arguments = [{"website_url": urls[0].rstrip(".,)")}] if urls else []
+        elif isinstance(tool, CachedSerperDevTool):
+            arguments = [
+                {"search_query": _for_company(fixture.query, tool.company_name or "")}
+                for fixture in self.fixtures.search
+            ]
+        else:
+            arguments = []
+
+        history = [] if isinstance(messages, str) else messages
+        actions_taken = sum(message.get("role") == "assistant" for message in history)
+        if actions_taken >= len(arguments):
+            return None
+        return (
+            "Thought: I need to gather more information\n"
+            f"Action: {tool.name}\n"
+            f"Action Input: {json.dumps(arguments[actions_taken])}"
+        )
+
+
+# ========================================
+# BENCHMARK REPORTING
+# ========================================
+
+
+class BenchmarkRun(BaseModel):
+    """
+    Measurements of one benchmarked batch size.
+
+    Attributes:
+        jobs (int): Number of jobs in the batch
+        failed (int): Number of failed jobs
+        wall_time (float): End-to-end batch time in seconds
+        mean_latency (float): Mean job latency in seconds
+        p95_latency (float): 95th percentile job latency in seconds
+        orchestration_overhead (float): Mean seconds per job spent outside
+            the LLM (prompt building, parsing, tools, knowledge, file I/O)
+        llm_calls (int): LLM calls served by the stub
+        peak_memory_mb (float, optional): Process memory high-water mark
+    """
+
+    jobs: int = Field(description="Number of jobs in the batch")
+    failed: int = Field(description="Number of failed jobs", default=0)
+    wall_time: float = Field(description="End-to-end batch time (seconds)")
+    mean_latency: float = Field(description="Mean job latency (seconds)")
+    p95_latency: float = Field(description="95th percentile job latency (seconds)")
+    orchestration_overhead: float = Field(
+        description="Mean non-LLM seconds per job"
+    )
+    llm_calls: int = Field(description="LLM calls served by the stub")
+    peak_memory_mb: Optional[float] = Field(
+        description="Process memory high-water mark (MB)", default=None
+    )
+
+
+class ProfileRun(BaseModel):
+    """
+    Measurements of one job run with an output profile.
+
+    Attributes:
+        profile (str): Output profile name
+        succeeded (bool): Whether the job succeeded
+        latency (float): Job latency in seconds
+        llm_time (float): Seconds spent inside the LLM
+        prompt_tokens (int): Prompt tokens of the job
+        completion_tokens (int): Completion tokens of the job
+        token_reduction (float): Relative reduction of all tokens against the
+            first benchmarked profile
+        completion_token_reduction (float): Relative reduction of completion
+            tokens against the first benchmarked profile
+        latency_reduction (float): Relative latency reduction against the
+            first benchmarked profile
+    """
+
+    profile: str = Field(description="Output profile name")
+    succeeded: bool = Field(description="Whether the job succeeded")
+    latency: float = Field(description="Job latency (seconds)")
+    llm_time: float = Field(description="Seconds spent inside the LLM")
+    prompt_tokens: int = Field(description="Prompt tokens of the job")
+    completion_tokens: int = Field(description="Completion tokens of the job")
+    token_reduction: float = Field(
+        description="Token reduction vs. the first profile", default=0.0
+    )
+    completion_token_reduction: float = Field(
+        description="Completion token reduction vs. the first profile", default=0.0
+    )
+    latency_reduction: float = Field(
+        description="Latency reduction vs. the first profile", default=0.0
+    )
+
+
+class RoutingRun(BaseModel):
+    """
+    Measurements of one job run with a model routing policy.
+
+    Attributes:
+        policy (str): Routing policy name
+        succeeded (bool): Whether the job succeeded
+        latency (float): Job latency in seconds
+        llm_calls (int): LLM calls of the job, including extractor calls
+        escalated_calls (int): Calls answered by an escalation model
+        prompt_tokens (int): Prompt tokens of the job
+        completion_tokens (int): Completion tokens of the job
+        cost_usd (float): Estimated cost of the job in USD
+        models (Dict[str, str]): Model routed to each task
+        latency_reduction (float): Relative latency reduction against the
+            first benchmarked policy
+        cost_reduction (float): Relative cost reduction against the first
+            benchmarked policy
+    """
+
+    policy: str = Field(description="Routing policy name")
+    succeeded: bool = Field(description="Whether the job succeeded")
+    latency: float = Field(description="Job latency (seconds)")
+    llm_calls: int = Field(description="LLM calls of the job")
+    escalated_calls: int = Field(
+        description="Calls answered by an escalation model", default=0
+    )
+    prompt_tokens: int = Field(description="Prompt tokens of the job")
+    completion_tokens: int = Field(description="Completion tokens of the job")
+    cost_usd: float = Field(description="Estimated cost (USD)")
+    models: Dict[str, str] = Field(
+        description="Model routed to each task", default_factory=dict
+    )
+    latency_reduction: float = Field(
+        description="Latency reduction vs. the first policy", default=0.0
+    )
+    cost_reduction: float = Field(
+        description="Cost reduction vs. the first policy", default=0.0
+    )
+
+
+def _change(reduction: float) -> str:
+    """Format a relative reduction as a signed percentage change."""
+    return f"{-reduction * 100 + 0:+.0f}%"
+
+
+class BenchmarkReport(BaseModel):
+    """
+    Result of an offline benchmark.
+
+    Attributes:
+        latency (float): Simulated LLM latency per call in seconds
+        token_latency (float): Simulated LLM latency per generated token
+        max_concurrency (int): Job concurrency of the batches
+        parallel (bool): Whether jobs used the parallel task scheduler
+        import_time (float): Interpreter start plus importing cv_opt.crew
+        startup_time (float): ResumeCrew construction with cold caches
+        warm_startup_time (float): ResumeCrew construction with warm caches
+        runs (List[BenchmarkRun]): One entry per batch size
+        profiles (List[ProfileRun]): One entry per benchmarked output profile
+        routing (List[RoutingRun]): One entry per benchmarked routing policy
+    """
+
+    latency: float = Field(description="Simulated LLM latency per call (seconds)")
+    token_latency: float = Field(
+        description="Simulated LLM latency per generated token (seconds)",
+        default=0.0,
+    )
+    max_concurrency: int = Field(description="Job concurrency of the batches")
+    parallel: bool = Field(description="Parallel task scheduling per job")
+    import_time: float = Field(description="Interpreter start and imports (s)")
+    startup_time: float = Field(description="Crew construction, cold caches (s)")
+    warm_startup_time: float = Field(description="Crew construction, warm (s)")
+    runs: List[BenchmarkRun] = Field(
+        description="One entry per batch size", default_factory=list
+    )
+    profiles: List[ProfileRun] = Field(
+        description="One entry per output profile", default_factory=list
+    )
+    routing: List[RoutingRun] = Field(
+        description="One entry per routing policy", default_factory=list
+    )
+
+    def summary(self) -> str:
+        """Return a human readable multi-line summary."""
+        lines = [
+            f"import {self.import_time:.2f}s, startup {self.startup_time:.2f}s "
+            f"cold / {self.warm_startup_time:.2f}s warm, "
+            f"LLM latency {self.latency:.3f}s/call"
+        ]
+        for run in self.runs:
+            memory = f"{run.peak_memory_mb:.0f}MB" if run.peak_memory_mb else "n/a"
+            lines.append(
+                f"{run.jobs:>4} jobs: wall {run.wall_time:.2f}s, "
+                f"latency mean {run.mean_latency:.2f}s / p95 {run.p95_latency:.2f}s, "
+                f"overhead {run.orchestration_overhead:.3f}s/job, "
+                f"{run.llm_calls} LLM calls, peak memory {memory}"
+            )
+        for run in self.profiles:
+            lines.append(
+                f"profile {run.profile:>8}: latency {run.latency:.2f}s "
+                f"({_change(run.latency_reduction)}), "
+                f"{run.prompt_tokens} prompt / {run.completion_tokens} completion "
+                f"tokens ({_change(run.token_reduction)} total, "
+                f"{_change(run.completion_token_reduction)} completion)"
+            )
+        for run in self.routing:
+            lines.append(
+                f"routing {run.policy:>8}: latency {run.latency:.2f}s "
+                f"({_change(run.latency_reduction)}), {run.llm_calls} LLM calls "
+                f"({run.escalated_calls} escalated), cost ${run.cost_usd:.4f} "
+                f"({_change(run.cost_reduction)})"
+            )
+        return "\n".join(lines)
+
+    def regressions(
+        self,
+        baseline: "BenchmarkReport",
+        tolerance: float = DEFAULT_REGRESSION_TOLERANCE,
+    ) -> List[str]:
+        """
+        Compare against a baseline report.
+
+        Args:
+            baseline (BenchmarkReport): Earlier report to compare against
+            tolerance (float): Allowed relative increase of each metric
+
+        Returns:
+            List[str]: Description of every metric that regressed
+        """
+        found = []
+
+        def check(name: str, current: Optional[float], previous: Optional[float]):
+            if current is None or not previous:
+                return
+            if current > previous * (1 + tolerance):
+                found.append(
+                    f"{name}: {current:.3f} vs baseline {previous:.3f} "
+                    f"(+{(current / previous - 1) * 100:.0f}%)"
+                )
+
+        check("import_time", self.import_time, baseline.import_time)
+        check("startup_time", self.startup_time, baseline.startup_time)
+        previous_runs = {run.jobs: run for run in baseline.runs}
+        for run in self.runs:
+            previous = previous_runs.get(run.jobs)
+            if previous is None:
+                continue
+            prefix = f"{run.jobs} jobs"
+            check(f"{prefix} wall_time", run.wall_time, previous.wall_time)
+            check(
+                f"{prefix} orchestration_overhead",
+                run.orchestration_overhead,
+                previous.orchestration_overhead,
+            )
+            check(
+                f"{prefix} peak_memory_mb", run.peak_memory_mb, previous.peak_memory_mb
+            )
+        return found
+
+
+# ========================================
+# BENCHMARK EXECUTION
+# ========================================
+
+
+def peak_memory_mb() -> Optional[float]:
+    """Return the process memory high-water mark in MB, if measurable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure_import_time() -> float:
+    """Time a fresh interpreter importing cv_opt.crew."""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", "import cv_opt.crew"],
+        check=True,
+        capture_output=True,
+    )
+    return time.perf_counter() - started
+
+
+def benchmark_jobs(count: int) -> List[BatchJob]:
+    """Return `count` synthetic jobs spread across BENCHMARK_COMPANIES."""
+    return [
+        BatchJob(
+            job_id=f"job-{index:04d}",
+            job_url=f"https://jobs.example.com/benchmark/{index}",
+            company_name=BENCHMARK_COMPANIES[index % len(BENCHMARK_COMPANIES)],
+        )
+        for index in range(count)
+    ]
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    return float(np.percentile(values, percentile)) if values else 0.0
+
+
+def _reduction(value: float, reference: float) -> float:
+    return 1 - value / reference if reference else 0.0
+
+
+def _job_trace(result: BatchJobResult) -> Optional[RunTrace]:
+    """Return the run trace of a succeeded batch job, if it was written."""
+    trace_path = Path(result.output_dir) / f"{DEFAULT_TRACE_NAME}.json"
+    if result.status != "succeeded" or not trace_path.exists():
+        return None
+    return RunTrace.model_validate_json(trace_path.read_text("utf-8"))
+
+
+def _write_jobs_file(run_dir: str, jobs: Sequence[BatchJob]) -> Path:
+    """Write the jobs of a benchmark batch to <run_dir>/jobs.jsonl."""
+    jobs_path = Path(run_dir) / "jobs.jsonl"
+    atomic_write_text(
+        jobs_path, "".join(job.model_dump_json() + "\n" for job in jobs)
+    )
+    return jobs_path
+
+
+def run_benchmark(
+    sizes: Sequence[int] = DEFAULT_BENCHMARK_SIZES,
+    latency: float = 0.0,
+    max_concurrency: int = 4,
+    parallel: bool = False,
+    output_dir: str = DEFAULT_BENCHMARK_OUTPUT_DIR,
+    fixtures_path: Optional[str] = None,
+    profiles: Sequence[str] = (),
+    token_latency: float = 0.0,
+    routing_policies: Sequence[str] = (),
+) -> BenchmarkReport:
+    """
+    Benchmark the pipeline offline for several batch sizes.
+
+    All caches live in <output_dir>/cache, which is emptied first, so the
+    first crew starts with cold caches and results are independent of the
+    developer's own cache.
+
+    Args:
+        sizes (Sequence[int]): Batch sizes to run, in order
+        latency (float): Simulated LLM latency per call in seconds
+        max_concurrency (int): Jobs processed at once in each batch
+        parallel (bool): Use the parallel task scheduler inside each job
+        output_dir (str): Root directory for benchmark outputs, relative to
+            the working directory; report.json is written here
+        fixtures_path (str, optional): Alternative fixtures file
+        profiles (Sequence[str]): Output profiles to compare on one job each,
+            e.g. ("full", "standard", "fast"); reductions are reported
+            against the first one
+        token_latency (float): Simulated LLM latency per generated token
+        routing_policies (Sequence[str]): Model routing policies to compare
+            on one job each, e.g. ("strong", "mini", "hybrid"); reductions
+            are reported against the first one
+
+    Returns:
+        BenchmarkReport: Startup, latency, overhead, memory, profile and
+            routing measurements
+    """
+    os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+    os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+    benchmark_cache_dir = Path(output_dir) / "cache"
+    shutil.rmtree(benchmark_cache_dir, ignore_errors=True)
+    previous_cache_dir = os.environ.get(CACHE_DIR_ENV)
+    os.environ[CACHE_DIR_ENV] = str(benchmark_cache_dir)
+
+    try:
+        fixtures = load_fixtures(fixtures_path)
+        llm = StubLLM(
+            latency=latency, fixtures=fixtures, token_latency=token_latency
+        )
+        embedder = stub_embedder()
+
+        import_time = measure_import_time()
+        started = time.perf_counter()
+        ResumeCrew(llm=llm, embedder=embedder).crew()
+        startup_time = time.perf_counter() - started
+        started = time.perf_counter()
+        ResumeCrew(llm=llm, embedder=embedder).crew()
+        warm_startup_time = time.perf_counter() - started
+
+        report = BenchmarkReport(
+            latency=latency,
+            token_latency=token_latency,
+            max_concurrency=max_concurrency,
+            parallel=parallel,
+            import_time=import_time,
+            startup_time=startup_time,
+            warm_startup_time=warm_startup_time,
+        )
+
+        for size in sizes:
+            print(f"⏱️ Benchmarking {size} job(s)...")
+            jobs = benchmark_jobs(size)
+            seed_tool_caches(fixtures, jobs)
+            run_dir = f"{output_dir}/{size}-jobs"
+            jobs_path = _write_jobs_file(run_dir, jobs)
+
+            calls_before = llm.calls
+            summary = run_batch(
+                str(jobs_path),
+                output_dir=run_dir,
+                max_concurrency=max_concurrency,
+                parallel=parallel,
+                llm=llm,
+                embedder=embedder,
+            )
+
+            latencies = [result.duration for result in summary.results]
+            overheads = []
+            for result in summary.results:
+                trace = _job_trace(result)
+                if trace is None:
+                    continue
+                llm_time = sum(task.llm_time for task in trace.tasks)
+                overheads.append(result.duration - llm_time)
+
+            report.runs.append(
+                BenchmarkRun(
+                    jobs=size,
+                    failed=summary.failed,
+                    wall_time=summary.wall_time,
+                    mean_latency=float(np.mean(latencies)) if latencies else 0.0,
+                    p95_latency=_percentile(latencies, 95),
+                    orchestration_overhead=(
+                        float(np.mean(overheads)) if overheads else 0.0
+                    ),
+                    llm_calls=llm.calls - calls_before,
+                    peak_memory_mb=peak_memory_mb(),
+                )
+            )
+
+        for profile in profiles:
+            print(f"⏱️ Benchmarking the {profile} output profile...")
+            jobs = benchmark_jobs(1)
+            seed_tool_caches(fixtures, jobs)
+            run_dir = f"{output_dir}/profile-{profile}"
+            summary = run_batch(
+                str(_write_jobs_file(run_dir, jobs)),
+                output_dir=run_dir,
+                max_concurrency=1,
+                parallel=parallel,
+                llm=llm,
+                embedder=embedder,
+                profile=profile,
+            )
+            result = summary.results[0]
+            trace = _job_trace(result) or RunTrace(started_at="")
+            report.profiles.append(
+                ProfileRun(
+                    profile=profile,
+                    succeeded=result.status == "succeeded",
+                    latency=result.duration,
+                    llm_time=sum(task.llm_time for task in trace.tasks),
+                    prompt_tokens=trace.prompt_tokens,
+                    completion_tokens=trace.completion_tokens,
+                )
+            )
+        if report.profiles:
+            reference = report.profiles[0]
+            for run in report.profiles:
+                run.token_reduction = _reduction(
+                    run.prompt_tokens + run.completion_tokens,
+                    reference.prompt_tokens + reference.completion_tokens,
+                )
+                run.completion_token_reduction = _reduction(
+                    run.completion_tokens, reference.completion_tokens
+                )
+                run.latency_reduction = _reduction(run.latency, reference.latency)
+
+        table = load_routing_table()
+        # Stub every LLM model of the routing table under its own name
+        stubs = {
+            name: StubLLM(
+                latency=latency * STUB_MODEL_LATENCY_FACTORS.get(endpoint.model, 1.0),
+                fixtures=fixtures,
+                token_latency=(
+                    token_latency * STUB_MODEL_LATENCY_FACTORS.get(endpoint.model, 1.0)
+                ),
+                model=endpoint.model,
+            )
+            for name, endpoint in table.models.items()
+            if endpoint.model is not None
+        }
+        for policy in routing_policies:
+            print(f"⏱️ Benchmarking the {policy} routing policy...")
+            jobs = benchmark_jobs(1)
+            seed_tool_caches(fixtures, jobs)
+            run_dir = f"{output_dir}/routing-{policy}"
+            summary = run_batch(
+                str(_write_jobs_file(run_dir, jobs)),
+                output_dir=run_dir,
+                max_concurrency=1,
+                parallel=parallel,
+                embedder=embedder,
+                routing=policy,
+                llms=stubs,
+            )
+            result = summary.results[0]
+            trace = _job_trace(result) or RunTrace(started_at="")
+            report.routing.append(
+                RoutingRun(
+                    policy=policy,
+                    succeeded=result.status == "succeeded",
+                    latency=result.duration,
+                    llm_calls=trace.llm_calls,
+                    escalated_calls=trace.escalated_calls,
+                    prompt_tokens=trace.prompt_tokens,
+                    completion_tokens=trace.completion_tokens,
+                    cost_usd=trace.cost_usd,
+                    models={task.task: task.model for task in trace.tasks},
+                )
+            )
+        if report.routing:
+            reference = report.routing[0]
+            for run in report.routing:
+                run.latency_reduction = _reduction(run.latency, reference.latency)
+                run.cost_reduction = _reduction(run.cost_usd, reference.cost_usd)
+    finally:
+        if previous_cache_dir is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = previous_cache_dir
+
+    atomic_write_text(
+        Path(output_dir) / "report.json", report.model_dump_json(indent=2)
+    )
+    return report
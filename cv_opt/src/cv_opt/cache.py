@@ -0,0 +1,122 @@
+"""
+Jobfull Resume Analyzer - Cache Utilities Module
+
+This module holds the small helpers shared by the on-disk caches of the
+workflow (web scraping, search results, knowledge and task outputs): the cache
+root directory, stable content hashing and atomic file writes.
+
+Cache Location:
+    All caches live below a single root directory, `.cache/` relative to the
+    working directory by default (next to `output/` and `knowledge/`). Set the
+    CV_OPT_CACHE_DIR environment variable to move it, e.g. to a shared volume
+    so that teammates reuse each other's cached fetches.
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+# Environment variable overriding the cache root directory
+CACHE_DIR_ENV = "CV_OPT_CACHE_DIR"
+
+# Default cache root, relative to the working directory
+DEFAULT_CACHE_DIR = ".cache"
+
+
+def cache_dir(namespace: str) -> Path:
+    """
+    Return (and create) the cache directory for one cache namespace.
+
+    Args:
+        namespace (str): Cache name, e.g. "scrape" or "knowledge"
+
+    Returns:
+        Path: Directory reserved for the namespace
+    """
+    path = Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)) / namespace
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def sha256_text(text: str) -> str:
+    """Return the hex SHA-256 digest of a UTF-8 string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def stable_hash(value: Any) -> str:
+    """
+    Return a SHA-256 digest of a JSON-serializable value.
+
+    Keys are sorted so that logically equal dictionaries hash identically.
+
+    Args:
+        value (Any): JSON-serializable value
+
+    Returns:
+        str: Hex digest of the canonical JSON representation
+    """
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return sha256_text(canonical)
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """Return the hex SHA-256 digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def atomic_write_text(path: Union[str, Path], text: str) -> None:
+    """
+    Write a text file atomically.
+
+    The content is written to a temporary file in the same directory and then
+    renamed over the target, so readers never observe a partially written
+    file, even if the process dies mid-write. The data is flushed to disk
+    before the rename, so a completed write survives a crash.
+
+    Args:
+        path (Union[str, Path]): Destination file
+        text (str): Content to write
+    """
+    _atomic_write(path, text)
+
+
+def atomic_write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write a binary file atomically, like atomic_write_text().
+
+    Args:
+        path (Union[str, Path]): Destination file
+        data (bytes): Content to write
+    """
+    _atomic_write(path, data)
+
+
+def _atomic_write(path: Union[str, Path], content: Union[str, bytes]) -> None:
+    """Write text (UTF-8) or bytes via a flushed temporary file and a rename."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        if isinstance(content, bytes):
+            file = os.fdopen(fd, "wb")
+        else:
+            file = os.fdopen(fd, "w", encoding="utf-8")
+        with file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
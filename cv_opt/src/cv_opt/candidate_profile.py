@@ -0,0 +1,620 @@
+"""
+Jobfull Resume Analyzer - Candidate Profile Module
+
+This module parses the resume text into a CandidateProfile once per PDF. The
+cover letter, resume and report tasks used to tell their agents to extract
+the candidate's name, contact details, roles and skills from the PDF, so
+every run paid for knowledge retrieval and for the agents re-reading and
+re-extracting the same resume. The profile is built deterministically in
+milliseconds, cached by PDF hash and placed compactly in the context of the
+tasks that declare `candidate_profile: true` in config/tasks.yaml.
+
+Parsing:
+    - Header: the lines before the first section heading hold the name, a
+      headline, contact details (email, phone, LinkedIn and other links,
+      location) and a summary
+    - Sections: known headings ("Professional Experience", "Education",
+      "Technical Skills", ...) and other all-caps headings; a heading
+      repeated on a later page continues its section
+    - Experience: every line with a date range ("01/2024 - Present",
+      "Mar 2019 – Oct 2020") starts a role; title and employer are taken
+      from the text before the dates or from the one or two lines above,
+      in either order ("Globex, Data Analyst" reads as employer first), and
+      the lines below become bullets (wrapped lines are joined)
+    - Education: degrees and institutions, including two-column layouts
+      that put two degrees on one line
+    - Other sections (publications, awards, ...) are kept line by line
+
+Cache Layout (.cache/profiles/):
+    <key>.json    # CandidateProfile; the key is the SHA-256 of the PDF
+                  # bytes and PROFILE_VERSION
+
+Example:
+    from cv_opt.candidate_profile import get_candidate_profile
+
+    profile = get_candidate_profile(resume_pdf)
+    print(profile.contact.name, [role.title for role in profile.experience])
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .cache import atomic_write_text, cache_dir, stable_hash
+from .knowledge import CachedPDFKnowledgeSource
+from .models import CandidateProfile, ContactInfo, EducationEntry, WorkExperience
+
+# Bump when the parser changes so that cached profiles are rebuilt
+PROFILE_VERSION = 2
+
+# Section headings by profile section (compared lowercased, without ":")
+SECTION_HEADINGS: Dict[str, Tuple[str, ...]] = {
+    "summary": (
+        "summary",
+        "professional summary",
+        "profile",
+        "professional profile",
+        "about me",
+        "objective",
+        "career objective",
+    ),
+    "experience": (
+        "experience",
+        "professional experience",
+        "work experience",
+        "relevant experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+    ),
+    "education": (
+        "education",
+        "academic background",
+        "academic qualifications",
+        "education and training",
+    ),
+    "skills": (
+        "skills",
+        "technical skills",
+        "key skills",
+        "core competencies",
+        "competencies",
+        "skills and tools",
+        "skills & tools",
+        "technologies",
+    ),
+}
+
+# Single-word all-caps headings of other sections
+_OTHER_HEADINGS = (
+    "publications",
+    "achievements",
+    "awards",
+    "honors",
+    "certifications",
+    "projects",
+    "languages",
+    "interests",
+    "volunteering",
+    "leadership",
+    "patents",
+    "activities",
+    "references",
+)
+
+# Labels inside a role that introduce its bullets
+_BULLET_LABELS = (
+    "achievements/tasks",
+    "achievements",
+    "key achievements",
+    "responsibilities",
+    "tasks",
+    "highlights",
+)
+
+_PAGE_MARKER = re.compile(r"^page \d+( of \d+)?$", re.IGNORECASE)
+_BULLET = re.compile(r"^\s*(?:[-*•·▪●◦]|\d+[.)])\s+")
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+_LINKEDIN = re.compile(
+    r"(?:https?://)?(?:www\.)?linkedin\.com/in/[\w%-]+/?", re.IGNORECASE
+)
+_URL = re.compile(
+    r"(?:https?://)?(?:www\.)?(?:github\.com|gitlab\.com|[\w-]+\.(?:io|dev|me))"
+    r"(?:/[\w./%-]*)?|https?://\S+",
+    re.IGNORECASE,
+)
+_PHONE = re.compile(r"\+?\(?\d[\d\s().-]{7,}\d")
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}})"
+_DATE_RANGE = re.compile(
+    rf"(?P<start>{_DATE})\s*(?:-|–|—|to)\s*"
+    rf"(?P<end>{_DATE}|present|current|now|today)",
+    re.IGNORECASE,
+)
+_YEAR_OR_RANGE = re.compile(rf"{_DATE_RANGE.pattern}|\b(?:19|20)\d{{2}}\b", re.I)
+_DEGREE = re.compile(
+    r"\b(?:Master|Bachelor|Doctor|Associate|Diploma|Ph\.?\s?D|M\.?\s?B\.?\s?A"
+    r"|[MB]\.\s?(?:Sc|Eng|Tech|S|A|E)\b\.?|[MB]Sc|[MB]Eng)(?![a-z])"
+)
+_INSTITUTION = re.compile(
+    r"Universit|College|Institute|School|Academy|Polytechnic", re.IGNORECASE
+)
+_INSTITUTION_START = re.compile(
+    r"(?<!\bThe)\s+(?=The\s|(?:University|Institute|College) of\s)"
+)
+_TERMINAL = (".", "!", "?", ";")
+
+# Words of job titles and of employer names, to order "Employer, Title"
+_TITLE_WORDS = re.compile(
+    r"\b(?:analyst|engineer|developer|programmer|scientist|manager|director|"
+    r"lead|head|chief|officer|consultant|advisor|specialist|architect|"
+    r"administrator|coordinator|associate|assistant|designer|researcher|"
+    r"intern|trainee|fellow|technician|accountant|teacher|lecturer|professor|"
+    r"founder|owner|president|vp|executive|representative|supervisor|"
+    r"strategist|editor|writer|[a-z]*ologist|c[etfo]o)s?\b",
+    re.IGNORECASE,
+)
+_EMPLOYER_WORDS = re.compile(
+    r"\b(?:inc|llc|ltd|gmbh|ag|plc|corp|corporation|company|co|group|bank|"
+    r"labs?|technologies|solutions|systems|consulting|partners|university|"
+    r"institute|college|hospital|agency|ministry)\b\.?",
+    re.IGNORECASE,
+)
+
+
+# ========================================
+# SECTIONS
+# ========================================
+
+
+def _heading(line: str, next_line: str = "") -> Optional[str]:
+    """
+    Return the section a heading line opens, if it is one.
+
+    Args:
+        line (str): Candidate heading line
+        next_line (str): Following line; an unknown all-caps line above a
+            date range is an employer, not a heading
+
+    Returns:
+        str, optional: "summary", "experience", "education", "skills" or the
+            title of another section
+    """
+    name = line.strip().rstrip(":").strip()
+    lowered = name.lower()
+    for section, headings in SECTION_HEADINGS.items():
+        if lowered in headings:
+            return section
+    if not name.isupper():
+        return None
+    if lowered in _OTHER_HEADINGS:
+        return name.title()
+    words = name.split()
+    if not 2 <= len(words) <= 4 or len(name) > 40:
+        return None
+    if not all(re.fullmatch(r"[A-Z&/-]+", word) for word in words):
+        return None
+    if _DATE_RANGE.search(next_line):
+        return None
+    return name.title()
+
+
+def split_resume_sections(text: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Split resume text into its header and its sections.
+
+    Args:
+        text (str): Extracted resume text
+
+    Returns:
+        Tuple[List[str], Dict[str, List[str]]]: Header lines, and the lines
+            of each section by section name in order of appearance
+    """
+    lines = [
+        line.strip()
+        for line in text.splitlines()
+        if line.strip() and not _PAGE_MARKER.match(line.strip())
+    ]
+    header: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    for index, line in enumerate(lines):
+        next_line = lines[index + 1] if index + 1 < len(lines) else ""
+        section = _heading(line, next_line)
+        # An all-caps first line is the candidate's name
+        if index == 0 and section not in SECTION_HEADINGS:
+            section = None
+        if section is not None:
+            current = section
+            sections.setdefault(section, [])
+        elif current is None:
+            header.append(line)
+        else:
+            sections[current].append(line)
+    return header, sections
+
+
+def _strip_bullet(line: str) -> str:
+    return _BULLET.sub("", line).strip()
+
+
+def merge_wrapped_lines(lines: Sequence[str]) -> List[str]:
+    """
+    Join the lines of bullets that the PDF wrapped over several lines.
+
+    With bullet markers, every marker starts an item. Without them a line
+    continues the previous one unless that one ends a sentence; if no line
+    ends a sentence, every line is an item of its own.
+
+    Args:
+        lines (Sequence[str]): Lines of a list
+
+    Returns:
+        List[str]: One entry per item, bullet markers removed
+    """
+    marked = any(_BULLET.match(line) for line in lines)
+    sentences = any(line.rstrip().endswith(_TERMINAL) for line in lines)
+    items: List[str] = []
+    for line in lines:
+        if marked:
+            starts = bool(_BULLET.match(line))
+        elif sentences:
+            starts = not items or (
+                items[-1].endswith(_TERMINAL) and not line[:1].islower()
+            )
+        else:
+            starts = True
+        text = _strip_bullet(line)
+        if starts or not items:
+            items.append(text)
+        else:
+            items[-1] = f"{items[-1]} {text}"
+    return items
+
+
+# ========================================
+# PROFILE PARTS
+# ========================================
+
+
+def parse_contact(header: Sequence[str]) -> Tuple[ContactInfo, str]:
+    """
+    Parse the resume header.
+
+    Args:
+        header (Sequence[str]): Lines before the first section heading
+
+    Returns:
+        Tuple[ContactInfo, str]: Contact details and the summary paragraph
+    """
+    contact = ContactInfo()
+    summary: List[str] = []
+    for index, line in enumerate(header):
+        rest = line
+        for email in _EMAIL.findall(rest):
+            contact.email = contact.email or email
+            rest = rest.replace(email, " ")
+        for linkedin in _LINKEDIN.findall(rest):
+            contact.linkedin = contact.linkedin or linkedin.rstrip("/")
+            rest = rest.replace(linkedin, " ")
+        for url in _URL.findall(rest):
+            contact.links.append(url)
+            rest = rest.replace(url, " ")
+        for phone in _PHONE.findall(rest):
+            if len(re.sub(r"\D", "", phone)) >= 9:
+                contact.phone = contact.phone or phone.strip()
+                rest = rest.replace(phone, " ")
+        rest = re.sub(r"\s+", " ", rest).strip(" |,;•·")
+        if not rest:
+            continue
+        had_contact = rest != line.strip()
+        words = len(rest.split())
+        if index == 0 and not contact.name:
+            contact.name = rest
+        elif (had_contact or "," in rest) and words <= 5 and not contact.location:
+            contact.location = rest
+        elif index == 1 and words <= 10 and not rest.endswith(_TERMINAL):
+            contact.headline = rest
+        else:
+            summary.append(rest)
+    return contact, " ".join(summary)
+
+
+def _title_first(first: str, second: str) -> Tuple[str, str]:
+    """
+    Order two heading parts of a role as (title, employer).
+
+    Resumes write both "Data Analyst, Globex" and "Globex, Data Analyst";
+    the parts are swapped when only the second one reads like a job title,
+    or only the first one like an employer.
+
+    Args:
+        first (str): Part written first
+        second (str): Part written second
+
+    Returns:
+        Tuple[str, str]: Title and employer
+    """
+    titles = (bool(_TITLE_WORDS.search(first)), bool(_TITLE_WORDS.search(second)))
+    employers = (
+        bool(_EMPLOYER_WORDS.search(first)),
+        bool(_EMPLOYER_WORDS.search(second)),
+    )
+    if titles == (False, True):
+        return second, first
+    if titles[0] == titles[1] and employers == (True, False):
+        return second, first
+    return first, second
+
+
+def _role_heading(
+    lines: Sequence[str], date_index: int, lower_bound: int
+) -> Tuple[str, str, int]:
+    """
+    Find the title and employer of the role whose dates are on a line.
+
+    Args:
+        lines (Sequence[str]): Lines of the experience section
+        date_index (int): Index of the line with the role's date range
+        lower_bound (int): First line the heading may use (after the dates
+            of the previous role)
+
+    Returns:
+        Tuple[str, str, int]: Title, employer and the index of the first
+            heading line
+    """
+    match = _DATE_RANGE.search(lines[date_index])
+    prefix = lines[date_index][: match.start()].strip(" |,-–—\t")
+    # Up to two short lines directly above the dates, stopping at a bullet
+    above: List[int] = []
+    for index in range(date_index - 1, max(lower_bound, date_index - 2) - 1, -1):
+        line = lines[index]
+        if len(line.split()) > 8 or line.endswith(_TERMINAL) or _BULLET.match(line):
+            break
+        above.insert(0, index)
+    if prefix:
+        if re.search(r"\s+at\s+", prefix):
+            title, organization = re.split(r"\s+at\s+", prefix, maxsplit=1)
+            return title, organization, date_index
+        parts = re.split(r"\s+\|\s+|\s+[-–—]\s+|,\s+", prefix, maxsplit=1)
+        if len(parts) == 2:
+            return (*_title_first(parts[0], parts[1]), date_index)
+        if above:
+            return (*_title_first(prefix, lines[above[-1]]), above[-1])
+        return prefix, "", date_index
+    if len(above) == 2:
+        return (*_title_first(lines[above[0]], lines[above[1]]), above[0])
+    if above:
+        return lines[above[0]], "", above[0]
+    return "", "", date_index
+
+
+def parse_experience(lines: Sequence[str]) -> List[WorkExperience]:
+    """
+    Parse the roles of the experience section.
+
+    Args:
+        lines (Sequence[str]): Lines of the experience section
+
+    Returns:
+        List[WorkExperience]: Roles in the order listed
+    """
+    dated = [index for index, line in enumerate(lines) if _DATE_RANGE.search(line)]
+    headings = []
+    lower_bound = 0
+    for date_index in dated:
+        headings.append(_role_heading(lines, date_index, lower_bound))
+        lower_bound = date_index + 1
+
+    roles = []
+    for position, (date_index, heading) in enumerate(zip(dated, headings)):
+        title, organization, _ = heading
+        end = headings[position + 1][2] if position + 1 < len(dated) else len(lines)
+        match = _DATE_RANGE.search(lines[date_index])
+        location = lines[date_index][match.end() :].strip(" ,|-–—\t")
+        body = [
+            line
+            for line in lines[date_index + 1 : end]
+            if line.strip().rstrip(":").lower() not in _BULLET_LABELS
+        ]
+        roles.append(
+            WorkExperience(
+                title=title,
+                organization=organization,
+                start_date=match.group("start"),
+                end_date=match.group("end"),
+                location=location or None,
+                bullets=merge_wrapped_lines(body),
+            )
+        )
+    return roles
+
+
+def _split_institutions(line: str) -> List[str]:
+    """Split a line that names several institutions side by side."""
+    return [part for part in _INSTITUTION_START.split(line) if part.strip()]
+
+
+def parse_education(lines: Sequence[str]) -> List[EducationEntry]:
+    """
+    Parse the degrees of the education section.
+
+    Degrees and institutions on separate lines are paired in order, so a
+    two-column layout (two degrees on one line, their universities on the
+    next) yields two entries.
+
+    Args:
+        lines (Sequence[str]): Lines of the education section
+
+    Returns:
+        List[EducationEntry]: Degrees in the order listed
+    """
+    degrees: List[List[str]] = []
+    institutions: List[str] = []
+    dates: List[str] = []
+    for line in lines:
+        dates += [match.group(0) for match in _YEAR_OR_RANGE.finditer(line)]
+        line = _strip_bullet(_YEAR_OR_RANGE.sub(" ", line)).strip(" ,|()-–—")
+        starts = [match.start() for match in _DEGREE.finditer(line)]
+        if starts:
+            for start, end in zip(starts, starts[1:] + [len(line)]):
+                parts = re.split(r"\s*[,|]\s*|\s+[-–—]\s+", line[start:end].strip())
+                school = [part for part in parts[1:] if _INSTITUTION.search(part)]
+                degrees.append([parts[0], school[0] if school else ""])
+        elif _INSTITUTION.search(line):
+            institutions += _split_institutions(line)
+
+    pending = iter(institutions)
+    entries = []
+    for degree, institution in degrees:
+        entries.append(
+            EducationEntry(
+                degree=degree,
+                institution=institution or next(pending, ""),
+            )
+        )
+    entries += [EducationEntry(degree="", institution=rest) for rest in pending]
+    for entry, period in zip(entries, dates):
+        entry.dates = period
+    return entries
+
+
+# ========================================
+# PROFILE
+# ========================================
+
+
+def extract_candidate_profile(text: str) -> CandidateProfile:
+    """
+    Parse resume text into a CandidateProfile without an LLM.
+
+    Args:
+        text (str): Extracted resume text
+
+    Returns:
+        CandidateProfile: Contact details, roles, education, skills and the
+            remaining sections
+    """
+    header, sections = split_resume_sections(text)
+    contact, summary = parse_contact(header)
+    if sections.get("summary"):
+        summary = " ".join(filter(None, [summary, *sections["summary"]]))
+    skills = []
+    for line in sections.get("skills", []):
+        if skills and line[:1].islower():
+            skills[-1] = f"{skills[-1]} {line}"
+        else:
+            skills.append(_strip_bullet(line))
+    return CandidateProfile(
+        contact=contact,
+        summary=summary,
+        experience=parse_experience(sections.get("experience", [])),
+        education=parse_education(sections.get("education", [])),
+        skills=skills,
+        other_sections={
+            name: [_strip_bullet(line) for line in lines]
+            for name, lines in sections.items()
+            if name not in SECTION_HEADINGS and lines
+        },
+    )
+
+
+def render_candidate_profile(profile: CandidateProfile) -> str:
+    """
+    Render a profile compactly for a task's context.
+
+    Args:
+        profile (CandidateProfile): Parsed profile
+
+    Returns:
+        str: One line per fact, roles with their bullets indented below
+    """
+    contact = profile.contact
+    lines = ["Candidate profile (parsed from the resume PDF, use these real details):"]
+    if contact.name:
+        lines.append(f"Name: {contact.name}")
+    if contact.headline:
+        lines.append(f"Headline: {contact.headline}")
+    details = [
+        contact.email,
+        contact.phone,
+        contact.location,
+        contact.linkedin,
+        *contact.links,
+    ]
+    if any(details):
+        lines.append("Contact: " + " | ".join(filter(None, details)))
+    if profile.summary:
+        lines.append(f"Summary: {profile.summary}")
+    if profile.experience:
+        lines.append("Experience:")
+    for role in profile.experience:
+        period = " - ".join(filter(None, [role.start_date, role.end_date]))
+        where = "; ".join(filter(None, [period, role.location]))
+        heading = ", ".join(filter(None, [role.title, role.organization]))
+        lines.append(f"- {heading} ({where})" if where else f"- {heading}")
+        lines += [f"  - {bullet}" for bullet in role.bullets]
+    if profile.education:
+        lines.append("Education:")
+    for entry in profile.education:
+        degree = ", ".join(filter(None, [entry.degree, entry.institution]))
+        lines.append(f"- {degree} ({entry.dates})" if entry.dates else f"- {degree}")
+    if profile.skills:
+        lines.append("Skills:")
+        lines += [f"- {skill}" for skill in profile.skills]
+    for name, items in profile.other_sections.items():
+        lines.append(f"{name}:")
+        lines += [f"- {item}" for item in items]
+    return "\n".join(lines)
+
+
+# ========================================
+# PROFILE CACHE
+# ========================================
+
+_profiles: Dict[str, CandidateProfile] = {}
+_profiles_lock = threading.Lock()
+
+
+def get_candidate_profile(
+    source: CachedPDFKnowledgeSource, directory: Optional[str] = None
+) -> CandidateProfile:
+    """
+    Return the profile of a resume, parsing it once per PDF.
+
+    Profiles are kept in memory for the process and on disk below
+    .cache/profiles, keyed by the PDF hash, so warm runs and every crew of
+    a batch share one parse. The returned profile is shared; do not modify it.
+
+    Args:
+        source (CachedPDFKnowledgeSource): Loaded resume source
+        directory (str, optional): Cache directory; defaults to .cache/profiles
+
+    Returns:
+        CandidateProfile: Parsed profile
+    """
+    key = stable_hash({"pdf": source.pdf_hash, "version": PROFILE_VERSION})
+    with _profiles_lock:
+        if key in _profiles:
+            return _profiles[key]
+        path = (Path(directory) if directory else cache_dir("profiles")) / (
+            f"{key}.json"
+        )
+        profile = None
+        if path.exists():
+            try:
+                profile = CandidateProfile.model_validate_json(
+                    path.read_text(encoding="utf-8")
+                )
+            except (OSError, ValueError):
+                profile = None
+        if profile is None:
+            profile = extract_candidate_profile("\n".join(source.content.values()))
+            atomic_write_text(path, profile.model_dump_json())
+        _profiles[key] = profile
+        return profile
@@ -0,0 +1,382 @@
+"""
+Jobfull Resume Analyzer - Run Checkpoint Module
+
+This module makes workflow runs resumable. Every run gets a run ID and its own
+output directory, and each task's output is checkpointed atomically as soon as
+the task completes. When a run dies part-way (rate limit, network error), it
+is resumed from the first incomplete task: completed tasks are restored from
+their checkpoints instead of being paid for again.
+
+Run Layout (output/<run_id>/):
+    run.json                   # RunManifest: inputs, options, status, progress
+    checkpoints/<task>.json    # One TaskMemoEntry per completed task
+    job_analysis.json, ...     # The usual task output files of the run
+
+Checkpointing:
+    RunCheckpointer listens for TaskCompletedEvent of its tasks, so it works
+    with the sequential crew, the parallel scheduler and incremental runs.
+    Tasks restored without executing (incremental memo hits) are checkpointed
+    when the run ends. Checkpoints and the manifest are written with
+    atomic_write_text(), so a crash never leaves a partial file behind.
+
+Resuming:
+    resume_tasks() runs the workflow again with the run's original inputs.
+    Tasks with a checkpoint are restored (callbacks run and output files are
+    rewritten); the first task without one, and everything after it, executes.
+
+Example:
+    from cv_opt.checkpoint import RunCheckpoints, RunCheckpointer, new_run_id
+
+    checkpoints = RunCheckpoints.create(new_run_id(), inputs)
+    crew = ResumeCrew(output_dir=str(checkpoints.run_dir))
+    with RunCheckpointer(crew.workflow_tasks(), checkpoints):
+        crew.crew().kickoff(inputs=inputs)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import secrets
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from crewai import Task
+from crewai.utilities.events import TaskCompletedEvent, crewai_event_bus
+from pydantic import BaseModel, Field
+
+from .cache import atomic_write_text
+from .incremental import TaskMemoEntry, memo_entry, restore_task_output
+from .scheduler import ParallelScheduler, ScheduleReport, execute_single_task
+
+# Root directory holding one directory per run
+DEFAULT_RUNS_DIR = "output"
+
+# Manifest file name inside a run directory
+MANIFEST_NAME = "run.json"
+
+# ========================================
+# RUN MANIFEST AND CHECKPOINT STORE
+# ========================================
+
+
+def new_run_id() -> str:
+    """
+    Return a new, sortable run ID such as "20250101-120000-3fa2c1".
+
+    Returns:
+        str: Timestamp followed by a random suffix
+    """
+    return f"{datetime.now():%Y%m%d-%H%M%S}-{secrets.token_hex(3)}"
+
+
+class RunManifest(BaseModel):
+    """
+    Description and progress of one workflow run.
+
+    Attributes:
+        run_id (str): Run identifier, also the run directory name
+        inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+        options (Dict[str, Any]): Execution options needed to resume the run
+            (split_research, parallel, max_concurrency, profile)
+        status (str): "running", "completed", "failed" or "incomplete"
+            (ended without error but tasks were skipped, e.g. with `only`)
+        tasks (List[str]): Workflow task names in execution order
+        completed (List[str]): Tasks with a checkpoint, in completion order
+        error (str, optional): Error message of a failed run
+        started_at (str): ISO timestamp of the first start
+        updated_at (str): ISO timestamp of the last manifest write
+    """
+
+    run_id: str = Field(description="Run identifier and directory name")
+    inputs: Dict[str, Any] = Field(description="Kickoff inputs")
+    options: Dict[str, Any] = Field(
+        description="Execution options needed to resume", default_factory=dict
+    )
+    status: str = Field(description="Run status", default="running")
+    tasks: List[str] = Field(description="Workflow task names", default_factory=list)
+    completed: List[str] = Field(
+        description="Tasks with a checkpoint", default_factory=list
+    )
+    error: Optional[str] = Field(description="Error of a failed run", default=None)
+    started_at: str = Field(description="ISO timestamp of the first start")
+    updated_at: str = Field(description="ISO timestamp of the last update")
+
+    @property
+    def pending(self) -> List[str]:
+        """Workflow tasks without a checkpoint, in execution order."""
+        return [name for name in self.tasks if name not in self.completed]
+
+
+class RunCheckpoints:
+    """
+    Manifest and task checkpoints of one run directory.
+
+    Attributes:
+        run_dir (Path): Directory of the run (output/<run_id>)
+        manifest (RunManifest): Current manifest of the run
+    """
+
+    def __init__(self, run_dir: Path, manifest: RunManifest) -> None:
+        self.run_dir = Path(run_dir)
+        self.manifest = manifest
+        self._lock = threading.Lock()
+
+    @property
+    def run_id(self) -> str:
+        return self.manifest.run_id
+
+    @classmethod
+    def create(
+        cls,
+        run_id: str,
+        inputs: Dict[str, Any],
+        options: Optional[Dict[str, Any]] = None,
+        runs_dir: str = DEFAULT_RUNS_DIR,
+    ) -> "RunCheckpoints":
+        """
+        Create the directory and manifest of a new run.
+
+        Args:
+            run_id (str): Run identifier, e.g. from new_run_id()
+            inputs (Dict[str, Any]): Kickoff inputs
+            options (Dict[str, Any], optional): Options needed to resume
+            runs_dir (str): Root directory of all runs
+
+        Returns:
+            RunCheckpoints: Store of the new run
+
+        Raises:
+            FileExistsError: If a run with this ID already exists
+        """
+        run_dir = Path(runs_dir) / run_id
+        if (run_dir / MANIFEST_NAME).exists():
+            raise FileExistsError(
+                f"Run '{run_id}' already exists in {runs_dir}; resume it instead"
+            )
+        now = datetime.now().isoformat(timespec="seconds")
+        checkpoints = cls(
+            run_dir,
+            RunManifest(
+                run_id=run_id,
+                inputs=dict(inputs),
+                options=dict(options or {}),
+                started_at=now,
+                updated_at=now,
+            ),
+        )
+        checkpoints.save_manifest()
+        return checkpoints
+
+    @classmethod
+    def load(cls, run_id: str, runs_dir: str = DEFAULT_RUNS_DIR) -> "RunCheckpoints":
+        """
+        Open an existing run.
+
+        Args:
+            run_id (str): Run identifier
+            runs_dir (str): Root directory of all runs
+
+        Returns:
+            RunCheckpoints: Store of the run
+
+        Raises:
+            FileNotFoundError: If the run has no manifest
+        """
+        run_dir = Path(runs_dir) / run_id
+        path = run_dir / MANIFEST_NAME
+        if not path.exists():
+            raise FileNotFoundError(f"No run '{run_id}' in {runs_dir}")
+        manifest = RunManifest.model_validate_json(path.read_text(encoding="utf-8"))
+        return cls(run_dir, manifest)
+
+    def save_manifest(self) -> None:
+        """Write the manifest atomically."""
+        with self._lock:
+            self.manifest.updated_at = datetime.now().isoformat(timespec="seconds")
+            atomic_write_text(
+                self.run_dir / MANIFEST_NAME, self.manifest.model_dump_json(indent=2)
+            )
+
+    def _task_path(self, task_name: str) -> Path:
+        return self.run_dir / "checkpoints" / f"{task_name}.json"
+
+    def save_task(self, task: Task) -> None:
+        """
+        Checkpoint a completed task and record it in the manifest.
+
+        Args:
+            task (Task): Task whose `output` is set
+        """
+        entry = memo_entry(task)
+        atomic_write_text(self._task_path(task.name), entry.model_dump_json())
+        with self._lock:
+            if task.name not in self.manifest.completed:
+                self.manifest.completed.append(task.name)
+        self.save_manifest()
+
+    def load_task(self, task_name: str) -> Optional[TaskMemoEntry]:
+        """Return the checkpoint of a task, or None if it has none."""
+        path = self._task_path(task_name)
+        if task_name not in self.manifest.completed or not path.exists():
+            return None
+        try:
+            return TaskMemoEntry.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+
+def list_runs(runs_dir: str = DEFAULT_RUNS_DIR) -> List[RunManifest]:
+    """
+    Return the manifests of all runs below a directory, oldest first.
+
+    Args:
+        runs_dir (str): Root directory of all runs
+
+    Returns:
+        List[RunManifest]: Manifests sorted by start time
+    """
+    manifests = []
+    for path in Path(runs_dir).glob(f"*/{MANIFEST_NAME}"):
+        try:
+            manifests.append(
+                RunManifest.model_validate_json(path.read_text(encoding="utf-8"))
+            )
+        except (OSError, ValueError):
+            continue
+    return sorted(manifests, key=lambda manifest: manifest.started_at)
+
+
+def latest_incomplete_run(runs_dir: str = DEFAULT_RUNS_DIR) -> Optional[str]:
+    """Return the ID of the most recently started run that did not complete."""
+    incomplete = [m for m in list_runs(runs_dir) if m.status != "completed"]
+    return incomplete[-1].run_id if incomplete else None
+
+
+# ========================================
+# CHECKPOINTING AND RESUMING
+# ========================================
+
+# Checkpointers currently receiving task completions
+_active_checkpointers: List["RunCheckpointer"] = []
+_checkpoint_handler_registered = False
+_checkpoint_registration_lock = threading.Lock()
+
+
+def _dispatch_task_completed(source: Any, event: TaskCompletedEvent) -> None:
+    """Event handler forwarding task completions to active checkpointers."""
+    for checkpointer in list(_active_checkpointers):
+        checkpointer.task_completed(event.task)
+
+
+def _register_checkpoint_handler() -> None:
+    """Register the task completion handler on the CrewAI event bus once."""
+    global _checkpoint_handler_registered
+    with _checkpoint_registration_lock:
+        if not _checkpoint_handler_registered:
+            crewai_event_bus.register_handler(
+                TaskCompletedEvent, _dispatch_task_completed
+            )
+            _checkpoint_handler_registered = True
+
+
+class RunCheckpointer:
+    """
+    Checkpoint each task of a run as soon as it completes.
+
+    Used as a context manager around any kickoff. On exit the manifest status
+    becomes "failed" with the error message if the kickoff raised, otherwise
+    "completed" or, if tasks were skipped, "incomplete". Exceptions are never
+    swallowed.
+
+    Attributes:
+        tasks (List[Task]): Workflow tasks of the run in execution order
+        checkpoints (RunCheckpoints): Store the checkpoints are written to
+
+    Example:
+        with RunCheckpointer(crew.workflow_tasks(), checkpoints):
+            crew.kickoff_parallel(inputs)
+    """
+
+    def __init__(self, tasks: Sequence[Task], checkpoints: RunCheckpoints) -> None:
+        self.tasks = list(tasks)
+        self.checkpoints = checkpoints
+        self._task_ids: Set[str] = {str(task.id) for task in self.tasks}
+        self._outputs_before: Dict[str, int] = {}
+
+    def __enter__(self) -> "RunCheckpointer":
+        manifest = self.checkpoints.manifest
+        manifest.tasks = [task.name for task in self.tasks]
+        manifest.status = "running"
+        manifest.error = None
+        self.checkpoints.save_manifest()
+        self._outputs_before = {
+            task.name: id(task.output) for task in self.tasks if task.output
+        }
+        _register_checkpoint_handler()
+        _active_checkpointers.append(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> None:
+        if self in _active_checkpointers:
+            _active_checkpointers.remove(self)
+        manifest = self.checkpoints.manifest
+        # Outputs restored without a TaskCompletedEvent (memo hits)
+        for task in self.tasks:
+            restored = task.output and id(task.output) != self._outputs_before.get(
+                task.name
+            )
+            if restored and task.name not in manifest.completed:
+                self.checkpoints.save_task(task)
+        if exc is not None:
+            manifest.status = "failed"
+            manifest.error = str(exc)
+        else:
+            manifest.status = "incomplete" if manifest.pending else "completed"
+        self.checkpoints.save_manifest()
+
+    def task_completed(self, task: Task) -> None:
+        """Checkpoint a completed task if it belongs to this run."""
+        if str(task.id) in self._task_ids and task.output is not None:
+            self.checkpoints.save_task(task)
+
+
+def resume_tasks(
+    tasks: Sequence[Task],
+    checkpoints: RunCheckpoints,
+    max_concurrency: int = 1,
+    verbose: bool = True,
+) -> ScheduleReport:
+    """
+    Run the workflow again, restoring every task that has a checkpoint.
+
+    Args:
+        tasks (Sequence[Task]): Workflow tasks in execution order, built for
+            the run's output directory
+        checkpoints (RunCheckpoints): Store of the run being resumed
+        max_concurrency (int): Maximum number of tasks running at once;
+            1 keeps the sequential execution order
+        verbose (bool): Verbose flag for the single-task crews
+
+    Returns:
+        ScheduleReport: Timings of the run; `reused` lists restored tasks
+    """
+    reused: List[str] = []
+
+    def execute(task: Task, inputs: Dict[str, Any]) -> None:
+        entry = checkpoints.load_task(task.name)
+        if entry is None:
+            execute_single_task(task, inputs, verbose=verbose)
+            return
+        task.interpolate_inputs_and_add_conversation_history(inputs)
+        task.agent.interpolate_inputs(inputs)
+        restore_task_output(task, entry)
+        reused.append(task.name)
+
+    scheduler = ParallelScheduler(max_concurrency=max_concurrency, verbose=verbose)
+    report = scheduler.run(
+        tasks, inputs=checkpoints.manifest.inputs, execute_task=execute
+    )
+    report.reused = [task.name for task in tasks if task.name in reused]
+    return report
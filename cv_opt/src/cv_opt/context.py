@@ -0,0 +1,287 @@
+"""
+Jobfull Resume Analyzer - Context Projection Module
+
+This module shrinks the context later tasks receive from their upstream
+tasks. CrewAI pastes the complete raw output of every context task into the
+prompt, so generate_report_task used to read five whole JSON documents,
+including a full cover letter, although it only needs a handful of fields.
+
+Projection:
+    A task in config/tasks.yaml may declare `context_fields`, mapping context
+    task names to the output fields it needs:
+
+        generate_report_task:
+          context: [analyze_job_task, optimize_resume_task]
+          context_fields:
+            analyze_job_task: [ats_keywords, match_score]
+
+    Only the selected fields of those tasks are rendered, one compact line per
+    field (strings verbatim, everything else as minified JSON). Context tasks
+    without an entry, e.g. markdown deliverables, are passed unchanged.
+    Fields missing from an output, e.g. dropped by an output profile, are
+    skipped.
+
+Known Fields:
+    Output fields that are known before a task runs, e.g. read from a job
+    posting's JSON-LD, can be set with set_known_fields(). They are removed
+    from the output model the LLM fills in, listed in the task's context so
+    the agent can rely on them, and merged back into the output by
+    merge_known_fields() from the task callback; the output file is written
+    from the merged output.
+
+Candidate Profile:
+    Tasks with `candidate_profile: true` in tasks.yaml receive the rendered
+    CandidateProfile (see cv_opt.candidate_profile) at the top of their
+    context, set by the crew as `profile_context`. Tasks with
+    `resume_layout: true` likewise receive the measured PDF layout and its
+    format diagnostics (see cv_opt.pdf_layout), set as `layout_context`.
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import json
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Sequence
+
+from crewai import Task
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from .profiles import base_model, trimmed_model
+
+# Separator CrewAI puts between the outputs of context tasks
+CONTEXT_DIVIDER = "\n\n----------\n\n"
+
+
+def _output_data(output: TaskOutput) -> Optional[Dict[str, Any]]:
+    """Return a task output as a JSON-compatible dictionary, if structured."""
+    if output.pydantic is not None:
+        return output.pydantic.model_dump(mode="json")
+    if output.json_dict:
+        return output.json_dict
+    try:
+        data = json.loads(output.raw)
+    except (TypeError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def project_output(task_name: str, output: TaskOutput, fields: Sequence[str]) -> str:
+    """
+    Render selected fields of a task output compactly.
+
+    Args:
+        task_name (str): Name of the task that produced the output
+        output (TaskOutput): Output to project
+        fields (Sequence[str]): Fields to keep, in rendering order
+
+    Returns:
+        str: One line per present field, or the raw output if the output is
+            not structured
+    """
+    data = _output_data(output)
+    if data is None:
+        return output.raw
+    lines = [f"Output of {task_name} (selected fields):"]
+    for field in fields:
+        if field not in data:
+            continue
+        value = data[field]
+        if not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        lines.append(f"{field}: {value}")
+    return "\n".join(lines)
+
+
+def render_known_fields(fields: Dict[str, Any]) -> str:
+    """
+    Render output fields that are already known, one compact line per field.
+
+    Args:
+        fields (Dict[str, Any]): Known field values by name
+
+    Returns:
+        str: Context block telling the agent not to generate the fields
+    """
+    lines = [
+        "Already known (added to your output automatically, do not "
+        "generate these fields):"
+    ]
+    for field, value in fields.items():
+        if not isinstance(value, str):
+            value = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        lines.append(f"{field}: {value}")
+    return "\n".join(lines)
+
+
+def render_context(
+    tasks: Sequence[Task], context_fields: Dict[str, List[str]]
+) -> str:
+    """
+    Build the context of a task from its executed context tasks.
+
+    Args:
+        tasks (Sequence[Task]): Context tasks of the task
+        context_fields (Dict[str, List[str]]): Fields to keep per task name;
+            tasks without an entry contribute their raw output
+
+    Returns:
+        str: Context in CrewAI's format, outputs separated by CONTEXT_DIVIDER
+    """
+    blocks = []
+    for task in tasks:
+        if task.output is None:
+            continue
+        fields = context_fields.get(task.name)
+        blocks.append(
+            task.output.raw
+            if fields is None
+            else project_output(task.name, task.output, fields)
+        )
+    return CONTEXT_DIVIDER.join(blocks)
+
+
+class ProjectedContextTask(Task):
+    """
+    A task that receives only selected fields of its context tasks.
+
+    Attributes:
+        context_fields (Dict[str, List[str]], optional): Output fields to
+            pass on per context task name; read from `context_fields` in
+            tasks.yaml
+        known_fields (Dict[str, Any]): Output fields known before the task
+            runs; see set_known_fields()
+        candidate_profile (bool): Whether the task receives the candidate
+            profile; read from `candidate_profile` in tasks.yaml
+        profile_context (str, optional): Rendered candidate profile
+        resume_layout (bool): Whether the task receives the resume layout
+            diagnostics; read from `resume_layout` in tasks.yaml
+        layout_context (str, optional): Rendered resume layout diagnostics
+    """
+
+    context_fields: Optional[Dict[str, List[str]]] = Field(
+        description="Output fields passed on per context task name",
+        default=None,
+    )
+    known_fields: Dict[str, Any] = Field(
+        description="Output fields known before the task runs",
+        default_factory=dict,
+    )
+    candidate_profile: bool = Field(
+        description="Whether the task receives the candidate profile",
+        default=False,
+    )
+    profile_context: Optional[str] = Field(
+        description="Rendered candidate profile", default=None
+    )
+    resume_layout: bool = Field(
+        description="Whether the task receives the resume layout diagnostics",
+        default=False,
+    )
+    layout_context: Optional[str] = Field(
+        description="Rendered resume layout diagnostics", default=None
+    )
+
+    _full_output_pydantic: Optional[type] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def check_context_fields(self) -> "ProjectedContextTask":
+        """Reject projections of tasks that are not in the task's context."""
+        if self.context_fields and isinstance(self.context, list):
+            names = {task.name for task in self.context}
+            unknown = sorted(set(self.context_fields) - names)
+            if unknown:
+                raise ValueError(
+                    f"context_fields of '{self.name}' name tasks outside its "
+                    f"context: {unknown}"
+                )
+        return self
+
+    def set_known_fields(self, fields: Dict[str, Any]) -> None:
+        """
+        Declare output fields the LLM does not have to generate.
+
+        Fields outside the task's output model are ignored. The output model
+        is trimmed to the remaining fields; an empty `fields` restores it.
+
+        Args:
+            fields (Dict[str, Any]): Known field values by name
+        """
+        if self._full_output_pydantic is None:
+            self._full_output_pydantic = self.output_pydantic
+        model = self._full_output_pydantic
+        if model is None:
+            return
+        known = {
+            name: value for name, value in fields.items() if name in model.model_fields
+        }
+        kept = tuple(name for name in model.model_fields if name not in known)
+        self.known_fields = known
+        self.output_pydantic = (
+            trimmed_model(base_model(model), kept) if known else model
+        )
+
+    def merge_known_fields(self, output: TaskOutput) -> None:
+        """
+        Add the known fields to a structured output of the task, in place.
+
+        Args:
+            output (TaskOutput): Output of the task, validated against the
+                trimmed model
+        """
+        if not self.known_fields or output.pydantic is None:
+            return
+        model = self._full_output_pydantic
+        merged: BaseModel = model.model_validate(
+            {**output.pydantic.model_dump(), **self.known_fields}
+        )
+        output.pydantic = merged
+        output.raw = merged.model_dump_json()
+
+    def _save_file(self, result: Any) -> None:
+        """Write the output file, including merged known fields."""
+        if self.known_fields and self.output is not None and self.output.pydantic:
+            result = self.output.pydantic.model_dump_json()
+        super()._save_file(result)
+
+    def project_context(self, context: Optional[str]) -> Optional[str]:
+        """
+        Replace CrewAI's aggregated context with the projected one.
+
+        Args:
+            context (str, optional): Context built by CrewAI
+
+        Returns:
+            str, optional: The candidate profile, the resume layout, the
+                projected context and the known fields, or `context`
+                unchanged when none applies
+        """
+        if self.context_fields and isinstance(self.context, list):
+            context = render_context(self.context, self.context_fields)
+        profile = self.profile_context if self.candidate_profile else None
+        layout = self.layout_context if self.resume_layout else None
+        known = render_known_fields(self.known_fields) if self.known_fields else None
+        if not profile and not layout and not known:
+            return context
+        return CONTEXT_DIVIDER.join(
+            block for block in (profile, layout, context, known) if block
+        )
+
+    def execute_sync(
+        self,
+        agent: Any = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> TaskOutput:
+        """Execute the task synchronously with the projected context."""
+        return super().execute_sync(agent, self.project_context(context), tools)
+
+    def execute_async(
+        self,
+        agent: Any = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> Future:
+        """Execute the task asynchronously with the projected context."""
+        return super().execute_async(agent, self.project_context(context), tools)
@@ -3,8 +3,9 @@ Jobfull Resume Analyzer - Crew Orchestration Module
 
 This module defines the ResumeCrew class, which orchestrates the complete AI-powered
 resume optimization workflow using the CrewAI framework. The class manages 6 specialized
-AI agents and 7 sequential tasks to analyze jobs, optimize resumes, research companies,
-and generate professional deliverables.
+AI agents through the workflow tasks of config/tasks.yaml (7, or 8 in split research
+mode) to analyze jobs, optimize resumes, research companies, and generate professional
+deliverables.
 
 Architecture Overview:
     The ResumeCrew follows a sequential processing model where each agent builds upon
@@ -15,7 +16,7 @@ Architecture Overview:
 
 Key Components:
     - 6 AI Agents: Each with specialized roles and capabilities
-    - 7 Tasks: Sequential workflow with context passing
+    - 7 Workflow Tasks (8 in split research mode): Context passing between tasks
     - PDF Knowledge Sources: Real resume content extraction
     - Structured Outputs: Pydantic models for data validation
     - File Outputs: JSON analysis + Markdown deliverables
@@ -31,17 +32,94 @@ Author: Jobfull Team
 Version: 1.0.0
 """
 
-from crewai import LLM, Agent, Crew, Process, Task
-from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
-from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import ScrapeWebsiteTool, SerperDevTool
-
+import copy
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+import yaml
+from crewai import Agent, Crew, Process, Task
+from crewai.knowledge.knowledge import Knowledge
+from crewai.llms.base_llm import BaseLLM
+from crewai.project import CrewBase, agent, before_kickoff, crew, task
+from crewai.tasks.task_output import TaskOutput
+
+from .ats_matcher import ATSMatchResult, match_keywords
+from .cache import atomic_write_text, sha256_text
+from .candidate_profile import get_candidate_profile, render_candidate_profile
+from .checkpoint import RunCheckpointer, RunCheckpoints, resume_tasks
+from .context import ProjectedContextTask
+from .incremental import IncrementalRunner
+from .knowledge import CachedPDFKnowledgeSource, get_resume_knowledge
+from .llm_cache import CachedLLM, get_llm_cache
 from .models import (
+    ATSOptimization,
     CompanyResearch,
     CoverLetterGeneration,
     JobRequirements,
     ResumeOptimization,
 )
+from .pdf_layout import get_resume_layout, render_layout_diagnostics
+from .profiles import DEFAULT_PROFILE, base_model, get_profile
+from .routing import ROUTING_KEY, ModelRouter, load_routing_table
+from .scheduler import DEFAULT_MAX_CONCURRENCY, ParallelScheduler, ScheduleReport
+from .tools import CachedScrapeWebsiteTool, CachedSerperDevTool, get_scrape_cache
+from .tracing import RunTracer
+
+# Parsed configuration files by (path, modification time)
+_config_cache: Dict[Tuple[str, int], Any] = {}
+_config_cache_lock = threading.Lock()
+
+
+def load_config_yaml(config_path: Path) -> Any:
+    """
+    Parse a YAML configuration file once per process.
+
+    CrewBase parses agents.yaml and tasks.yaml for every crew instance, which
+    dominates crew construction in long-lived processes. CrewAI replaces agent
+    and tool names in the parsed dictionaries with objects, so every caller
+    gets its own deep copy. Edited files are re-parsed (keyed by mtime).
+
+    Args:
+        config_path (Path): YAML file to load
+
+    Returns:
+        Any: Parsed YAML content
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    key = (str(config_path), Path(config_path).stat().st_mtime_ns)
+    with _config_cache_lock:
+        if key not in _config_cache:
+            with open(config_path, "r", encoding="utf-8") as file:
+                _config_cache[key] = yaml.safe_load(file)
+        return copy.deepcopy(_config_cache[key])
+
+
+def replace_step(description: str, step: str) -> str:
+    """
+    Replace the step of a task description that has the same heading.
+
+    Descriptions in tasks.yaml are folded, so each step (its bold heading
+    and bullets) is one line of the description.
+
+    Args:
+        description (str): Task description
+        step (str): Replacement step, starting with its bold heading
+
+    Returns:
+        str: The description with the step replaced, or unchanged if it has
+            no step with that heading (e.g. an output profile's override)
+    """
+    heading = step.split("**", 2)[1]
+    lines = description.split("\n")
+    for index, line in enumerate(lines):
+        if line.startswith(f"**{heading}**"):
+            lines[index] = step.strip()
+            return "\n".join(lines)
+    return description
 
 
 @CrewBase
@@ -50,8 +128,10 @@ class ResumeCrew:
     Main orchestration class for the Jobfull Resume Analyzer system.
 
     This class manages the complete AI-powered resume optimization workflow,
-    coordinating 6 specialized AI agents through 7 sequential tasks. Each agent
-    has specific expertise and contributes to the overall optimization process.
+    coordinating 6 specialized AI agents through the workflow tasks returned by
+    workflow_tasks(): 7 by default, 8 in split research mode, never the
+    auxiliary tasks. Each agent has specific expertise and contributes to the
+    overall optimization process.
 
     Agent Workflow:
         1. Job Analyzer: Extracts ATS keywords and analyzes job requirements
@@ -70,12 +150,21 @@ class ResumeCrew:
         - Agent configurations loaded from config/agents.yaml
         - Task configurations loaded from config/tasks.yaml
         - Resume PDF processed through knowledge sources
-        - All agents use GPT-4o-mini for consistency
+        - Agents use the models of the routing policy (GPT-4o-mini by default)
 
     Attributes:
         agents_config (str): Path to agent configuration file
         tasks_config (str): Path to task configuration file
-        resume_pdf (PDFKnowledgeSource): PDF knowledge source for resume content
+        resume_pdf (CachedPDFKnowledgeSource): Parsed resume PDF source
+        resume_knowledge (Knowledge): Shared read-only resume index queried by
+            every agent that needs candidate information
+        candidate_profile (CandidateProfile): Resume parsed once per PDF and
+            placed in the context of tasks declaring `candidate_profile`
+        resume_layout (ResumeLayout, optional): Layout measured from the
+            resume PDF; its format checklist and parsing warnings replace
+            the resume analyzer's estimates
+        llm (BaseLLM, optional): LLM override used by every agent
+        router (ModelRouter): Model routing of the agents and tasks
 
     Example:
         # Initialize and run the crew
@@ -91,7 +180,29 @@ class ResumeCrew:
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
 
-    def __init__(self) -> None:
+    # Resume PDF file name, resolved inside the knowledge/ directory
+    resume_file = "GhonemCV_2025.pdf"
+
+    # tasks.yaml entries that are not steps of the standard workflow: the
+    # configuration research_company_task uses in split mode and the
+    # job-independent resume format analysis shared across batch jobs
+    auxiliary_tasks = ("align_company_research_task", "analyze_resume_format_task")
+
+    def __init__(
+        self,
+        split_research: bool = False,
+        output_dir: str = "output",
+        resume_pdf: Optional[CachedPDFKnowledgeSource] = None,
+        resume_format_task: Optional[Task] = None,
+        llm: Optional[BaseLLM] = None,
+        embedder: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        profile: str = DEFAULT_PROFILE,
+        llm_cache: bool = False,
+        routing: Optional[str] = None,
+        model_overrides: Optional[Dict[str, str]] = None,
+        llms: Optional[Dict[str, BaseLLM]] = None,
+    ) -> None:
         """
         Initialize the ResumeCrew with PDF knowledge source.
 
@@ -99,23 +210,144 @@ class ResumeCrew:
         The resume PDF is made available to all agents that need access
         to candidate information for personalization and optimization.
 
+        Args:
+            split_research (bool): Split company research into a raw
+                intelligence gathering task with no dependencies and a short
+                alignment step that waits for the job and resume analysis.
+                Combined with kickoff_parallel, gathering starts at kickoff
+                and runs alongside job analysis. Defaults to False.
+            output_dir (str): Directory for all output files, relative to the
+                working directory. Defaults to "output".
+            resume_pdf (CachedPDFKnowledgeSource, optional): Already parsed resume
+                source to use instead of loading the PDF again, e.g. when
+                many crews are built for one resume in a batch run.
+            resume_format_task (Task, optional): Executed, job-independent
+                resume format analysis added to optimize_resume_task's
+                context so the format review is shared across jobs.
+            llm (BaseLLM, optional): LLM used by every agent instead of
+                GPT-4o-mini, e.g. the stub LLM of cv_opt.benchmark.
+            embedder (Dict[str, Any], optional): CrewAI embedder configuration
+                for the resume index; defaults to CrewAI's default embedder.
+            stream (bool): Stream GPT-4o-mini responses so that token deltas
+                are emitted as LLMStreamChunkEvents (see cv_opt.progress).
+                Ignored when `llm` is given. Defaults to False.
+            profile (str): Output profile (see cv_opt.profiles): "full",
+                "standard" or "fast". Trims the output models and task
+                descriptions to cut completion tokens. Defaults to "full".
+            llm_cache (bool): Serve repeated LLM requests from the on-disk
+                response cache (see cv_opt.llm_cache), so replaying an
+                identical run makes no provider calls. GPT-4o-mini then runs
+                at temperature 0. Defaults to False.
+            routing (str, optional): Model routing policy of agents.yaml
+                (see cv_opt.routing), e.g. "hybrid"; defaults to the table's
+                default policy. Ignored when `llm` is given.
+            model_overrides (Dict[str, str], optional): Model by agent or
+                task name, overriding the policy, e.g.
+                {"generate_report_task": "strong"}.
+            llms (Dict[str, BaseLLM], optional): LLM instances replacing
+                named models of the routing table, e.g. stub LLMs.
+
         Note:
             The PDF path is currently hardcoded for demonstration purposes.
             In production, this should be configurable or passed as a parameter.
 
         Raises:
             FileNotFoundError: If the resume PDF file is not found
-            ValueError: If the PDF file is corrupted or unreadable
+            ValueError: If the PDF file is corrupted or unreadable, the
+                profile or routing policy is unknown, or an override names
+                an unknown agent or task
         """
+        self.profile = get_profile(profile)
+        self.router = ModelRouter(
+            load_routing_table(),
+            routing,
+            model_overrides,
+            llms,
+            stream=stream,
+            llm_cache=llm_cache,
+        )
+        config_dir = Path(__file__).parent / "config"
+        agent_names = set(load_config_yaml(config_dir / "agents.yaml")) - {ROUTING_KEY}
+        task_configs = load_config_yaml(config_dir / "tasks.yaml")
+        self.router.check_names(agent_names | set(task_configs))
         # Initialize PDF knowledge source for resume content extraction
         # This enables all agents to access real candidate information
-        self.resume_pdf = PDFKnowledgeSource(file_paths="GhonemCV_2025.pdf")
+        self.resume_pdf = resume_pdf or CachedPDFKnowledgeSource(
+            file_paths=self.resume_file
+        )
+        # One read-only vector index over the resume, shared by all agents
+        # (and by every crew in the process built for the same resume)
+        self.resume_knowledge = get_resume_knowledge(self.resume_pdf, embedder)
+        # Structured resume content, parsed once per PDF; agents whose every
+        # task receives it in context no longer query the resume index
+        self.candidate_profile = get_candidate_profile(self.resume_pdf)
+        self.candidate_context = render_candidate_profile(self.candidate_profile)
+        # Layout of the resume PDF, measured once per file; tasks declaring
+        # `resume_layout` see it, and the format checklist and parsing
+        # warnings it yields are merged into their outputs
+        self.resume_layout = get_resume_layout(self.resume_pdf)
+        self.layout_context = (
+            render_layout_diagnostics(self.resume_layout)
+            if self._layout_fields()
+            else None
+        )
+        self.profile_agents = {
+            config["agent"]
+            for config in task_configs.values()
+            if config.get("candidate_profile")
+        } - {
+            config["agent"]
+            for config in task_configs.values()
+            if not config.get("candidate_profile")
+        }
+        self.llm = llm
+        self.stream = stream
+        self.llm_cache = llm_cache
+        self.split_research = split_research
+        self.output_dir = output_dir
+        self.resume_format_task = resume_format_task
+
+        # Search tool shared by the research agent; results are cached per
+        # company, which is bound from the kickoff inputs
+        self.search_tool = CachedSerperDevTool()
+
+        # Scrape tool of the job analyzer; also read before kickoff for the
+        # fields a posting's JSON-LD states (see prefill_job_posting)
+        self.scrape_tool = CachedScrapeWebsiteTool()
+
+        # Deterministic keyword match of the resume against the job's ATS
+        # keywords, computed after analyze_job_task
+        self.ats_match: Optional[ATSMatchResult] = None
 
     # ========================================
     # AI AGENT DEFINITIONS
     # ========================================
     # Each agent is specialized for a specific aspect of the optimization process
 
+    def _llm(self, agent_name: str) -> BaseLLM:
+        """
+        Return the LLM for an agent: the injected LLM, behind the LLM response
+        cache if enabled, or the agent's routed LLM (see cv_opt.routing).
+
+        Args:
+            agent_name (str): Agent name in agents.yaml
+        """
+        if self.llm is None:
+            return self.router.agent_llm(agent_name)
+        return CachedLLM(self.llm) if self.llm_cache else self.llm
+
+    def _knowledge(self, agent_name: str) -> Optional[Knowledge]:
+        """
+        Return the resume index for an agent, unless the candidate profile
+        in the context of all its tasks replaces retrieval.
+
+        Args:
+            agent_name (str): Agent name in agents.yaml
+        """
+        if agent_name in self.profile_agents and self.candidate_profile.experience:
+            return None
+        return self.resume_knowledge
+
     @agent
     def resume_analyzer(self) -> Agent:
         """
@@ -133,7 +365,8 @@ class ResumeCrew:
             - Parsing optimization for maximum ATS compatibility
 
         Tools:
-            - PDF Knowledge Source: Access to candidate's resume content
+            - Candidate Profile: Parsed resume in the task context (the resume
+              index only if the profile could not be parsed)
             - GPT-4o-mini: Advanced language understanding for analysis
 
         Returns:
@@ -142,8 +375,8 @@ class ResumeCrew:
         return Agent(
             config=self.agents_config["resume_analyzer"],
             verbose=True,
-            llm=LLM("gpt-4o-mini"),
-            knowledge_sources=[self.resume_pdf],
+            llm=self._llm("resume_analyzer"),
+            knowledge=self._knowledge("resume_analyzer"),
         )
 
     @agent
@@ -163,7 +396,9 @@ class ResumeCrew:
             - Candidate-job fit scoring and gap analysis
 
         Tools:
-            - ScrapeWebsiteTool: Web scraping for job posting content
+            - CachedScrapeWebsiteTool: Web scraping for job posting content,
+              served from the on-disk scrape cache when already fetched and
+              cut down to the posting itself (see cv_opt.tools.job_posting)
             - GPT-4o-mini: Advanced language understanding for analysis
 
         Returns:
@@ -172,8 +407,8 @@ class ResumeCrew:
         return Agent(
             config=self.agents_config["job_analyzer"],
             verbose=True,
-            tools=[ScrapeWebsiteTool()],
-            llm=LLM("gpt-4o-mini"),
+            tools=[self.scrape_tool],
+            llm=self._llm("job_analyzer"),
         )
 
     @agent
@@ -193,8 +428,9 @@ class ResumeCrew:
             - Industry trends and company growth trajectory assessment
 
         Tools:
-            - SerperDevTool: Web search for company intelligence
-            - PDF Knowledge Source: Candidate context for alignment
+            - CachedSerperDevTool: Web search for company intelligence, with
+              results cached per company across runs
+            - Resume Knowledge: Candidate context for alignment
             - GPT-4o-mini: Advanced reasoning for strategic insights
 
         Returns:
@@ -203,9 +439,9 @@ class ResumeCrew:
         return Agent(
             config=self.agents_config["company_researcher"],
             verbose=True,
-            tools=[SerperDevTool()],
-            llm=LLM("gpt-4o-mini"),
-            knowledge_sources=[self.resume_pdf],
+            tools=[self.search_tool],
+            llm=self._llm("company_researcher"),
+            knowledge=self._knowledge("company_researcher"),
         )
 
     @agent
@@ -225,7 +461,8 @@ class ResumeCrew:
             - Achievement-focused storytelling with quantified results
 
         Tools:
-            - PDF Knowledge Source: Real candidate information extraction
+            - Candidate Profile: Parsed resume in the task context (the resume
+              index only if the profile could not be parsed)
             - GPT-4o-mini: Advanced language generation for personalization
 
         Returns:
@@ -234,8 +471,8 @@ class ResumeCrew:
         return Agent(
             config=self.agents_config["cover_letter_generator"],
             verbose=True,
-            llm=LLM("gpt-4o-mini"),
-            knowledge_sources=[self.resume_pdf],
+            llm=self._llm("cover_letter_generator"),
+            knowledge=self._knowledge("cover_letter_generator"),
         )
 
     @agent
@@ -255,7 +492,8 @@ class ResumeCrew:
             - Professional formatting and presentation
 
         Tools:
-            - PDF Knowledge Source: Real candidate data extraction
+            - Candidate Profile: Parsed resume in the task context (the resume
+              index only if the profile could not be parsed)
             - GPT-4o-mini: Advanced content optimization and enhancement
 
         Returns:
@@ -264,8 +502,8 @@ class ResumeCrew:
         return Agent(
             config=self.agents_config["resume_writer"],
             verbose=True,
-            llm=LLM("gpt-4o-mini"),
-            knowledge_sources=[self.resume_pdf],
+            llm=self._llm("resume_writer"),
+            knowledge=self._knowledge("resume_writer"),
         )
 
     @agent
@@ -285,7 +523,8 @@ class ResumeCrew:
             - Comprehensive intelligence synthesis
 
         Tools:
-            - PDF Knowledge Source: Candidate context for personalization
+            - Candidate Profile: Parsed resume in the task context (the resume
+              index only if the profile could not be parsed)
             - GPT-4o-mini: Advanced reasoning for strategic insights
 
         Returns:
@@ -294,8 +533,8 @@ class ResumeCrew:
         return Agent(
             config=self.agents_config["report_generator"],
             verbose=True,
-            llm=LLM("gpt-4o-mini"),
-            knowledge_sources=[self.resume_pdf],
+            llm=self._llm("report_generator"),
+            knowledge=self._knowledge("report_generator"),
         )
 
     # ========================================
@@ -324,13 +563,24 @@ class ResumeCrew:
             - Structure: JobRequirements Pydantic model
             - Contains: ATS keywords, requirements, scoring, and analysis
 
+        Deterministic Scoring:
+            The numeric match_score fields are recomputed from the extracted
+            ATS keywords and the resume text by cv_opt.ats_matcher; the full
+            keyword match breakdown is written to output/ats_match.json.
+
+        Known Fields:
+            Fields stated by the posting's schema.org JobPosting (title,
+            location, salary, dates) are filled in before kickoff and merged
+            into the output instead of being generated by the LLM.
+
         Returns:
             Task: Configured job analysis task instance
         """
-        return Task(
-            config=self.tasks_config["analyze_job_task"],
-            output_file="output/job_analysis.json",
-            output_pydantic=JobRequirements,
+        return ProjectedContextTask(
+            config=self._task_config("analyze_job_task"),
+            output_file=self._output_file("job_analysis.json"),
+            output_pydantic=self.profile.model_for(JobRequirements),
+            callback=self._finish_job_analysis,
         )
 
     @task
@@ -353,14 +603,56 @@ class ResumeCrew:
             - Structure: ResumeOptimization Pydantic model
             - Contains: ATS scores, optimization suggestions, and improvements
 
+        Shared Format Analysis:
+            When the crew is created with a resume_format_task, its output is
+            appended to this task's context and reused for the format review.
+
+        Measured Layout:
+            The format compliance checklist and parsing warnings measured
+            from the resume PDF by cv_opt.pdf_layout replace the LLM's.
+
         Returns:
             Task: Configured resume optimization task instance
         """
-        return Task(
-            config=self.tasks_config["optimize_resume_task"],
-            output_file="output/resume_optimization.json",
-            output_pydantic=ResumeOptimization,
+        optimize_task = ProjectedContextTask(
+            config=self._task_config("optimize_resume_task"),
+            output_file=self._output_file("resume_optimization.json"),
+            output_pydantic=self.profile.model_for(ResumeOptimization),
+            callback=self._finish_resume_optimization,
         )
+        if self.resume_format_task is not None:
+            optimize_task.context = [*optimize_task.context, self.resume_format_task]
+        return optimize_task
+
+    @task
+    def analyze_resume_format_task(self) -> Task:
+        """
+        Create the job-independent resume format analysis task.
+
+        This task reviews only the resume itself (layout, fonts, sections,
+        parsing risks and content originality), so its result can be computed
+        once and shared by every job in a batch run.
+
+        Output:
+            - File: output/resume_format_analysis.json
+            - Structure: ATSOptimization Pydantic model
+
+        Known Fields:
+            The format compliance checklist and parsing warnings measured
+            from the resume PDF are merged into the output instead of being
+            generated by the LLM.
+
+        Returns:
+            Task: Configured resume format analysis task instance
+        """
+        format_task = ProjectedContextTask(
+            config=self._task_config("analyze_resume_format_task"),
+            output_file=self._output_file("resume_format_analysis.json"),
+            output_pydantic=self.profile.model_for(ATSOptimization),
+            callback=self._finish_format_analysis,
+        )
+        format_task.set_known_fields(self._layout_fields())
+        return format_task
 
     @task
     def research_company_task(self) -> Task:
@@ -377,6 +669,11 @@ class ResumeCrew:
             4. Market positioning and competitive analysis
             5. Strategic insights and interview intelligence
 
+        Split Mode:
+            With split_research enabled, the task uses the
+            align_company_research_task configuration and builds on the notes
+            from gather_company_intel_task instead of searching from scratch.
+
         Output:
             - File: output/company_research.json
             - Structure: CompanyResearch Pydantic model
@@ -385,10 +682,36 @@ class ResumeCrew:
         Returns:
             Task: Configured company research task instance
         """
-        return Task(
-            config=self.tasks_config["research_company_task"],
-            output_file="output/company_research.json",
-            output_pydantic=CompanyResearch,
+        # In split mode the raw searching happens in gather_company_intel_task;
+        # this task only aligns the gathered intelligence to the candidate
+        config_name = (
+            "align_company_research_task"
+            if self.split_research
+            else "research_company_task"
+        )
+        return ProjectedContextTask(
+            config=self._task_config(config_name),
+            output_file=self._output_file("company_research.json"),
+            output_pydantic=self.profile.model_for(CompanyResearch),
+        )
+
+    @task
+    def gather_company_intel_task(self) -> Task:
+        """
+        Create the raw company intelligence gathering task (split mode only).
+
+        This task collects sourced company facts through web search using only
+        the company name. It has no context dependencies, so the parallel
+        scheduler starts it at kickoff alongside the job analysis.
+
+        Output:
+            - In-memory markdown research notes passed to research_company_task
+
+        Returns:
+            Task: Configured company intelligence gathering task instance
+        """
+        return ProjectedContextTask(
+            config=self._task_config("gather_company_intel_task")
         )
 
     @task
@@ -415,10 +738,10 @@ class ResumeCrew:
         Returns:
             Task: Configured cover letter analysis task instance
         """
-        return Task(
-            config=self.tasks_config["generate_cover_letter_task"],
-            output_file="output/cover_letter_analysis.json",
-            output_pydantic=CoverLetterGeneration,
+        return ProjectedContextTask(
+            config=self._task_config("generate_cover_letter_task"),
+            output_file=self._output_file("cover_letter_analysis.json"),
+            output_pydantic=self.profile.model_for(CoverLetterGeneration),
         )
 
     @task
@@ -444,9 +767,9 @@ class ResumeCrew:
         Returns:
             Task: Configured cover letter content generation task instance
         """
-        return Task(
-            config=self.tasks_config["generate_cover_letter_content_task"],
-            output_file="output/cover_letter.md",
+        return ProjectedContextTask(
+            config=self._task_config("generate_cover_letter_content_task"),
+            output_file=self._output_file("cover_letter.md"),
         )
 
     @task
@@ -472,9 +795,9 @@ class ResumeCrew:
         Returns:
             Task: Configured resume generation task instance
         """
-        return Task(
-            config=self.tasks_config["generate_resume_task"],
-            output_file="output/optimized_resume.md",
+        return ProjectedContextTask(
+            config=self._task_config("generate_resume_task"),
+            output_file=self._output_file("optimized_resume.md"),
         )
 
     @task
@@ -500,15 +823,220 @@ class ResumeCrew:
         Returns:
             Task: Configured final report generation task instance
         """
-        return Task(
-            config=self.tasks_config["generate_report_task"],
-            output_file="output/final_report.md",
+        return ProjectedContextTask(
+            config=self._task_config("generate_report_task"),
+            output_file=self._output_file("final_report.md"),
         )
 
     # ========================================
     # CREW ORCHESTRATION
     # ========================================
 
+    def _task_config(self, task_name: str) -> Dict[str, Any]:
+        """
+        Return a task's tasks.yaml configuration for the output profile, with
+        the rendered candidate profile and resume layout if the task declares
+        them. Once the layout is measured, the task's `measured_layout_step`
+        replaces the step of its description that it shares a heading with.
+        """
+        config = self.profile.task_config(task_name, self.tasks_config[task_name])
+        if config.get("candidate_profile"):
+            config = {**config, "profile_context": self.candidate_context}
+        if config.get("resume_layout"):
+            config = {**config, "layout_context": self.layout_context}
+        if self.layout_context and config.get("measured_layout_step"):
+            description = replace_step(
+                config["description"], config["measured_layout_step"]
+            )
+            config = {**config, "description": description}
+        return config
+
+    def _output_file(self, file_name: str) -> str:
+        """Return the path of an output file inside the crew's output directory."""
+        return f"{self.output_dir}/{file_name}"
+
+    @property
+    def resume_text(self) -> str:
+        """Extracted text of the resume PDF."""
+        return "\n".join(self.resume_pdf.content.values())
+
+    def _finish_job_analysis(self, output: TaskOutput) -> None:
+        """
+        Merge the fields known from the posting, then score the analysis.
+
+        Args:
+            output (TaskOutput): Output of analyze_job_task
+        """
+        self.analyze_job_task().merge_known_fields(output)
+        self._score_job_analysis(output)
+
+    def _score_job_analysis(self, output: TaskOutput) -> None:
+        """
+        Replace the LLM's numeric job match scores with deterministic ones.
+
+        Runs as the analyze_job_task callback, before the output file is
+        written and before downstream tasks read the output. Narrative
+        strengths and gaps from the job analyzer are kept when present.
+
+        Args:
+            output (TaskOutput): Output of analyze_job_task
+        """
+        requirements = output.pydantic
+        if requirements is None:
+            return
+        if base_model(type(requirements)) is not JobRequirements:
+            return
+        if not requirements.ats_keywords:
+            return
+
+        self.ats_match = match_keywords(requirements.ats_keywords, self.resume_text)
+        narrative = requirements.match_score
+        requirements.match_score = self.ats_match.match_score.model_copy(
+            update={
+                "strengths": narrative.strengths
+                or self.ats_match.match_score.strengths,
+                "gaps": narrative.gaps or self.ats_match.match_score.gaps,
+            }
+        )
+        output.raw = requirements.model_dump_json()
+        atomic_write_text(
+            self._output_file("ats_match.json"),
+            self.ats_match.model_dump_json(indent=2),
+        )
+
+    def _finish_format_analysis(self, output: TaskOutput) -> None:
+        """
+        Merge the layout diagnostics measured from the resume PDF.
+
+        Args:
+            output (TaskOutput): Output of analyze_resume_format_task
+        """
+        self.analyze_resume_format_task().merge_known_fields(output)
+
+    def _layout_fields(self) -> Dict[str, Any]:
+        """
+        Return the ATSOptimization fields measured from the resume PDF.
+
+        Returns:
+            Dict[str, Any]: format_compliance and parsing_warnings, or an
+                empty dictionary when the PDF could not be measured (an
+                encrypted PDF has no pages but still yields its warning)
+        """
+        layout = self.resume_layout
+        if layout is None or not (layout.pages or layout.encrypted):
+            return {}
+        return {
+            "format_compliance": dict(layout.format_compliance),
+            "parsing_warnings": list(layout.parsing_warnings),
+        }
+
+    def _finish_resume_optimization(self, output: TaskOutput) -> None:
+        """
+        Apply the keyword densities, then the measured layout diagnostics.
+
+        Args:
+            output (TaskOutput): Output of optimize_resume_task
+        """
+        self._apply_keyword_density(output)
+        self._apply_layout_diagnostics(output)
+
+    def _apply_layout_diagnostics(self, output: TaskOutput) -> None:
+        """
+        Replace the LLM's format checklist and parsing warnings with the ones
+        measured from the resume PDF.
+
+        Args:
+            output (TaskOutput): Output of optimize_resume_task
+        """
+        optimization = output.pydantic
+        fields = self._layout_fields()
+        if not fields or optimization is None:
+            return
+        if base_model(type(optimization)) is not ResumeOptimization:
+            return
+        ats_optimization = optimization.ats_optimization
+        ats_optimization.format_compliance = fields["format_compliance"]
+        ats_optimization.parsing_warnings = fields["parsing_warnings"]
+        output.raw = optimization.model_dump_json()
+
+    def _apply_keyword_density(self, output: TaskOutput) -> None:
+        """
+        Replace the LLM's keyword densities with the deterministic ones.
+
+        Args:
+            output (TaskOutput): Output of optimize_resume_task
+        """
+        optimization = output.pydantic
+        if self.ats_match is None or optimization is None:
+            return
+        if base_model(type(optimization)) is not ResumeOptimization:
+            return
+        optimization.ats_optimization.keyword_density = dict(
+            self.ats_match.keyword_density
+        )
+        output.raw = optimization.model_dump_json()
+
+    @before_kickoff
+    def bind_company(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Partition the search cache by the company of the current run.
+
+        Args:
+            inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+
+        Returns:
+            Dict[str, Any]: The unchanged inputs
+        """
+        self.search_tool.company_name = (inputs or {}).get("company_name")
+        return inputs
+
+    @before_kickoff
+    def prefill_job_posting(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill in the job analysis fields the posting's JSON-LD states.
+
+        The posting is fetched through the job analyzer's scrape tool, so the
+        agent's own fetch is a cache hit. Title, location, compensation and
+        dates of a schema.org JobPosting are removed from the output model
+        the LLM generates and merged into the analysis afterwards. Pages
+        without a JobPosting, or that cannot be fetched, leave the task
+        unchanged.
+
+        Args:
+            inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+
+        Returns:
+            Dict[str, Any]: The unchanged inputs
+        """
+        job_url = (inputs or {}).get("job_url")
+        fields: Dict[str, Any] = {}
+        if job_url:
+            try:
+                fields = self.scrape_tool.posting_fields(job_url)
+            except requests.RequestException:
+                fields = {}
+        self.analyze_job_task().set_known_fields(fields)
+        return inputs
+
+    def workflow_tasks(self) -> List[Task]:
+        """
+        Return the tasks of the configured workflow in tasks.yaml order.
+
+        Auxiliary entries (see `auxiliary_tasks`) are never part of the
+        workflow, and gather_company_intel_task is only included in split
+        research mode.
+
+        Returns:
+            List[Task]: Memoized Task instances in execution order
+        """
+        task_names = [
+            task_name
+            for task_name in self.tasks_config
+            if task_name not in self.auxiliary_tasks
+            and (self.split_research or task_name != "gather_company_intel_task")
+        ]
+        return [getattr(self, task_name)() for task_name in task_names]
+
     @crew
     def crew(self) -> Crew:
         """
@@ -526,10 +1054,14 @@ class ResumeCrew:
             6. Resume Generation → Apply optimizations with real data
             7. Report Generation → Synthesize insights into executive report
 
+            In split research mode gather_company_intel_task runs before the
+            company research, making 8 tasks; the auxiliary tasks (see
+            `auxiliary_tasks`) are never part of the crew.
+
         Configuration:
             - Process: Sequential (each task builds on previous results)
             - Verbose: Enabled for detailed execution logging
-            - Knowledge Sources: Shared PDF resume across all agents
+            - Knowledge: Shared resume index queried by the agents
             - Context Passing: Automatic between sequential tasks
 
         Returns:
@@ -542,8 +1074,186 @@ class ResumeCrew:
         """
         return Crew(
             agents=self.agents,  # All 6 specialized agents
-            tasks=self.tasks,  # All 7 sequential tasks
+            tasks=self.workflow_tasks(),  # Workflow tasks, auxiliary ones excluded
             verbose=True,  # Enable detailed logging
             process=Process.sequential,  # Sequential task execution
-            knowledge_sources=[self.resume_pdf],  # Shared PDF knowledge
         )
+
+    def kickoff_parallel(
+        self,
+        inputs: Dict[str, Any],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> ScheduleReport:
+        """
+        Run the workflow with the dependency-aware parallel scheduler.
+
+        Instead of Process.sequential, tasks are scheduled from the `context`
+        declarations in config/tasks.yaml. Independent tasks (for example
+        generate_cover_letter_content_task and generate_resume_task) run at
+        the same time, bounded by `max_concurrency`. Output files are the same
+        as for the sequential crew.
+
+        Args:
+            inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+            max_concurrency (int): Maximum number of tasks running at once
+
+        Returns:
+            ScheduleReport: Per-task timings, critical path and time saved
+
+        Example:
+            crew = ResumeCrew()
+            report = crew.kickoff_parallel(inputs, max_concurrency=2)
+            print(report.summary())
+        """
+        self.bind_company(inputs)
+        self.prefill_job_posting(inputs)
+        scheduler = ParallelScheduler(max_concurrency=max_concurrency)
+        return scheduler.run(self.workflow_tasks(), inputs=inputs)
+
+    def kickoff_incremental(
+        self,
+        inputs: Dict[str, Any],
+        from_task: Optional[str] = None,
+        only: Optional[List[str]] = None,
+        max_concurrency: int = 1,
+    ) -> ScheduleReport:
+        """
+        Run the workflow, re-executing only tasks whose inputs changed.
+
+        Every task output is memoized under a hash of its rendered prompt,
+        agent, model, context outputs and the resume (see cv_opt.incremental).
+        Unchanged tasks are restored from the memo and rewrite their output
+        files; the rest execute and are memoized for the next run.
+
+        Args:
+            inputs (Dict[str, Any]): Kickoff inputs (job_url, company_name)
+            from_task (str, optional): Force this task and everything
+                downstream of it to re-execute
+            only (List[str], optional): Re-execute just these tasks, reusing
+                stored outputs of their upstream tasks
+            max_concurrency (int): Maximum number of tasks running at once;
+                1 keeps the sequential execution order
+
+        Returns:
+            ScheduleReport: Timings of the run; `reused` lists restored tasks
+
+        Example:
+            crew = ResumeCrew()
+            report = crew.kickoff_incremental(inputs, only=["generate_report_task"])
+            print(report.reused)
+        """
+        self.bind_company(inputs)
+        self.prefill_job_posting(inputs)
+        runner = IncrementalRunner(
+            salt={
+                "resume": self.resume_pdf.cache_key,
+                "candidate_profile": sha256_text(self.candidate_context),
+                "resume_layout": sha256_text(self.layout_context or ""),
+            },
+            max_concurrency=max_concurrency,
+        )
+        return runner.run(
+            self.workflow_tasks(), inputs=inputs, from_task=from_task, only=only
+        )
+
+    def kickoff_resume(
+        self, checkpoints: RunCheckpoints, max_concurrency: int = 1
+    ) -> ScheduleReport:
+        """
+        Resume an interrupted run from its first incomplete task.
+
+        The run's original inputs are used again. Tasks with a checkpoint are
+        restored and rewrite their output files; the remaining tasks execute.
+        The crew must be created with the run directory as `output_dir`.
+
+        Args:
+            checkpoints (RunCheckpoints): Store of the run being resumed
+            max_concurrency (int): Maximum number of tasks running at once;
+                1 keeps the sequential execution order
+
+        Returns:
+            ScheduleReport: Timings of the run; `reused` lists restored tasks
+
+        Example:
+            checkpoints = RunCheckpoints.load(run_id)
+            crew = ResumeCrew(output_dir=str(checkpoints.run_dir))
+            with crew.checkpointer(checkpoints):
+                crew.kickoff_resume(checkpoints)
+        """
+        self.bind_company(checkpoints.manifest.inputs)
+        self.prefill_job_posting(checkpoints.manifest.inputs)
+        return resume_tasks(
+            self.workflow_tasks(), checkpoints, max_concurrency=max_concurrency
+        )
+
+    def checkpointer(self, checkpoints: RunCheckpoints) -> RunCheckpointer:
+        """
+        Create a checkpointer writing each completed task to a run's store.
+
+        Returns:
+            RunCheckpointer: Checkpointer covering `workflow_tasks()`
+        """
+        return RunCheckpointer(self.workflow_tasks(), checkpoints)
+
+    def tracer(self) -> RunTracer:
+        """
+        Create a tracer for the workflow tasks of this crew.
+
+        The tracer writes run_trace.json and run_trace.trace.json (Chrome
+        trace format) to the crew's output directory when its context exits.
+
+        Returns:
+            RunTracer: Tracer covering `workflow_tasks()`
+
+        Example:
+            crew = ResumeCrew()
+            with crew.tracer() as tracer:
+                crew.crew().kickoff(inputs=inputs)
+            print(tracer.trace.summary())
+        """
+        return RunTracer(self.workflow_tasks(), output_dir=self.output_dir)
+
+    def embedding_stats(self) -> Dict[str, int]:
+        """
+        Return the embeddings computed by the shared resume index.
+
+        The counters cover every crew in the process that shares the index,
+        so a batch of any size reports the same chunk embedding count as a
+        single run.
+
+        Returns:
+            Dict[str, int]: Chunk and query embedding counts
+        """
+        return dict(self.resume_knowledge.storage.stats)
+
+    def llm_cache_stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the LLM response cache.
+
+        The cache is shared by every crew in the process, so the counters
+        cover all of them.
+
+        Returns:
+            Dict[str, int]: Hits, misses, stores, evictions and bypassed
+                calls; empty if the crew does not use the cache
+        """
+        return dict(get_llm_cache().stats) if self.llm_cache else {}
+
+    def scrape_stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the scrape cache.
+
+        page_tokens and posting_tokens are the estimated tokens of the full
+        career pages and of the job postings extracted from them that were
+        handed to the Job Analyzer. The cache is shared by every crew in the
+        process, so the counters cover all of them.
+
+        Returns:
+            Dict[str, int]: Hits, misses, revalidations, evictions and token
+                counters
+        """
+        return dict(get_scrape_cache().stats)
+
+
+# Reuse parsed agents.yaml/tasks.yaml across crew instances
+ResumeCrew.load_yaml = staticmethod(load_config_yaml)
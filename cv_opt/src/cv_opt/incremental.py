@@ -0,0 +1,511 @@
+"""
+Jobfull Resume Analyzer - Incremental Execution Module
+
+This module memoizes task outputs by the content of everything that shapes
+them, so that re-running the workflow only executes the tasks whose inputs
+actually changed. Tweaking generate_report_task in tasks.yaml re-runs the
+report only; job scraping, research and the other analyses are restored.
+
+Memo Key:
+    The SHA-256 of:
+    - the rendered task description and expected output
+    - the output model schema (output_pydantic)
+    - the agent's role, goal, backstory and tool names
+    - the model routed to the task (see cv_opt.routing)
+    - the raw outputs of the task's context tasks
+    - the task's context_fields projection, if any (see cv_opt.context)
+    - a run-level salt (the resume's content hash)
+
+    Tool results cannot be known before a task runs, so each memo entry also
+    records the hash of every tool result the task saw. A hit is only served
+    if the tools still return the same results; the cached scrape and search
+    tools answer these checks from their own caches in the common case.
+
+Cache Layout (.cache/tasks/):
+    <key>.json      # TaskMemoEntry: output, agent and recorded tool calls
+
+Selection:
+    - default: every task is restored from the memo when its key matches
+    - from_task: the task and everything downstream of it re-execute; other
+      tasks are restored from the memo, or from their existing output file
+    - only: just the selected tasks re-execute; their upstream tasks must be
+      restorable from the memo or an output file, and all other tasks are
+      skipped
+
+Example:
+    from cv_opt.incremental import IncrementalRunner
+
+    runner = IncrementalRunner(salt={"resume": crew.resume_pdf.cache_key})
+    report = runner.run(crew.workflow_tasks(), inputs)
+    print(report.reused)  # ["analyze_job_task", "optimize_resume_task", ...]
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from crewai import Task
+from crewai.tasks.output_format import OutputFormat
+from crewai.tasks.task_output import TaskOutput
+from crewai.utilities.events import ToolUsageFinishedEvent, crewai_event_bus
+from pydantic import BaseModel, Field
+
+from .cache import atomic_write_text, cache_dir, sha256_text, stable_hash
+from .routing import routed_model
+from .scheduler import (
+    ParallelScheduler,
+    ScheduleReport,
+    build_task_graph,
+    execute_single_task,
+    topological_order,
+)
+
+# ========================================
+# TASK MEMO
+# ========================================
+
+
+class ToolCallRecord(BaseModel):
+    """
+    A tool call made while a memoized task executed.
+
+    Attributes:
+        tool (str): Tool name
+        args (Dict[str, Any]): Arguments the tool was called with
+        result_hash (str): SHA-256 of the tool result
+    """
+
+    tool: str = Field(description="Tool name")
+    args: Dict[str, Any] = Field(description="Tool arguments", default_factory=dict)
+    result_hash: str = Field(description="SHA-256 of the tool result")
+
+
+class TaskMemoEntry(BaseModel):
+    """
+    Stored output of one task execution.
+
+    Attributes:
+        task (str): Task name from tasks.yaml
+        agent (str): Role of the agent that produced the output
+        raw (str): Raw task output
+        pydantic (Dict[str, Any], optional): Structured output, if any
+        tool_calls (List[ToolCallRecord]): Tool calls made by the task
+        created_at (float): UNIX time the output was produced
+    """
+
+    task: str = Field(description="Task name from tasks.yaml")
+    agent: str = Field(description="Role of the producing agent", default="")
+    raw: str = Field(description="Raw task output")
+    pydantic: Optional[Dict[str, Any]] = Field(
+        description="Structured output, if any", default=None
+    )
+    tool_calls: List[ToolCallRecord] = Field(
+        description="Tool calls made by the task", default_factory=list
+    )
+    created_at: float = Field(description="UNIX time the output was produced")
+
+
+class TaskMemo:
+    """
+    Disk-backed store of task outputs keyed by task_memo_key().
+
+    Attributes:
+        directory (Path): Directory holding one JSON file per key
+        stats (Dict[str, int]): Counters for hits, misses and stores
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0}
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def load(self, key: str) -> Optional[TaskMemoEntry]:
+        """Return the entry stored for a key, if any."""
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            return TaskMemoEntry.model_validate_json(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, entry: TaskMemoEntry) -> None:
+        """Store the entry for a key, replacing any previous one."""
+        atomic_write_text(self._path(key), entry.model_dump_json())
+        self.stats["stores"] += 1
+
+
+_memos: Dict[Path, TaskMemo] = {}
+_memos_lock = threading.Lock()
+
+
+def get_task_memo(directory: Optional[str] = None) -> TaskMemo:
+    """
+    Return the process-wide TaskMemo for a directory.
+
+    Args:
+        directory (str, optional): Memo directory; defaults to .cache/tasks
+
+    Returns:
+        TaskMemo: Shared memo instance
+    """
+    path = Path(directory) if directory else cache_dir("tasks")
+    with _memos_lock:
+        if path not in _memos:
+            _memos[path] = TaskMemo(path)
+        return _memos[path]
+
+
+# ========================================
+# KEYS AND RESTORATION
+# ========================================
+
+
+def task_memo_key(task: Task, salt: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Compute the memo key of a task whose inputs are already interpolated.
+
+    Args:
+        task (Task): Task with its agent assigned; all context tasks must
+            have an output
+        salt (Dict[str, Any], optional): Run-level values every output
+            depends on, e.g. the resume's content hash
+
+    Returns:
+        str: Hex digest identifying the task's inputs
+    """
+    agent = task.agent
+    context = task.context if isinstance(task.context, list) else []
+    return stable_hash(
+        {
+            "task": task.name,
+            "description": task.description,
+            "expected_output": task.expected_output,
+            "output_schema": (
+                task.output_pydantic.model_json_schema()
+                if task.output_pydantic
+                else None
+            ),
+            "agent": {
+                "role": agent.role,
+                "goal": agent.goal,
+                "backstory": agent.backstory,
+                "tools": sorted(tool.name for tool in agent.tools or []),
+            },
+            "model": routed_model(agent.llm, task.name),
+            "context": [
+                sha256_text(context_task.output.raw) for context_task in context
+            ],
+            "salt": salt or {},
+            # Only present for projected contexts, so other keys stay valid
+            **(
+                {"context_fields": task.context_fields}
+                if getattr(task, "context_fields", None)
+                else {}
+            ),
+        }
+    )
+
+
+def memo_entry(task: Task, tool_calls: Sequence[ToolCallRecord] = ()) -> TaskMemoEntry:
+    """Build a memo entry from an executed task's output."""
+    output = task.output
+    return TaskMemoEntry(
+        task=task.name,
+        agent=output.agent,
+        raw=output.raw,
+        pydantic=output.pydantic.model_dump() if output.pydantic else None,
+        tool_calls=list(tool_calls),
+        created_at=time.time(),
+    )
+
+
+def load_output_file(task: Task) -> Optional[TaskMemoEntry]:
+    """
+    Build a memo entry from a task's existing output file, if present.
+
+    Args:
+        task (Task): Task whose `output_file` is read
+
+    Returns:
+        TaskMemoEntry: Entry for the file, or None if it is missing or does
+            not validate against the task's output model
+    """
+    path = Path(task.output_file) if task.output_file else None
+    if path is None or not path.exists():
+        return None
+    raw = path.read_text(encoding="utf-8")
+    pydantic = None
+    if task.output_pydantic:
+        try:
+            pydantic = task.output_pydantic.model_validate_json(raw).model_dump()
+        except ValueError:
+            return None
+    return TaskMemoEntry(
+        task=task.name,
+        agent=task.agent.role if task.agent else "",
+        raw=raw,
+        pydantic=pydantic,
+        created_at=path.stat().st_mtime,
+    )
+
+
+def restore_task_output(task: Task, entry: TaskMemoEntry) -> TaskOutput:
+    """
+    Install a stored output on a task as if the task had just executed.
+
+    The task's callback runs on the restored output (callbacks of this crew
+    are deterministic post-processing) and the output file is rewritten, so
+    downstream tasks and readers of the output directory see the same state
+    as after a real execution.
+
+    Args:
+        task (Task): Task to restore, with inputs already interpolated
+        entry (TaskMemoEntry): Stored output
+
+    Returns:
+        TaskOutput: The restored output, also set as `task.output`
+    """
+    pydantic = (
+        task.output_pydantic.model_validate(entry.pydantic)
+        if task.output_pydantic and entry.pydantic is not None
+        else None
+    )
+    output = TaskOutput(
+        name=task.name,
+        description=task.description,
+        expected_output=task.expected_output,
+        raw=entry.raw,
+        pydantic=pydantic,
+        agent=entry.agent,
+        output_format=OutputFormat.PYDANTIC if pydantic else OutputFormat.RAW,
+    )
+    task.output = output
+    if task.callback:
+        task.callback(output)
+    if task.output_file:
+        atomic_write_text(
+            task.output_file,
+            output.pydantic.model_dump_json() if output.pydantic else output.raw,
+        )
+    return output
+
+
+def _downstream(graph: Dict[str, List[str]], names: Set[str]) -> Set[str]:
+    """Names of the tasks that depend, directly or not, on `names`."""
+    found: Set[str] = set()
+    for name in topological_order(graph):
+        if any(dep in names or dep in found for dep in graph[name]):
+            found.add(name)
+    return found
+
+
+def _upstream(graph: Dict[str, List[str]], names: Set[str]) -> Set[str]:
+    """Names of the tasks that `names` depend on, directly or not."""
+    found: Set[str] = set()
+    pending = [dep for name in names for dep in graph[name]]
+    while pending:
+        name = pending.pop()
+        if name not in found:
+            found.add(name)
+            pending.extend(graph[name])
+    return found
+
+
+# ========================================
+# INCREMENTAL RUNNER
+# ========================================
+
+# Runners currently recording tool calls
+_active_runners: List["IncrementalRunner"] = []
+_memo_handler_registered = False
+_memo_registration_lock = threading.Lock()
+
+
+def _record_tool_call(source: Any, event: ToolUsageFinishedEvent) -> None:
+    """Event handler forwarding finished tool calls to active runners."""
+    task = getattr(source, "task", None)
+    if task is None:
+        return
+    for runner in list(_active_runners):
+        runner.record_tool_call(task, event)
+
+
+def _register_memo_handler() -> None:
+    """Register the tool call recording handler on the event bus once."""
+    global _memo_handler_registered
+    with _memo_registration_lock:
+        if not _memo_handler_registered:
+            crewai_event_bus.register_handler(
+                ToolUsageFinishedEvent, _record_tool_call
+            )
+            _memo_handler_registered = True
+
+
+class IncrementalRunner:
+    """
+    Run workflow tasks, restoring every task whose memo key is unchanged.
+
+    Tasks are executed with the ParallelScheduler, so incremental runs can
+    also run independent tasks concurrently. Restored tasks complete almost
+    instantly and unblock their downstream tasks like executed ones.
+
+    Attributes:
+        memo (TaskMemo): Store of task outputs
+        salt (Dict[str, Any]): Run-level values included in every memo key
+        max_concurrency (int): Maximum number of tasks running at once
+        verify_tools (bool): Re-check recorded tool results before reuse
+        verbose (bool): Verbose flag for the single-task crews
+    """
+
+    def __init__(
+        self,
+        memo: Optional[TaskMemo] = None,
+        salt: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 1,
+        verify_tools: bool = True,
+        verbose: bool = True,
+    ) -> None:
+        self.memo = memo or get_task_memo()
+        self.salt = salt or {}
+        self.max_concurrency = max_concurrency
+        self.verify_tools = verify_tools
+        self.verbose = verbose
+        self._tool_calls: Dict[str, List[ToolCallRecord]] = {}
+        self._lock = threading.Lock()
+
+    def record_tool_call(self, task: Task, event: ToolUsageFinishedEvent) -> None:
+        """Record a finished tool call of a task executed by this runner."""
+        with self._lock:
+            calls = self._tool_calls.get(str(task.id))
+            if calls is None:
+                return
+            args = event.tool_args if isinstance(event.tool_args, dict) else {}
+            calls.append(
+                ToolCallRecord(
+                    tool=event.tool_name,
+                    args=args,
+                    result_hash=sha256_text(str(event.output)),
+                )
+            )
+
+    def _tools_unchanged(self, task: Task, entry: TaskMemoEntry) -> bool:
+        """Whether every recorded tool call still returns the same result."""
+        if not self.verify_tools:
+            return True
+        tools = {tool.name: tool for tool in task.agent.tools or []}
+        for call in entry.tool_calls:
+            tool = tools.get(call.tool)
+            if tool is None:
+                return False
+            try:
+                result = tool.run(**call.args)
+            except Exception:
+                return False
+            if sha256_text(str(result)) != call.result_hash:
+                return False
+        return True
+
+    def _lookup(self, task: Task, key: str) -> Optional[TaskMemoEntry]:
+        entry = self.memo.load(key)
+        if entry is not None and self._tools_unchanged(task, entry):
+            self.memo.stats["hits"] += 1
+            return entry
+        self.memo.stats["misses"] += 1
+        return None
+
+    def _execute(self, task: Task, inputs: Dict[str, Any], key: str) -> None:
+        with self._lock:
+            self._tool_calls[str(task.id)] = []
+        try:
+            execute_single_task(task, inputs, verbose=self.verbose)
+        finally:
+            with self._lock:
+                tool_calls = self._tool_calls.pop(str(task.id), [])
+        self.memo.store(key, memo_entry(task, tool_calls))
+
+    def run(
+        self,
+        tasks: Sequence[Task],
+        inputs: Dict[str, Any],
+        from_task: Optional[str] = None,
+        only: Optional[Sequence[str]] = None,
+    ) -> ScheduleReport:
+        """
+        Run the tasks, re-executing only what changed or was selected.
+
+        Args:
+            tasks (Sequence[Task]): Tasks in workflow order
+            inputs (Dict[str, Any]): Kickoff inputs
+            from_task (str, optional): Re-execute this task and everything
+                downstream of it
+            only (Sequence[str], optional): Re-execute just these tasks; all
+                tasks they do not depend on are skipped
+
+        Returns:
+            ScheduleReport: Timings of the run; `reused` lists the restored
+                tasks
+
+        Raises:
+            ValueError: If a selected task name is unknown, or an upstream
+                task of an `only` selection has no stored output
+        """
+        graph = build_task_graph(tasks)
+        selected = set(only or ([from_task] if from_task else []))
+        unknown = selected - set(graph)
+        if unknown:
+            raise ValueError(
+                f"Unknown task(s) {sorted(unknown)}; available: {list(graph)}"
+            )
+
+        if only:
+            forced = selected
+            pinned = _upstream(graph, selected) - forced
+            tasks = [task for task in tasks if task.name in forced | pinned]
+        elif from_task:
+            forced = selected | _downstream(graph, selected)
+            pinned = set(graph) - forced
+        else:
+            forced, pinned = set(), set()
+
+        reused: List[str] = []
+
+        def execute(task: Task, task_inputs: Dict[str, Any]) -> None:
+            task.interpolate_inputs_and_add_conversation_history(task_inputs)
+            task.agent.interpolate_inputs(task_inputs)
+            key = task_memo_key(task, self.salt)
+            if task.name not in forced:
+                entry = self._lookup(task, key)
+                if entry is None and task.name in pinned:
+                    entry = load_output_file(task)
+                    if entry is None and only:
+                        raise ValueError(
+                            f"No stored output for '{task.name}', which "
+                            f"{sorted(selected)} depend(s) on; run it first"
+                        )
+                if entry is not None:
+                    restore_task_output(task, entry)
+                    reused.append(task.name)
+                    return
+            self._execute(task, task_inputs, key)
+
+        _register_memo_handler()
+        _active_runners.append(self)
+        try:
+            scheduler = ParallelScheduler(
+                max_concurrency=self.max_concurrency, verbose=self.verbose
+            )
+            report = scheduler.run(tasks, inputs=inputs, execute_task=execute)
+        finally:
+            _active_runners.remove(self)
+
+        report.reused = [name for name in graph if name in reused]
+        return report
+
@@ -0,0 +1,464 @@
+"""
+Jobfull Resume Analyzer - Job Requirements Extractor Module
+
+This module extracts JobRequirements from the text of a job posting without
+any LLM call. Most of analyze_job_task's output is plain extraction: the job
+title, the bullet lists under "Responsibilities" or "Requirements", and the
+skills and tools named in them. A section parser and a skill lexicon cover
+that part deterministically in milliseconds. The numeric match scores are
+computed by cv_opt.ats_matcher afterwards, as for LLM answers.
+
+Sections:
+    Headings such as "What you'll be doing", "Requirements" or "Nice to have"
+    assign the bullets below them to responsibilities, requirements,
+    preferred qualifications or benefits. A paragraph after a section's
+    bullets closes the section. Without recognizable headings, every bullet
+    counts as a requirement.
+
+ATS Keywords:
+    Lexicon terms found in the posting become ATSKeywords. A keyword is
+    required when it appears in a requirements section. Its importance
+    grows with that and with how often the posting repeats it. "N+ years"
+    experience phrases and degree levels are added as well.
+
+Limits:
+    Narrative fields (strengths, gaps, industry trends, company values) stay
+    empty, and skills outside the lexicon are missed. The model routing
+    table therefore escalates to an LLM when the extraction comes back
+    without a job title or keywords (see cv_opt.routing).
+
+Example:
+    from cv_opt.job_extractor import extract_job_requirements
+
+    job = extract_job_requirements(page_text, job_url="https://...")
+    print(job.job_title, [k.keyword for k in job.ats_keywords])
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import ATSKeyword, JobMatchScore, JobRequirements
+
+# Lexicon of recognized skills: display form by category
+SKILL_LEXICON: Dict[str, Tuple[str, ...]] = {
+    "technical": (
+        "Python",
+        "Java",
+        "JavaScript",
+        "TypeScript",
+        "C++",
+        "C#",
+        "Rust",
+        "Scala",
+        "Kotlin",
+        "Swift",
+        "SQL",
+        "NoSQL",
+        "Machine Learning",
+        "Deep Learning",
+        "Computer Vision",
+        "Natural Language Processing",
+        "NLP",
+        "Large Language Models",
+        "Generative AI",
+        "Retrieval-Augmented Generation",
+        "Reinforcement Learning",
+        "Distributed Training",
+        "Distributed Systems",
+        "MLOps",
+        "DevOps",
+        "Data Science",
+        "Data Engineering",
+        "Data Analysis",
+        "Statistics",
+        "CUDA",
+        "GPU Programming",
+        "Computer Architecture",
+        "Mixed Precision",
+        "Inference Optimization",
+        "CI/CD",
+        "Microservices",
+        "REST APIs",
+        "GraphQL",
+        "ETL",
+        "Cloud Computing",
+        "Cybersecurity",
+        "Embedded Systems",
+        "Algorithms",
+        "Data Structures",
+        "Object-Oriented Programming",
+        "Unit Testing",
+        "A/B Testing",
+    ),
+    "tools": (
+        "PyTorch",
+        "TensorFlow",
+        "JAX",
+        "Keras",
+        "scikit-learn",
+        "Pandas",
+        "NumPy",
+        "TensorRT",
+        "Triton",
+        "ONNX",
+        "Hugging Face",
+        "LangChain",
+        "Kubernetes",
+        "Docker",
+        "Terraform",
+        "Ansible",
+        "AWS",
+        "GCP",
+        "Azure",
+        "Spark",
+        "Hadoop",
+        "Kafka",
+        "Airflow",
+        "Databricks",
+        "Snowflake",
+        "PostgreSQL",
+        "MySQL",
+        "MongoDB",
+        "Redis",
+        "Elasticsearch",
+        "Git",
+        "Linux",
+        "Jenkins",
+        "React",
+        "Node.js",
+        "Django",
+        "Flask",
+        "FastAPI",
+        "Tableau",
+        "Power BI",
+        "Excel",
+        "Jira",
+        "Salesforce",
+    ),
+    "soft": (
+        "Communication",
+        "Leadership",
+        "Collaboration",
+        "Teamwork",
+        "Problem Solving",
+        "Mentoring",
+        "Stakeholder Management",
+        "Project Management",
+        "Time Management",
+        "Critical Thinking",
+        "Presentation",
+        "Cross-Functional",
+        "Ownership",
+        "Adaptability",
+    ),
+}
+
+# Alternative spellings that count as a lexicon term
+TERM_VARIANTS: Dict[str, Tuple[str, ...]] = {
+    "Machine Learning": ("ml",),
+    "Large Language Models": ("llm", "llms", "large language model"),
+    "Retrieval-Augmented Generation": ("retrieval augmented generation", "rag"),
+    "Mentoring": ("mentor", "mentorship"),
+    "Problem Solving": ("problem-solving",),
+    "Communication": ("communicate", "communication skills"),
+    "Leadership": ("lead technical", "leading teams"),
+    "Collaboration": ("collaborate", "collaborative"),
+    "GCP": ("google cloud",),
+    "AWS": ("amazon web services",),
+    "Kubernetes": ("k8s",),
+    "Node.js": ("nodejs",),
+    "PostgreSQL": ("postgres",),
+    "Cross-Functional": ("cross functional",),
+}
+
+# Heading phrases of the posting sections, checked in order
+SECTION_HEADINGS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (
+        "intro",
+        ("about the role", "about the team", "about us", "about the company"),
+    ),
+    (
+        "preferred",
+        (
+            "nice to have",
+            "ways to stand out",
+            "preferred",
+            "bonus",
+            "pluses",
+            "stand out",
+        ),
+    ),
+    (
+        "requirements",
+        (
+            "requirements",
+            "qualifications",
+            "what we need",
+            "what you need",
+            "what you'll need",
+            "what you bring",
+            "who you are",
+            "must have",
+            "skills",
+        ),
+    ),
+    (
+        "responsibilities",
+        (
+            "responsibilities",
+            "what you'll be doing",
+            "what you will be doing",
+            "what you'll do",
+            "what you will do",
+            "your role",
+            "the role",
+            "duties",
+            "day to day",
+        ),
+    ),
+    ("benefits", ("benefits", "what we offer", "perks")),
+)
+
+# Words that mark a line as a job title
+_TITLE_WORDS = re.compile(
+    r"\b(engineer|developer|scientist|manager|analyst|designer|architect|"
+    r"specialist|consultant|director|lead|intern|administrator|coordinator|"
+    r"researcher|technician|officer|representative|associate|programmer)\b",
+    re.IGNORECASE,
+)
+_LEVEL_WORDS = ("intern", "junior", "senior", "staff", "principal", "lead", "head")
+_BULLET = re.compile(r"^\s*(?:[-*•·▪●]|\d+[.)])\s+")
+_YEARS = re.compile(r"(\d+)\s*\+?\s*(?:-\s*\d+\s*)?years?", re.IGNORECASE)
+_DEGREE = re.compile(
+    r"\b(bachelor'?s?|master'?s?|ph\.?d|doctorate|b\.?s\.?|m\.?s\.?|"
+    r"b\.?a\.?|mba|degree)\b",
+    re.IGNORECASE,
+)
+# Degree levels from the lowest; the first one named is the minimum required
+_DEGREE_LEVELS = (
+    ("Bachelor's Degree", re.compile(r"\b(bachelor'?s?|b\.?s\.?|b\.?a\.?)\b", re.I)),
+    ("Master's Degree", re.compile(r"\b(master'?s?|m\.?s\.?|mba)\b", re.I)),
+    ("PhD", re.compile(r"\b(ph\.?d|doctorate)\b", re.I)),
+)
+
+
+def _term_pattern(term: str) -> re.Pattern:
+    """Case-insensitive pattern matching a term as a whole word."""
+    return re.compile(
+        r"(?<![a-z0-9])" + re.escape(term.lower()) + r"(?![a-z0-9+#])"
+    )
+
+
+# Compiled patterns of every lexicon term and its variants
+_TERM_PATTERNS: List[Tuple[str, str, Tuple[re.Pattern, ...]]] = [
+    (
+        category,
+        term,
+        tuple(_term_pattern(form) for form in (term, *TERM_VARIANTS.get(term, ()))),
+    )
+    for category, terms in SKILL_LEXICON.items()
+    for term in terms
+]
+
+
+# ========================================
+# SECTION PARSING
+# ========================================
+
+
+def _heading_section(line: str) -> Optional[str]:
+    """Return the section a heading line opens, or None for other lines."""
+    text = line.strip().rstrip(":").lower()
+    if not text or _BULLET.match(line) or len(text.split()) > 7:
+        return None
+    for section, phrases in SECTION_HEADINGS:
+        if any(phrase in text for phrase in phrases):
+            return section
+    return None
+
+
+def split_sections(text: str) -> Dict[str, List[str]]:
+    """
+    Group the lines of a posting by section.
+
+    Args:
+        text (str): Job posting text
+
+    Returns:
+        Dict[str, List[str]]: Lines per section ("intro", "responsibilities",
+            "requirements", "preferred", "benefits", "other"); bullet
+            markers are stripped
+    """
+    sections: Dict[str, List[str]] = defaultdict(list)
+    current = "intro"
+    found_heading = False
+    in_bullets = False
+    for line in text.splitlines():
+        section = _heading_section(line)
+        if section is not None:
+            current = section
+            found_heading = True
+            in_bullets = False
+            continue
+        stripped = _BULLET.sub("", line).strip()
+        if not stripped:
+            continue
+        is_bullet = bool(_BULLET.match(line))
+        if in_bullets and not is_bullet:
+            # Closing paragraph of the posting, e.g. an EEO statement
+            current = "other"
+        in_bullets = is_bullet
+        sections[current].append(stripped)
+    if not found_heading:
+        # Without headings every bullet point is taken as a requirement
+        sections["requirements"] = [
+            _BULLET.sub("", line).strip() for line in text.splitlines()
+            if _BULLET.match(line)
+        ]
+    return dict(sections)
+
+
+def find_job_title(text: str, max_lines: int = 10) -> str:
+    """Return the first short line near the top that names a role."""
+    for line in text.splitlines()[:max_lines]:
+        line = line.strip().strip("#").strip()
+        if line and len(line.split()) <= 10 and _TITLE_WORDS.search(line):
+            return line.split(" - ")[0].split(" | ")[0].strip()
+    return ""
+
+
+# ========================================
+# EXTRACTION
+# ========================================
+
+
+def _matched_terms(text: str) -> List[Tuple[str, str, int]]:
+    """Return (category, term, frequency) of every lexicon term in a text."""
+    lowered = text.lower()
+    found = []
+    for category, term, patterns in _TERM_PATTERNS:
+        frequency = sum(len(pattern.findall(lowered)) for pattern in patterns)
+        if frequency:
+            found.append((category, term, frequency))
+    return found
+
+
+def _importance(required: bool, preferred: bool, frequency: int) -> int:
+    """Importance (1-5) of a keyword from where and how often it appears."""
+    base = 4 if required else 2 if preferred else 3
+    return min(5, base + (1 if frequency >= 2 else 0))
+
+
+def _lines_matching(lines: Sequence[str], pattern: re.Pattern) -> List[str]:
+    return [line for line in lines if pattern.search(line)]
+
+
+def extract_job_requirements(text: str, job_url: str = "") -> JobRequirements:
+    """
+    Extract the requirements of a job posting without an LLM.
+
+    Args:
+        text (str): Job posting text, e.g. the cleaned page of the job URL
+        job_url (str): URL of the posting, stored in the result
+
+    Returns:
+        JobRequirements: Extracted requirements and ATS keywords; match
+            scores are zero and narrative fields keep their defaults
+    """
+    sections = split_sections(text)
+    requirements = sections.get("requirements", [])
+    preferred = sections.get("preferred", [])
+    required_text = "\n".join(requirements)
+    preferred_text = "\n".join(preferred)
+
+    job_title = find_job_title(text)
+    lowered_title = job_title.lower()
+    job_level = next(
+        (level.title() for level in _LEVEL_WORDS if level in lowered_title.split()),
+        None,
+    )
+
+    skills: Dict[str, List[str]] = defaultdict(list)
+    keywords: List[ATSKeyword] = []
+    required_terms = {term for _, term, _ in _matched_terms(required_text)}
+    preferred_terms = {term for _, term, _ in _matched_terms(preferred_text)}
+    for category, term, frequency in _matched_terms(text):
+        required = term in required_terms
+        skills[category].append(term)
+        keywords.append(
+            ATSKeyword(
+                keyword=term,
+                importance=_importance(
+                    required, term in preferred_terms, frequency
+                ),
+                category=category,
+                required=required,
+                frequency=frequency,
+            )
+        )
+
+    experience = _lines_matching(requirements, re.compile(r"experience|years", re.I))
+    years = [int(match) for match in _YEARS.findall(required_text)]
+    if years:
+        keywords.append(
+            ATSKeyword(
+                keyword=f"{max(years)}+ years experience",
+                importance=5,
+                category="experience",
+                required=True,
+                frequency=len(years),
+            )
+        )
+    education = _lines_matching(requirements + preferred, _DEGREE)
+    for degree, pattern in _DEGREE_LEVELS:
+        if pattern.search(required_text):
+            keywords.append(
+                ATSKeyword(
+                    keyword=degree,
+                    importance=4,
+                    category="education",
+                    required=True,
+                    frequency=1,
+                )
+            )
+            break
+
+    location = next(
+        (
+            line.split(":", 1)[1].strip()
+            for line in sections.get("intro", [])
+            if line.lower().startswith("location:")
+        ),
+        None,
+    )
+    return JobRequirements(
+        job_title=job_title,
+        job_level=job_level,
+        job_url=job_url,
+        technical_skills=skills["technical"],
+        tools_and_technologies=skills["tools"],
+        soft_skills=skills["soft"],
+        experience_requirements=experience,
+        education_requirements=education,
+        key_responsibilities=sections.get("responsibilities", []),
+        nice_to_have=preferred,
+        benefits=sections.get("benefits", []),
+        certifications_required=_lines_matching(
+            requirements, re.compile(r"certif", re.I)
+        ),
+        location_requirements={"location": location} if location else {},
+        ats_keywords=keywords,
+        # Placeholder; ResumeCrew scores the keywords against the resume
+        match_score=JobMatchScore(
+            overall_match=0.0,
+            technical_skills_match=0.0,
+            soft_skills_match=0.0,
+            experience_match=0.0,
+            education_match=0.0,
+            industry_match=0.0,
+        ),
+    )
@@ -0,0 +1,409 @@
+"""
+Jobfull Resume Analyzer - Resume Knowledge Cache Module
+
+This module provides a persistent cache for the parsed and embedded resume PDF
+and a drop-in replacement for CrewAI's PDFKnowledgeSource that uses it. The
+stock source extracts the PDF text on every instantiation and re-embeds every
+chunk whenever a crew or agent sets up its knowledge, even though the resume
+rarely changes.
+
+Cache Layout (.cache/knowledge/):
+    <source key>/chunks.json                # Extracted text and chunks
+    <source key>/vectors-<embedder>.npy     # Chunk embeddings per embedder
+
+    The source key is the SHA-256 of the PDF bytes plus the chunker settings
+    (chunk_size, chunk_overlap); vector files are additionally keyed by the
+    embedding function's class and model. Changing the resume, the chunker
+    or the embedder therefore never serves stale data.
+
+Warm Runs:
+    - No PDF text extraction: content and chunks are read from chunks.json
+    - No re-embedding: stored vectors are upserted with the chunks, and
+      collections that already hold every chunk are left untouched
+
+Shared Resume Index:
+    Instead of giving every agent (and the crew) its own knowledge sources,
+    which creates one vector collection per agent role, all agents query a
+    single read-only in-process ResumeIndex built from the cached vectors.
+    Memory use and embedding calls stay constant as agents are added, and
+    the index reports how many embeddings each run computed.
+
+Example:
+    from cv_opt.knowledge import CachedPDFKnowledgeSource, get_resume_knowledge
+
+    resume_pdf = CachedPDFKnowledgeSource(file_paths="GhonemCV_2025.pdf")
+    knowledge = get_resume_knowledge(resume_pdf)
+    agent = Agent(config=..., knowledge=knowledge)
+    ...
+    print(knowledge.storage.stats)  # {"chunks_embedded": 0, "queries_embedded": 7}
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import io
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from crewai.knowledge.knowledge import Knowledge
+from crewai.knowledge.source.pdf_knowledge_source import PDFKnowledgeSource
+from crewai.knowledge.storage.base_knowledge_storage import BaseKnowledgeStorage
+from crewai.knowledge.storage.knowledge_storage import KnowledgeStorage
+from pydantic import PrivateAttr
+
+from .cache import atomic_write_text, cache_dir, file_sha256, sha256_text, stable_hash
+
+# ========================================
+# KNOWLEDGE CACHE
+# ========================================
+
+
+def embedder_signature(embedder: Any) -> Dict[str, Any]:
+    """
+    Describe an embedding function well enough to key its vectors.
+
+    Args:
+        embedder (Any): Chroma embedding function of a knowledge storage
+
+    Returns:
+        Dict[str, Any]: Class path plus model and dimension settings
+    """
+    embedder_type = type(embedder)
+    return {
+        "class": f"{embedder_type.__module__}.{embedder_type.__qualname__}",
+        "model": getattr(embedder, "_model_name", None)
+        or getattr(embedder, "model_name", None),
+        "dimensions": getattr(embedder, "_dimensions", None),
+    }
+
+
+class KnowledgeCache:
+    """
+    Disk cache of extracted resume text, chunks and chunk embeddings.
+
+    Use get_knowledge_cache() to obtain the shared instance for a directory.
+
+    Attributes:
+        directory (Path): Cache directory
+        stats (Dict[str, int]): Counters for parsed sources, sources loaded
+            from cache, chunks embedded and chunks whose vectors were loaded
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.stats: Dict[str, int] = {
+            "parsed": 0,
+            "loaded": 0,
+            "embedded": 0,
+            "vectors_loaded": 0,
+        }
+        self._lock = threading.Lock()
+
+    def _chunks_path(self, key: str) -> Path:
+        return self.directory / key / "chunks.json"
+
+    def _vectors_path(self, key: str, embedder: Any) -> Path:
+        signature = stable_hash(embedder_signature(embedder))[:16]
+        return self.directory / key / f"vectors-{signature}.npy"
+
+    def load_chunks(self, key: str) -> Optional[Tuple[Dict[str, str], List[str]]]:
+        """Return the cached (content by path, chunks) of a source key."""
+        path = self._chunks_path(key)
+        if not path.exists():
+            return None
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        self.stats["loaded"] += 1
+        return cached["content"], cached["chunks"]
+
+    def save_chunks(self, key: str, content: Dict[str, str], chunks: List[str]) -> None:
+        """Store the extracted content and chunks of a source key."""
+        self.stats["parsed"] += 1
+        atomic_write_text(
+            self._chunks_path(key), json.dumps({"content": content, "chunks": chunks})
+        )
+
+    def vectors(self, key: str, chunks: List[str], embedder: Any) -> np.ndarray:
+        """
+        Return the embeddings of a source's chunks, computing them only once.
+
+        Args:
+            key (str): Source key (PDF hash plus chunker settings)
+            chunks (List[str]): Chunks of the source, in order
+            embedder (Any): Chroma embedding function used by the storage
+
+        Returns:
+            np.ndarray: One embedding row per chunk
+        """
+        path = self._vectors_path(key, embedder)
+        with self._lock:
+            if path.exists():
+                vectors = np.load(path)
+                if len(vectors) == len(chunks):
+                    self.stats["vectors_loaded"] += len(chunks)
+                    return vectors
+
+            vectors = np.asarray(embedder(chunks), dtype=np.float32)
+            self.stats["embedded"] += len(chunks)
+            buffer = io.BytesIO()
+            np.save(buffer, vectors)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(buffer.getvalue())
+            temp_path.replace(path)
+            return vectors
+
+
+_caches: Dict[Path, KnowledgeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_knowledge_cache(directory: Optional[str] = None) -> KnowledgeCache:
+    """
+    Return the process-wide KnowledgeCache for a directory.
+
+    Args:
+        directory (str, optional): Cache directory; defaults to .cache/knowledge
+
+    Returns:
+        KnowledgeCache: Shared cache instance
+    """
+    path = Path(directory) if directory else cache_dir("knowledge")
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = KnowledgeCache(path)
+        return _caches[path]
+
+
+# ========================================
+# CACHED PDF KNOWLEDGE SOURCE
+# ========================================
+
+
+class CachedPDFKnowledgeSource(PDFKnowledgeSource):
+    """
+    Drop-in PDFKnowledgeSource backed by the persistent knowledge cache.
+
+    Content and chunks are loaded from the cache when the PDF bytes and
+    chunker settings match a previous run; otherwise the PDF is parsed once
+    and cached. Adding the source to a storage upserts precomputed vectors,
+    and adding it repeatedly (CrewAI sets up knowledge on every kickoff) does
+    not grow its chunk list or trigger new embedding calls.
+
+    Attributes:
+        cache_dir (str, optional): Cache directory (default .cache/knowledge)
+    """
+
+    cache_dir: Optional[str] = None
+
+    _cache_key: str = PrivateAttr(default="")
+    _pdf_hash: str = PrivateAttr(default="")
+
+    @property
+    def cache(self) -> KnowledgeCache:
+        """The KnowledgeCache used by this source."""
+        return get_knowledge_cache(self.cache_dir)
+
+    @property
+    def cache_key(self) -> str:
+        """Key of the PDF contents and chunker settings."""
+        return self._cache_key
+
+    @property
+    def pdf_hash(self) -> str:
+        """Key of the PDF contents alone, independent of the chunker."""
+        return self._pdf_hash
+
+    def load_content(self) -> Dict[Path, str]:
+        """Load PDF text from the cache, parsing the PDF only on a miss."""
+        paths = [self.convert_to_path(path) for path in self.safe_file_paths]
+        files = [file_sha256(path) for path in paths]
+        self._pdf_hash = stable_hash(files)
+        self._cache_key = stable_hash(
+            {
+                "files": files,
+                "chunk_size": self.chunk_size,
+                "chunk_overlap": self.chunk_overlap,
+            }
+        )
+
+        cached = self.cache.load_chunks(self._cache_key)
+        if cached is not None:
+            content, self.chunks = cached
+            return {Path(path): text for path, text in content.items()}
+
+        content = super().load_content()
+        self.chunks = [
+            chunk for text in content.values() for chunk in self._chunk_text(text)
+        ]
+        self.cache.save_chunks(
+            self._cache_key,
+            {str(path): text for path, text in content.items()},
+            self.chunks,
+        )
+        return content
+
+    def add(self) -> None:
+        """Save the cached chunks to the storage with precomputed embeddings."""
+        if not self.storage:
+            raise ValueError("No storage found to save documents.")
+        if not self.chunks:
+            return
+
+        collection = self.storage.collection
+        if collection is None:
+            raise Exception("Collection not initialized")
+
+        # Chunk IDs match KnowledgeStorage.save, so both paths share entries
+        unique = {sha256_text(chunk): index for index, chunk in enumerate(self.chunks)}
+        if len(collection.get(ids=list(unique), include=[])["ids"]) == len(unique):
+            return
+
+        vectors = self.cache.vectors(
+            self._cache_key, self.chunks, self.storage.embedder
+        )
+        collection.upsert(
+            ids=list(unique),
+            documents=[self.chunks[index] for index in unique.values()],
+            embeddings=[vectors[index].tolist() for index in unique.values()],
+        )
+
+
+# ========================================
+# SHARED RESUME INDEX
+# ========================================
+
+
+class ResumeIndex(BaseKnowledgeStorage):
+    """
+    Read-only in-process vector index over the chunks of a cached source.
+
+    The index holds the chunk vectors in one NumPy matrix and answers
+    searches with the same squared-L2 distance and score filtering as
+    CrewAI's Chroma-backed KnowledgeStorage. Vectors come from the
+    knowledge cache, so building the index embeds nothing on warm runs;
+    only search queries are embedded.
+
+    Attributes:
+        source (CachedPDFKnowledgeSource): Source whose chunks are indexed
+        embedder (Any): Chroma embedding function for chunks and queries
+        stats (Dict[str, int]): Embeddings computed for chunks and queries
+    """
+
+    def __init__(
+        self,
+        source: CachedPDFKnowledgeSource,
+        embedder: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.source = source
+        self.embedder = KnowledgeStorage(embedder=embedder).embedder
+        self.stats: Dict[str, int] = {"chunks_embedded": 0, "queries_embedded": 0}
+        self._vectors: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+    def initialize_knowledge_storage(self) -> None:
+        """Load (or compute once) the chunk vectors of the source."""
+        with self._lock:
+            if self._vectors is not None:
+                return
+            cache = self.source.cache
+            embedded_before = cache.stats["embedded"]
+            self._vectors = cache.vectors(
+                self.source.cache_key, self.source.chunks, self.embedder
+            )
+            self.stats["chunks_embedded"] += cache.stats["embedded"] - embedded_before
+
+    def search(
+        self,
+        query: List[str],
+        limit: int = 3,
+        filter: Optional[dict] = None,
+        score_threshold: float = 0.35,
+    ) -> List[Dict[str, Any]]:
+        """Return the chunks nearest to the first query, like KnowledgeStorage."""
+        self.initialize_knowledge_storage()
+        query_vector = np.asarray(self.embedder(query[:1])[0], dtype=np.float32)
+        with self._lock:
+            self.stats["queries_embedded"] += 1
+
+        distances = ((self._vectors - query_vector) ** 2).sum(axis=1)
+        results = []
+        for index in np.argsort(distances)[:limit]:
+            chunk = self.source.chunks[index]
+            result = {
+                "id": sha256_text(chunk),
+                "metadata": None,
+                "context": chunk,
+                "score": float(distances[index]),
+            }
+            if result["score"] >= score_threshold:
+                results.append(result)
+        return results
+
+    def save(
+        self,
+        documents: List[str],
+        metadata: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
+    ) -> None:
+        """Reject writes; the index only serves its source's chunks."""
+        raise TypeError("ResumeIndex is read-only")
+
+    def reset(self) -> None:
+        """Drop the loaded vectors; they are reloaded on the next search."""
+        with self._lock:
+            self._vectors = None
+
+    def reset_stats(self) -> None:
+        """Reset the embedding counters, e.g. at the start of a run."""
+        with self._lock:
+            self.stats = {"chunks_embedded": 0, "queries_embedded": 0}
+
+
+_resume_knowledge: Dict[Tuple[str, str], Knowledge] = {}
+_resume_knowledge_lock = threading.Lock()
+
+
+def get_resume_knowledge(
+    source: CachedPDFKnowledgeSource, embedder: Optional[Dict[str, Any]] = None
+) -> Knowledge:
+    """
+    Return the process-wide shared Knowledge for a cached resume source.
+
+    Every crew and agent built for the same resume (same cache key) and
+    embedder configuration receives the same Knowledge object, backed by a
+    single ResumeIndex.
+
+    Args:
+        source (CachedPDFKnowledgeSource): Parsed resume source
+        embedder (Dict[str, Any], optional): CrewAI embedder configuration;
+            defaults to CrewAI's default knowledge embedder
+
+    Returns:
+        Knowledge: Shared knowledge to pass to agents via `knowledge=`
+    """
+    key = (source.cache_key, stable_hash(embedder))
+    with _resume_knowledge_lock:
+        if key not in _resume_knowledge:
+            _resume_knowledge[key] = Knowledge(
+                collection_name="resume",
+                sources=[source],
+                storage=ResumeIndex(source, embedder=embedder),
+            )
+        return _resume_knowledge[key]
+
+
+def release_resume_knowledge(cache_key: str) -> None:
+    """
+    Drop the shared Knowledge of a resume for every embedder configuration.
+
+    Args:
+        cache_key (str): Cache key of the resume source
+    """
+    with _resume_knowledge_lock:
+        for key in [key for key in _resume_knowledge if key[0] == cache_key]:
+            del _resume_knowledge[key]
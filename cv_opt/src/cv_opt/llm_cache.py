@@ -0,0 +1,460 @@
+"""
+Jobfull Resume Analyzer - LLM Response Cache Module
+
+This module provides a persistent cache of LLM completions and a wrapper LLM
+that serves repeated prompts from it. Re-running the workflow for the same job
+and resume sends the agents exactly the same prompts (the scrape, search and
+knowledge caches make the tool results identical too), so a replay of an
+identical run is answered from disk without a single provider request.
+
+Cache Keys:
+    A completion is keyed on the model, the sampling parameters (temperature,
+    top_p, max tokens, stop words, seed, response format, ...), the message
+    list and the tool schemas. Equivalent requests share a key:
+        - message content is compared with normalized whitespace (trailing
+          spaces, blank line runs, repeated spaces and tabs)
+        - tool schemas are compared independently of their order
+        - streaming and non-streaming calls share entries
+
+Deterministic Reuse:
+    Only requests with temperature 0 are reused by default; sampled
+    completions are legitimately different on every call. Set
+    `reuse_sampled=True` to also replay sampled completions. ResumeCrew
+    uses temperature 0 for GPT-4o-mini when its LLM cache is enabled.
+
+Eviction:
+    Entries are evicted least recently used first once the cache exceeds
+    `max_entries` entries or `max_bytes` bytes of responses.
+
+Cache Layout (.cache/llm/):
+    responses.db    # SQLite: key, model, response, size, created/used times
+
+Example:
+    from crewai import LLM
+    from cv_opt.llm_cache import CachedLLM
+
+    llm = CachedLLM(LLM("gpt-4o-mini", temperature=0))
+    agent = Agent(config=..., llm=llm)
+    print(llm.cache.stats)  # {"hits": 12, "misses": 0, ...}
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+    LLMStreamChunkEvent,
+    crewai_event_bus,
+)
+from pydantic import BaseModel
+
+from .cache import cache_dir, stable_hash
+
+# Default size limits of the cache
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Request parameters that change the completion and are part of the key
+_KEY_PARAMS = (
+    "temperature",
+    "top_p",
+    "n",
+    "stop",
+    "max_tokens",
+    "max_completion_tokens",
+    "presence_penalty",
+    "frequency_penalty",
+    "logit_bias",
+    "seed",
+    "reasoning_effort",
+    "base_url",
+    "api_base",
+    "api_version",
+    "additional_params",
+)
+
+_HORIZONTAL_SPACE = re.compile(r"[ \t]+")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+# ========================================
+# CACHE KEYS
+# ========================================
+
+
+def normalize_content(text: str) -> str:
+    """
+    Normalize the whitespace of a message so equivalent prompts match.
+
+    Args:
+        text (str): Message content
+
+    Returns:
+        str: Content with repeated spaces and tabs collapsed, trailing
+            spaces removed and runs of blank lines reduced to one
+    """
+    lines = [_HORIZONTAL_SPACE.sub(" ", line).rstrip() for line in text.splitlines()]
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def normalize_messages(
+    messages: Union[str, List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Return a canonical form of an LLM message list.
+
+    Args:
+        messages (Union[str, List[Dict[str, Any]]]): Prompt string or chat
+            messages
+
+    Returns:
+        List[Dict[str, Any]]: Messages with normalized string content
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    return [
+        {
+            key: normalize_content(value)
+            if key == "content" and isinstance(value, str)
+            else value
+            for key, value in message.items()
+        }
+        for message in messages
+    ]
+
+
+def llm_cache_key(
+    llm: BaseLLM,
+    messages: Union[str, List[Dict[str, Any]]],
+    tools: Optional[List[dict]] = None,
+) -> str:
+    """
+    Compute the cache key of an LLM request.
+
+    Args:
+        llm (BaseLLM): LLM that would serve the request
+        messages (Union[str, List[Dict[str, Any]]]): Prompt
+        tools (List[dict], optional): Tool schemas offered to the model
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    response_format = getattr(llm, "response_format", None)
+    if isinstance(response_format, type) and issubclass(response_format, BaseModel):
+        response_format = response_format.model_json_schema()
+    return stable_hash(
+        {
+            "model": llm.model,
+            "params": {name: getattr(llm, name, None) for name in _KEY_PARAMS},
+            "response_format": response_format,
+            "messages": normalize_messages(messages),
+            "tools": sorted(tools or [], key=stable_hash),
+        }
+    )
+
+
+def is_deterministic(llm: BaseLLM) -> bool:
+    """Whether an LLM's sampling settings make its completions reproducible."""
+    return llm.temperature == 0 and (getattr(llm, "n", None) or 1) == 1
+
+
+# ========================================
+# RESPONSE CACHE
+# ========================================
+
+
+class LLMResponseCache:
+    """
+    SQLite-backed LRU cache of LLM completions.
+
+    Each operation opens its own connection, so one cache can be shared by
+    agents running in different threads. Use get_llm_cache() to obtain the
+    shared instance for a database path.
+
+    Attributes:
+        path (Path): SQLite database file
+        max_entries (int): Maximum number of cached completions
+        max_bytes (int): Maximum total size of the cached completions
+        stats (Dict[str, int]): Counters for hits, misses, stores, evictions
+            and bypassed (uncacheable) calls
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bypassed": 0,
+        }
+        self._lock = threading.Lock()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS llm_responses_used_at "
+                "ON llm_responses (used_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Return the completion cached for a key and mark it recently used."""
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT response FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE llm_responses SET used_at = ? WHERE key = ?",
+                    (time.time(), key),
+                )
+        with self._lock:
+            self.stats["hits" if row is not None else "misses"] += 1
+        return row[0] if row is not None else None
+
+    def count(self, name: str) -> None:
+        """Increment one of the stats counters."""
+        with self._lock:
+            self.stats[name] += 1
+
+    def store(self, key: str, model: str, response: str) -> None:
+        """Cache a completion, evicting least recently used entries if needed."""
+        now = time.time()
+        with self._lock, closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO llm_responses "
+                "(key, model, response, size, created_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now),
+            )
+            self.stats["stores"] += 1
+            self.stats["evictions"] += self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        """Delete least recently used entries until the limits hold."""
+        entries, size = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+        ).fetchone()
+        if entries <= self.max_entries and size <= self.max_bytes:
+            return 0
+        evicted = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM llm_responses ORDER BY used_at"
+        ):
+            if entries <= self.max_entries and size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            entries -= 1
+            size -= entry_size
+        connection.executemany("DELETE FROM llm_responses WHERE key = ?", evicted)
+        return len(evicted)
+
+    def usage(self) -> Dict[str, int]:
+        """Return the number of cached completions and their total size."""
+        with closing(self._connect()) as connection:
+            entries, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()
+        return {"entries": entries, "bytes": size}
+
+    def clear(self) -> int:
+        """Delete all cached completions; returns the row count."""
+        with self._lock, closing(self._connect()) as connection, connection:
+            cursor = connection.execute("DELETE FROM llm_responses")
+        return cursor.rowcount
+
+
+_caches: Dict[Path, LLMResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_llm_cache(path: Optional[str] = None) -> LLMResponseCache:
+    """
+    Return the process-wide LLMResponseCache for a database path.
+
+    Args:
+        path (str, optional): SQLite file; defaults to .cache/llm/responses.db
+
+    Returns:
+        LLMResponseCache: Shared cache instance
+    """
+    db_path = Path(path) if path else cache_dir("llm") / "responses.db"
+    with _caches_lock:
+        if db_path not in _caches:
+            _caches[db_path] = LLMResponseCache(db_path)
+        return _caches[db_path]
+
+
+# ========================================
+# CACHED LLM
+# ========================================
+
+
+class CachedLLMCallStartedEvent(LLMCallStartedEvent):
+    """LLMCallStartedEvent of a call answered from the LLM response cache."""
+
+    from_cache: bool = True
+
+
+class CachedLLMCallCompletedEvent(LLMCallCompletedEvent):
+    """LLMCallCompletedEvent of a call answered from the LLM response cache."""
+
+    from_cache: bool = True
+
+
+class CachedLLM(BaseLLM):
+    """
+    LLM wrapper that answers repeated requests from the LLM response cache.
+
+    Cache hits emit the usual LLM call events, as subclasses with
+    `from_cache=True`, so progress listeners and run tracing see them; a
+    streaming LLM also receives the cached completion as one stream chunk.
+    Requests that may execute functions (`available_functions`) always go
+    to the wrapped LLM, and non-text results are never stored.
+
+    Attributes:
+        llm (BaseLLM): Wrapped LLM serving cache misses
+        cache (LLMResponseCache): Completion store
+        reuse_sampled (bool): Also reuse completions of non-deterministic
+            requests (temperature above 0)
+
+    Example:
+        llm = CachedLLM(LLM("gpt-4o-mini", temperature=0))
+    """
+
+    def __init__(
+        self,
+        llm: BaseLLM,
+        cache: Optional[LLMResponseCache] = None,
+        reuse_sampled: bool = False,
+    ) -> None:
+        self.llm = llm
+        stop = llm.stop
+        super().__init__(model=llm.model, temperature=llm.temperature)
+        self.stop = stop
+        self.cache = cache or get_llm_cache()
+        self.reuse_sampled = reuse_sampled
+
+    # CrewAI sets the agent's stop words on its LLM; they belong to the
+    # wrapped LLM, which sends them to the provider
+    @property
+    def stop(self) -> List[str]:
+        return self.llm.stop
+
+    @stop.setter
+    def stop(self, value: List[str]) -> None:
+        self.llm.stop = value
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper lacks, e.g. `stream`
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def cacheable(self, available_functions: Optional[Dict[str, Any]]) -> bool:
+        """Whether a request may be served from and stored in the cache."""
+        return not available_functions and (
+            self.reuse_sampled or is_deterministic(self.llm)
+        )
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        def forward() -> Union[str, Any]:
+            return self.llm.call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+
+        if not self.cacheable(available_functions):
+            self.cache.count("bypassed")
+            return forward()
+
+        key = llm_cache_key(self.llm, messages, tools)
+        response = self.cache.lookup(key)
+        if response is None:
+            response = forward()
+            if isinstance(response, str) and response:
+                self.cache.store(key, self.model, response)
+            return response
+
+        crewai_event_bus.emit(
+            self,
+            CachedLLMCallStartedEvent(
+                messages=messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            ),
+        )
+        if getattr(self.llm, "stream", False):
+            crewai_event_bus.emit(
+                self,
+                LLMStreamChunkEvent(
+                    chunk=response, from_task=from_task, from_agent=from_agent
+                ),
+            )
+        crewai_event_bus.emit(
+            self,
+            CachedLLMCallCompletedEvent(
+                response=response,
+                call_type=LLMCallType.LLM_CALL,
+                from_task=from_task,
+                from_agent=from_agent,
+            ),
+        )
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return self.llm.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.llm.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.llm.get_context_window_size()
@@ -30,25 +30,89 @@ Technical Stack:
 Example Usage:
     python main.py
 
+    # Command line
+    cv_opt run --job-url https://company.com/careers/job-123 --company-name TechCorp
+    cv_opt run --only generate_report_task
+    cv_opt run --profile fast
+    cv_opt run --llm-cache
+    cv_opt run --routing hybrid --model generate_report_task=strong
+    cv_opt resume 20250101-120000-3fa2c1
+    cv_opt batch jobs.csv --max-concurrency 4 --requests-per-minute 60
+    cv_opt screen output/batch/*/job_analysis.json --resumes cvs/*.pdf --top-k 3
+    cv_opt benchmark --sizes 1 10 100 --latency 0.05
+    cv_opt serve --port 8000 --max-concurrency 4
+
     # Or programmatically:
     from cv_opt.main import run
     run()
 
+    # Or from asyncio, many runs at once:
+    from cv_opt.async_run import run_async
+    result = await run_async({"job_url": "...", "company_name": "TechCorp"})
+
 Author: Jobfull Team
 Version: 1.0.0
 License: MIT
 """
 
+import argparse
+import sys
 import warnings
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
+from cv_opt.batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_BATCH_OUTPUT_DIR,
+    BatchSummary,
+    run_batch,
+)
+from cv_opt.benchmark import (
+    DEFAULT_BENCHMARK_OUTPUT_DIR,
+    DEFAULT_BENCHMARK_SIZES,
+    DEFAULT_REGRESSION_TOLERANCE,
+    BenchmarkReport,
+    run_benchmark,
+)
+from cv_opt.checkpoint import (
+    DEFAULT_RUNS_DIR,
+    RunCheckpoints,
+    latest_incomplete_run,
+    new_run_id,
+)
 from cv_opt.crew import ResumeCrew
+from cv_opt.match_matrix import ScreeningReport
+from cv_opt.match_matrix import screen as screen_resumes
+from cv_opt.profiles import DEFAULT_PROFILE, load_profiles
+from cv_opt.progress import ProgressCallback, ProgressListener
+from cv_opt.routing import load_routing_table, parse_model_overrides
+from cv_opt.scheduler import DEFAULT_MAX_CONCURRENCY, ScheduleReport
 
 # Suppress specific warning that can occur during PDF processing
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
 
+# Default inputs for demonstration - NVIDIA GPU Silicon Architect position
+DEFAULT_INPUTS = {
+    "job_url": "https://www.google.com/about/careers/applications/jobs/results/105532306164196038-gpu-silicon-architect",
+    "company_name": "NVIDIA",
+}
 
-def run(custom_inputs: Dict[str, Any] = None) -> None:
+
+def run(
+    custom_inputs: Dict[str, Any] = None,
+    parallel: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    split_research: bool = False,
+    incremental: bool = False,
+    from_task: Optional[str] = None,
+    only: Optional[List[str]] = None,
+    run_id: Optional[str] = None,
+    on_event: Optional[ProgressCallback] = None,
+    profile: str = DEFAULT_PROFILE,
+    llm_cache: bool = False,
+    routing: Optional[str] = None,
+    model_overrides: Optional[Dict[str, str]] = None,
+) -> None:
     """
     Execute the complete resume optimization workflow.
 
@@ -63,23 +127,61 @@ def run(custom_inputs: Dict[str, Any] = None) -> None:
             - company_name (str): Name of the target company
 
             If None, uses default NVIDIA job posting for demonstration.
+        parallel (bool): Use the dependency-aware parallel scheduler instead
+            of sequential execution. Defaults to False.
+        max_concurrency (int): Maximum number of tasks running at once when
+            `parallel` is enabled.
+        split_research (bool): Gather raw company intelligence independently
+            of the job and resume analysis and only align it to the candidate
+            at the end. Takes company research off the critical path when
+            combined with `parallel`.
+        incremental (bool): Restore tasks whose rendered prompt, agent,
+            model and context outputs are unchanged since an earlier
+            incremental run instead of executing them again.
+        from_task (str, optional): Re-execute this task and everything
+            downstream of it; earlier tasks are restored. Implies
+            `incremental`.
+        only (List[str], optional): Re-execute just these tasks, restoring
+            their upstream tasks. Implies `incremental`.
+        run_id (str, optional): ID of the run; a new one is generated if
+            omitted. Outputs and checkpoints go to output/<run_id>/, so
+            concurrent runs never overwrite each other.
+        on_event (ProgressCallback, optional): Called with every progress
+            event while the workflow runs: task start/finish, streamed token
+            deltas, tool calls and each validated Pydantic task output (see
+            cv_opt.progress). Enables LLM streaming.
+        profile (str): Output profile: "full" (default), "standard" or
+            "fast". Smaller profiles ask the agents for fewer analysis fields
+            with shorter task descriptions (see cv_opt.profiles).
+        llm_cache (bool): Answer repeated LLM requests from the on-disk
+            response cache (see cv_opt.llm_cache); replaying an identical run
+            makes no provider calls. Runs GPT-4o-mini at temperature 0.
+        routing (str, optional): Model routing policy (see cv_opt.routing),
+            e.g. "hybrid"; defaults to the policy set in agents.yaml.
+        model_overrides (Dict[str, str], optional): Model by agent or task
+            name, overriding the routing policy.
 
     Returns:
         None: The function executes the workflow and saves outputs to files.
+            In parallel mode the ScheduleReport of the run is returned.
 
     Raises:
         ValueError: If required inputs are missing or invalid
         ConnectionError: If unable to access job URL or company information
         FileNotFoundError: If resume PDF is not found in the expected location
 
-    Output Files Generated:
-        - output/job_analysis.json: Job requirements and ATS keyword analysis
-        - output/resume_optimization.json: Resume optimization recommendations
-        - output/company_research.json: Company intelligence and research
-        - output/cover_letter_analysis.json: Cover letter generation analysis
-        - output/cover_letter.md: Personalized cover letter content
-        - output/optimized_resume.md: ATS-optimized resume content
-        - output/final_report.md: Executive intelligence report with visuals
+    Output Files Generated (in output/<run_id>/):
+        - run.json: Run manifest with inputs, status and completed tasks
+        - checkpoints/<task>.json: Output of each completed task
+        - job_analysis.json: Job requirements and ATS keyword analysis
+        - resume_optimization.json: Resume optimization recommendations
+        - company_research.json: Company intelligence and research
+        - cover_letter_analysis.json: Cover letter generation analysis
+        - cover_letter.md: Personalized cover letter content
+        - optimized_resume.md: ATS-optimized resume content
+        - final_report.md: Executive intelligence report with visuals
+        - run_trace.json: Per-task latency, token and cost metrics
+        - run_trace.trace.json: Chrome/Perfetto trace of the run
 
     Example:
         # Run with default inputs
@@ -91,15 +193,32 @@ def run(custom_inputs: Dict[str, Any] = None) -> None:
             "company_name": "TechCorp"
         }
         run(custom_inputs)
+
+        # Run independent tasks concurrently
+        run(custom_inputs, parallel=True, max_concurrency=2)
+
+        # Start company research at kickoff, alongside job analysis
+        run(custom_inputs, parallel=True, split_research=True)
+
+        # Regenerate only the report after editing its prompt in tasks.yaml
+        run(custom_inputs, only=["generate_report_task"])
+
+        # Generate only the analysis fields the deliverables need
+        run(custom_inputs, profile="fast")
+
+        # Replay an identical run from the LLM response cache
+        run(custom_inputs, llm_cache=True)
+
+        # Show the job analysis as soon as it is validated
+        run(custom_inputs, on_event=lambda event: print(event.type, event.task))
+
+        # Continue a run that failed part-way
+        resume("20250101-120000-3fa2c1")
     """
 
     # Use custom inputs if provided, otherwise use default demonstration inputs
     if custom_inputs is None:
-        # Default inputs for demonstration - NVIDIA GPU Silicon Architect position
-        inputs = {
-            "job_url": "https://www.google.com/about/careers/applications/jobs/results/105532306164196038-gpu-silicon-architect",
-            "company_name": "NVIDIA",
-        }
+        inputs = dict(DEFAULT_INPUTS)
         print("🚀 Running Jobfull Resume Analyzer with default inputs...")
         print(f"📄 Job URL: {inputs['job_url']}")
         print(f"🏢 Company: {inputs['company_name']}")
@@ -121,13 +240,88 @@ def run(custom_inputs: Dict[str, Any] = None) -> None:
     print("🤖 Initializing AI agents and starting workflow...")
     print("📊 This process typically takes 3-5 minutes to complete...")
 
+    # Every run writes to its own directory and checkpoints each task there
+    run_id = run_id or new_run_id()
+    checkpoints = RunCheckpoints.create(
+        run_id,
+        inputs,
+        options={
+            "split_research": split_research,
+            "parallel": parallel,
+            "max_concurrency": max_concurrency,
+            "profile": profile,
+            "llm_cache": llm_cache,
+            "routing": routing,
+            "model_overrides": model_overrides or {},
+        },
+    )
+    print(f"🆔 Run ID: {run_id}")
+
     try:
         # Initialize the ResumeCrew system and execute the workflow
-        crew_instance = ResumeCrew()
-        result = crew_instance.crew().kickoff(inputs=inputs)
+        crew_instance = ResumeCrew(
+            split_research=split_research,
+            output_dir=str(checkpoints.run_dir),
+            stream=on_event is not None,
+            profile=profile,
+            llm_cache=llm_cache,
+            routing=routing,
+            model_overrides=model_overrides,
+        )
+        incremental = incremental or bool(from_task or only)
+        progress = ProgressListener(
+            crew_instance.workflow_tasks(),
+            on_event or (lambda event: None),
+            run_id=run_id,
+        )
+        with crew_instance.tracer() as tracer, crew_instance.checkpointer(
+            checkpoints
+        ), progress:
+            if incremental:
+                result = crew_instance.kickoff_incremental(
+                    inputs,
+                    from_task=from_task,
+                    only=only,
+                    max_concurrency=max_concurrency if parallel else 1,
+                )
+            elif parallel:
+                result = crew_instance.kickoff_parallel(
+                    inputs, max_concurrency=max_concurrency
+                )
+            else:
+                result = crew_instance.crew().kickoff(inputs=inputs)
+        if parallel:
+            print(f"⚡ Parallel schedule: {result.summary()}")
+        if incremental:
+            executed = len(result.tasks) - len(result.reused)
+            print(
+                f"♻️ Reused {len(result.reused)} unchanged task(s), "
+                f"executed {executed}: "
+                + ", ".join(t.task for t in result.tasks if t.task not in result.reused)
+            )
 
+        embeddings = crew_instance.embedding_stats()
         print("✅ Resume optimization workflow completed successfully!")
-        print("📁 Check the 'output/' directory for generated files:")
+        print(
+            f"🧠 Embeddings computed: {embeddings['chunks_embedded']} resume chunks, "
+            f"{embeddings['queries_embedded']} knowledge queries"
+        )
+        llm_cache_stats = crew_instance.llm_cache_stats()
+        if llm_cache_stats:
+            print(
+                f"🗄️ LLM cache: {llm_cache_stats['hits']} hits, "
+                f"{llm_cache_stats['misses']} misses, "
+                f"{llm_cache_stats['evictions']} evictions"
+            )
+        scrape_stats = crew_instance.scrape_stats()
+        if scrape_stats["page_tokens"]:
+            reduction = 1 - scrape_stats["posting_tokens"] / scrape_stats["page_tokens"]
+            print(
+                f"🧹 Job posting extraction: {scrape_stats['page_tokens']} → "
+                f"{scrape_stats['posting_tokens']} tokens (-{reduction:.0%})"
+            )
+        print(f"⏱️ Run trace: {tracer.trace.summary()}")
+        print(f"📁 Check the '{checkpoints.run_dir}/' directory for generated files:")
         print("   - job_analysis.json (ATS keyword analysis)")
         print("   - resume_optimization.json (optimization recommendations)")
         print("   - company_research.json (company intelligence)")
@@ -135,15 +329,606 @@ def run(custom_inputs: Dict[str, Any] = None) -> None:
         print("   - cover_letter.md (personalized cover letter)")
         print("   - optimized_resume.md (ATS-optimized resume)")
         print("   - final_report.md (executive intelligence report)")
+        print("   - run_trace.json (per-task latency, tokens and cost)")
+        print("   - run_trace.trace.json (open in https://ui.perfetto.dev)")
 
         return result
 
     except Exception as e:
         print(f"❌ Error during workflow execution: {str(e)}")
         print("🔧 Please check your inputs and try again.")
+        print(f"💾 Completed tasks are checkpointed: cv_opt resume {run_id}")
         raise
 
 
+def resume(
+    run_id: Optional[str] = None, runs_dir: str = DEFAULT_RUNS_DIR
+) -> ScheduleReport:
+    """
+    Resume an interrupted run from its first incomplete task.
+
+    Completed tasks are restored from the run's checkpoints, so only the
+    remaining tasks make LLM calls. The run's original inputs and execution
+    options are reused.
+
+    Args:
+        run_id (str, optional): Run to resume; defaults to the most recently
+            started run that did not complete
+        runs_dir (str): Root directory of all runs
+
+    Returns:
+        ScheduleReport: Timings of the run; `reused` lists restored tasks
+
+    Raises:
+        FileNotFoundError: If the run does not exist or no run is incomplete
+
+    Example:
+        resume()                           # latest incomplete run
+        resume("20250101-120000-3fa2c1")
+    """
+    run_id = run_id or latest_incomplete_run(runs_dir)
+    if run_id is None:
+        raise FileNotFoundError(f"No incomplete run in {runs_dir}")
+    checkpoints = RunCheckpoints.load(run_id, runs_dir)
+    manifest = checkpoints.manifest
+    options = manifest.options
+    print(f"🔁 Resuming run {run_id} ({manifest.status})")
+    print(f"✔️ Checkpointed: {', '.join(manifest.completed) or 'none'}")
+
+    crew_instance = ResumeCrew(
+        split_research=options.get("split_research", False),
+        output_dir=str(checkpoints.run_dir),
+        profile=options.get("profile", DEFAULT_PROFILE),
+        llm_cache=options.get("llm_cache", False),
+        routing=options.get("routing"),
+        model_overrides=options.get("model_overrides"),
+    )
+    max_concurrency = (
+        options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        if options.get("parallel")
+        else 1
+    )
+    with crew_instance.tracer() as tracer, crew_instance.checkpointer(checkpoints):
+        report = crew_instance.kickoff_resume(
+            checkpoints, max_concurrency=max_concurrency
+        )
+    executed = [task.task for task in report.tasks if task.task not in report.reused]
+    print(
+        f"✅ Run {run_id} completed: restored {len(report.reused)} task(s), "
+        f"executed {len(executed)}: {', '.join(executed)}"
+    )
+    print(f"⏱️ Run trace: {tracer.trace.summary()}")
+    print(f"📁 Outputs: {checkpoints.run_dir}/")
+    return report
+
+
+def batch(
+    jobs_path: str,
+    output_dir: str = DEFAULT_BATCH_OUTPUT_DIR,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    requests_per_minute: Optional[int] = None,
+    parallel: bool = False,
+    split_research: bool = False,
+    profile: str = DEFAULT_PROFILE,
+    llm_cache: bool = False,
+    routing: Optional[str] = None,
+    model_overrides: Optional[Dict[str, str]] = None,
+) -> BatchSummary:
+    """
+    Optimize the resume against every job posting in a CSV/JSONL file.
+
+    The resume is parsed once and its job-independent format analysis is
+    shared by all jobs. Jobs run concurrently under a global LLM rate limit,
+    and each job writes the standard output files to its own directory.
+
+    Args:
+        jobs_path (str): CSV/JSONL file with job_url, company_name and an
+            optional job_id per job
+        output_dir (str): Root directory for per-job outputs and index.json
+        max_concurrency (int): Maximum number of jobs processed at once
+        requests_per_minute (int, optional): Global LLM request limit
+        parallel (bool): Use the parallel task scheduler inside each job
+        split_research (bool): Use split company research for each job
+        profile (str): Output profile of every job (see cv_opt.profiles)
+        llm_cache (bool): Serve repeated LLM requests from the LLM response
+            cache (see cv_opt.llm_cache)
+        routing (str, optional): Model routing policy of every job
+        model_overrides (Dict[str, str], optional): Model by agent or task
+            name, overriding the routing policy
+
+    Returns:
+        BatchSummary: Per-job results, also written to <output_dir>/index.json
+
+    Example:
+        batch("jobs.jsonl", max_concurrency=4, requests_per_minute=60)
+    """
+    print(f"🚀 Running Jobfull Resume Analyzer batch from {jobs_path}...")
+    summary = run_batch(
+        jobs_path,
+        output_dir=output_dir,
+        max_concurrency=max_concurrency,
+        requests_per_minute=requests_per_minute,
+        parallel=parallel,
+        split_research=split_research,
+        profile=profile,
+        llm_cache=llm_cache,
+        routing=routing,
+        model_overrides=model_overrides,
+    )
+    print(
+        f"✅ Batch finished: {summary.succeeded}/{summary.total} jobs succeeded "
+        f"in {summary.wall_time:.1f}s"
+    )
+    print(f"📁 Summary index: {output_dir}/index.json")
+    return summary
+
+
+def screen(
+    job_analysis_paths: List[str],
+    resume_paths: List[str],
+    top_k: int = 3,
+    output_path: str = "output/screening.json",
+) -> ScreeningReport:
+    """
+    Shortlist (job, resume) pairs by deterministic keyword match.
+
+    Scores every resume against every analyzed job in one vectorized pass,
+    without LLM calls, so that only the shortlisted pairs need a full run.
+
+    Args:
+        job_analysis_paths (List[str]): job_analysis.json files
+        resume_paths (List[str]): Resume PDF files
+        top_k (int): Resumes kept per job and jobs kept per resume
+        output_path (str): File the screening report is written to
+
+    Returns:
+        ScreeningReport: Shortlisted pairs, best first
+
+    Example:
+        screen(["output/batch/acme/job_analysis.json"], ["cvs/alice.pdf"])
+    """
+    report = screen_resumes(
+        job_analysis_paths, resume_paths, top_k=top_k, output_path=output_path
+    )
+    print(
+        f"🔎 Scored {len(report.jobs)} jobs × {len(report.resumes)} resumes "
+        f"in {report.matrix_time * 1000:.0f}ms; "
+        f"{len(report.shortlist)} pairs shortlisted"
+    )
+    for pair in report.shortlist:
+        print(f"   {pair.job_id} ← {pair.resume_id}: {pair.overall_match:.1f}%")
+    print(f"📁 Screening report: {output_path}")
+    return report
+
+
+def benchmark(
+    sizes: List[int] = list(DEFAULT_BENCHMARK_SIZES),
+    latency: float = 0.0,
+    max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    parallel: bool = False,
+    output_dir: str = DEFAULT_BENCHMARK_OUTPUT_DIR,
+    baseline_path: Optional[str] = None,
+    tolerance: float = DEFAULT_REGRESSION_TOLERANCE,
+    profiles: Optional[List[str]] = None,
+    token_latency: float = 0.0,
+    routing_policies: Optional[List[str]] = None,
+) -> BenchmarkReport:
+    """
+    Benchmark the pipeline offline with a stub LLM and recorded fixtures.
+
+    No OpenAI or Serper calls are made. When a baseline report is given, the
+    process exits with status 1 if any metric regressed beyond the tolerance,
+    so the benchmark can gate CI.
+
+    Args:
+        sizes (List[int]): Batch sizes to benchmark
+        latency (float): Simulated LLM latency per call in seconds
+        max_concurrency (int): Jobs processed at once in each batch
+        parallel (bool): Use the parallel task scheduler inside each job
+        output_dir (str): Root directory for benchmark outputs and report.json
+        baseline_path (str, optional): Earlier report.json to compare against
+        tolerance (float): Allowed relative increase of each metric
+        profiles (List[str], optional): Output profiles to compare on one
+            job each; token and latency reductions are reported against the
+            first one
+        token_latency (float): Simulated LLM latency per generated token
+        routing_policies (List[str], optional): Model routing policies to
+            compare on one job each; latency and cost are reported per policy
+
+    Returns:
+        BenchmarkReport: Startup, latency, overhead, memory, profile and
+            routing measurements
+
+    Example:
+        benchmark([1, 10], latency=0.05, baseline_path="baseline.json")
+
+        # Token and latency reduction of the output profiles
+        benchmark([1], profiles=["full", "standard", "fast"], token_latency=0.005)
+
+        # Latency and cost of the model routing policies
+        benchmark([1], routing_policies=["strong", "mini", "hybrid"])
+    """
+    report = run_benchmark(
+        sizes=sizes,
+        latency=latency,
+        max_concurrency=max_concurrency,
+        parallel=parallel,
+        output_dir=output_dir,
+        profiles=profiles or (),
+        token_latency=token_latency,
+        routing_policies=routing_policies or (),
+    )
+    print("📊 Benchmark results:")
+    print(report.summary())
+    print(f"📁 Benchmark report: {output_dir}/report.json")
+
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as file:
+            baseline = BenchmarkReport.model_validate_json(file.read())
+        regressions = report.regressions(baseline, tolerance=tolerance)
+        if regressions:
+            print("❌ Performance regressions against the baseline:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            sys.exit(1)
+        print("✅ No regressions against the baseline")
+    return report
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    max_concurrency: int = 4,
+) -> None:
+    """
+    Serve the analyzer over HTTP with warm agents and a job queue.
+
+    Imports, configuration, the LLM client and resume indexes are loaded once,
+    so submitted runs start their first task without startup cost. Requires
+    the "service" extra (fastapi and uvicorn).
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to listen on
+        max_concurrency (int): Number of workflows run at once
+
+    Example:
+        serve(port=8000, max_concurrency=4)
+    """
+    try:
+        from cv_opt.service import serve as serve_http
+    except ImportError as e:
+        raise SystemExit(
+            f"❌ The service needs fastapi and uvicorn ({e}); "
+            "install them with: pip install 'cv_opt[service]'"
+        )
+    print(f"🌐 Serving Jobfull Resume Analyzer on http://{host}:{port}")
+    serve_http(host=host, port=port, max_concurrency=max_concurrency)
+
+
+def train() -> None:
+    """
+    Train the crew for a number of iterations.
+
+    Invoked by `crewai train` as `train <n_iterations> <filename>`.
+    """
+    try:
+        ResumeCrew().crew().train(
+            n_iterations=int(sys.argv[1]), filename=sys.argv[2], inputs=DEFAULT_INPUTS
+        )
+    except Exception as e:
+        raise Exception(f"An error occurred while training the crew: {e}")
+
+
+def replay() -> None:
+    """
+    Resume a checkpointed run, or replay the crew from a CrewAI task ID.
+
+    Invoked as `replay [run_id]`: without an argument the latest incomplete
+    run in output/ is resumed. An argument that is not a run ID is treated
+    as a task ID from `crewai log-tasks-outputs`, as with `crewai replay`.
+    """
+    run_id = sys.argv[1] if len(sys.argv) > 1 else None
+    try:
+        if run_id is None or (Path(DEFAULT_RUNS_DIR) / run_id).is_dir():
+            resume(run_id)
+        else:
+            ResumeCrew().crew().replay(task_id=run_id)
+    except Exception as e:
+        raise Exception(f"An error occurred while replaying the crew: {e}")
+
+
+def test() -> None:
+    """
+    Test the crew execution and return the results.
+
+    Invoked by `crewai test` as `test <n_iterations> <eval_llm>`. For an
+    offline performance check without API calls use `cv_opt benchmark`.
+    """
+    try:
+        ResumeCrew().crew().test(
+            n_iterations=int(sys.argv[1]), eval_llm=sys.argv[2], inputs=DEFAULT_INPUTS
+        )
+    except Exception as e:
+        raise Exception(f"An error occurred while testing the crew: {e}")
+
+
+def cli(argv: Optional[List[str]] = None) -> None:
+    """
+    Command line entry point for the `cv_opt` script.
+
+    Without a subcommand the default demonstration job is analyzed, matching
+    the previous behavior of the script.
+
+    Subcommands:
+        run: Analyze a single job posting
+        resume: Continue an interrupted run from its checkpoints
+        batch: Analyze every job posting in a CSV/JSONL file
+        screen: Shortlist job/resume pairs by keyword match
+        benchmark: Measure performance offline with a stub LLM
+        serve: Run the HTTP service with a job queue
+
+    Args:
+        argv (List[str], optional): Arguments to parse instead of sys.argv
+    """
+    parser = argparse.ArgumentParser(
+        prog="cv_opt", description="Jobfull Resume Analyzer"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    run_parser = subparsers.add_parser("run", help="Analyze a single job posting")
+    run_parser.add_argument("--job-url", help="URL of the job posting")
+    run_parser.add_argument("--company-name", help="Name of the target company")
+    run_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Restore tasks whose inputs are unchanged since the last run",
+    )
+    run_parser.add_argument(
+        "--from-task",
+        help="Re-execute this task and everything downstream of it",
+    )
+    run_parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="TASK",
+        help="Re-execute just these tasks, reusing their upstream outputs",
+    )
+
+    run_parser.add_argument(
+        "--run-id", help="ID of the run (default: timestamp and random suffix)"
+    )
+    run_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum number of tasks running at once with --parallel",
+    )
+
+    resume_parser = subparsers.add_parser(
+        "resume", help="Continue an interrupted run from its checkpoints"
+    )
+    resume_parser.add_argument(
+        "run_id", nargs="?", help="Run to resume (default: latest incomplete run)"
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Analyze every job posting in a CSV/JSONL file"
+    )
+    batch_parser.add_argument("jobs_file", help="CSV/JSONL file of jobs")
+    batch_parser.add_argument(
+        "--output-dir",
+        default=DEFAULT_BATCH_OUTPUT_DIR,
+        help="Root directory for per-job outputs (relative path)",
+    )
+    batch_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help="Maximum number of jobs processed at once",
+    )
+    batch_parser.add_argument(
+        "--requests-per-minute",
+        type=int,
+        default=None,
+        help="Global LLM request limit shared by all jobs",
+    )
+
+    screen_parser = subparsers.add_parser(
+        "screen", help="Shortlist job/resume pairs by keyword match"
+    )
+    screen_parser.add_argument(
+        "job_analyses", nargs="+", help="job_analysis.json files to screen against"
+    )
+    screen_parser.add_argument(
+        "--resumes", nargs="+", required=True, help="Resume PDF files"
+    )
+    screen_parser.add_argument(
+        "--top-k",
+        type=int,
+        default=3,
+        help="Resumes kept per job and jobs kept per resume",
+    )
+    screen_parser.add_argument(
+        "--output",
+        default="output/screening.json",
+        help="File the screening report is written to",
+    )
+
+    benchmark_parser = subparsers.add_parser(
+        "benchmark", help="Measure performance offline with a stub LLM"
+    )
+    benchmark_parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=list(DEFAULT_BENCHMARK_SIZES),
+        help="Batch sizes to benchmark",
+    )
+    benchmark_parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Simulated LLM latency per call in seconds",
+    )
+    benchmark_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        help="Maximum number of jobs processed at once",
+    )
+    benchmark_parser.add_argument(
+        "--output-dir",
+        default=DEFAULT_BENCHMARK_OUTPUT_DIR,
+        help="Root directory for benchmark outputs (relative path)",
+    )
+    benchmark_parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run independent tasks of each job concurrently",
+    )
+    benchmark_parser.add_argument(
+        "--baseline", help="Earlier report.json; exit with 1 on regressions"
+    )
+    benchmark_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_REGRESSION_TOLERANCE,
+        help="Allowed relative increase of each metric",
+    )
+    benchmark_parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=sorted(load_profiles()),
+        help="Output profiles to compare, e.g. full standard fast",
+    )
+    benchmark_parser.add_argument(
+        "--token-latency",
+        type=float,
+        default=0.0,
+        help="Simulated LLM latency per generated token in seconds",
+    )
+    benchmark_parser.add_argument(
+        "--routing-policies",
+        nargs="+",
+        choices=sorted(load_routing_table().policies),
+        help="Model routing policies to compare, e.g. strong mini hybrid",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run the HTTP service with a job queue"
+    )
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    serve_parser.add_argument("--port", type=int, default=8000, help="Port")
+    serve_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Number of workflows run at once",
+    )
+
+    for subparser in (run_parser, batch_parser):
+        subparser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Run independent tasks concurrently",
+        )
+        subparser.add_argument(
+            "--split-research",
+            action="store_true",
+            help="Gather company intelligence independently of the resume analysis",
+        )
+        subparser.add_argument(
+            "--profile",
+            choices=sorted(load_profiles()),
+            default=DEFAULT_PROFILE,
+            help="Output profile: how many analysis fields the agents generate",
+        )
+        subparser.add_argument(
+            "--llm-cache",
+            action="store_true",
+            help="Answer repeated LLM requests from the on-disk response cache",
+        )
+        subparser.add_argument(
+            "--routing",
+            choices=sorted(load_routing_table().policies),
+            help="Model routing policy, e.g. hybrid (default from agents.yaml)",
+        )
+        subparser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            metavar="NAME=MODEL",
+            help="Route an agent or task to a model, e.g. report_generator=strong",
+        )
+
+    args = parser.parse_args(argv)
+    try:
+        model_overrides = parse_model_overrides(getattr(args, "model", []))
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.command == "serve":
+        serve(args.host, args.port, max_concurrency=args.max_concurrency)
+    elif args.command == "benchmark":
+        benchmark(
+            args.sizes,
+            latency=args.latency,
+            max_concurrency=args.max_concurrency,
+            parallel=args.parallel,
+            output_dir=args.output_dir,
+            baseline_path=args.baseline,
+            tolerance=args.tolerance,
+            profiles=args.profiles,
+            token_latency=args.token_latency,
+            routing_policies=args.routing_policies,
+        )
+    elif args.command == "screen":
+        screen(
+            args.job_analyses,
+            args.resumes,
+            top_k=args.top_k,
+            output_path=args.output,
+        )
+    elif args.command == "resume":
+        resume(args.run_id)
+    elif args.command == "batch":
+        batch(
+            args.jobs_file,
+            output_dir=args.output_dir,
+            max_concurrency=args.max_concurrency,
+            requests_per_minute=args.requests_per_minute,
+            parallel=args.parallel,
+            split_research=args.split_research,
+            profile=args.profile,
+            llm_cache=args.llm_cache,
+            routing=args.routing,
+            model_overrides=model_overrides,
+        )
+    elif args.command == "run":
+        custom_inputs = (
+            {"job_url": args.job_url, "company_name": args.company_name}
+            if args.job_url or args.company_name
+            else None
+        )
+        run(
+            custom_inputs,
+            parallel=args.parallel,
+            max_concurrency=args.max_concurrency,
+            split_research=args.split_research,
+            incremental=args.incremental,
+            from_task=args.from_task,
+            only=args.only,
+            run_id=args.run_id,
+            profile=args.profile,
+            llm_cache=args.llm_cache,
+            routing=args.routing,
+            model_overrides=model_overrides,
+        )
+    else:
+        run()
+
+
 if __name__ == "__main__":
     # Entry point when script is run directly
     print("=" * 60)
@@ -151,4 +936,4 @@ if __name__ == "__main__":
     print("   AI-Powered Resume Optimization for 2025 ATS Standards")
     print("=" * 60)
 
-    run()
+    cli()
@@ -0,0 +1,417 @@
+"""
+Jobfull Resume Analyzer - Job × Resume Match Matrix Module
+
+This module screens many resumes against many job openings at once using the
+deterministic keyword scoring of cv_opt.ats_matcher. Instead of running the
+full 7-task ResumeCrew pipeline for every (job, resume) pair, the N × M
+`overall_match` matrix is computed in one vectorized pass and only the top-k
+pairs are sent to the expensive LLM pipeline.
+
+Matrix Construction:
+    1. Every distinct keyword across all jobs becomes a term column
+    2. Jobs become a sparse (job, dimension) × term weight matrix, stored as
+       coordinate arrays (weight = importance × 1.5 if required)
+    3. One pass over each resume's n-gram counters fills dense resume ×
+       n-gram count matrices (exact and stemmed); exact, stemmed and synonym
+       counts per term, and from them the resume × term credit matrix
+       (exact 1.0, stemmed 0.9, synonym 0.75, missing 0.0), are derived with
+       array operations
+    4. One sparse-dense product yields earned weight per job, dimension and
+       resume; dimension scores combine with the 35/20/25/10/10 weights
+
+    Scores are identical to JobMatchScore.overall_match from
+    ats_matcher.match_keywords() for each pair (up to rounding).
+
+Screening:
+    screen() loads job_analysis.json files (e.g. from a batch run) and resume
+    PDFs, builds the matrix and writes the shortlist of pairs worth a full
+    ResumeCrew run to a ScreeningReport JSON file:
+
+        cv_opt screen output/batch/*/job_analysis.json --resumes a.pdf b.pdf
+
+Example:
+    from cv_opt.match_matrix import build_match_matrix
+
+    matrix = build_match_matrix(
+        jobs={"acme-ml": acme_requirements.ats_keywords, ...},
+        resumes={"alice": alice_text, "bob": bob_text, ...},
+    )
+    for pair in matrix.top_resumes("acme-ml", k=3):
+        print(pair.resume_id, pair.overall_match)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from .ats_matcher import (
+    MATCH_CREDIT,
+    SCORING_WEIGHTS,
+    build_synonym_index,
+    keyword_dimension,
+    keyword_weight,
+    resume_ngram_counts,
+    stem,
+    synonym_terms,
+    tokenize,
+)
+from .cache import atomic_write_text
+from .knowledge import CachedPDFKnowledgeSource
+from .models import ATSKeyword, JobRequirements
+
+# Number of sparse entries multiplied at once (bounds temporary memory)
+_ENTRY_BLOCK_SIZE = 4096
+
+
+class MatchPair(BaseModel):
+    """
+    One (job, resume) pair selected from a match matrix.
+
+    Attributes:
+        job_id (str): Identifier of the job
+        resume_id (str): Identifier of the resume
+        overall_match (float): Weighted keyword match score (0-100)
+        rank (int): Rank of the pair within its selection (1 = best)
+    """
+
+    job_id: str = Field(description="Identifier of the job")
+    resume_id: str = Field(description="Identifier of the resume")
+    overall_match: float = Field(description="Weighted keyword match score (0-100)")
+    rank: int = Field(description="Rank within the selection (1 = best)")
+
+
+class ScreeningReport(BaseModel):
+    """
+    Result of screening resumes against job analyses.
+
+    Attributes:
+        jobs (List[str]): Job IDs (matrix rows)
+        resumes (List[str]): Resume IDs (matrix columns)
+        top_k (int): k used for per-job and per-resume retrieval
+        matrix_time (float): Time to build the match matrix in seconds
+        shortlist (List[MatchPair]): Pairs selected for a full ResumeCrew run
+    """
+
+    jobs: List[str] = Field(description="Job IDs (matrix rows)")
+    resumes: List[str] = Field(description="Resume IDs (matrix columns)")
+    top_k: int = Field(description="k used for top-k retrieval")
+    matrix_time: float = Field(description="Time to build the matrix (seconds)")
+    shortlist: List[MatchPair] = Field(
+        description="Pairs selected for a full ResumeCrew run", default_factory=list
+    )
+
+
+class MatchMatrix:
+    """
+    N × M matrix of overall keyword match scores with top-k retrieval.
+
+    Attributes:
+        job_ids (List[str]): Row identifiers
+        resume_ids (List[str]): Column identifiers
+        scores (np.ndarray): overall_match scores, shape (N, M), 0-100
+        dimension_scores (Dict[str, np.ndarray]): Per-dimension scores,
+            each of shape (N, M)
+    """
+
+    def __init__(
+        self,
+        job_ids: Sequence[str],
+        resume_ids: Sequence[str],
+        scores: np.ndarray,
+        dimension_scores: Dict[str, np.ndarray],
+    ) -> None:
+        self.job_ids = list(job_ids)
+        self.resume_ids = list(resume_ids)
+        self.scores = scores
+        self.dimension_scores = dimension_scores
+        self._job_rows = {job_id: row for row, job_id in enumerate(self.job_ids)}
+        self._resume_cols = {
+            resume_id: col for col, resume_id in enumerate(self.resume_ids)
+        }
+
+    def _pairs(self, rows: np.ndarray, cols: np.ndarray) -> List[MatchPair]:
+        return [
+            MatchPair(
+                job_id=self.job_ids[row],
+                resume_id=self.resume_ids[col],
+                overall_match=round(float(self.scores[row, col]), 1),
+                rank=rank,
+            )
+            for rank, (row, col) in enumerate(zip(rows, cols), start=1)
+        ]
+
+    @staticmethod
+    def _top_indices(values: np.ndarray, k: int) -> np.ndarray:
+        """Indices of the k largest values, best first (lowest index on ties)."""
+        return np.argsort(-values, kind="stable")[: max(k, 0)]
+
+    def top_resumes(self, job_id: str, k: int = 3) -> List[MatchPair]:
+        """Return the k best-matching resumes for a job."""
+        row = self._job_rows[job_id]
+        cols = self._top_indices(self.scores[row], k)
+        return self._pairs(np.full(len(cols), row), cols)
+
+    def top_jobs(self, resume_id: str, k: int = 3) -> List[MatchPair]:
+        """Return the k best-matching jobs for a resume."""
+        col = self._resume_cols[resume_id]
+        rows = self._top_indices(self.scores[:, col], k)
+        return self._pairs(rows, np.full(len(rows), col))
+
+    def top_pairs(self, k: int = 10) -> List[MatchPair]:
+        """Return the k best (job, resume) pairs across the whole matrix."""
+        flat = self._top_indices(self.scores.ravel(), k)
+        rows, cols = np.unravel_index(flat, self.scores.shape)
+        return self._pairs(rows, cols)
+
+    def shortlist(self, k: int = 3) -> List[MatchPair]:
+        """
+        Return the union of each job's top-k resumes and each resume's top-k
+        jobs, i.e. the pairs worth a full ResumeCrew run, best first.
+        """
+        n_jobs, n_resumes = self.scores.shape
+        k = max(k, 0)
+        # Each job's top-k columns and each resume's top-k rows
+        top_cols = np.argsort(-self.scores, axis=1, kind="stable")[:, :k]
+        top_rows = np.argsort(-self.scores, axis=0, kind="stable")[:k, :]
+        flat = np.unique(
+            np.concatenate(
+                [
+                    (np.arange(n_jobs)[:, None] * n_resumes + top_cols).ravel(),
+                    (top_rows * n_resumes + np.arange(n_resumes)[None, :]).ravel(),
+                ]
+            )
+        )
+        rows, cols = np.divmod(flat, max(n_resumes, 1))
+        order = np.lexsort((cols, rows, -self.scores[rows, cols]))
+        return self._pairs(rows[order], cols[order])
+
+
+def build_match_matrix(
+    jobs: Mapping[str, Sequence[ATSKeyword]],
+    resumes: Mapping[str, str],
+    synonyms: Optional[Dict[Tuple[str, ...], List[Tuple[str, ...]]]] = None,
+) -> MatchMatrix:
+    """
+    Score every resume against every job's ATS keywords in one pass.
+
+    Args:
+        jobs (Mapping[str, Sequence[ATSKeyword]]): Job ID → ATS keywords
+            (e.g. JobRequirements.ats_keywords from job_analysis.json)
+        resumes (Mapping[str, str]): Resume ID → extracted resume text
+        synonyms (Dict, optional): Synonym index from build_synonym_index()
+
+    Returns:
+        MatchMatrix: Scores of shape (len(jobs), len(resumes))
+    """
+    synonyms = build_synonym_index() if synonyms is None else synonyms
+    dimensions = list(SCORING_WEIGHTS)
+    job_ids = list(jobs)
+    resume_ids = list(resumes)
+
+    # Term vocabulary and sparse (job, dimension) × term weights
+    terms: Dict[Tuple[str, ...], int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    weights: List[float] = []
+    for job_index, job_id in enumerate(job_ids):
+        for keyword in jobs[job_id]:
+            term = tuple(tokenize(keyword.keyword))
+            if not term:
+                continue
+            dimension = dimensions.index(keyword_dimension(keyword.category))
+            rows.append(job_index * len(dimensions) + dimension)
+            cols.append(terms.setdefault(term, len(terms)))
+            weights.append(keyword_weight(keyword.importance, keyword.required))
+
+    credits = _credit_matrix(list(terms), list(resumes.values()), synonyms)
+
+    # Sparse (job, dimension) × term weights times dense credits
+    row_array = np.array(rows, dtype=int)
+    col_array = np.array(cols, dtype=int)
+    weight_array = np.array(weights, dtype=np.float32)
+    earned = np.zeros((len(job_ids) * len(dimensions), len(resume_ids)), np.float32)
+    for start in range(0, len(weight_array), _ENTRY_BLOCK_SIZE):
+        block = slice(start, start + _ENTRY_BLOCK_SIZE)
+        np.add.at(
+            earned,
+            row_array[block],
+            weight_array[block, None] * credits[:, col_array[block]].T,
+        )
+    possible = np.bincount(
+        row_array, weights=weight_array, minlength=len(job_ids) * len(dimensions)
+    )
+
+    earned = earned.reshape(len(job_ids), len(dimensions), len(resume_ids))
+    possible = possible.reshape(len(job_ids), len(dimensions), 1)
+    total_possible = possible.sum(axis=1)
+    coverage = np.divide(
+        earned.sum(axis=1),
+        total_possible,
+        out=np.zeros((len(job_ids), len(resume_ids)), np.float32),
+        where=total_possible > 0,
+    )
+    dimension_ratio = np.where(
+        possible > 0,
+        earned / np.where(possible > 0, possible, 1),
+        coverage[:, None, :],
+    )
+    dimension_scores = {
+        name: 100.0 * dimension_ratio[:, index, :]
+        for index, name in enumerate(dimensions)
+    }
+    scores = sum(SCORING_WEIGHTS[name] * dimension_scores[name] for name in dimensions)
+
+    return MatchMatrix(job_ids, resume_ids, scores, dimension_scores)
+
+
+def _credit_matrix(
+    term_list: Sequence[Tuple[str, ...]],
+    resume_texts: Sequence[str],
+    synonyms: Dict[Tuple[str, ...], List[Tuple[str, ...]]],
+) -> np.ndarray:
+    """
+    Return the resume × term credit matrix of the best match type per pair.
+
+    Counts follow ats_matcher.count_term_matches(): exact occurrences,
+    additional stemmed occurrences, and occurrences of the distinct
+    synonyms from ats_matcher.synonym_terms().
+
+    Args:
+        term_list (Sequence[Tuple[str, ...]]): Tokens of every term column
+        resume_texts (Sequence[str]): Extracted resume texts (rows)
+        synonyms (Dict): Synonym index from build_synonym_index()
+
+    Returns:
+        np.ndarray: Credits of shape (len(resume_texts), len(term_list))
+    """
+    # Column of every n-gram of interest, exact and stemmed
+    exact_columns = {term: index for index, term in enumerate(term_list)}
+    stemmed_columns: Dict[Tuple[str, ...], int] = {}
+    stemmed_terms = []
+    synonym_terms_of: List[int] = []
+    synonym_columns: List[int] = []
+    for term_index, term in enumerate(term_list):
+        stemmed_term = tuple(stem(token) for token in term)
+        stemmed_terms.append(
+            stemmed_columns.setdefault(stemmed_term, len(stemmed_columns))
+        )
+        for alternative in synonym_terms(stemmed_term, synonyms.get(term, [])):
+            synonym_terms_of.append(term_index)
+            synonym_columns.append(
+                stemmed_columns.setdefault(alternative, len(stemmed_columns))
+            )
+    max_n = max((len(t) for t in [*exact_columns, *stemmed_columns]), default=1)
+
+    # One pass over each resume's n-gram counters
+    exact_counts = np.zeros((len(resume_texts), len(exact_columns)), np.float32)
+    stemmed_counts = np.zeros((len(resume_texts), len(stemmed_columns)), np.float32)
+    for row, text in enumerate(resume_texts):
+        exact_ngrams, stemmed_ngrams = resume_ngram_counts(tokenize(text), max_n)
+        for ngram, count in exact_ngrams.items():
+            column = exact_columns.get(ngram)
+            if column is not None:
+                exact_counts[row, column] = count
+        for ngram, count in stemmed_ngrams.items():
+            column = stemmed_columns.get(ngram)
+            if column is not None:
+                stemmed_counts[row, column] = count
+
+    exact = exact_counts
+    stemmed = stemmed_counts[:, stemmed_terms] - exact
+    synonym = np.zeros_like(exact)
+    if synonym_columns:
+        np.add.at(
+            synonym.T,
+            np.array(synonym_terms_of, dtype=int),
+            stemmed_counts[:, synonym_columns].T,
+        )
+    return np.where(
+        exact > 0,
+        MATCH_CREDIT["exact"],
+        np.where(
+            stemmed > 0,
+            MATCH_CREDIT["stemmed"],
+            np.where(synonym > 0, MATCH_CREDIT["synonym"], 0.0),
+        ),
+    ).astype(np.float32)
+
+
+def _job_id(path: Path) -> str:
+    """Job ID of a job analysis file: its directory for job_analysis.json."""
+    return path.parent.name if path.name == "job_analysis.json" else path.stem
+
+
+def _paths_by_id(
+    paths: Sequence[str], id_of: Callable[[Path], str], kind: str
+) -> Dict[str, Path]:
+    """
+    Map the IDs of input files to their paths.
+
+    Raises:
+        ValueError: If two files have the same ID
+    """
+    by_id: Dict[str, Path] = {}
+    for path in map(Path, paths):
+        key = id_of(path)
+        if key in by_id:
+            raise ValueError(
+                f"{kind} ID '{key}' is shared by {by_id[key]} and {path}; "
+                "rename one of them"
+            )
+        by_id[key] = path
+    return by_id
+
+
+def screen(
+    job_analysis_paths: Sequence[str],
+    resume_paths: Sequence[str],
+    top_k: int = 3,
+    output_path: Optional[str] = None,
+) -> ScreeningReport:
+    """
+    Screen resume PDFs against job analyses and shortlist the best pairs.
+
+    Args:
+        job_analysis_paths (Sequence[str]): job_analysis.json files
+            (JobRequirements); jobs are identified by their directory name
+        resume_paths (Sequence[str]): Resume PDF files, identified by stem
+        top_k (int): Resumes kept per job and jobs kept per resume
+        output_path (str, optional): File to write the report to as JSON
+
+    Returns:
+        ScreeningReport: Shortlisted pairs, best first
+
+    Raises:
+        ValueError: If two jobs or two resumes have the same ID
+    """
+    job_paths = _paths_by_id(job_analysis_paths, _job_id, "Job")
+    resume_paths_by_id = _paths_by_id(resume_paths, lambda path: path.stem, "Resume")
+    jobs = {
+        job_id: JobRequirements.model_validate_json(
+            path.read_text(encoding="utf-8")
+        ).ats_keywords
+        for job_id, path in job_paths.items()
+    }
+    resumes = {}
+    for resume_id, path in resume_paths_by_id.items():
+        source = CachedPDFKnowledgeSource(file_paths=[path.resolve()])
+        resumes[resume_id] = "\n".join(source.content.values())
+
+    start = time.perf_counter()
+    matrix = build_match_matrix(jobs, resumes)
+    report = ScreeningReport(
+        jobs=matrix.job_ids,
+        resumes=matrix.resume_ids,
+        top_k=top_k,
+        matrix_time=time.perf_counter() - start,
+        shortlist=matrix.shortlist(top_k),
+    )
+    if output_path:
+        atomic_write_text(output_path, report.model_dump_json(indent=2))
+    return report
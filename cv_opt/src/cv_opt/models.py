@@ -21,6 +21,11 @@ Model Hierarchy:
        - ATSOptimization: ATS-specific scoring and recommendations
        - Various scoring and analysis components
 
+    4. Resume Profile Models:
+       - CandidateProfile: Contact details, roles, education and skills parsed
+         once from the resume PDF (see cv_opt.candidate_profile)
+       - ContactInfo, WorkExperience, EducationEntry: Its components
+
 Data Validation:
     All models use Pydantic for automatic validation, type checking, and
     serialization. Field constraints ensure data integrity and consistency
@@ -730,3 +735,114 @@ class CoverLetterGeneration(BaseModel):
         description="Predicted impact score based on personalization and relevance",
         default=0.7,
     )
+
+
+# ========================================
+# RESUME PROFILE MODELS
+# ========================================
+# Structured resume content parsed once per PDF and shared by every task
+
+
+class ContactInfo(BaseModel):
+    """
+    Contact details from the resume header.
+
+    Attributes:
+        name (str): Candidate name
+        headline (str): Professional headline below the name
+        email (str, optional): Email address
+        phone (str, optional): Phone number as written on the resume
+        location (str, optional): City and country
+        linkedin (str, optional): LinkedIn profile URL
+        links (List[str]): Other profile or portfolio URLs
+    """
+
+    name: str = Field(description="Candidate name", default="")
+    headline: str = Field(description="Professional headline", default="")
+    email: Optional[str] = Field(description="Email address", default=None)
+    phone: Optional[str] = Field(description="Phone number", default=None)
+    location: Optional[str] = Field(description="City and country", default=None)
+    linkedin: Optional[str] = Field(description="LinkedIn profile URL", default=None)
+    links: List[str] = Field(
+        description="Other profile or portfolio URLs", default_factory=list
+    )
+
+
+class WorkExperience(BaseModel):
+    """
+    One role of the candidate's work history.
+
+    Attributes:
+        title (str): Job title
+        organization (str): Employer
+        start_date (str): Start date as written, e.g. "01/2024"
+        end_date (str): End date as written, e.g. "Present"
+        location (str, optional): Location of the role
+        bullets (List[str]): Achievements and responsibilities
+    """
+
+    title: str = Field(description="Job title")
+    organization: str = Field(description="Employer", default="")
+    start_date: str = Field(description="Start date as written", default="")
+    end_date: str = Field(description="End date as written", default="")
+    location: Optional[str] = Field(description="Location of the role", default=None)
+    bullets: List[str] = Field(
+        description="Achievements and responsibilities", default_factory=list
+    )
+
+
+class EducationEntry(BaseModel):
+    """
+    One degree of the candidate.
+
+    Attributes:
+        degree (str): Degree and field, e.g. "M.Sc. in Computer Engineering"
+        institution (str): University or school
+        dates (str, optional): Graduation year or period
+    """
+
+    degree: str = Field(description="Degree and field of study")
+    institution: str = Field(description="University or school", default="")
+    dates: Optional[str] = Field(description="Graduation year or period", default=None)
+
+
+class CandidateProfile(BaseModel):
+    """
+    Structured resume content, parsed once per resume PDF.
+
+    Tasks that write about the candidate receive this profile in their
+    context instead of re-extracting contact details, roles and skills from
+    the PDF through knowledge retrieval on every run.
+
+    Attributes:
+        contact (ContactInfo): Contact details from the header
+        summary (str): Professional summary
+        experience (List[WorkExperience]): Roles, most recent first as listed
+        education (List[EducationEntry]): Degrees
+        skills (List[str]): Skill lines as listed, e.g. "Languages: Python"
+        other_sections (Dict[str, List[str]]): Lines of the remaining
+            sections (publications, awards, ...) by section heading
+
+    Example:
+        CandidateProfile(
+            contact=ContactInfo(name="Jane Doe", email="jane@example.com"),
+            experience=[WorkExperience(title="ML Engineer", organization="Acme")],
+            skills=["Languages: Python, C++"]
+        )
+    """
+
+    contact: ContactInfo = Field(
+        description="Contact details from the header", default_factory=ContactInfo
+    )
+    summary: str = Field(description="Professional summary", default="")
+    experience: List[WorkExperience] = Field(
+        description="Roles in the order listed", default_factory=list
+    )
+    education: List[EducationEntry] = Field(
+        description="Degrees", default_factory=list
+    )
+    skills: List[str] = Field(description="Skill lines as listed", default_factory=list)
+    other_sections: Dict[str, List[str]] = Field(
+        description="Lines of the remaining sections by heading",
+        default_factory=dict,
+    )
@@ -0,0 +1,2096 @@
+"""
+Jobfull Resume Analyzer - PDF Layout Module
+
+This module reads the layout of the resume PDF and derives the ATS format
+compliance checklist and parsing warnings from it. PDFKnowledgeSource only
+yields the text, so the resume analyzer was asked to judge the columns,
+fonts, tables and images of a page it never saw, while pdfplumber and pypdf
+take seconds for a three-page resume. This reader is a small pure-Python
+PDF parser that makes a single pass over the memory-mapped file and
+returns in milliseconds; the same PDF always gives the same diagnostics.
+
+Reading:
+    - File structure: cross-reference tables and streams, object streams;
+      files with a damaged cross-reference are recovered by scanning
+    - Streams: FlateDecode (with PNG predictors), ASCIIHexDecode and
+      ASCII85Decode
+    - Fonts: simple fonts (standard encodings, /Differences) and composite
+      fonts (2-byte codes), mapped to Unicode through their ToUnicode
+      CMaps; glyph widths give every text span its extent on the page
+    - Content: text, path and image operators, form XObjects and inline
+      images
+
+Diagnostics (format_compliance keys of ATSOptimization):
+    - single_column: no run of lines split into text columns side by side
+    - standard_fonts: only widely available fonts, and no text without a
+      Unicode mapping
+    - no_tables: no ruled grids and no text aligned in three columns
+    - no_images: no raster images
+    - no_headers_footers: no page numbers or text repeated in the top or
+      bottom margin of the pages
+    - standard_sections: Experience, Education and Skills headings
+    - doc_format: a text-based PDF (not encrypted, not scanned)
+
+    Every failed check comes with a parsing warning naming the pages and
+    text concerned. Hidden text (invisible, or white outside any filled
+    shape) and rotated text are reported as warnings only.
+
+Example:
+    from cv_opt.pdf_layout import analyze_pdf_layout
+
+    layout = analyze_pdf_layout("knowledge/GhonemCV_2025.pdf")
+    print(layout.format_compliance["single_column"], layout.parsing_warnings)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import base64
+import math
+import mmap
+import re
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field
+
+from .candidate_profile import split_resume_sections
+from .knowledge import CachedPDFKnowledgeSource
+
+# Widely available font families (lowercased, without spaces and styles)
+STANDARD_FONTS = (
+    "arial",
+    "arimo",
+    "helvetica",
+    "helveticaneue",
+    "liberationsans",
+    "times",
+    "timesnewroman",
+    "tinos",
+    "liberationserif",
+    "calibri",
+    "carlito",
+    "cambria",
+    "caladea",
+    "aptos",
+    "garamond",
+    "ebgaramond",
+    "georgia",
+    "verdana",
+    "tahoma",
+    "trebuchetms",
+    "segoeui",
+    "bookantiqua",
+    "palatino",
+    "palatinolinotype",
+    "centurygothic",
+    "gillsans",
+    "courier",
+    "couriernew",
+    "lato",
+    "roboto",
+    "opensans",
+    "sourcesanspro",
+    "notosans",
+    "notoserif",
+    "dejavusans",
+    "dejavuserif",
+)
+
+# Symbol fonts, whose glyphs (bullets, icons) have no meaningful text
+SYMBOL_FONTS = ("symbol", "wingdings", "webdings", "zapfdingbats", "fontawesome")
+
+# Headings of the sections every ATS expects (see cv_opt.candidate_profile)
+REQUIRED_SECTIONS = ("experience", "education", "skills")
+
+# Gap between two spans of a line that separates columns, in font sizes
+_COLUMN_GAP = 2.0
+# Gap between two spans of a line that separates words, in font sizes
+_WORD_GAP = 0.15
+# Backward TJ adjustment that separates words, in thousandths of an em
+_TJ_WORD_GAP = 200
+# Lines sharing a column boundary before the page counts as multi-column
+_MIN_COLUMN_LINES = 2
+# Shortest rule that can border a table cell, in points
+_MIN_RULE = 10
+# Thickest filled shape, in points, still read as a rule
+_MAX_RULE_WIDTH = 3.0
+# Share of the page height taken by the header and footer margins
+_MARGIN = 0.08
+# Nesting limit of form XObjects
+_MAX_FORM_DEPTH = 8
+
+_IDENTITY = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+# ========================================
+# PDF OBJECTS
+# ========================================
+
+
+class PDFSyntaxError(ValueError):
+    """Raised when a file is not a PDF this reader can parse."""
+
+
+class _Name(str):
+    """A PDF name object, without the leading slash."""
+
+    __slots__ = ()
+
+
+class _Op(str):
+    """A bare keyword: a content stream operator, obj, R, stream, ..."""
+
+    __slots__ = ()
+
+
+class _Ref(NamedTuple):
+    """An indirect object reference."""
+
+    num: int
+    gen: int
+
+
+class _Stream:
+    """A stream object: its dictionary and its undecoded bytes."""
+
+    __slots__ = ("attrs", "raw", "data")
+
+    def __init__(self, attrs: Dict[str, Any], raw: bytes) -> None:
+        self.attrs = attrs
+        self.raw = raw
+        self.data: Optional[bytes] = None
+
+
+_EOF = object()
+_KEYWORD_VALUES = {"true": True, "false": False, "null": None}
+_OPEN = {"[", "<<"}
+_CLOSE = {"]", ">>"}
+_DIGITS = frozenset(b"0123456789+-.")
+
+_TOKEN = re.compile(
+    rb"[ \t\r\n\f\x00]+|%[^\r\n]*"
+    rb"|/[^ \t\r\n\f\x00()<>\[\]{}/%]*"
+    rb"|<<|>>|<[0-9A-Fa-f \t\r\n\f]*>"
+    rb"|[()\[\]{}]"
+    rb"|[^ \t\r\n\f\x00()<>\[\]{}/%]+"
+)
+_STRING_SPECIAL = re.compile(rb"[()\\]")
+_OCTAL = re.compile(rb"[0-7]{1,3}")
+_NAME_ESCAPE = re.compile(rb"#([0-9A-Fa-f]{2})")
+_HEX_JUNK = re.compile(rb"[^0-9A-Fa-f]")
+_ESCAPES = {
+    b"n": b"\n",
+    b"r": b"\r",
+    b"t": b"\t",
+    b"b": b"\b",
+    b"f": b"\f",
+}
+_INLINE_IMAGE_END = re.compile(rb"[ \t\r\n\f\x00]EI(?=[ \t\r\n\f\x00]|\Z)")
+
+
+def _literal_string(data: Any, pos: int) -> Tuple[bytes, int]:
+    """
+    Parse a literal string.
+
+    Args:
+        data (Any): Buffer holding the string
+        pos (int): Offset just after the opening parenthesis
+
+    Returns:
+        Tuple[bytes, int]: String bytes and the offset after the string
+    """
+    out = bytearray()
+    depth = 1
+    while True:
+        match = _STRING_SPECIAL.search(data, pos)
+        if match is None:
+            out += data[pos:]
+            return bytes(out), len(data)
+        start = match.start()
+        out += data[pos:start]
+        char = match.group()
+        if char == b"\\":
+            following = data[start + 1 : start + 2]
+            if following and following in b"01234567":
+                octal = _OCTAL.match(data, start + 1)
+                out.append(int(octal.group(), 8) & 0xFF)
+                pos = octal.end()
+                continue
+            pos = start + 2
+            if following == b"\r":
+                if data[pos : pos + 1] == b"\n":
+                    pos += 1
+            elif following != b"\n":
+                out += _ESCAPES.get(following, following)
+        elif char == b"(":
+            depth += 1
+            out += char
+            pos = start + 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return bytes(out), start + 1
+            out += char
+            pos = start + 1
+
+
+class _Lexer:
+    """Reads PDF objects and keywords from a buffer."""
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: Any, pos: int = 0) -> None:
+        self.data = data
+        self.pos = pos
+
+    def token(self) -> Any:
+        """Return the next token, or _EOF at the end of the buffer."""
+        data = self.data
+        match_token = _TOKEN.match
+        while True:
+            match = match_token(data, self.pos)
+            if match is None:
+                if self.pos >= len(data):
+                    return _EOF
+                self.pos += 1
+                continue
+            self.pos = match.end()
+            token = match.group()
+            first = token[0]
+            if first in b" \t\r\n\f\x00%":
+                continue
+            if first == 0x2F:  # "/"
+                if b"#" in token:
+                    token = _NAME_ESCAPE.sub(
+                        lambda escape: bytes([int(escape.group(1), 16)]), token
+                    )
+                return _Name(token[1:].decode("latin-1"))
+            if first in _DIGITS:
+                try:
+                    return int(token)
+                except ValueError:
+                    try:
+                        return float(token)
+                    except ValueError:
+                        pass
+            if first == 0x28:  # "("
+                value, self.pos = _literal_string(data, self.pos)
+                return value
+            if first == 0x3C and token != b"<<":  # hex string
+                digits = _HEX_JUNK.sub(b"", token[1:-1])
+                if len(digits) % 2:
+                    digits += b"0"
+                return bytes.fromhex(digits.decode("ascii"))
+            return _Op(token.decode("latin-1"))
+
+    def read(self) -> Any:
+        """
+        Return the next complete object.
+
+        Arrays become lists, dictionaries dicts, strings bytes, names _Name
+        and references _Ref. Keywords (operators, obj, stream, ...) are
+        returned as _Op; _EOF marks the end of the buffer.
+        """
+        stack: List[list] = []
+        while True:
+            token = self.token()
+            if token is _EOF:
+                return _EOF
+            if type(token) is _Op:
+                if token in _OPEN:
+                    stack.append([token])
+                    continue
+                if token in _CLOSE:
+                    if not stack:
+                        continue
+                    items = stack.pop()
+                    if items[0] == "[":
+                        value: Any = items[1:]
+                    else:
+                        # Keys that are not names (damaged files) are dropped
+                        value = {
+                            key: item
+                            for key, item in zip(items[1::2], items[2::2])
+                            if type(key) is _Name
+                        }
+                elif (
+                    token == "R"
+                    and stack
+                    and len(stack[-1]) > 2
+                    and type(stack[-1][-1]) is int
+                    and type(stack[-1][-2]) is int
+                ):
+                    generation = stack[-1].pop()
+                    value = _Ref(stack[-1].pop(), generation)
+                elif token in _KEYWORD_VALUES:
+                    value = _KEYWORD_VALUES[token]
+                elif stack:
+                    value = token
+                else:
+                    return token
+            else:
+                value = token
+            if not stack:
+                return value
+            stack[-1].append(value)
+
+
+# ========================================
+# FILE STRUCTURE
+# ========================================
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)")
+_XREF_SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)\s*")
+_XREF_ENTRY = re.compile(rb"\s*(\d{1,10})\s+(\d{1,5})\s+([nf])")
+_OBJECT_HEADER = re.compile(rb"(?<![0-9])(\d+)\s+(\d+)\s+obj\b")
+_ENDSTREAM = re.compile(rb"\r?\n?endstream")
+
+
+def _inflate(data: bytes) -> bytes:
+    """Decompress zlib data, keeping what precedes a damaged tail."""
+    try:
+        return zlib.decompress(data)
+    except zlib.error:
+        try:
+            return zlib.decompressobj().decompress(data)
+        except zlib.error as error:
+            raise PDFSyntaxError(f"corrupt FlateDecode stream: {error}") from error
+
+
+def _unpredict(data: bytes, params: Dict[str, Any]) -> bytes:
+    """Undo the PNG predictors of a FlateDecode stream."""
+    predictor = params.get("Predictor", 1)
+    if predictor < 10:
+        if predictor == 2:
+            raise PDFSyntaxError("unsupported TIFF predictor")
+        return data
+    colors = params.get("Colors", 1)
+    bits = params.get("BitsPerComponent", 8)
+    row_size = (params.get("Columns", 1) * colors * bits + 7) // 8
+    pixel_size = max(1, colors * bits // 8)
+    previous = bytearray(row_size)
+    out = bytearray()
+    for start in range(0, len(data) - row_size, row_size + 1):
+        kind = data[start]
+        row = bytearray(data[start + 1 : start + 1 + row_size])
+        for index in range(row_size):
+            left = row[index - pixel_size] if index >= pixel_size else 0
+            up = previous[index]
+            if kind == 1:
+                row[index] = (row[index] + left) & 0xFF
+            elif kind == 2:
+                row[index] = (row[index] + up) & 0xFF
+            elif kind == 3:
+                row[index] = (row[index] + (left + up) // 2) & 0xFF
+            elif kind == 4:
+                upper_left = previous[index - pixel_size] if index >= pixel_size else 0
+                estimate = left + up - upper_left
+                distances = (
+                    abs(estimate - left),
+                    abs(estimate - up),
+                    abs(estimate - upper_left),
+                )
+                if distances[0] <= distances[1] and distances[0] <= distances[2]:
+                    row[index] = (row[index] + left) & 0xFF
+                elif distances[1] <= distances[2]:
+                    row[index] = (row[index] + up) & 0xFF
+                else:
+                    row[index] = (row[index] + upper_left) & 0xFF
+        out += row
+        previous = row
+    return bytes(out)
+
+
+class _PDFReader:
+    """
+    Random access to the objects of a PDF held in a buffer.
+
+    Attributes:
+        data (Any): The file contents (an mmap)
+        trailer (Dict[str, Any]): Merged trailer dictionaries
+        xref (Dict[int, Tuple[int, int, int]]): Object locations by number:
+            (1, offset, 0) for plain objects, (2, stream number, index) for
+            objects inside an object stream
+    """
+
+    def __init__(self, data: Any) -> None:
+        if not data[:1024].lstrip().startswith(b"%PDF") and b"%PDF" not in data[:1024]:
+            raise PDFSyntaxError("not a PDF file")
+        self.data = data
+        self.trailer: Dict[str, Any] = {}
+        self.xref: Dict[int, Tuple[int, int, int]] = {}
+        self._objects: Dict[int, Any] = {}
+        self._object_streams: Dict[int, List[Any]] = {}
+        self._scanned = False
+        try:
+            self._read_xref()
+        except (PDFSyntaxError, ValueError, IndexError, KeyError, TypeError):
+            self.xref, self.trailer = {}, {}
+        if "Root" not in self.trailer or not self.xref:
+            self._scan_objects()
+
+    # Cross-reference -------------------------------------------------
+
+    def _read_xref(self) -> None:
+        """Read the cross-reference sections, newest first."""
+        match = None
+        for match in _STARTXREF.finditer(self.data, max(0, len(self.data) - 4096)):
+            pass
+        if match is None:
+            raise PDFSyntaxError("startxref not found")
+        offset: Any = int(match.group(1))
+        seen = set()
+        while isinstance(offset, int) and offset not in seen:
+            seen.add(offset)
+            trailer = self._read_xref_section(offset)
+            if isinstance(trailer.get("XRefStm"), int):
+                self._read_xref_section(trailer["XRefStm"])
+            for key, value in trailer.items():
+                self.trailer.setdefault(key, value)
+            offset = trailer.get("Prev")
+
+    def _read_xref_section(self, offset: int) -> Dict[str, Any]:
+        """Read one cross-reference table or stream; return its trailer."""
+        data = self.data
+        if data[offset : offset + 4] != b"xref":
+            return self._read_xref_stream(offset)
+        pos = offset + 4
+        while True:
+            while data[pos : pos + 1] in (b" ", b"\t", b"\r", b"\n", b"\f"):
+                pos += 1
+            if data[pos : pos + 7] == b"trailer":
+                trailer = _Lexer(data, pos + 7).read()
+                if not isinstance(trailer, dict):
+                    raise PDFSyntaxError("malformed trailer")
+                return trailer
+            subsection = _XREF_SUBSECTION.match(data, pos)
+            if subsection is None:
+                raise PDFSyntaxError("malformed cross-reference table")
+            first, count = int(subsection.group(1)), int(subsection.group(2))
+            pos = subsection.end()
+            for num in range(first, first + count):
+                entry = _XREF_ENTRY.match(data, pos)
+                if entry is None:
+                    raise PDFSyntaxError("malformed cross-reference entry")
+                pos = entry.end()
+                if entry.group(3) == b"n":
+                    self.xref.setdefault(num, (1, int(entry.group(1)), 0))
+
+    def _read_xref_stream(self, offset: int) -> Dict[str, Any]:
+        """Read a cross-reference stream; return its dictionary."""
+        stream = self._object_at(offset)
+        if not isinstance(stream, _Stream):
+            raise PDFSyntaxError("cross-reference stream not found")
+        attrs = stream.attrs
+        widths = attrs["W"]
+        row_size = sum(widths)
+        index = attrs.get("Index") or [0, attrs["Size"]]
+        rows = self.stream_data(stream)
+        pos = 0
+        for first, count in zip(index[::2], index[1::2]):
+            for num in range(first, first + count):
+                row = rows[pos : pos + row_size]
+                pos += row_size
+                if len(row) < row_size:
+                    break
+                fields = []
+                start = 0
+                for width in widths:
+                    fields.append(int.from_bytes(row[start : start + width], "big"))
+                    start += width
+                kind = fields[0] if widths[0] else 1
+                if kind in (1, 2):
+                    self.xref.setdefault(num, (kind, fields[1], fields[2]))
+        return attrs
+
+    def _scan_objects(self) -> None:
+        """Rebuild the cross-reference by scanning the file for objects."""
+        self._scanned = True
+        for match in _OBJECT_HEADER.finditer(self.data):
+            self.xref[int(match.group(1))] = (1, match.start(), 0)
+        self._objects.clear()
+        for match in re.finditer(rb"trailer\s*<<", self.data):
+            trailer = _Lexer(self.data, match.end() - 2).read()
+            if isinstance(trailer, dict):
+                self.trailer.update(trailer)
+        if "Root" in self.trailer:
+            return
+        for num in list(self.xref):
+            try:
+                obj = self.get(num)
+            except PDFSyntaxError:
+                continue
+            attrs = obj.attrs if isinstance(obj, _Stream) else obj
+            if isinstance(attrs, dict):
+                if attrs.get("Type") == "Catalog":
+                    self.trailer["Root"] = _Ref(num, 0)
+                elif attrs.get("Type") == "XRef" and "Root" in attrs:
+                    self.trailer.setdefault("Root", attrs["Root"])
+        if "Root" not in self.trailer:
+            raise PDFSyntaxError("document catalog not found")
+
+    # Objects -----------------------------------------------------------
+
+    def get(self, num: int) -> Any:
+        """Return an indirect object by number (None if it does not exist)."""
+        if num in self._objects:
+            return self._objects[num]
+        entry = self.xref.get(num)
+        if entry is None:
+            return None
+        self._objects[num] = None  # breaks reference cycles
+        if entry[0] == 1:
+            try:
+                obj = self._object_at(entry[1])
+            except PDFSyntaxError:
+                if self._scanned:
+                    raise
+                # A stale offset: rebuild the cross-reference once and retry
+                self._scan_objects()
+                return self.get(num)
+        else:
+            obj = self._compressed_object(entry[1], entry[2])
+        self._objects[num] = obj
+        return obj
+
+    def resolve(self, value: Any) -> Any:
+        """Follow references until a direct object is reached."""
+        while type(value) is _Ref:
+            value = self.get(value.num)
+        return value
+
+    def number(self, value: Any) -> float:
+        """Resolve a numeric object; raise PDFSyntaxError if it is not one."""
+        value = self.resolve(value)
+        if type(value) not in (int, float):
+            raise PDFSyntaxError(f"expected a number, got {value!r:.40}")
+        return float(value)
+
+    def _object_at(self, offset: int) -> Any:
+        """Parse the indirect object whose header starts at `offset`."""
+        lexer = _Lexer(self.data, offset)
+        lexer.read()
+        lexer.read()
+        if lexer.read() != "obj":
+            raise PDFSyntaxError(f"no object at offset {offset}")
+        obj = lexer.read()
+        if not isinstance(obj, dict):
+            return obj
+        end_of_dict = lexer.pos
+        if lexer.token() != "stream":
+            lexer.pos = end_of_dict
+            return obj
+        data = self.data
+        start = lexer.pos
+        if data[start : start + 2] == b"\r\n":
+            start += 2
+        elif data[start : start + 1] in (b"\r", b"\n"):
+            start += 1
+        length = self.resolve(obj.get("Length"))
+        if isinstance(length, int) and length >= 0:
+            tail = data[start + length : start + length + 32]
+            if tail.lstrip().startswith(b"endstream"):
+                return _Stream(obj, data[start : start + length])
+        end = _ENDSTREAM.search(data, start)
+        if end is None:
+            raise PDFSyntaxError(f"unterminated stream at offset {offset}")
+        return _Stream(obj, data[start : end.start()])
+
+    def _compressed_object(self, stream_num: int, index: int) -> Any:
+        """Return an object stored inside an object stream."""
+        objects = self._object_streams.get(stream_num)
+        if objects is None:
+            objects = []
+            stream = self.get(stream_num)
+            if isinstance(stream, _Stream):
+                data = self.stream_data(stream)
+                lexer = _Lexer(data)
+                header = [lexer.read() for _ in range(2 * stream.attrs.get("N", 0))]
+                first = stream.attrs.get("First", 0)
+                for offset in header[1::2]:
+                    lexer.pos = first + offset
+                    objects.append(lexer.read())
+            self._object_streams[stream_num] = objects
+        return objects[index] if index < len(objects) else None
+
+    def stream_data(self, stream: _Stream) -> bytes:
+        """
+        Return the decoded bytes of a stream.
+
+        Raises:
+            PDFSyntaxError: If a filter is not supported or the data is corrupt
+        """
+        if stream.data is not None:
+            return stream.data
+        filters = self.resolve(stream.attrs.get("Filter"))
+        params = self.resolve(stream.attrs.get("DecodeParms"))
+        if not isinstance(filters, list):
+            filters = [filters] if filters else []
+        if not isinstance(params, list):
+            params = [params] * len(filters)
+        data = bytes(stream.raw)
+        for name, param in zip(filters, params):
+            param = self.resolve(param) or {}
+            if name in ("FlateDecode", "Fl"):
+                data = _unpredict(_inflate(data), param)
+            elif name in ("ASCIIHexDecode", "AHx"):
+                digits = _HEX_JUNK.sub(b"", data.split(b">", 1)[0])
+                data = bytes.fromhex((digits + b"0" * (len(digits) % 2)).decode())
+            elif name in ("ASCII85Decode", "A85"):
+                data = base64.a85decode(data.strip().removesuffix(b"~>"))
+            else:
+                raise PDFSyntaxError(f"unsupported stream filter {name}")
+        stream.data = data
+        return data
+
+    # Pages -------------------------------------------------------------
+
+    @property
+    def encrypted(self) -> bool:
+        """Whether the document is encrypted."""
+        return "Encrypt" in self.trailer
+
+    def pages(self) -> Iterator[Dict[str, Any]]:
+        """Yield the page dictionaries, with inherited attributes filled in."""
+        root = self.resolve(self.trailer.get("Root"))
+        if not isinstance(root, dict):
+            raise PDFSyntaxError("document catalog not found")
+        seen = set()
+        stack: List[Tuple[Any, Dict[str, Any]]] = [(root.get("Pages"), {})]
+        while stack:
+            ref, inherited = stack.pop()
+            if type(ref) is _Ref:
+                if ref.num in seen:
+                    continue
+                seen.add(ref.num)
+            node = self.resolve(ref)
+            if not isinstance(node, dict):
+                continue
+            attrs = dict(inherited)
+            for key in ("Resources", "MediaBox", "CropBox", "Rotate"):
+                if key in node:
+                    attrs[key] = node[key]
+            kids = self.resolve(node.get("Kids"))
+            if node.get("Type") == "Pages" or isinstance(kids, list):
+                if isinstance(kids, list):
+                    stack.extend((kid, attrs) for kid in reversed(kids))
+            else:
+                yield {**node, **attrs}
+
+
+# ========================================
+# FONTS
+# ========================================
+
+# Glyph names of /Differences that are not single characters or uniXXXX
+_GLYPH_NAMES = {
+    "space": " ",
+    "exclam": "!",
+    "quotedbl": '"',
+    "numbersign": "#",
+    "dollar": "$",
+    "percent": "%",
+    "ampersand": "&",
+    "quotesingle": "'",
+    "quoteright": "’",
+    "quoteleft": "‘",
+    "quotedblleft": "“",
+    "quotedblright": "”",
+    "parenleft": "(",
+    "parenright": ")",
+    "asterisk": "*",
+    "plus": "+",
+    "comma": ",",
+    "hyphen": "-",
+    "minus": "-",
+    "period": ".",
+    "slash": "/",
+    "colon": ":",
+    "semicolon": ";",
+    "less": "<",
+    "equal": "=",
+    "greater": ">",
+    "question": "?",
+    "at": "@",
+    "bracketleft": "[",
+    "backslash": "\\",
+    "bracketright": "]",
+    "underscore": "_",
+    "bar": "|",
+    "braceleft": "{",
+    "braceright": "}",
+    "endash": "–",
+    "emdash": "—",
+    "bullet": "•",
+    "periodcentered": "·",
+    "ellipsis": "…",
+    "fi": "fi",
+    "fl": "fl",
+    "ff": "ff",
+    "ffi": "ffi",
+    "ffl": "ffl",
+    "copyright": "©",
+    "registered": "®",
+    "trademark": "™",
+    "degree": "°",
+    "zero": "0",
+    "one": "1",
+    "two": "2",
+    "three": "3",
+    "four": "4",
+    "five": "5",
+    "six": "6",
+    "seven": "7",
+    "eight": "8",
+    "nine": "9",
+}
+
+_SUBSET_PREFIX = re.compile(r"^[A-Z]{6}\+")
+_FONT_STYLE = re.compile(
+    r"(?:[-,_ ]?(?:Bold|Italic|Oblique|Regular|Roman|Light|Medium|Semibold|"
+    r"SemiBold|Black|Heavy|Book|Condensed|Narrow|BoldItalic|It|Bd|MT|PS|PSMT))+$"
+)
+
+
+def _glyph_text(name: str) -> str:
+    """Return the text of a glyph name, or an empty string if unknown."""
+    base = name.split(".", 1)[0]
+    if len(base) == 1:
+        return base
+    if base in _GLYPH_NAMES:
+        return _GLYPH_NAMES[base]
+    if base.startswith("uni") and len(base) >= 7:
+        try:
+            return "".join(
+                chr(int(base[index : index + 4], 16))
+                for index in range(3, len(base) - 3, 4)
+            )
+        except ValueError:
+            return ""
+    if base.startswith("u") and 5 <= len(base) <= 7:
+        try:
+            return chr(int(base[1:], 16))
+        except ValueError:
+            return ""
+    if "_" in base:
+        return "".join(_glyph_text(part) for part in base.split("_"))
+    return ""
+
+
+def _codec_table(codec: str) -> List[str]:
+    """Return the characters of the 256 codes of a single-byte encoding."""
+    return [bytes([code]).decode(codec, "replace") for code in range(256)]
+
+
+_ENCODINGS = {
+    "WinAnsiEncoding": _codec_table("cp1252"),
+    "MacRomanEncoding": _codec_table("mac_roman"),
+    "StandardEncoding": _codec_table("latin-1"),
+}
+
+
+def _utf16(value: Any) -> str:
+    """Decode a ToUnicode destination (UTF-16BE bytes or a glyph name)."""
+    if isinstance(value, bytes):
+        if len(value) % 2:
+            return value.decode("latin-1")
+        return value.decode("utf-16-be", "replace")
+    return _glyph_text(str(value))
+
+
+def parse_to_unicode(data: bytes) -> Dict[int, str]:
+    """
+    Parse a ToUnicode CMap.
+
+    Args:
+        data (bytes): Decoded CMap stream
+
+    Returns:
+        Dict[int, str]: Text by character code
+    """
+    lexer = _Lexer(data)
+    mapping: Dict[int, str] = {}
+    operands: List[Any] = []
+    while True:
+        obj = lexer.read()
+        if obj is _EOF:
+            return mapping
+        if type(obj) is not _Op:
+            operands.append(obj)
+            continue
+        if obj == "endbfchar":
+            for source, target in zip(operands[::2], operands[1::2]):
+                if isinstance(source, bytes):
+                    mapping[int.from_bytes(source, "big")] = _utf16(target)
+        elif obj == "endbfrange":
+            for low, high, target in zip(
+                operands[::3], operands[1::3], operands[2::3]
+            ):
+                if not isinstance(low, bytes) or not isinstance(high, bytes):
+                    continue
+                first = int.from_bytes(low, "big")
+                last = min(int.from_bytes(high, "big"), first + 0xFFFF)
+                if isinstance(target, list):
+                    for offset, value in enumerate(target[: last - first + 1]):
+                        mapping[first + offset] = _utf16(value)
+                    continue
+                text = _utf16(target)
+                if not text:
+                    continue
+                prefix, base = text[:-1], ord(text[-1])
+                for offset in range(last - first + 1):
+                    if base + offset > 0x10FFFF:
+                        break
+                    mapping[first + offset] = prefix + chr(base + offset)
+        operands = []
+
+
+class _Font:
+    """
+    A font of a page, as needed to place and decode its text.
+
+    Attributes:
+        name (str): Font name without subset prefix, e.g. "Ubuntu-Bold"
+        family (str): Family without styles, e.g. "Ubuntu"
+        embedded (bool): Whether the font program is embedded
+        two_byte (bool): Whether character codes are two bytes long
+        widths (Dict[int, float]): Glyph widths by code, in 1/1000 em
+        default_width (float): Width of codes missing from `widths`
+        unicode (Dict[int, str]): Text by code
+        unmapped (int): Characters decoded without a Unicode mapping
+    """
+
+    def __init__(self, reader: _PDFReader, attrs: Dict[str, Any]) -> None:
+        resolve, number = reader.resolve, reader.number
+        subtype = attrs.get("Subtype")
+        base_font = str(resolve(attrs.get("BaseFont")) or "")
+        font = attrs
+        if subtype == "Type0":
+            descendants = resolve(attrs.get("DescendantFonts"))
+            font = {}
+            if isinstance(descendants, list) and descendants:
+                font = resolve(descendants[0])
+            if not isinstance(font, dict):
+                font = {}
+        descriptor = resolve(font.get("FontDescriptor"))
+        if not isinstance(descriptor, dict):
+            descriptor = {}
+        if not base_font:
+            base_font = str(resolve(descriptor.get("FontName")) or "Unknown")
+        self.name = _SUBSET_PREFIX.sub("", base_font)
+        self.family = _FONT_STYLE.sub("", self.name) or self.name
+        self.embedded = subtype == "Type3" or any(
+            key in descriptor for key in ("FontFile", "FontFile2", "FontFile3")
+        )
+        self.two_byte = subtype == "Type0"
+        self.widths: Dict[int, float] = {}
+        self.unicode: Dict[int, str] = {}
+        self.unmapped = 0
+        if self.two_byte:
+            self.default_width = number(font.get("DW", 1000))
+            self._load_cid_widths(resolve(font.get("W")) or [], reader)
+        else:
+            self.default_width = number(
+                descriptor.get("MissingWidth")
+                or (600 if "Courier" in self.name else 500)
+            )
+            scale = 1.0
+            matrix = resolve(attrs.get("FontMatrix"))
+            if subtype == "Type3" and isinstance(matrix, list) and matrix:
+                scale = number(matrix[0]) * 1000
+            first = int(number(attrs.get("FirstChar", 0) or 0))
+            widths = resolve(attrs.get("Widths"))
+            for offset, width in enumerate(widths if isinstance(widths, list) else []):
+                self.widths[first + offset] = number(width) * scale
+            self.unicode = dict(enumerate(self._encoding(resolve, attrs)))
+        to_unicode = resolve(attrs.get("ToUnicode"))
+        if isinstance(to_unicode, _Stream):
+            try:
+                self.unicode.update(parse_to_unicode(reader.stream_data(to_unicode)))
+            except PDFSyntaxError:
+                pass
+
+    def _load_cid_widths(self, widths: Any, reader: _PDFReader) -> None:
+        """Read the /W array of a CID font."""
+        if not isinstance(widths, list):
+            return
+        index = 0
+        while index + 1 < len(widths):
+            first = int(reader.number(widths[index]))
+            following = reader.resolve(widths[index + 1])
+            if isinstance(following, list):
+                for offset, width in enumerate(following):
+                    self.widths[first + offset] = reader.number(width)
+                index += 2
+            elif index + 2 < len(widths):
+                last = int(reader.number(following))
+                width = reader.number(widths[index + 2])
+                for code in range(first, min(last, first + 0xFFFF) + 1):
+                    self.widths[code] = width
+                index += 3
+            else:
+                break
+
+    @staticmethod
+    def _encoding(resolve: Any, attrs: Dict[str, Any]) -> List[str]:
+        """Return the characters of the 256 codes of a simple font."""
+        encoding = resolve(attrs.get("Encoding"))
+        differences: List[Any] = []
+        if isinstance(encoding, dict):
+            differences = resolve(encoding.get("Differences")) or []
+            encoding = encoding.get("BaseEncoding")
+        table = list(_ENCODINGS.get(encoding, _ENCODINGS["WinAnsiEncoding"]))
+        code = 0
+        for item in differences:
+            if isinstance(item, int):
+                code = item
+            elif code < 256:
+                table[code] = _glyph_text(str(item))
+                code += 1
+        return table
+
+    def decode(self, raw: bytes) -> Tuple[str, float, int, int]:
+        """
+        Decode a shown string.
+
+        Args:
+            raw (bytes): String operand of a text showing operator
+
+        Returns:
+            Tuple[str, float, int, int]: Text, total glyph width (1/1000 em),
+                number of glyphs and number of single-byte spaces
+        """
+        if self.two_byte:
+            count = len(raw) // 2
+            codes: Any = struct.unpack(f">{count}H", raw[: 2 * count])
+        else:
+            codes = raw
+        unicode, widths, default = self.unicode, self.widths, self.default_width
+        chars = []
+        width = 0.0
+        for code in codes:
+            text = unicode.get(code)
+            if text is None or text == "�":
+                self.unmapped += 1
+                text = "�"
+            chars.append(text)
+            width += widths.get(code, default)
+        spaces = 0 if self.two_byte else raw.count(32)
+        return "".join(chars), width, len(codes), spaces
+
+
+# ========================================
+# PAGE CONTENT
+# ========================================
+
+
+class _Span(NamedTuple):
+    """A run of text drawn by one text showing operator."""
+
+    x0: float
+    x1: float
+    y: float
+    size: float
+    font: _Font
+    text: str
+
+
+# Graphics state slots. The state is a list so that q can copy it cheaply;
+# some generators wrap every glyph in q/Q.
+_CTM, _FONT, _SIZE, _CHAR_SPACING, _WORD_SPACING = range(5)
+_SCALE, _LEADING, _RISE, _RENDER, _WHITE = range(5, 10)
+_INITIAL_STATE = [_IDENTITY, None, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0, False]
+
+# Operands of a content stream instruction. Strings nest one level of
+# parentheses; anything else falls back to the _Lexer.
+_OPERANDS = (
+    rb"(?:[ \t\r\n\f\x00]|%[^\r\n]*"
+    rb"|[-+]?(?:\d++\.?\d*+|\.\d++)"
+    rb"|/[^ \t\r\n\f\x00()<>\[\]{}/%]*+"
+    rb"|\((?:[^()\\]|\\.|\((?:[^()\\]|\\.)*+\))*+\)"
+    rb"|<[0-9A-Fa-f \t\r\n\f]*+>"
+    rb"|[\[\]]|<<|>>)*+"
+)
+_OPERATOR_END = rb"(?![A-Za-z0-9*'\"])"
+# Operators that do not affect text, lines or images by themselves. Path
+# construction is included: a painted path is parsed from the stream when
+# its painting operator is reached (see _paint).
+_SKIPPED_OPERATORS = (
+    rb"(?:l|m|h|n|W\*?|re|c|v|y|gs|cs|CS|SCN|SC|G|RG|K|w|J|j|d|M|ri|i"
+    rb"|BDC|BMC|EMC|MP|DP|sh|BX|EX|ET|d0|d1)"
+)
+_COLOR_OPERATORS = rb"(?:g|rg|k|sc|scn)"
+# A q ... Q block that only changes state, nesting up to three levels
+_STATE_BLOCK = b""
+for _level in range(3):
+    _STATE_BLOCK = (
+        rb"[ \t\r\n\f\x00]*+q"
+        + _OPERATOR_END
+        + rb"(?:"
+        + _OPERANDS
+        + rb"(?:"
+        + _SKIPPED_OPERATORS
+        + rb"|"
+        + _COLOR_OPERATORS
+        + rb"|cm)"
+        + _OPERATOR_END
+        + (rb"|" + _STATE_BLOCK if _STATE_BLOCK else b"")
+        + rb")*+"
+        + _OPERANDS
+        + rb"Q"
+        + _OPERATOR_END
+    )
+# One instruction the interpreter handles, after any run of skipped
+# instructions and state blocks. Groups: the last fill color set in the
+# run, the operands and the operator.
+_INSTRUCTION = re.compile(
+    rb"(?:" + _STATE_BLOCK
+    + rb"|" + _OPERANDS + _SKIPPED_OPERATORS + _OPERATOR_END
+    + rb"|(" + _OPERANDS + _COLOR_OPERATORS + _OPERATOR_END + rb"))*+"
+    + rb"(" + _OPERANDS + rb")([A-Za-z][A-Za-z0-9]*+\*?|'|\")",
+    re.S,
+)
+# Path construction and clipping, to parse a painted path
+_PATH_INSTRUCTION = re.compile(
+    rb"(?<![^ \t\r\n\f\x00\])>])"
+    rb"((?:[-+]?(?:\d+\.?\d*|\.\d+)[ \t\r\n\f\x00]+)*)"
+    rb"(re|m|l|c|v|y|h|n|W\*?)(?![A-Za-z0-9*])"
+)
+_HEX_OPERAND = re.compile(rb"[ \t\r\n\f\x00]*<(?:[0-9A-Fa-f]{2})*>[ \t\r\n\f\x00]*")
+_PAINT_OPS = frozenset(b"S s f F f* B B* b b*".split())
+_COLOR_OPS = frozenset(b"g rg k sc scn".split())
+_KEYWORD_OPERANDS = frozenset((b"true", b"false", b"null"))
+
+
+def _multiply(m: Any, n: Any) -> Tuple[float, ...]:
+    """Multiply two PDF matrices (a b c d e f)."""
+    return (
+        m[0] * n[0] + m[1] * n[2],
+        m[0] * n[1] + m[1] * n[3],
+        m[2] * n[0] + m[3] * n[2],
+        m[2] * n[1] + m[3] * n[3],
+        m[4] * n[0] + m[5] * n[2] + n[4],
+        m[4] * n[1] + m[5] * n[3] + n[5],
+    )
+
+
+def _apply(m: Any, x: float, y: float) -> Tuple[float, float]:
+    """Transform a point by a matrix."""
+    return m[0] * x + m[2] * y + m[4], m[1] * x + m[3] * y + m[5]
+
+
+def _is_white(operands: List[Any]) -> bool:
+    """Whether the operands of a fill color operator give white."""
+    values = [value for value in operands if isinstance(value, (int, float))]
+    if len(values) == 4:
+        return max(values) <= 0.01
+    return bool(values) and min(values) >= 0.99
+
+
+def _parse_operands(text: bytes) -> List[Any]:
+    """Parse the operands of an instruction with the general lexer."""
+    lexer = _Lexer(text)
+    operands = []
+    while True:
+        obj = lexer.read()
+        if obj is _EOF:
+            return operands
+        operands.append(obj)
+
+
+class _PageContent:
+    """
+    Interprets the content streams of a page.
+
+    Attributes:
+        spans (List[_Span]): Visible horizontal text
+        rules (List[Tuple[str, float, float, float]]): Painted horizontal
+            ("h", y, x0, x1) and vertical ("v", x, y0, y1) lines
+        images (List[Tuple[float, float, float, float]]): Image bounding boxes
+        drawings (int): Painted paths with curves (icons, charts)
+        hidden (int): Characters drawn invisibly, or in white on a white page
+        rotated (int): Characters drawn rotated or mirrored
+    """
+
+    def __init__(self, reader: _PDFReader, fonts: Dict[Any, _Font]) -> None:
+        self.reader = reader
+        self.fonts = fonts
+        self.spans: List[_Span] = []
+        self.rules: List[Tuple[str, float, float, float]] = []
+        self.images: List[Tuple[float, float, float, float]] = []
+        self.drawings = 0
+        self.hidden = 0
+        self.rotated = 0
+        self._forms: set = set()
+        self._white_spans: List[_Span] = []
+        self._fills: List[Tuple[float, float, float, float]] = []
+
+    def _font(self, resources: Dict[str, Any], name: Any) -> Optional[_Font]:
+        """Return a font of the resources by name, loading it once."""
+        resolve = self.reader.resolve
+        fonts = resolve(resources.get("Font"))
+        if not isinstance(fonts, dict):
+            return None
+        ref = fonts.get(name)
+        key = ref if type(ref) is _Ref else id(ref)
+        if key not in self.fonts:
+            attrs = resolve(ref)
+            if not isinstance(attrs, dict):
+                return None
+            self.fonts[key] = _Font(self.reader, attrs)
+        return self.fonts[key]
+
+    def run(
+        self, data: bytes, resources: Any, state: Optional[list] = None, depth: int = 0
+    ) -> None:
+        """
+        Interpret a content stream.
+
+        Args:
+            data (bytes): Decoded content stream
+            resources (Any): Resource dictionary of the stream
+            state (list, optional): Graphics state at the start of the stream
+            depth (int): Nesting depth of form XObjects
+        """
+        resources = self.reader.resolve(resources)
+        if not isinstance(resources, dict):
+            resources = {}
+        state = list(state or _INITIAL_STATE)
+        match_instruction = _INSTRUCTION.match
+        saved: List[list] = []
+        tm = tlm = _IDENTITY
+        pending: List[Any] = []
+        pos, end = 0, len(data)
+        while pos < end:
+            match = match_instruction(data, pos)
+            if match is None:
+                # Operands the instruction pattern does not cover
+                lexer = _Lexer(data, pos)
+                obj = lexer.read()
+                pos = max(lexer.pos, pos + 1)
+                if obj is not _EOF and type(obj) is not _Op:
+                    pending.append(obj)
+                continue
+            pos = match.end()
+            color, text, op = match.groups()
+            if color is not None:
+                state[_WHITE] = _is_white(_parse_operands(color))
+            if op in _KEYWORD_OPERANDS:
+                pending.extend(_parse_operands(text))
+                pending.append(_KEYWORD_VALUES[op.decode()])
+                continue
+            try:
+                if op == b"q":
+                    saved.append(state[:])
+                elif op == b"Q":
+                    if saved:
+                        state = saved.pop()
+                elif op == b"cm":
+                    state[_CTM] = _multiply(
+                        [float(value) for value in text.split()], state[_CTM]
+                    )
+                elif op == b"Td" or op == b"TD":
+                    tx, ty = (float(value) for value in text.split())
+                    if op == b"TD":
+                        state[_LEADING] = -ty
+                    tlm = tm = (
+                        tlm[0],
+                        tlm[1],
+                        tlm[2],
+                        tlm[3],
+                        tx * tlm[0] + ty * tlm[2] + tlm[4],
+                        tx * tlm[1] + ty * tlm[3] + tlm[5],
+                    )
+                elif op == b"Tj" and _HEX_OPERAND.fullmatch(text):
+                    items = bytes.fromhex(_HEX_JUNK.sub(b"", text).decode("ascii"))
+                    tm = self._show([items], tm, state)
+                elif op == b"Tj" or op == b"TJ":
+                    items = (pending + _parse_operands(text))[-1]
+                    tm = self._show(items if op == b"TJ" else [items], tm, state)
+                elif op in _PAINT_OPS:
+                    self._paint(data[match.start() : match.start(3)], state, op)
+                elif op == b"Tf":
+                    operands = pending + _parse_operands(text)
+                    state[_FONT] = self._font(resources, operands[0])
+                    state[_SIZE] = operands[1]
+                elif op == b"Tm":
+                    tlm = tm = tuple(float(value) for value in text.split())
+                elif op in (b"T*", b"'", b'"'):
+                    operands = pending + _parse_operands(text)
+                    if op == b'"':
+                        state[_WORD_SPACING], state[_CHAR_SPACING] = operands[:2]
+                    leading = state[_LEADING]
+                    tlm = tm = (
+                        tlm[0],
+                        tlm[1],
+                        tlm[2],
+                        tlm[3],
+                        tlm[4] - leading * tlm[2],
+                        tlm[5] - leading * tlm[3],
+                    )
+                    if op != b"T*":
+                        tm = self._show([operands[-1]], tm, state)
+                elif op == b"BT":
+                    tlm = tm = _IDENTITY
+                elif op in _COLOR_OPS:
+                    state[_WHITE] = _is_white(pending + _parse_operands(text))
+                elif op == b"Tc":
+                    state[_CHAR_SPACING] = float(text)
+                elif op == b"Tw":
+                    state[_WORD_SPACING] = float(text)
+                elif op == b"Tz":
+                    state[_SCALE] = float(text) / 100
+                elif op == b"TL":
+                    state[_LEADING] = float(text)
+                elif op == b"Ts":
+                    state[_RISE] = float(text)
+                elif op == b"Tr":
+                    state[_RENDER] = int(float(text))
+                elif op == b"Do":
+                    operands = pending + _parse_operands(text)
+                    self._xobject(resources, operands[-1], state, depth)
+                elif op == b"BI":
+                    pos = self._inline_image(data, pos, state)
+            except (IndexError, TypeError, ValueError, ZeroDivisionError):
+                pass
+            pending = []
+        if depth == 0:
+            self._place_white_text()
+
+    def _show(self, items: List[Any], tm: Any, state: list) -> Tuple[float, ...]:
+        """Record the text of a Tj or TJ operand; return the advanced Tm."""
+        font = state[_FONT]
+        if font is None:
+            return tm
+        size, scale = state[_SIZE], state[_SCALE]
+        char_spacing, word_spacing = state[_CHAR_SPACING], state[_WORD_SPACING]
+        parts: List[str] = []
+        advance = 0.0
+        for item in items:
+            if type(item) is bytes:
+                text, width, glyphs, spaces = font.decode(item)
+                parts.append(text)
+                advance += (
+                    width / 1000 * size + char_spacing * glyphs + word_spacing * spaces
+                ) * scale
+            elif isinstance(item, (int, float)):
+                advance -= item / 1000 * size * scale
+                if -item >= _TJ_WORD_GAP and parts and not parts[-1].endswith(" "):
+                    parts.append(" ")
+        text = "".join(parts).strip()
+        if text:
+            m = _multiply(tm, state[_CTM])
+            rise = state[_RISE]
+            x0 = m[4] + rise * m[2]
+            if state[_RENDER] in (3, 7):
+                self.hidden += len(text)
+            elif abs(m[1]) > 0.01 * abs(m[0]) or m[0] <= 0 or m[3] <= 0:
+                self.rotated += len(text)
+            else:
+                spans = self._white_spans if state[_WHITE] else self.spans
+                spans.append(
+                    _Span(
+                        x0,
+                        x0 + advance * m[0],
+                        m[5] + rise * m[3],
+                        size * math.hypot(m[2], m[3]),
+                        font,
+                        "".join(parts),
+                    )
+                )
+        return (
+            tm[0],
+            tm[1],
+            tm[2],
+            tm[3],
+            tm[4] + advance * tm[0],
+            tm[5] + advance * tm[1],
+        )
+
+    def _paint(self, region: bytes, state: list, op: bytes) -> None:
+        """
+        Record the rules and filled areas of a painted path.
+
+        Args:
+            region (bytes): Content stream since the previous handled
+                instruction, holding the path construction operators
+            state (list): Graphics state
+            op (bytes): Painting operator
+        """
+        ctm = state[_CTM]
+        segments: List[Tuple[float, float, float, float]] = []
+        points: List[Tuple[float, float]] = []
+        current = start = (0.0, 0.0)
+        curved = False
+        for text, path_op in _PATH_INSTRUCTION.findall(region):
+            try:
+                values = [float(value) for value in text.split()]
+                if path_op == b"l":
+                    point = _apply(ctm, values[0], values[1])
+                    segments.append((*current, *point))
+                    current = point
+                elif path_op == b"m":
+                    current = start = _apply(ctm, values[0], values[1])
+                elif path_op == b"re":
+                    x, y, width, height = values[:4]
+                    x0, y0 = _apply(ctm, x, y)
+                    x1, y1 = _apply(ctm, x + width, y + height)
+                    segments.extend(
+                        [
+                            (x0, y0, x1, y0),
+                            (x1, y0, x1, y1),
+                            (x1, y1, x0, y1),
+                            (x0, y1, x0, y0),
+                        ]
+                    )
+                    current = start = (x0, y0)
+                elif path_op == b"h":
+                    segments.append((*current, *start))
+                    current = start
+                elif path_op in (b"c", b"v", b"y"):
+                    current = _apply(ctm, values[-2], values[-1])
+                    curved = True
+                elif path_op == b"n":
+                    # A clipping path ended; the painted path follows
+                    segments, points = [], []
+                    curved = False
+                    continue
+                points.append(current)
+            except (IndexError, ValueError):
+                continue
+        self.drawings += curved
+        if not points:
+            return
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        box = (min(xs), min(ys), max(xs), max(ys))
+        width, height = box[2] - box[0], box[3] - box[1]
+        if op not in (b"S", b"s"):
+            if height <= _MAX_RULE_WIDTH and width > 8 * max(height, 0.1):
+                # A thin filled shape is drawn as a rule
+                self.rules.append(("h", (box[1] + box[3]) / 2, box[0], box[2]))
+                return
+            if width <= _MAX_RULE_WIDTH and height > 8 * max(width, 0.1):
+                self.rules.append(("v", (box[0] + box[2]) / 2, box[1], box[3]))
+                return
+            if not state[_WHITE]:
+                self._fills.append(box)
+            if op not in (b"B", b"B*", b"b", b"b*"):
+                return
+        for x0, y0, x1, y1 in segments:
+            if abs(y1 - y0) <= 1 and abs(x1 - x0) > 1:
+                self.rules.append(("h", (y0 + y1) / 2, min(x0, x1), max(x0, x1)))
+            elif abs(x1 - x0) <= 1 and abs(y1 - y0) > 1:
+                self.rules.append(("v", (x0 + x1) / 2, min(y0, y1), max(y0, y1)))
+
+    def _place_white_text(self) -> None:
+        """Keep white text drawn on a filled shape; count the rest as hidden."""
+        for span in self._white_spans:
+            x, y = (span.x0 + span.x1) / 2, span.y + span.size / 3
+            if any(x0 <= x <= x1 and y0 <= y <= y1 for x0, y0, x1, y1 in self._fills):
+                self.spans.append(span)
+            else:
+                self.hidden += len(span.text.strip())
+        self._white_spans = []
+
+    def _image(self, ctm: Any) -> None:
+        """Record an image drawn into the unit square of `ctm`."""
+        corners = [_apply(ctm, x, y) for x, y in ((0, 0), (1, 0), (0, 1), (1, 1))]
+        xs = [x for x, _ in corners]
+        ys = [y for _, y in corners]
+        self.images.append((min(xs), min(ys), max(xs), max(ys)))
+
+    def _xobject(self, resources: Dict[str, Any], name: Any, state: list, depth: int):
+        """Draw an image or form XObject."""
+        resolve = self.reader.resolve
+        xobjects = resolve(resources.get("XObject"))
+        if not isinstance(xobjects, dict):
+            return
+        xobject = resolve(xobjects.get(name))
+        if not isinstance(xobject, _Stream):
+            return
+        subtype = xobject.attrs.get("Subtype")
+        if subtype == "Image":
+            self._image(state[_CTM])
+        elif subtype == "Form" and depth < _MAX_FORM_DEPTH:
+            if id(xobject) in self._forms:
+                return
+            self._forms.add(id(xobject))
+            form_state = state[:]
+            matrix = resolve(xobject.attrs.get("Matrix"))
+            if isinstance(matrix, list) and len(matrix) == 6:
+                matrix = [self.reader.number(value) for value in matrix]
+                form_state[_CTM] = _multiply(matrix, state[_CTM])
+            self.run(
+                self.reader.stream_data(xobject),
+                xobject.attrs.get("Resources") or resources,
+                form_state,
+                depth + 1,
+            )
+            self._forms.discard(id(xobject))
+
+    def _inline_image(self, data: bytes, pos: int, state: list) -> int:
+        """Record an inline image (BI ... ID data EI); return the offset after it."""
+        lexer = _Lexer(data, pos)
+        while True:
+            obj = lexer.read()
+            if obj is _EOF or obj == "ID":
+                break
+        end = _INLINE_IMAGE_END.search(data, lexer.pos)
+        self._image(state[_CTM])
+        return end.end() if end else len(data)
+
+
+# ========================================
+# LAYOUT MODELS
+# ========================================
+
+
+class FontUsage(BaseModel):
+    """
+    A font used for the text of the document.
+
+    Attributes:
+        name (str): Font name without subset prefix, e.g. "Ubuntu-Bold"
+        family (str): Font family, e.g. "Ubuntu"
+        embedded (bool): Whether the font program is embedded
+        standard (bool): Whether the family is widely available
+        sizes (List[float]): Font sizes used, in points
+        characters (int): Characters set in the font
+        unmapped_characters (int): Characters without a Unicode mapping
+    """
+
+    name: str = Field(description="Font name without subset prefix")
+    family: str = Field(description="Font family")
+    embedded: bool = Field(description="Whether the font program is embedded")
+    standard: bool = Field(description="Whether the family is widely available")
+    sizes: List[float] = Field(description="Font sizes used, in points")
+    characters: int = Field(description="Characters set in the font")
+    unmapped_characters: int = Field(
+        description="Characters without a Unicode mapping", default=0
+    )
+
+
+class PageLayout(BaseModel):
+    """
+    Layout of one page.
+
+    Attributes:
+        number (int): Page number, starting at 1
+        width (float): Page width in points
+        height (float): Page height in points
+        lines (int): Text lines
+        columns (int): Most text columns side by side
+        column_lines (int): Lines laid out in two or more columns
+        tables (int): Ruled or aligned tables
+        images (int): Raster images
+        drawings (int): Vector drawings with curves (icons, charts)
+        header_footer (List[str]): Lines in the page margins that repeat
+            on other pages or are page numbers
+        text (str): Page text in reading order, column by column
+    """
+
+    number: int = Field(description="Page number, starting at 1")
+    width: float = Field(description="Page width in points")
+    height: float = Field(description="Page height in points")
+    lines: int = Field(description="Text lines", default=0)
+    columns: int = Field(description="Most text columns side by side", default=1)
+    column_lines: int = Field(
+        description="Lines laid out in two or more columns", default=0
+    )
+    tables: int = Field(description="Ruled or aligned tables", default=0)
+    images: int = Field(description="Raster images", default=0)
+    drawings: int = Field(description="Vector drawings with curves", default=0)
+    header_footer: List[str] = Field(
+        description="Header and footer lines", default_factory=list
+    )
+    text: str = Field(description="Page text in reading order", default="")
+
+
+class ResumeLayout(BaseModel):
+    """
+    Layout analysis of a resume PDF.
+
+    Attributes:
+        pages (List[PageLayout]): Layout of every page
+        fonts (List[FontUsage]): Fonts by number of characters, descending
+        sections (List[str]): Section headings found, in order
+        encrypted (bool): Whether the PDF is encrypted
+        format_compliance (Dict[str, bool]): ATS format checklist, with the
+            keys of ATSOptimization.format_compliance
+        parsing_warnings (List[str]): Parsing issues found in the layout
+    """
+
+    pages: List[PageLayout] = Field(
+        description="Layout of every page", default_factory=list
+    )
+    fonts: List[FontUsage] = Field(
+        description="Fonts by number of characters", default_factory=list
+    )
+    sections: List[str] = Field(
+        description="Section headings found", default_factory=list
+    )
+    encrypted: bool = Field(description="Whether the PDF is encrypted", default=False)
+    format_compliance: Dict[str, bool] = Field(
+        description="ATS format compliance checklist", default_factory=dict
+    )
+    parsing_warnings: List[str] = Field(
+        description="Parsing issues found in the layout", default_factory=list
+    )
+
+    @property
+    def text(self) -> str:
+        """Document text in reading order."""
+        return "\n".join(page.text for page in self.pages)
+
+
+# ========================================
+# LAYOUT ANALYSIS
+# ========================================
+
+_PAGE_NUMBER = re.compile(r"^(?:page\s*)?#+(?:\s*(?:of|/)\s*#+)?$")
+_WORD = re.compile(r"[^\W\d_]{2,}")
+
+
+class _Segment(NamedTuple):
+    """Spans of a line that are not separated by a column gap."""
+
+    x0: float
+    x1: float
+    text: str
+
+
+def _lines(spans: List[_Span]) -> List[Tuple[float, List[_Segment]]]:
+    """
+    Group spans into lines, top to bottom, and split them at column gaps.
+
+    Returns:
+        List[Tuple[float, List[_Segment]]]: Baseline and segments per line
+    """
+    rows: List[List[_Span]] = []
+    for span in sorted(spans, key=lambda span: (-span.y, span.x0)):
+        if rows:
+            anchor = rows[-1][0]
+            if anchor.y - span.y <= 0.4 * min(anchor.size, span.size):
+                rows[-1].append(span)
+                continue
+        rows.append([span])
+    lines = []
+    for row in rows:
+        row.sort(key=lambda span: span.x0)
+        segments: List[_Segment] = []
+        parts: List[str] = []
+        x0 = x1 = row[0].x0
+        for span in row:
+            gap = span.x0 - x1
+            if parts and gap >= _COLUMN_GAP * span.size:
+                segments.append(_Segment(x0, x1, "".join(parts).strip()))
+                parts = []
+                x0 = span.x0
+            elif parts and gap > _WORD_GAP * span.size and not parts[-1].endswith(" "):
+                parts.append(" ")
+            parts.append(span.text)
+            x1 = max(x1, span.x1)
+        segments.append(_Segment(x0, x1, "".join(parts).strip()))
+        lines.append((row[0].y, [segment for segment in segments if segment.text]))
+    return [line for line in lines if line[1]]
+
+
+def _prose(segment: _Segment) -> bool:
+    """Whether a segment holds running text rather than a date or a link."""
+    return len(_WORD.findall(segment.text)) >= 3
+
+
+def _column_boundaries(
+    lines: List[Tuple[float, List[_Segment]]], tolerance: float
+) -> Dict[int, List[float]]:
+    """
+    Find the lines whose text is laid out in columns.
+
+    A boundary is the left edge of a text segment that is not the first of
+    its line; boundaries shared by at least _MIN_COLUMN_LINES lines (within
+    `tolerance`) separate columns. Segments that are not prose, such as
+    right-aligned dates, do not count.
+
+    Returns:
+        Dict[int, List[float]]: Column boundaries by line index
+    """
+    candidates: List[Tuple[float, int]] = []
+    for index, (_, segments) in enumerate(lines):
+        prose = [segment for segment in segments if _prose(segment)]
+        if len(prose) >= 2:
+            candidates.extend((segment.x0, index) for segment in prose[1:])
+    candidates.sort()
+    boundaries: Dict[int, List[float]] = {}
+    cluster: List[Tuple[float, int]] = []
+    for candidate in candidates + [(math.inf, -1)]:
+        if cluster and candidate[0] - cluster[0][0] > tolerance:
+            if len({index for _, index in cluster}) >= _MIN_COLUMN_LINES:
+                boundary = min(x for x, _ in cluster)
+                for _, index in cluster:
+                    boundaries.setdefault(index, []).append(boundary)
+            cluster = []
+        cluster.append(candidate)
+    return {index: sorted(set(xs)) for index, xs in boundaries.items()}
+
+
+def _reading_order(
+    lines: List[Tuple[float, List[_Segment]]], boundaries: Dict[int, List[float]]
+) -> str:
+    """Return the page text, reading runs of column lines column by column."""
+    out: List[str] = []
+    index = 0
+    while index < len(lines):
+        if index not in boundaries:
+            out.append(" ".join(segment.text for segment in lines[index][1]))
+            index += 1
+            continue
+        end = index
+        while end + 1 < len(lines) and end + 1 in boundaries:
+            end += 1
+        edges = sorted({x for line in range(index, end + 1) for x in boundaries[line]})
+        columns: List[List[str]] = [[] for _ in range(len(edges) + 1)]
+        for line in range(index, end + 1):
+            cells: Dict[int, List[str]] = {}
+            for segment in lines[line][1]:
+                column = sum(segment.x0 >= edge - 1 for edge in edges)
+                cells.setdefault(column, []).append(segment.text)
+            for column, texts in cells.items():
+                columns[column].append(" ".join(texts))
+        out.extend(text for column in columns for text in column)
+        index = end + 1
+    return "\n".join(out)
+
+
+def _ruled_tables(rules: List[Tuple[str, float, float, float]]) -> int:
+    """
+    Count the grids of horizontal and vertical rules with two or more cells.
+
+    Short rules (icons) are ignored and doubled rules count once. Rules that
+    cross (within 2pt) are connected; a connected group with at least two
+    rules in one direction and three in the other is a table.
+    """
+    kept: List[Tuple[str, float, float, float]] = []
+    for rule in sorted(rules):
+        if rule[3] - rule[2] < _MIN_RULE:
+            continue
+        if any(
+            other[0] == rule[0]
+            and abs(other[1] - rule[1]) <= 2
+            and min(other[3], rule[3]) - max(other[2], rule[2])
+            >= 0.5 * (rule[3] - rule[2])
+            for other in kept[-8:]
+        ):
+            continue
+        kept.append(rule)
+    horizontal = [rule for rule in kept if rule[0] == "h"][:200]
+    vertical = [rule for rule in kept if rule[0] == "v"][:200]
+    if len(horizontal) < 2 or len(vertical) < 2:
+        return 0
+    parent = list(range(len(horizontal) + len(vertical)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    for h_index, (_, y, x0, x1) in enumerate(horizontal):
+        for v_index, (_, x, y0, y1) in enumerate(vertical):
+            if x0 - 2 <= x <= x1 + 2 and y0 - 2 <= y <= y1 + 2:
+                parent[find(h_index)] = find(len(horizontal) + v_index)
+    groups: Dict[int, List[int]] = {}
+    for node in range(len(parent)):
+        counts = groups.setdefault(find(node), [0, 0])
+        counts[node >= len(horizontal)] += 1
+    return sum(
+        1
+        for h_count, v_count in groups.values()
+        if min(h_count, v_count) >= 2 and max(h_count, v_count) >= 3
+    )
+
+
+def _aligned_tables(
+    lines: List[Tuple[float, List[_Segment]]], boundaries: Dict[int, List[float]]
+) -> int:
+    """Count runs of at least three lines split into three or more columns."""
+    tables = 0
+    run = 0
+    for index in range(len(lines) + 1):
+        if index < len(lines) and len(boundaries.get(index, ())) >= 2:
+            run += 1
+            continue
+        tables += run >= _MIN_COLUMN_LINES
+        run = 0
+    return tables
+
+
+def _normalize_margin_text(text: str) -> str:
+    """Normalize a margin line for comparison across pages."""
+    return re.sub(r"\d+", "#", " ".join(text.lower().split()))
+
+
+def _family_key(family: str) -> str:
+    """Return a font family lowercased, without spaces, hyphens or styles."""
+    return re.sub(r"[\s_-]", "", family).lower()
+
+
+def _join_pages(numbers: List[int]) -> str:
+    """Describe a list of page numbers, e.g. "page 1" or "pages 1, 3"."""
+    label = "page" if len(numbers) == 1 else "pages"
+    return f"{label} {', '.join(str(number) for number in numbers)}"
+
+
+def _analyze(reader: _PDFReader) -> ResumeLayout:
+    """Analyze the pages of an opened PDF."""
+    if reader.encrypted:
+        return ResumeLayout(
+            encrypted=True,
+            format_compliance={"doc_format": False},
+            parsing_warnings=[
+                "The PDF is encrypted; ATS parsers may be unable to read its text"
+            ],
+        )
+    fonts: Dict[Any, _Font] = {}
+    pages: List[PageLayout] = []
+    page_lines: List[List[Tuple[float, List[_Segment]]]] = []
+    margins: List[Tuple[int, str, str]] = []
+    usage: Dict[str, Dict[str, Any]] = {}
+    hidden = rotated = 0
+    unreadable: List[int] = []
+    for number, page in enumerate(reader.pages(), start=1):
+        box = reader.resolve(page.get("CropBox") or page.get("MediaBox"))
+        if not box:
+            box = [0, 0, 612, 792]
+        if not isinstance(box, list) or len(box) != 4:
+            raise PDFSyntaxError(f"malformed page box on page {number}")
+        box = [reader.number(value) for value in box]
+        left, bottom, right, top = (
+            min(box[0], box[2]),
+            min(box[1], box[3]),
+            max(box[0], box[2]),
+            max(box[1], box[3]),
+        )
+        content = _PageContent(reader, fonts)
+        streams = reader.resolve(page.get("Contents"))
+        if not isinstance(streams, list):
+            streams = [streams] if streams else []
+        try:
+            data = b"\n".join(
+                reader.stream_data(stream)
+                for stream in map(reader.resolve, streams)
+                if isinstance(stream, _Stream)
+            )
+            content.run(data, page.get("Resources"))
+        except PDFSyntaxError:
+            unreadable.append(number)
+        hidden += content.hidden
+        rotated += content.rotated
+        for span in content.spans:
+            entry = usage.setdefault(span.font.name, {"font": span.font, "sizes": {}})
+            size = round(span.size, 1)
+            entry["sizes"][size] = entry["sizes"].get(size, 0) + len(span.text)
+        lines = _lines(content.spans)
+        boundaries = _column_boundaries(lines, tolerance=0.02 * (right - left))
+        margin = _MARGIN * (top - bottom)
+        for y, segments in lines:
+            if y >= top - margin or y <= bottom + margin:
+                text = " ".join(segment.text for segment in segments)
+                margins.append((number, text, _normalize_margin_text(text)))
+        page_lines.append(lines)
+        pages.append(
+            PageLayout(
+                number=number,
+                width=round(right - left, 1),
+                height=round(top - bottom, 1),
+                lines=len(lines),
+                columns=1 + max((len(xs) for xs in boundaries.values()), default=0),
+                column_lines=len(boundaries),
+                tables=_ruled_tables(content.rules)
+                + _aligned_tables(lines, boundaries),
+                images=len(
+                    [
+                        image
+                        for image in content.images
+                        if image[2] - image[0] >= 2 and image[3] - image[1] >= 2
+                    ]
+                ),
+                drawings=content.drawings,
+                text=_reading_order(lines, boundaries),
+            )
+        )
+
+    # Header and footer lines: page numbers, or margin text on several pages
+    pages_by_text: Dict[str, set] = {}
+    for number, _, key in margins:
+        pages_by_text.setdefault(key, set()).add(number)
+    for number, text, key in margins:
+        page_number = _PAGE_NUMBER.match(key) and re.search(r"\d+", text)
+        if len(pages_by_text[key]) >= 2 or (
+            page_number and int(page_number.group()) == number
+        ):
+            pages[number - 1].header_footer.append(text)
+
+    font_usage = sorted(
+        (
+            FontUsage(
+                name=name,
+                family=entry["font"].family,
+                embedded=entry["font"].embedded,
+                standard=_family_key(entry["font"].family).startswith(STANDARD_FONTS),
+                sizes=sorted(entry["sizes"]),
+                characters=sum(entry["sizes"].values()),
+                unmapped_characters=entry["font"].unmapped,
+            )
+            for name, entry in usage.items()
+        ),
+        key=lambda font: -font.characters,
+    )
+    layout = ResumeLayout(pages=pages, fonts=font_usage)
+    _, sections = split_resume_sections(layout.text)
+    layout.sections = list(sections)
+    layout.format_compliance, layout.parsing_warnings = _diagnose(
+        layout, hidden, rotated, unreadable
+    )
+    return layout
+
+
+def _diagnose(
+    layout: ResumeLayout, hidden: int, rotated: int, unreadable: List[int]
+) -> Tuple[Dict[str, bool], List[str]]:
+    """
+    Derive the format checklist and parsing warnings from a layout.
+
+    Args:
+        layout (ResumeLayout): Analyzed pages, fonts and sections
+        hidden (int): Characters drawn invisibly or in white
+        rotated (int): Characters drawn rotated
+        unreadable (List[int]): Pages whose content could not be decoded
+
+    Returns:
+        Tuple[Dict[str, bool], List[str]]: Checklist and warnings
+    """
+    pages = layout.pages
+    warnings: List[str] = []
+    total = sum(font.characters for font in layout.fonts)
+
+    column_pages = [page for page in pages if page.column_lines]
+    if column_pages:
+        details = ", ".join(
+            f"{page.column_lines} on page {page.number}" for page in column_pages
+        )
+        warnings.append(
+            "Multi-column layout: lines split into "
+            f"{max(page.columns for page in column_pages)} columns side by side"
+            f" ({details}); ATS parsers read across the columns and merge "
+            "unrelated text"
+        )
+
+    unmapped = sum(font.unmapped_characters for font in layout.fonts)
+    uncommon = [
+        font.family
+        for font in layout.fonts
+        if not font.standard
+        and not _family_key(font.family).startswith(SYMBOL_FONTS)
+    ]
+    symbols = [
+        font.family
+        for font in layout.fonts
+        if _family_key(font.family).startswith(SYMBOL_FONTS)
+    ]
+    if uncommon:
+        warnings.append(
+            f"Uncommon font family {', '.join(dict.fromkeys(uncommon))}; use a "
+            "standard font such as Arial, Calibri or Times New Roman"
+        )
+    if symbols:
+        warnings.append(
+            "Bullets or icons set in symbol fonts "
+            f"({', '.join(dict.fromkeys(symbols))}) are extracted as stray "
+            "characters"
+        )
+    not_embedded = [
+        font.name
+        for font in layout.fonts
+        if not font.embedded and not font.standard
+    ]
+    if not_embedded:
+        warnings.append(
+            f"Fonts not embedded ({', '.join(not_embedded)}); the resume renders "
+            "differently where they are not installed"
+        )
+    if unmapped:
+        warnings.append(
+            f"{unmapped} characters have no Unicode mapping and are extracted as "
+            "unreadable symbols"
+        )
+
+    table_pages = [page.number for page in pages if page.tables]
+    if table_pages:
+        warnings.append(
+            f"Tables on {_join_pages(table_pages)}; ATS parsers often flatten or "
+            "skip table cells"
+        )
+    image_pages = [page.number for page in pages if page.images]
+    if image_pages:
+        count = sum(page.images for page in pages)
+        warnings.append(
+            f"{count} image(s) on {_join_pages(image_pages)}; text inside images "
+            "is not parsed"
+        )
+    drawing_pages = [page.number for page in pages if page.drawings]
+    if drawing_pages:
+        count = sum(page.drawings for page in pages)
+        warnings.append(
+            f"{count} vector graphics (icons, charts) on {_join_pages(drawing_pages)};"
+            " they carry no text, so labels they stand for are lost"
+        )
+    margin_lines = list(
+        dict.fromkeys(line for page in pages for line in page.header_footer)
+    )
+    if margin_lines:
+        shown = "; ".join(f"'{line}'" for line in margin_lines[:3])
+        warnings.append(
+            f"Header/footer text ({shown}); many ATS parsers drop the page margins"
+        )
+
+    missing = [name for name in REQUIRED_SECTIONS if name not in layout.sections]
+    if missing:
+        warnings.append(
+            "No standard section heading for "
+            f"{', '.join(name.title() for name in missing)}"
+        )
+    if unreadable:
+        warnings.append(
+            f"The content of {_join_pages(unreadable)} could not be decoded"
+        )
+    if total == 0:
+        warnings.append(
+            "No text layer: the PDF is a scanned or image-only document that "
+            "ATS parsers cannot read"
+        )
+    if hidden:
+        warnings.append(
+            f"{hidden} characters of invisible or white text; ATS filters flag "
+            "hidden text as keyword stuffing"
+        )
+    if rotated:
+        warnings.append(
+            f"{rotated} characters of rotated text are read out of order or dropped"
+        )
+
+    compliance = {
+        "single_column": not column_pages,
+        "standard_fonts": not uncommon and not symbols and not unmapped,
+        "no_tables": not table_pages,
+        "no_images": not image_pages,
+        "no_headers_footers": not margin_lines,
+        "standard_sections": not missing,
+        "doc_format": total > 0
+        and not unreadable
+        and (unmapped <= 0.01 * total),
+    }
+    return compliance, warnings
+
+
+def analyze_pdf_layout(path: Union[str, Path]) -> ResumeLayout:
+    """
+    Analyze the layout of a PDF in one pass over the memory-mapped file.
+
+    Args:
+        path (Union[str, Path]): PDF file
+
+    Returns:
+        ResumeLayout: Pages, fonts, sections, checklist and warnings
+
+    Raises:
+        OSError: If the file cannot be read
+        PDFSyntaxError: If the file is not a readable PDF
+    """
+    with open(path, "rb") as file:
+        if not Path(path).stat().st_size:
+            raise PDFSyntaxError("empty file")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                return _analyze(_PDFReader(data))
+            except PDFSyntaxError:
+                raise
+            except RecursionError as error:
+                raise PDFSyntaxError("object nesting too deep") from error
+            except (AttributeError, LookupError, TypeError, ValueError) as error:
+                # An object of a type the reader does not expect at its place
+                raise PDFSyntaxError(f"malformed object ({error})") from error
+
+
+# In-process layouts by PDF hash
+_layouts: Dict[str, Optional[ResumeLayout]] = {}
+_layouts_lock = threading.Lock()
+
+
+def get_resume_layout(source: CachedPDFKnowledgeSource) -> Optional[ResumeLayout]:
+    """
+    Return the layout of a resume source, analyzing each PDF once per process.
+
+    Args:
+        source (CachedPDFKnowledgeSource): Loaded resume source
+
+    Returns:
+        ResumeLayout, optional: Layout of the resume's first PDF, or None if
+            it cannot be read. The returned layout is shared; do not modify it.
+    """
+    with _layouts_lock:
+        if source.pdf_hash not in _layouts:
+            layout = None
+            for path in source.content:
+                try:
+                    layout = analyze_pdf_layout(path)
+                except (OSError, ValueError):
+                    # Also covers PDFSyntaxError
+                    layout = None
+                break
+            _layouts[source.pdf_hash] = layout
+        return _layouts[source.pdf_hash]
+
+
+def render_layout_diagnostics(layout: ResumeLayout) -> str:
+    """
+    Render a layout compactly for a task's context.
+
+    Args:
+        layout (ResumeLayout): Analyzed resume layout
+
+    Returns:
+        str: The measured layout, checklist and warnings
+    """
+    lines = [
+        "Resume layout (measured from the PDF; the format compliance checklist "
+        "and parsing warnings are final):",
+    ]
+    for page in layout.pages:
+        details = [f"{page.lines} lines"]
+        if page.column_lines:
+            details.append(f"{page.column_lines} lines in {page.columns} columns")
+        for count, label in (
+            (page.tables, "tables"),
+            (page.images, "images"),
+            (page.drawings, "vector graphics"),
+        ):
+            if count:
+                details.append(f"{count} {label}")
+        lines.append(f"Page {page.number}: {', '.join(details)}")
+    fonts = []
+    for font in layout.fonts:
+        sizes = f"{min(font.sizes):g}"
+        if max(font.sizes) != min(font.sizes):
+            sizes += f"-{max(font.sizes):g}"
+        fonts.append(f"{font.name} {sizes}pt ({font.characters} chars)")
+    if fonts:
+        lines.append(f"Fonts: {'; '.join(fonts)}")
+    failed = [name for name, passed in layout.format_compliance.items() if not passed]
+    lines.append(f"Failed checks: {', '.join(failed) if failed else 'none'}")
+    lines.extend(f"- {warning}" for warning in layout.parsing_warnings)
+    return "\n".join(lines)
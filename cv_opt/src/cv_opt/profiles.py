@@ -0,0 +1,248 @@
+"""
+Jobfull Resume Analyzer - Output Profiles Module
+
+This module selects how much structured analysis a run generates. Every field
+of an output model costs completion tokens and latency, yet many fields of
+JobRequirements and CompanyResearch (benefits, training_provided,
+employee_sentiment, ...) are never read by a downstream task. An output
+profile trims the models the agents have to fill in and can replace task
+descriptions with shorter ones.
+
+Profiles (config/profiles.yaml):
+    full       # Every field, original task descriptions (default)
+    standard   # Drops JobRequirements/CompanyResearch fields nobody reads
+    fast       # Only the fields the deliverables are built from, with short
+               # task descriptions
+
+Trimmed Models:
+    A trimmed model is a copy of the full model with the same name and only
+    the kept fields, so the output schema in the prompt, the validation and
+    the JSON output file all shrink. base_model() maps it back to the full
+    model for code that needs to recognize the output type.
+
+Example:
+    from cv_opt.crew import ResumeCrew
+
+    crew = ResumeCrew(profile="fast")
+
+    # Command line
+    cv_opt run --profile fast
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import yaml
+from pydantic import BaseModel, Field, create_model
+
+# Profile definitions shipped with the package
+PROFILES_CONFIG = Path(__file__).parent / "config" / "profiles.yaml"
+
+# Profile used when none is selected
+DEFAULT_PROFILE = "full"
+
+# Parsed profile files by path
+_profiles: Dict[str, Dict[str, "OutputProfile"]] = {}
+_profiles_lock = threading.Lock()
+
+# Trimmed models by (full model, kept fields), and the full model of each
+_trimmed_models: Dict[Tuple[Type[BaseModel], Tuple[str, ...]], Type[BaseModel]] = {}
+_base_models: Dict[Type[BaseModel], Type[BaseModel]] = {}
+_models_lock = threading.Lock()
+
+
+class ModelFields(BaseModel):
+    """
+    Field selection of one output model.
+
+    Attributes:
+        include (List[str], optional): Keep only these fields
+        exclude (List[str]): Drop these fields
+    """
+
+    include: Optional[List[str]] = Field(
+        description="Fields to keep; all fields if omitted", default=None
+    )
+    exclude: List[str] = Field(description="Fields to drop", default_factory=list)
+
+    def kept(self, model: Type[BaseModel]) -> Tuple[str, ...]:
+        """
+        Return the kept fields of a model in declaration order.
+
+        Args:
+            model (Type[BaseModel]): Full output model
+
+        Returns:
+            Tuple[str, ...]: Names of the kept fields
+
+        Raises:
+            ValueError: If a listed field does not exist or a required field
+                would be dropped
+        """
+        listed = set(self.include or []) | set(self.exclude)
+        unknown = sorted(listed - set(model.model_fields))
+        if unknown:
+            raise ValueError(f"Unknown {model.__name__} fields: {unknown}")
+        kept = tuple(
+            name
+            for name in model.model_fields
+            if (self.include is None or name in self.include)
+            and name not in self.exclude
+        )
+        dropped_required = [
+            name
+            for name, field in model.model_fields.items()
+            if field.is_required() and name not in kept
+        ]
+        if dropped_required:
+            raise ValueError(
+                f"Required {model.__name__} fields cannot be dropped: "
+                f"{dropped_required}"
+            )
+        return kept
+
+
+class OutputProfile(BaseModel):
+    """
+    An output profile of the workflow.
+
+    Attributes:
+        name (str): Profile name, e.g. "fast"
+        description (str): What the profile keeps
+        models (Dict[str, ModelFields]): Field selection by model name
+        tasks (Dict[str, Dict[str, str]]): tasks.yaml overrides (description,
+            expected_output) by task name
+    """
+
+    name: str = Field(description="Profile name")
+    description: str = Field(description="What the profile keeps", default="")
+    models: Dict[str, ModelFields] = Field(
+        description="Field selection by model name", default_factory=dict
+    )
+    tasks: Dict[str, Dict[str, str]] = Field(
+        description="Task configuration overrides by task name",
+        default_factory=dict,
+    )
+
+    def model_for(self, model: Type[BaseModel]) -> Type[BaseModel]:
+        """
+        Return the output model a task of this profile uses.
+
+        Args:
+            model (Type[BaseModel]): Full output model, e.g. JobRequirements
+
+        Returns:
+            Type[BaseModel]: The full model, or its trimmed variant
+        """
+        selection = self.models.get(model.__name__)
+        if selection is None:
+            return model
+        return trimmed_model(model, selection.kept(model))
+
+    def task_config(self, task_name: str, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Apply the profile's overrides to a task configuration.
+
+        Args:
+            task_name (str): Task name in tasks.yaml
+            config (Dict[str, Any]): Task configuration from tasks.yaml
+
+        Returns:
+            Dict[str, Any]: The configuration with overridden entries
+        """
+        overrides = self.tasks.get(task_name)
+        return {**config, **overrides} if overrides else config
+
+
+def trimmed_model(
+    model: Type[BaseModel], fields: Tuple[str, ...]
+) -> Type[BaseModel]:
+    """
+    Return a copy of a model with only some of its fields.
+
+    Args:
+        model (Type[BaseModel]): Full output model
+        fields (Tuple[str, ...]): Fields to keep
+
+    Returns:
+        Type[BaseModel]: The model itself if all fields are kept, otherwise
+            a trimmed model of the same name (created once per selection)
+    """
+    if fields == tuple(model.model_fields):
+        return model
+    key = (model, fields)
+    with _models_lock:
+        if key not in _trimmed_models:
+            definitions = {
+                name: (model.model_fields[name].annotation, model.model_fields[name])
+                for name in fields
+            }
+            trimmed = create_model(
+                model.__name__,
+                __doc__=model.__doc__,
+                __module__=model.__module__,
+                **definitions,
+            )
+            _trimmed_models[key] = trimmed
+            _base_models[trimmed] = model
+        return _trimmed_models[key]
+
+
+def base_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Return the full model of a possibly trimmed output model.
+
+    Args:
+        model (Type[BaseModel]): Output model of a task
+
+    Returns:
+        Type[BaseModel]: The full model, e.g. JobRequirements
+    """
+    return _base_models.get(model, model)
+
+
+def load_profiles(path: Path = PROFILES_CONFIG) -> Dict[str, OutputProfile]:
+    """
+    Load the output profiles of a profiles file once per process.
+
+    Args:
+        path (Path): YAML file with the profile definitions
+
+    Returns:
+        Dict[str, OutputProfile]: Profiles by name
+    """
+    key = str(path)
+    with _profiles_lock:
+        if key not in _profiles:
+            with open(path, "r", encoding="utf-8") as file:
+                definitions = yaml.safe_load(file) or {}
+            _profiles[key] = {
+                name: OutputProfile(name=name, **(definition or {}))
+                for name, definition in definitions.items()
+            }
+        return _profiles[key]
+
+
+def get_profile(name: str = DEFAULT_PROFILE) -> OutputProfile:
+    """
+    Return an output profile by name.
+
+    Args:
+        name (str): Profile name, e.g. "fast", "standard" or "full"
+
+    Returns:
+        OutputProfile: The profile
+
+    Raises:
+        ValueError: If no such profile exists
+    """
+    profiles = load_profiles()
+    if name not in profiles:
+        raise ValueError(
+            f"Unknown output profile '{name}'. Available: {sorted(profiles)}"
+        )
+    return profiles[name]
@@ -0,0 +1,264 @@
+"""
+Jobfull Resume Analyzer - Run Progress Module
+
+This module turns the CrewAI events of one run into ProgressEvent objects that
+callers can show while the workflow is still running, e.g. the HTTP service
+streaming per-task progress to a UI, or cv_opt.async_run.stream_run().
+
+Event Types:
+    task_started     # A workflow task began executing
+    token            # data.delta: streamed LLM output (LLMs with stream=True)
+    tool_call        # data.tool, data.args: an agent called a tool
+    tool_result      # data.tool, data.from_cache, data.output_chars
+    field            # data.model, data.field, data.value: one top-level field
+                     # of a streamed structured answer, validated as soon as
+                     # its value is complete (LLMs with stream=True)
+    field_error      # data.model, data.field, data.error: the streamed answer
+                     # violates its schema; sent at the first bad field
+    task_finished    # A task completed; data holds the raw output size
+    task_result      # data.model, data.output: the validated Pydantic output
+                     # (JobRequirements, CompanyResearch, ...) of a task
+    task_failed      # A task raised; data holds the error message
+    run_finished     # Emitted by the caller when the whole run succeeded
+    run_failed       # Emitted by the caller when the run failed
+
+    task_result follows task_finished immediately, so e.g. the job analysis
+    is available as soon as analyze_job_task completes, minutes before the
+    report. field events deliver its parts even earlier, while the answer is
+    still being generated (see cv_opt.streaming).
+
+Delivery:
+    ProgressListener is a context manager like RunTracer: it only reports
+    events of its own tasks, so concurrent runs in one process never see each
+    other's progress. The callback runs synchronously in the thread that
+    executes the task; hand events over to other threads or an event loop
+    (loop.call_soon_threadsafe) inside the callback.
+
+Example:
+    from cv_opt.progress import ProgressListener
+
+    with ProgressListener(crew.workflow_tasks(), print, run_id="demo"):
+        crew.crew().kickoff(inputs=inputs)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from crewai import Task
+from crewai.utilities.events import (
+    LLMCallStartedEvent,
+    LLMStreamChunkEvent,
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageStartedEvent,
+    crewai_event_bus,
+)
+from pydantic import BaseModel, Field
+
+from .streaming import SchemaViolationError, StreamingModelParser
+
+
+class ProgressEvent(BaseModel):
+    """
+    A progress update of one run.
+
+    Attributes:
+        run_id (str): Run the event belongs to
+        type (str): Event type, e.g. "task_started" or "task_finished"
+        task (str, optional): Task name for task events
+        timestamp (float): UNIX time of the event
+        data (Dict[str, Any]): Event-specific details
+    """
+
+    run_id: str = Field(description="Run the event belongs to", default="")
+    type: str = Field(description="Event type")
+    task: Optional[str] = Field(description="Task name of task events", default=None)
+    timestamp: float = Field(description="UNIX time of the event")
+    data: Dict[str, Any] = Field(description="Event details", default_factory=dict)
+
+
+# Type of the callbacks receiving progress events
+ProgressCallback = Callable[[ProgressEvent], None]
+
+# Listeners currently receiving events
+_active_listeners: List["ProgressListener"] = []
+_progress_handlers_registered = False
+_progress_registration_lock = threading.Lock()
+
+_PROGRESS_EVENTS = (
+    TaskStartedEvent,
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    LLMCallStartedEvent,
+    LLMStreamChunkEvent,
+    ToolUsageStartedEvent,
+    ToolUsageFinishedEvent,
+)
+
+
+def _dispatch_progress_event(source: Any, event: Any) -> None:
+    """Event handler forwarding CrewAI events to all active listeners."""
+    for listener in list(_active_listeners):
+        listener.handle(source, event)
+
+
+def _register_progress_handlers() -> None:
+    """Register the progress handler on the CrewAI event bus once."""
+    global _progress_handlers_registered
+    with _progress_registration_lock:
+        if not _progress_handlers_registered:
+            for event_type in _PROGRESS_EVENTS:
+                crewai_event_bus.register_handler(event_type, _dispatch_progress_event)
+            _progress_handlers_registered = True
+
+
+class ProgressListener:
+    """
+    Report task progress of one run to a callback.
+
+    Attributes:
+        tasks (List[Task]): Workflow tasks of the run
+        callback (ProgressCallback): Receives every ProgressEvent
+        run_id (str): Run ID set on the events
+        tokens (bool): Report streamed LLM output as token events
+        fields (bool): Parse streamed answers of tasks with an
+            output_pydantic model into field and field_error events
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[Task],
+        callback: ProgressCallback,
+        run_id: str = "",
+        tokens: bool = True,
+        fields: bool = True,
+    ) -> None:
+        self.tasks = list(tasks)
+        self.callback = callback
+        self.run_id = run_id
+        self.tokens = tokens
+        self.fields = fields
+        self._task_names = {str(task.id): task.name for task in self.tasks}
+        self._task_models = {
+            str(task.id): task.output_pydantic
+            for task in self.tasks
+            if task.output_pydantic is not None
+        }
+        # Parser of the current LLM call of each task with a model
+        self._parsers: Dict[str, StreamingModelParser] = {}
+
+    def __enter__(self) -> "ProgressListener":
+        _register_progress_handlers()
+        _active_listeners.append(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self in _active_listeners:
+            _active_listeners.remove(self)
+
+    def emit(
+        self, event_type: str, task: Optional[str] = None, **data: Any
+    ) -> ProgressEvent:
+        """
+        Send an event of this run to the callback.
+
+        Args:
+            event_type (str): Event type
+            task (str, optional): Task name
+            **data: Event details
+
+        Returns:
+            ProgressEvent: The event sent
+        """
+        event = ProgressEvent(
+            run_id=self.run_id,
+            type=event_type,
+            task=task,
+            timestamp=time.time(),
+            data=data,
+        )
+        self.callback(event)
+        return event
+
+    def handle(self, source: Any, event: Any) -> None:
+        """
+        Translate one CrewAI event if it belongs to a task of this run.
+
+        Args:
+            source (Any): Object that emitted the event
+            event (Any): One of the task, LLM call, LLM stream chunk or tool
+                usage events
+        """
+        if isinstance(event, LLMCallStartedEvent):
+            task_id = str(event.task_id or "")
+            if self.fields and task_id in self._task_models:
+                self._parsers[task_id] = StreamingModelParser(
+                    self._task_models[task_id]
+                )
+            return
+        if isinstance(event, LLMStreamChunkEvent):
+            task_id = str(event.task_id or "")
+            name = self._task_names.get(task_id)
+            if name and event.chunk:
+                if self.tokens:
+                    self.emit("token", name, delta=event.chunk)
+                if event.tool_call is None and task_id in self._parsers:
+                    self._parse_fields(self._parsers[task_id], name, event.chunk)
+            return
+        if isinstance(event, (ToolUsageStartedEvent, ToolUsageFinishedEvent)):
+            task = getattr(source, "task", None)
+        else:
+            task = getattr(event, "task", None)
+        name = self._task_names.get(str(task.id)) if task is not None else None
+        if name is None:
+            return
+
+        if isinstance(event, TaskStartedEvent):
+            self.emit("task_started", name, agent=task.agent.role if task.agent else "")
+        elif isinstance(event, TaskCompletedEvent):
+            output = event.output
+            self.emit("task_finished", name, output_chars=len(output.raw or ""))
+            if output.pydantic is not None:
+                self.emit(
+                    "task_result",
+                    name,
+                    model=type(output.pydantic).__name__,
+                    output=output.pydantic.model_dump(mode="json"),
+                )
+        elif isinstance(event, TaskFailedEvent):
+            self.emit("task_failed", name, error=event.error)
+        elif isinstance(event, ToolUsageStartedEvent):
+            self.emit("tool_call", name, tool=event.tool_name, args=event.tool_args)
+        elif isinstance(event, ToolUsageFinishedEvent):
+            self.emit(
+                "tool_result",
+                name,
+                tool=event.tool_name,
+                from_cache=event.from_cache,
+                output_chars=len(str(event.output)),
+            )
+
+    def _parse_fields(
+        self, parser: StreamingModelParser, name: str, chunk: str
+    ) -> None:
+        """Feed a streamed chunk to a task's parser and report its fields."""
+        if parser.error is not None:
+            return
+        model = parser.model.__name__
+        try:
+            completed = parser.feed(chunk)
+        except SchemaViolationError as e:
+            self.emit(
+                "field_error", name, model=model, field=e.field, error=str(e)
+            )
+            return
+        for field in completed:
+            self.emit(
+                "field", name, model=model, field=field, value=parser.values[field]
+            )
@@ -0,0 +1,603 @@
+"""
+Jobfull Resume Analyzer - Model Routing Module
+
+This module decides which model serves each agent and task. Extraction-heavy
+tasks such as analyze_job_task do not need the same model as the report
+writer. Some need no language model at all: a pure-Python extractor fills in
+most of JobRequirements. The routing table in config/agents.yaml names the
+available models and groups routes into policies.
+
+Routing Table (agents.yaml, `model_routing`):
+    models:     named endpoints, either an LLM (`model`, plus optional
+                `params` such as base_url for a local model) or a
+                pure-Python `extractor`
+    policies:   per policy a `default` route, plus routes per agent name
+                (`agents`) and per task name (`tasks`)
+
+    A route names its model and optionally a model to `escalate_to` when the
+    answer fails schema validation against the task's output model. Fields
+    listed in `require` must also be non-empty, which catches extractions
+    that validate but found nothing.
+
+Resolution (first match wins):
+    1. runtime override for the task, 2. runtime override for the agent,
+    3. the policy's task route, 4. the policy's agent route, 5. its default
+
+    Runtime overrides (ResumeCrew(model_overrides=...), --model NAME=MODEL)
+    map an agent or task name to a model name of the table or to any LiteLLM
+    model id, e.g. "ollama/llama3.2".
+
+Example:
+    from cv_opt.crew import ResumeCrew
+
+    crew = ResumeCrew(routing="hybrid")
+    crew = ResumeCrew(model_overrides={"generate_report_task": "strong"})
+
+    # Command line
+    cv_opt run --routing hybrid --model generate_report_task=strong
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+import yaml
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.events import (
+    LLMCallCompletedEvent,
+    LLMCallStartedEvent,
+    LLMCallType,
+    crewai_event_bus,
+)
+from pydantic import BaseModel, Field, model_validator
+
+from .job_extractor import extract_job_requirements
+from .llm_cache import CachedLLM
+from .streaming import SchemaViolationError, StreamingModelParser
+from .tools import CachedScrapeWebsiteTool
+
+# Routing table shipped with the package
+ROUTING_CONFIG = Path(__file__).parent / "config" / "agents.yaml"
+
+# Key of the routing table in agents.yaml
+ROUTING_KEY = "model_routing"
+
+# Pure-Python extractors by name: (posting text, job URL) -> structured output
+EXTRACTORS: Dict[str, Callable[[str, str], BaseModel]] = {
+    "job_requirements": extract_job_requirements,
+}
+
+# Parsed routing tables by path
+_tables: Dict[str, "RoutingTable"] = {}
+_tables_lock = threading.Lock()
+
+# ========================================
+# ROUTING TABLE
+# ========================================
+
+
+class ModelEndpoint(BaseModel):
+    """
+    A model the routing table can send requests to.
+
+    Attributes:
+        model (str, optional): LiteLLM model id, e.g. "gpt-4o-mini"
+        extractor (str, optional): Name of a pure-Python extractor
+        params (Dict[str, Any]): Extra LLM arguments, e.g. base_url
+    """
+
+    model: Optional[str] = Field(description="LiteLLM model id", default=None)
+    extractor: Optional[str] = Field(
+        description="Pure-Python extractor name", default=None
+    )
+    params: Dict[str, Any] = Field(
+        description="Extra LLM arguments", default_factory=dict
+    )
+
+    @model_validator(mode="after")
+    def check_kind(self) -> "ModelEndpoint":
+        """Require exactly one of model and extractor."""
+        if (self.model is None) == (self.extractor is None):
+            raise ValueError("A model endpoint needs either model or extractor")
+        if self.extractor is not None and self.extractor not in EXTRACTORS:
+            raise ValueError(
+                f"Unknown extractor '{self.extractor}'. "
+                f"Available: {sorted(EXTRACTORS)}"
+            )
+        return self
+
+    @property
+    def model_id(self) -> str:
+        """Model name reported in traces, e.g. "python/job_requirements"."""
+        return self.model or f"python/{self.extractor}"
+
+
+class ModelRoute(BaseModel):
+    """
+    The model serving an agent or task, with its escalation.
+
+    Attributes:
+        model (str): Endpoint name or LiteLLM model id
+        escalate_to (str, optional): Model answering instead when the
+            answer fails validation
+        require (List[str]): Output fields that must not be empty
+    """
+
+    model: str = Field(description="Endpoint name or LiteLLM model id")
+    escalate_to: Optional[str] = Field(
+        description="Model used when validation fails", default=None
+    )
+    require: List[str] = Field(
+        description="Output fields that must not be empty", default_factory=list
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def from_name(cls, value: Any) -> Any:
+        """Accept a bare model name as a route."""
+        return {"model": value} if isinstance(value, str) else value
+
+
+class RoutingPolicy(BaseModel):
+    """
+    A named set of routes.
+
+    Attributes:
+        description (str): What the policy optimizes for
+        default (ModelRoute): Route of agents and tasks without their own
+        agents (Dict[str, ModelRoute]): Routes by agent name
+        tasks (Dict[str, ModelRoute]): Routes by task name
+    """
+
+    description: str = Field(description="What the policy optimizes for", default="")
+    default: ModelRoute = Field(description="Route used when nothing else matches")
+    agents: Dict[str, ModelRoute] = Field(
+        description="Routes by agent name", default_factory=dict
+    )
+    tasks: Dict[str, ModelRoute] = Field(
+        description="Routes by task name", default_factory=dict
+    )
+
+    def routes(self) -> Iterable[ModelRoute]:
+        """Every route of the policy."""
+        yield self.default
+        yield from self.agents.values()
+        yield from self.tasks.values()
+
+
+class RoutingTable(BaseModel):
+    """
+    The model routing table of agents.yaml.
+
+    Attributes:
+        default_policy (str): Policy used when none is selected
+        models (Dict[str, ModelEndpoint]): Endpoints by name
+        policies (Dict[str, RoutingPolicy]): Policies by name
+    """
+
+    default_policy: str = Field(description="Policy used when none is selected")
+    models: Dict[str, ModelEndpoint] = Field(description="Endpoints by name")
+    policies: Dict[str, RoutingPolicy] = Field(description="Policies by name")
+
+    @model_validator(mode="after")
+    def check_references(self) -> "RoutingTable":
+        """Reject unknown policies and routes to undefined models."""
+        self.policy(self.default_policy)
+        for name, policy in self.policies.items():
+            for route in policy.routes():
+                for model in filter(None, (route.model, route.escalate_to)):
+                    if model not in self.models:
+                        raise ValueError(
+                            f"Policy '{name}' routes to undefined model '{model}'"
+                        )
+        return self
+
+    def policy(self, name: Optional[str] = None) -> RoutingPolicy:
+        """
+        Return a policy by name.
+
+        Args:
+            name (str, optional): Policy name; the default policy if omitted
+
+        Returns:
+            RoutingPolicy: The policy
+
+        Raises:
+            ValueError: If no such policy exists
+        """
+        name = name or self.default_policy
+        if name not in self.policies:
+            raise ValueError(
+                f"Unknown routing policy '{name}'. Available: {sorted(self.policies)}"
+            )
+        return self.policies[name]
+
+    def endpoint(self, name: str) -> ModelEndpoint:
+        """Return a named endpoint, or an LLM endpoint for a raw model id."""
+        return self.models.get(name) or ModelEndpoint(model=name)
+
+
+def load_routing_table(path: Path = ROUTING_CONFIG) -> RoutingTable:
+    """
+    Load the routing table of an agents file once per process.
+
+    Args:
+        path (Path): agents.yaml holding a `model_routing` section
+
+    Returns:
+        RoutingTable: The parsed table
+
+    Raises:
+        ValueError: If the file has no routing table or it is invalid
+    """
+    key = str(path)
+    with _tables_lock:
+        if key not in _tables:
+            with open(path, "r", encoding="utf-8") as file:
+                definitions = (yaml.safe_load(file) or {}).get(ROUTING_KEY)
+            if definitions is None:
+                raise ValueError(f"{path} has no '{ROUTING_KEY}' section")
+            _tables[key] = RoutingTable.model_validate(definitions)
+        return _tables[key]
+
+
+def parse_model_overrides(values: Iterable[str]) -> Dict[str, str]:
+    """
+    Parse NAME=MODEL command line overrides.
+
+    Args:
+        values (Iterable[str]): e.g. ["generate_report_task=strong"]
+
+    Returns:
+        Dict[str, str]: Model by agent or task name
+
+    Raises:
+        ValueError: If a value is not of the form NAME=MODEL
+    """
+    overrides = {}
+    for value in values:
+        name, separator, model = value.partition("=")
+        if not separator or not name.strip() or not model.strip():
+            raise ValueError(f"Expected NAME=MODEL, got '{value}'")
+        overrides[name.strip()] = model.strip()
+    return overrides
+
+
+def routed_model(llm: Any, task_name: Optional[str]) -> str:
+    """
+    Return the model that serves a task on an agent's LLM.
+
+    Args:
+        llm (Any): The agent's LLM, routed or not
+        task_name (str, optional): Task name
+
+    Returns:
+        str: Model id of the task's route, or the LLM's model
+    """
+    model_for = getattr(llm, "model_for", None)
+    return model_for(task_name) if model_for else str(getattr(llm, "model", ""))
+
+
+# ========================================
+# ANSWER VALIDATION
+# ========================================
+
+
+def validate_answer(
+    response: str, model: type, require: Iterable[str] = ()
+) -> Optional[str]:
+    """
+    Check a final answer against the task's output model.
+
+    Args:
+        response (str): LLM response
+        model (type): Pydantic output model of the task
+        require (Iterable[str]): Fields of the model that must not be empty
+
+    Returns:
+        str, optional: Why the answer is invalid; None if it is valid or the
+            response is not a final answer (e.g. a tool action)
+    """
+    if "Final Answer:" not in response:
+        return None
+    parser = StreamingModelParser(model)
+    try:
+        parser.feed(response)
+    except SchemaViolationError as e:
+        return str(e)
+    if not parser.done:
+        return f"{model.__name__}: no complete JSON answer"
+    for field in require:
+        if field in model.model_fields and not parser.values.get(field):
+            return f"{model.__name__}.{field}: empty"
+    return None
+
+
+# ========================================
+# EXTRACTOR LLM
+# ========================================
+
+
+class ExtractorLLM(BaseLLM):
+    """
+    Answer a task with a pure-Python extractor, speaking the ReAct protocol.
+
+    The first call asks the agent's scrape tool for the job URL in the task
+    description. The next call extracts the output from the tool's
+    observation and returns it as the final answer, keeping only the fields
+    of the task's output model.
+
+    Attributes:
+        extractor (str): Name of the extractor in EXTRACTORS
+    """
+
+    def __init__(self, extractor: str) -> None:
+        super().__init__(model=f"python/{extractor}", temperature=0)
+        self.extractor = extractor
+        self._extract = EXTRACTORS[extractor]
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> str:
+        if from_task is None or from_task.output_pydantic is None:
+            raise ValueError(
+                f"The {self.extractor} extractor can only answer tasks with "
+                "an output model"
+            )
+        crewai_event_bus.emit(
+            self,
+            LLMCallStartedEvent(
+                messages=messages, from_task=from_task, from_agent=from_agent
+            ),
+        )
+        history = [] if isinstance(messages, str) else messages
+        urls = re.findall(r"https?://[^\s\"'<>]+", from_task.description)
+        job_url = urls[0].rstrip(".,)") if urls else ""
+        observation = self._observation(history)
+        tool = next(
+            (
+                tool
+                for tool in (from_task.agent.tools if from_task.agent else [])
+                if isinstance(tool, CachedScrapeWebsiteTool)
+            ),
+            None,
+        )
+        if observation is None and tool is not None and job_url:
+            response = (
+                "Thought: I need the job posting\n"
+                f"Action: {tool.name}\n"
+                f"Action Input: {json.dumps({'website_url': job_url})}"
+            )
+        else:
+            output = self._extract(observation or "", job_url)
+            fields = from_task.output_pydantic.model_fields
+            answer = {
+                name: value
+                for name, value in output.model_dump(mode="json").items()
+                if name in fields
+            }
+            response = (
+                "Thought: I now know the final answer\n"
+                f"Final Answer: {json.dumps(answer)}"
+            )
+        crewai_event_bus.emit(
+            self,
+            LLMCallCompletedEvent(
+                response=response,
+                call_type=LLMCallType.LLM_CALL,
+                from_task=from_task,
+                from_agent=from_agent,
+            ),
+        )
+        return response
+
+    @staticmethod
+    def _observation(messages: List[Dict[str, str]]) -> Optional[str]:
+        """Return the latest tool observation of the conversation."""
+        # CrewAI appends observations to the assistant turn; the prompt's
+        # format instructions mention "Observation:" as well
+        for message in reversed(messages):
+            content = str(message.get("content") or "")
+            if message.get("role") == "assistant" and "Observation:" in content:
+                return content.rsplit("Observation:", 1)[1].strip()
+        return None
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 128000
+
+
+# ========================================
+# ROUTED LLM
+# ========================================
+
+
+class ModelRouter:
+    """
+    Resolve routes of one crew and build the LLMs serving them.
+
+    Attributes:
+        table (RoutingTable): Routing table
+        policy (RoutingPolicy): Selected policy
+        overrides (Dict[str, str]): Runtime model overrides by agent or task
+        llms (Dict[str, BaseLLM]): LLM instances replacing named endpoints,
+            e.g. stub LLMs in the benchmark
+        stream (bool): Stream responses of the LLM endpoints
+        llm_cache (bool): Put LLM endpoints behind the LLM response cache
+    """
+
+    def __init__(
+        self,
+        table: RoutingTable,
+        policy: Optional[str] = None,
+        overrides: Optional[Dict[str, str]] = None,
+        llms: Optional[Dict[str, BaseLLM]] = None,
+        stream: bool = False,
+        llm_cache: bool = False,
+    ) -> None:
+        self.table = table
+        self.policy = table.policy(policy)
+        self.overrides = dict(overrides or {})
+        self.llms = dict(llms or {})
+        self.stream = stream
+        self.llm_cache = llm_cache
+
+    def check_names(self, names: Iterable[str]) -> None:
+        """
+        Reject overrides of unknown agents or tasks.
+
+        Args:
+            names (Iterable[str]): Agent and task names of the crew
+
+        Raises:
+            ValueError: If an override names no known agent or task
+        """
+        unknown = sorted(set(self.overrides) - set(names))
+        if unknown:
+            raise ValueError(f"Model overrides for unknown agents/tasks: {unknown}")
+
+    def route(self, agent: str, task: Optional[str] = None) -> ModelRoute:
+        """Return the route of a task executed by an agent."""
+        for name in (task, agent):
+            if name in self.overrides:
+                return ModelRoute(model=self.overrides[name])
+        if task in self.policy.tasks:
+            return self.policy.tasks[task]
+        return self.policy.agents.get(agent, self.policy.default)
+
+    def model_for(self, agent: str, task: Optional[str] = None) -> str:
+        """Return the model id serving a task executed by an agent."""
+        name = self.route(agent, task).model
+        if name in self.llms:
+            return str(self.llms[name].model)
+        return self.table.endpoint(name).model_id
+
+    def build(self, name: str) -> BaseLLM:
+        """Create the LLM of an endpoint name or raw model id."""
+        endpoint = self.table.endpoint(name)
+        if endpoint.extractor is not None:
+            return ExtractorLLM(endpoint.extractor)
+        llm = self.llms.get(name)
+        if llm is None:
+            params = dict(endpoint.params)
+            if self.llm_cache:
+                # Cached completions are only reused for deterministic requests
+                params["temperature"] = 0
+            llm = LLM(endpoint.model, stream=self.stream, **params)
+        return CachedLLM(llm) if self.llm_cache else llm
+
+    def agent_llm(self, agent: str) -> "RoutedLLM":
+        """Return the routed LLM of an agent."""
+        return RoutedLLM(agent, self)
+
+
+class RoutedLLM(BaseLLM):
+    """
+    An agent's LLM that forwards each call to the model of the task's route.
+
+    When the route has an escalation model and the task an output model, a
+    final answer that fails validation is discarded and the same request
+    is sent to the escalation model.
+
+    Attributes:
+        agent (str): Agent name in agents.yaml
+        router (ModelRouter): Route resolution of the crew
+        escalations (int): Answers replaced by the escalation model
+    """
+
+    def __init__(self, agent: str, router: ModelRouter) -> None:
+        self.agent = agent
+        self.router = router
+        self.escalations = 0
+        self._llms: Dict[str, BaseLLM] = {}
+        self._lock = threading.Lock()
+        super().__init__(model=router.model_for(agent), temperature=None)
+
+    # CrewAI sets the agent's stop words on its LLM; they are applied to
+    # every model the agent is routed to
+    @property
+    def stop(self) -> List[str]:
+        return self._stop
+
+    @stop.setter
+    def stop(self, value: List[str]) -> None:
+        self._stop = list(value or [])
+        for llm in self._llms.values():
+            llm.stop = list(self._stop)
+
+    def model_for(self, task: Optional[str]) -> str:
+        """Return the model id serving a task of this agent."""
+        return self.router.model_for(self.agent, task)
+
+    def _llm(self, name: str) -> BaseLLM:
+        with self._lock:
+            if name not in self._llms:
+                llm = self.router.build(name)
+                llm.stop = list(self._stop)
+                self._llms[name] = llm
+            return self._llms[name]
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        task_name = from_task.name if from_task is not None else None
+        route = self.router.route(self.agent, task_name)
+
+        def ask(model: str) -> Union[str, Any]:
+            return self._llm(model).call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+            )
+
+        response = ask(route.model)
+        output_model = from_task.output_pydantic if from_task is not None else None
+        if (
+            route.escalate_to is None
+            or route.escalate_to == route.model
+            or output_model is None
+            or not isinstance(response, str)
+        ):
+            return response
+        error = validate_answer(response, output_model, route.require)
+        if error is None:
+            return response
+        print(f"⤴️ {task_name}: {error}; escalating to {route.escalate_to}")
+        with self._lock:
+            self.escalations += 1
+        return ask(route.escalate_to)
+
+    def _default_llm(self) -> BaseLLM:
+        return self._llm(self.router.route(self.agent).model)
+
+    def supports_function_calling(self) -> bool:
+        return self._default_llm().supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return True
+
+    def get_context_window_size(self) -> int:
+        return self._default_llm().get_context_window_size()
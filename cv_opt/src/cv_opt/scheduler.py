@@ -0,0 +1,386 @@
+"""
+Jobfull Resume Analyzer - Parallel Task Scheduler Module
+
+This module provides a dependency-aware scheduler that executes the ResumeCrew
+tasks as a directed acyclic graph instead of a strictly sequential chain. The
+graph is derived from the `context:` declarations in config/tasks.yaml, so any
+tasks whose upstream outputs are all available can run side by side.
+
+Execution Model:
+    Each task is executed by a single-task Crew that shares the task and agent
+    objects of the parent ResumeCrew. Because upstream Task objects keep their
+    `output` after execution, CrewAI's normal context aggregation works
+    unchanged, and every task still writes its configured `output_file`.
+
+    analyze_job_task → optimize_resume_task → research_company_task
+    → generate_cover_letter_task → (generate_cover_letter_content_task ∥
+    generate_resume_task) → generate_report_task
+
+Reporting:
+    After a run, a ScheduleReport records per-task timings, the serial time
+    (sum of task durations), the observed wall-clock time, the critical path
+    through the graph and the time saved versus sequential execution.
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from crewai import Crew, Process, Task
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel, Field
+
+# Default number of tasks allowed to run at the same time
+DEFAULT_MAX_CONCURRENCY = 3
+
+
+# ========================================
+# TASK GRAPH CONSTRUCTION
+# ========================================
+
+
+def build_task_graph(tasks: Sequence[Task]) -> Dict[str, List[str]]:
+    """
+    Build the dependency graph of a task list from its context declarations.
+
+    Tasks with an explicit `context` list depend exactly on those tasks. Tasks
+    without one fall back to CrewAI's sequential semantics and depend on the
+    task immediately before them, so the schedule never reorders work that
+    relies on implicit context passing. Context tasks outside the list that
+    already have an output (e.g. a shared analysis computed once per batch)
+    are treated as satisfied.
+
+    Args:
+        tasks (Sequence[Task]): Tasks in crew definition order
+
+    Returns:
+        Dict[str, List[str]]: Mapping of task name to upstream task names
+
+    Raises:
+        ValueError: If a context task outside the list has not been executed
+            or the declarations contain a cycle
+    """
+    names = [task.name for task in tasks]
+    graph: Dict[str, List[str]] = {}
+
+    for index, task in enumerate(tasks):
+        if isinstance(task.context, list):
+            dependencies = []
+            for context_task in task.context:
+                if context_task.name in names:
+                    dependencies.append(context_task.name)
+                elif context_task.output is None:
+                    raise ValueError(
+                        f"Task '{task.name}' depends on '{context_task.name}', "
+                        "which is outside the crew and has no output"
+                    )
+        else:
+            dependencies = [names[index - 1]] if index > 0 else []
+        graph[task.name] = dependencies
+
+    topological_order(graph)
+    return graph
+
+
+def topological_order(graph: Dict[str, List[str]]) -> List[str]:
+    """
+    Return the task names of a dependency graph in a valid execution order.
+
+    Ties are broken by the insertion order of the graph, which keeps the
+    result identical to the sequential order whenever that order is valid.
+
+    Args:
+        graph (Dict[str, List[str]]): Mapping of task name to upstream names
+
+    Returns:
+        List[str]: Task names ordered so that dependencies come first
+
+    Raises:
+        ValueError: If the graph contains a cycle
+    """
+    remaining = {name: set(dependencies) for name, dependencies in graph.items()}
+    order: List[str] = []
+
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(
+                f"Task context declarations form a cycle: {sorted(remaining)}"
+            )
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return order
+
+
+def critical_path(
+    graph: Dict[str, List[str]], durations: Dict[str, float]
+) -> List[str]:
+    """
+    Compute the longest duration-weighted path through the task graph.
+
+    Args:
+        graph (Dict[str, List[str]]): Mapping of task name to upstream names
+        durations (Dict[str, float]): Measured duration of each task in seconds
+
+    Returns:
+        List[str]: Task names on the critical path, in execution order
+    """
+    finish: Dict[str, float] = {}
+    previous: Dict[str, Optional[str]] = {}
+
+    for name in topological_order(graph):
+        upstream = max(graph[name], key=lambda dep: finish[dep], default=None)
+        start = finish[upstream] if upstream else 0.0
+        finish[name] = start + durations.get(name, 0.0)
+        previous[name] = upstream
+
+    if not finish:
+        return []
+
+    path = [max(finish, key=finish.get)]
+    while previous[path[-1]]:
+        path.append(previous[path[-1]])
+    return list(reversed(path))
+
+
+def execute_single_task(
+    task: Task,
+    inputs: Dict[str, Any],
+    knowledge_sources: Optional[List[Any]] = None,
+    verbose: bool = True,
+) -> TaskOutput:
+    """
+    Execute one task through a single-task crew.
+
+    The single-task crew performs the same input interpolation, knowledge
+    setup and output file handling as the full crew. Context tasks outside the
+    crew are read from their existing `output`, so upstream tasks must have
+    been executed first. Crew-level knowledge is only attached when the agent
+    has none of its own, which avoids embedding the same resume twice for
+    one task.
+
+    Args:
+        task (Task): Task to execute, with its agent assigned
+        inputs (Dict[str, Any]): Kickoff inputs interpolated into the task
+        knowledge_sources (List[Any], optional): Crew-level knowledge sources
+        verbose (bool): Verbose flag for the single-task crew
+
+    Returns:
+        TaskOutput: Output of the executed task
+    """
+    crew_knowledge = None if task.agent.knowledge_sources else knowledge_sources
+    Crew(
+        agents=[task.agent],
+        tasks=[task],
+        process=Process.sequential,
+        verbose=verbose,
+        knowledge_sources=crew_knowledge,
+    ).kickoff(inputs=inputs)
+    return task.output
+
+
+# ========================================
+# SCHEDULE REPORTING
+# ========================================
+
+
+class TaskTiming(BaseModel):
+    """
+    Execution timing of a single scheduled task.
+
+    Attributes:
+        task (str): Task name from tasks.yaml
+        agent (str): Role of the agent that executed the task
+        started_at (float): Start offset in seconds from the run start
+        finished_at (float): Finish offset in seconds from the run start
+        duration (float): Task execution time in seconds
+    """
+
+    task: str = Field(description="Task name from tasks.yaml")
+    agent: str = Field(description="Role of the agent that executed the task")
+    started_at: float = Field(description="Start offset from run start (seconds)")
+    finished_at: float = Field(description="Finish offset from run start (seconds)")
+    duration: float = Field(description="Task execution time (seconds)")
+
+
+class ScheduleReport(BaseModel):
+    """
+    Summary of a parallel scheduler run.
+
+    Attributes:
+        max_concurrency (int): Concurrency limit used for the run
+        wall_time (float): Observed end-to-end time in seconds
+        serial_time (float): Sum of task durations (sequential equivalent)
+        critical_path (List[str]): Longest duration-weighted dependency chain
+        critical_path_time (float): Total duration of the critical path
+        time_saved (float): Seconds saved versus sequential execution
+        tasks (List[TaskTiming]): Per-task timings in completion order
+        reused (List[str]): Tasks whose stored output was restored instead
+            of executed (incremental runs)
+    """
+
+    max_concurrency: int = Field(description="Concurrency limit used for the run")
+    wall_time: float = Field(description="Observed end-to-end time (seconds)")
+    serial_time: float = Field(description="Sum of task durations (seconds)")
+    critical_path: List[str] = Field(
+        description="Longest duration-weighted dependency chain", default_factory=list
+    )
+    critical_path_time: float = Field(
+        description="Total duration of the critical path (seconds)", default=0.0
+    )
+    time_saved: float = Field(
+        description="Seconds saved versus sequential execution", default=0.0
+    )
+    tasks: List[TaskTiming] = Field(
+        description="Per-task timings in completion order", default_factory=list
+    )
+    reused: List[str] = Field(
+        description="Tasks whose stored output was restored instead of executed",
+        default_factory=list,
+    )
+
+    def summary(self) -> str:
+        """Return a one-line human readable summary of the run."""
+        speedup = self.serial_time / self.wall_time if self.wall_time else 1.0
+        return (
+            f"wall {self.wall_time:.1f}s vs serial {self.serial_time:.1f}s "
+            f"(saved {self.time_saved:.1f}s, {speedup:.2f}x); "
+            f"critical path {self.critical_path_time:.1f}s: "
+            + " → ".join(self.critical_path)
+        )
+
+
+# ========================================
+# PARALLEL SCHEDULER
+# ========================================
+
+
+class ParallelScheduler:
+    """
+    Execute crew tasks concurrently while respecting context dependencies.
+
+    Tasks become ready once all of their upstream tasks have finished. Ready
+    tasks are submitted to a thread pool bounded by `max_concurrency`. Tasks
+    that share an agent are serialized on that agent, since CrewAI agents keep
+    per-execution state and are not safe to run twice at once.
+
+    Attributes:
+        max_concurrency (int): Maximum number of tasks running at once
+        verbose (bool): Verbose flag passed to the single-task crews
+
+    Example:
+        scheduler = ParallelScheduler(max_concurrency=2)
+        report = scheduler.run(
+            crew_instance.tasks,
+            inputs={"job_url": "...", "company_name": "..."},
+        )
+        print(report.summary())
+    """
+
+    def __init__(
+        self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, verbose: bool = True
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.verbose = verbose
+        self.outputs: Dict[str, TaskOutput] = {}
+
+    def run(
+        self,
+        tasks: Sequence[Task],
+        inputs: Dict[str, Any],
+        knowledge_sources: Optional[List[Any]] = None,
+        execute_task: Optional[Callable[[Task, Dict[str, Any]], Any]] = None,
+    ) -> ScheduleReport:
+        """
+        Run all tasks, starting each one as soon as its dependencies finish.
+
+        Args:
+            tasks (Sequence[Task]): Tasks in crew definition order
+            inputs (Dict[str, Any]): Kickoff inputs interpolated into each task
+            knowledge_sources (List[Any], optional): Crew-level knowledge given
+                to tasks whose agent has no knowledge sources of its own
+            execute_task (Callable, optional): Called as
+                `execute_task(task, inputs)` instead of execute_single_task,
+                e.g. to restore memoized outputs. It must leave the task's
+                `output` set.
+
+        Returns:
+            ScheduleReport: Timings, critical path and time saved for the run
+
+        Raises:
+            Exception: Re-raises the first task failure after cancelling all
+                tasks that have not started yet
+        """
+        graph = build_task_graph(tasks)
+        by_name = {task.name: task for task in tasks}
+        agent_locks: Dict[int, threading.Lock] = {}
+        for task in tasks:
+            agent_locks.setdefault(id(task.agent), threading.Lock())
+
+        self.outputs = {}
+        timings: List[TaskTiming] = []
+        done: set = set()
+        running: Dict[Future, str] = {}
+        run_start = time.perf_counter()
+
+        def execute(task: Task) -> TaskTiming:
+            with agent_locks[id(task.agent)]:
+                started = time.perf_counter()
+                if execute_task is not None:
+                    execute_task(task, inputs)
+                else:
+                    execute_single_task(
+                        task, inputs, knowledge_sources, verbose=self.verbose
+                    )
+                finished = time.perf_counter()
+            return TaskTiming(
+                task=task.name,
+                agent=task.agent.role if task.agent else "",
+                started_at=started - run_start,
+                finished_at=finished - run_start,
+                duration=finished - started,
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while len(done) < len(graph):
+                scheduled = done | set(running.values())
+                for name, dependencies in graph.items():
+                    if name not in scheduled and set(dependencies) <= done:
+                        running[executor.submit(execute, by_name[name])] = name
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        timings.append(future.result())
+                    except Exception:
+                        for pending in running:
+                            pending.cancel()
+                        raise
+                    self.outputs[name] = by_name[name].output
+                    done.add(name)
+
+        wall_time = time.perf_counter() - run_start
+        durations = {timing.task: timing.duration for timing in timings}
+        path = critical_path(graph, durations)
+        serial_time = sum(durations.values())
+
+        return ScheduleReport(
+            max_concurrency=self.max_concurrency,
+            wall_time=wall_time,
+            serial_time=serial_time,
+            critical_path=path,
+            critical_path_time=sum(durations[name] for name in path),
+            time_saved=max(serial_time - wall_time, 0.0),
+            tasks=timings,
+        )
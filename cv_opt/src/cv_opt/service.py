@@ -0,0 +1,617 @@
+"""
+Jobfull Resume Analyzer - HTTP Service Module
+
+This module runs the analyzer as a long-lived local HTTP (ASGI) service. Every
+`cv_opt run` invocation pays several seconds of crewai/crewai_tools import
+time, re-parses agents.yaml and tasks.yaml and loads the resume PDF again. The
+service pays these costs once at startup and keeps them warm:
+
+    - crewai, crewai_tools and the crew module are imported once
+    - agents.yaml/tasks.yaml are parsed once (see load_config_yaml)
+    - one streaming LLM client is shared by every agent of every run
+    - parsed resumes and their shared resume indexes are kept by content hash
+    - scrape, search and task caches stay loaded in memory
+
+Submissions go to an in-process queue served by a fixed number of workers,
+each of which runs one workflow at a time with cv_opt.async_run.run_async.
+
+Retention:
+    The service runs indefinitely, so its in-memory state is bounded. Once a
+    run has finished and its event subscribers have drained, only its final
+    event is kept. Finished runs are forgotten after `run_retention` seconds
+    or when more than `max_finished_runs` have accumulated, oldest first.
+    At most `max_uploaded_resumes` uploaded resumes stay parsed and indexed;
+    the least recently submitted ones not used by a queued or running run
+    are released and their stored PDFs deleted.
+
+Endpoints:
+    GET  /health               # Queue depth, worker count, warm resumes
+    POST /runs                 # Submit a job (JSON, optional base64 resume PDF)
+    GET  /runs/{run_id}        # Status, timings and result of a run
+    GET  /runs/{run_id}/events # Server-sent events: progress, token deltas,
+                               # tool calls and validated task outputs
+
+    Submission body:
+        {
+            "job_url": "https://company.com/careers/job-123",
+            "company_name": "TechCorp",
+            "resume_pdf_base64": "JVBERi0xLjcK...",   # optional
+            "parallel": true                           # optional
+        }
+
+Dependencies:
+    fastapi and uvicorn, installed with the "service" extra:
+        pip install "cv_opt[service]"
+
+Example:
+    cv_opt serve --port 8000 --max-concurrency 4
+
+    curl -X POST localhost:8000/runs -H 'Content-Type: application/json' \\
+        -d '{"job_url": "https://...", "company_name": "TechCorp"}'
+    curl -N localhost:8000/runs/<run_id>/events
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import asyncio
+import base64
+import binascii
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from crewai import LLM
+from crewai.llms.base_llm import BaseLLM
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from .async_run import RunResult, run_async
+from .cache import atomic_write_bytes, cache_dir
+from .checkpoint import DEFAULT_RUNS_DIR, new_run_id
+from .crew import ResumeCrew
+from .knowledge import (
+    CachedPDFKnowledgeSource,
+    get_resume_knowledge,
+    release_resume_knowledge,
+)
+from .profiles import DEFAULT_PROFILE, get_profile
+from .progress import ProgressEvent
+from .routing import load_routing_table
+from .scheduler import DEFAULT_MAX_CONCURRENCY
+
+# Default number of workflows the service runs at once
+DEFAULT_SERVICE_CONCURRENCY = 4
+
+# Default address of the service
+DEFAULT_SERVICE_HOST = "127.0.0.1"
+DEFAULT_SERVICE_PORT = 8000
+
+# Model shared by all agents unless the service is given its own LLM
+DEFAULT_SERVICE_MODEL = "gpt-4o-mini"
+
+# Seconds a finished run stays queryable
+DEFAULT_RUN_RETENTION = 3600
+
+# Maximum number of finished runs kept in memory
+DEFAULT_MAX_FINISHED_RUNS = 200
+
+# Maximum number of uploaded resumes kept parsed and indexed
+DEFAULT_MAX_UPLOADED_RESUMES = 16
+
+# Progress events ending a run
+FINAL_EVENT_TYPES = ("run_finished", "run_failed")
+
+# ========================================
+# SERVICE DATA MODELS
+# ========================================
+
+
+class RunSubmission(BaseModel):
+    """
+    Body of POST /runs.
+
+    Attributes:
+        job_url (str): URL of the job posting
+        company_name (str): Name of the hiring company
+        resume_pdf_base64 (str, optional): Resume PDF to optimize, base64
+            encoded; the service's default resume is used when omitted
+        parallel (bool): Run independent tasks of the workflow concurrently
+        split_research (bool): Use split company research
+        profile (str): Output profile: "full", "standard" or "fast"
+        llm_cache (bool): Serve repeated LLM requests from the LLM response
+            cache
+        routing (str, optional): Model routing policy (see cv_opt.routing);
+            the service's shared LLM serves every agent when omitted
+        model_overrides (Dict[str, str]): Model by agent or task name,
+            overriding the routing policy
+    """
+
+    job_url: str = Field(description="URL of the job posting")
+    company_name: str = Field(description="Name of the hiring company")
+    resume_pdf_base64: Optional[str] = Field(
+        description="Base64-encoded resume PDF", default=None
+    )
+    parallel: bool = Field(
+        description="Run independent tasks concurrently", default=False
+    )
+    split_research: bool = Field(
+        description="Use split company research", default=False
+    )
+    profile: str = Field(
+        description="Output profile (full, standard or fast)",
+        default=DEFAULT_PROFILE,
+    )
+    llm_cache: bool = Field(
+        description="Serve repeated LLM requests from the response cache",
+        default=False,
+    )
+    routing: Optional[str] = Field(
+        description="Model routing policy, e.g. hybrid", default=None
+    )
+    model_overrides: Dict[str, str] = Field(
+        description="Model by agent or task name", default_factory=dict
+    )
+
+
+class ServiceRun(BaseModel):
+    """
+    State of a submitted run, returned by GET /runs/{run_id}.
+
+    Attributes:
+        run_id (str): Run identifier (also its output directory name)
+        status (str): "queued", "running", "succeeded" or "failed"
+        job_url (str): URL of the job posting
+        company_name (str): Name of the hiring company
+        resume (str): Cache key of the resume PDF being optimized
+        submitted_at (float): UNIX time of the submission
+        started_at (float, optional): UNIX time a worker picked the run up
+        time_to_first_task (float, optional): Seconds from submission until
+            the first task started
+        finished_at (float, optional): UNIX time the run ended
+        result (RunResult, optional): Outputs and trace of a finished run
+    """
+
+    run_id: str = Field(description="Run identifier")
+    status: str = Field(description="queued, running, succeeded or failed")
+    job_url: str = Field(description="URL of the job posting")
+    company_name: str = Field(description="Name of the hiring company")
+    resume: str = Field(description="Cache key of the resume PDF")
+    submitted_at: float = Field(description="UNIX time of the submission")
+    started_at: Optional[float] = Field(description="UNIX start time", default=None)
+    time_to_first_task: Optional[float] = Field(
+        description="Seconds from submission to the first task start", default=None
+    )
+    finished_at: Optional[float] = Field(description="UNIX end time", default=None)
+    result: Optional[RunResult] = Field(description="Result of the run", default=None)
+
+
+# ========================================
+# RESUME SERVICE
+# ========================================
+
+
+class ResumeService:
+    """
+    Queue of workflow runs served by warm, long-lived workers.
+
+    Attributes:
+        max_concurrency (int): Number of worker coroutines (runs at once)
+        runs_dir (str): Root directory of the per-run output directories
+        llm (BaseLLM): LLM client shared by all agents of all runs
+        embedder (Dict[str, Any], optional): Embedder of the resume indexes
+        run_retention (float): Seconds a finished run stays queryable
+        max_finished_runs (int): Maximum number of finished runs kept
+        max_uploaded_resumes (int): Maximum number of uploaded resumes kept
+            parsed and indexed
+        runs (Dict[str, ServiceRun]): Submitted runs by run ID
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_SERVICE_CONCURRENCY,
+        runs_dir: str = DEFAULT_RUNS_DIR,
+        llm: Optional[BaseLLM] = None,
+        embedder: Optional[Dict[str, Any]] = None,
+        run_retention: float = DEFAULT_RUN_RETENTION,
+        max_finished_runs: int = DEFAULT_MAX_FINISHED_RUNS,
+        max_uploaded_resumes: int = DEFAULT_MAX_UPLOADED_RESUMES,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.runs_dir = runs_dir
+        self.llm = llm or LLM(DEFAULT_SERVICE_MODEL, stream=True)
+        self.embedder = embedder
+        self.run_retention = run_retention
+        self.max_finished_runs = max_finished_runs
+        self.max_uploaded_resumes = max_uploaded_resumes
+        self.runs: Dict[str, ServiceRun] = {}
+        self._requests: Dict[str, RunSubmission] = {}
+        self._events: Dict[str, List[ProgressEvent]] = {}
+        self._changed: Dict[str, asyncio.Event] = {}
+        self._subscribers: Dict[str, int] = {}
+        self._resumes: Dict[str, CachedPDFKnowledgeSource] = {}
+        # Uploaded resume keys and PDF paths, least recently submitted first
+        self._uploads: "OrderedDict[str, Path]" = OrderedDict()
+        self._resumes_lock = threading.Lock()
+        self._default_resume: Optional[str] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._started_at = time.time()
+
+    # ----------------------------------------
+    # Lifecycle
+    # ----------------------------------------
+
+    async def start(self) -> None:
+        """Warm up the default resume and start the worker coroutines."""
+        loop = asyncio.get_running_loop()
+        # One thread per running workflow plus headroom for warm-up work
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=self.max_concurrency + 4)
+        )
+        self._queue = asyncio.Queue()
+        self._default_resume = await asyncio.to_thread(
+            self._load_resume, ResumeCrew.resume_file
+        )
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.max_concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; queued runs are dropped."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    # ----------------------------------------
+    # Warm resumes
+    # ----------------------------------------
+
+    def _load_resume(self, file_path: Any) -> str:
+        """Parse a resume and build its shared index; returns its key."""
+        source = CachedPDFKnowledgeSource(file_paths=file_path)
+        key = source.cache_key
+        with self._resumes_lock:
+            if key not in self._resumes:
+                get_resume_knowledge(source, self.embedder)
+                self._resumes[key] = source
+        return key
+
+    @staticmethod
+    def _routed(submission: RunSubmission) -> bool:
+        """Whether a submission selects its models through the routing table."""
+        return submission.routing is not None or bool(submission.model_overrides)
+
+    def _store_upload(self, resume_pdf_base64: str) -> Tuple[str, Path]:
+        """Decode and store an uploaded resume PDF; returns its key and path."""
+        try:
+            data = base64.b64decode(resume_pdf_base64, validate=True)
+        except (binascii.Error, ValueError):
+            raise ValueError("resume_pdf_base64 is not valid base64")
+        if not data.startswith(b"%PDF"):
+            raise ValueError("resume_pdf_base64 does not contain a PDF file")
+        path = cache_dir("uploads") / f"{hashlib.sha256(data).hexdigest()}.pdf"
+        if not path.exists():
+            atomic_write_bytes(path, data)
+        return self._load_resume([path.resolve()]), path
+
+    def _track_upload(self, key: str, path: Path) -> None:
+        """
+        Mark an uploaded resume as used and release the excess ones.
+
+        Resumes of queued or running runs and the default resume are kept.
+        Called on the event loop thread after the submitting run is queued.
+
+        Args:
+            key (str): Resume key of the upload
+            path (Path): Stored PDF of the upload
+        """
+        if key == self._default_resume:
+            return
+        in_use = {
+            run.resume
+            for run in self.runs.values()
+            if run.status in ("queued", "running")
+        }
+        with self._resumes_lock:
+            self._uploads[key] = path
+            self._uploads.move_to_end(key)
+            excess = len(self._uploads) - self.max_uploaded_resumes
+            for old in [old for old in self._uploads if old not in in_use]:
+                if excess <= 0:
+                    break
+                self._uploads.pop(old).unlink(missing_ok=True)
+                self._resumes.pop(old, None)
+                release_resume_knowledge(old)
+                excess -= 1
+
+    # ----------------------------------------
+    # Runs
+    # ----------------------------------------
+
+    async def submit(self, submission: RunSubmission) -> ServiceRun:
+        """
+        Queue a run.
+
+        Args:
+            submission (RunSubmission): Job and optional resume PDF
+
+        Returns:
+            ServiceRun: The queued run
+
+        Raises:
+            ValueError: If the uploaded resume is not a base64-encoded PDF, or
+                the output profile or routing policy is unknown
+            RuntimeError: If the service has not been started
+        """
+        if self._queue is None:
+            raise RuntimeError("The service has not been started")
+        get_profile(submission.profile)
+        load_routing_table().policy(submission.routing)
+        upload: Optional[Path] = None
+        if submission.resume_pdf_base64:
+            resume, upload = await asyncio.to_thread(
+                self._store_upload, submission.resume_pdf_base64
+            )
+        else:
+            resume = self._default_resume
+        self._prune_runs()
+
+        run = ServiceRun(
+            run_id=new_run_id(),
+            status="queued",
+            job_url=submission.job_url,
+            company_name=submission.company_name,
+            resume=resume,
+            submitted_at=time.time(),
+        )
+        self.runs[run.run_id] = run
+        self._requests[run.run_id] = submission
+        self._events[run.run_id] = []
+        self._changed[run.run_id] = asyncio.Event()
+        self._record(
+            run.run_id,
+            ProgressEvent(run_id=run.run_id, type="queued", timestamp=run.submitted_at),
+        )
+        self._queue.put_nowait(run.run_id)
+        if upload is not None:
+            self._track_upload(resume, upload)
+        return run
+
+    @property
+    def queued(self) -> int:
+        """Number of runs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _record(self, run_id: str, event: ProgressEvent) -> None:
+        """Store a progress event and wake up its subscribers (loop thread)."""
+        run = self.runs.get(run_id)
+        if run is None:
+            return
+        if event.type == "task_started" and run.time_to_first_task is None:
+            run.time_to_first_task = event.timestamp - run.submitted_at
+        self._events[run_id].append(event)
+        changed = self._changed[run_id]
+        changed.set()
+        self._changed[run_id] = asyncio.Event()
+        if event.type in FINAL_EVENT_TYPES:
+            run.finished_at = run.finished_at or event.timestamp
+            if not self._subscribers.get(run_id):
+                self._drop_events(run_id)
+
+    def _drop_events(self, run_id: str) -> None:
+        """Keep only the final event of a finished run without subscribers."""
+        events = self._events.get(run_id)
+        if events is not None:
+            self._events[run_id] = [
+                event for event in events if event.type in FINAL_EVENT_TYPES
+            ][-1:]
+
+    def _prune_runs(self) -> None:
+        """Forget expired finished runs and the oldest ones beyond the cap."""
+        finished = sorted(
+            (
+                run
+                for run in self.runs.values()
+                if run.finished_at is not None
+                and run.status not in ("queued", "running")
+                and not self._subscribers.get(run.run_id)
+            ),
+            key=lambda run: run.finished_at,
+        )
+        overflow = len(finished) - self.max_finished_runs
+        now = time.time()
+        for index, run in enumerate(finished):
+            if index < overflow or now - run.finished_at > self.run_retention:
+                del self.runs[run.run_id]
+                self._events.pop(run.run_id, None)
+                self._changed.pop(run.run_id, None)
+
+    def _record_threadsafe(
+        self, loop: asyncio.AbstractEventLoop, run_id: str, event: ProgressEvent
+    ) -> None:
+        """Record a progress event emitted in a worker thread."""
+        loop.call_soon_threadsafe(self._record, run_id, event)
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            run_id = await self._queue.get()
+            run = self.runs[run_id]
+            submission = self._requests.pop(run_id)
+            run.status = "running"
+            run.started_at = time.time()
+            try:
+                run.result = await run_async(
+                    {"job_url": run.job_url, "company_name": run.company_name},
+                    run_id=run_id,
+                    parallel=submission.parallel,
+                    max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                    split_research=submission.split_research,
+                    profile=submission.profile,
+                    llm_cache=submission.llm_cache,
+                    routing=submission.routing,
+                    model_overrides=submission.model_overrides,
+                    semaphore=asyncio.Semaphore(1),
+                    runs_dir=self.runs_dir,
+                    # Routed runs build their own LLMs per agent and task
+                    llm=None if self._routed(submission) else self.llm,
+                    stream=True,
+                    embedder=self.embedder,
+                    resume_pdf=self._resumes[run.resume],
+                    on_event=functools.partial(self._record_threadsafe, loop, run_id),
+                )
+                run.status = run.result.status
+            except Exception as e:
+                run.status = "failed"
+                self._record(
+                    run_id,
+                    ProgressEvent(
+                        run_id=run_id,
+                        type="run_failed",
+                        timestamp=time.time(),
+                        data={"error": str(e)},
+                    ),
+                )
+            finally:
+                run.finished_at = run.finished_at or time.time()
+                self._prune_runs()
+                self._queue.task_done()
+
+    async def events(self, run_id: str) -> AsyncIterator[ProgressEvent]:
+        """
+        Yield the progress events of a run, past ones first, until it ends.
+
+        Args:
+            run_id (str): Run identifier
+
+        Yields:
+            ProgressEvent: Events in the order they occurred; only the final
+                event once a finished run's events have been dropped
+        """
+        if run_id not in self._events:
+            return
+        self._subscribers[run_id] = self._subscribers.get(run_id, 0) + 1
+        try:
+            sent = 0
+            while True:
+                changed = self._changed[run_id]
+                events = self._events[run_id]
+                while sent < len(events):
+                    event = events[sent]
+                    sent += 1
+                    yield event
+                    if event.type in FINAL_EVENT_TYPES:
+                        return
+                await changed.wait()
+        finally:
+            self._subscribers[run_id] -= 1
+            if not self._subscribers[run_id]:
+                del self._subscribers[run_id]
+                run = self.runs.get(run_id)
+                if run is not None and run.finished_at is not None:
+                    self._drop_events(run_id)
+
+    def health(self) -> Dict[str, Any]:
+        """Return queue depth, worker and warm resume counts."""
+        return {
+            "status": "ok",
+            "workers": len(self._workers),
+            "queued": self.queued,
+            "running": sum(run.status == "running" for run in self.runs.values()),
+            "runs": len(self.runs),
+            "resumes_loaded": len(self._resumes),
+            "uptime": time.time() - self._started_at,
+        }
+
+
+# ========================================
+# ASGI APPLICATION
+# ========================================
+
+
+def create_app(service: Optional[ResumeService] = None) -> FastAPI:
+    """
+    Create the ASGI application serving a ResumeService.
+
+    Args:
+        service (ResumeService, optional): Service to expose; a default one
+            is created when omitted
+
+    Returns:
+        FastAPI: Application starting and stopping the service with its
+            lifespan
+    """
+    service = service or ResumeService()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        await service.start()
+        yield
+        await service.stop()
+
+    app = FastAPI(title="Jobfull Resume Analyzer", lifespan=lifespan)
+    app.state.service = service
+
+    def get_run(run_id: str) -> ServiceRun:
+        if run_id not in service.runs:
+            raise HTTPException(status_code=404, detail=f"Unknown run '{run_id}'")
+        return service.runs[run_id]
+
+    @app.get("/health")
+    async def health() -> Dict[str, Any]:
+        return service.health()
+
+    @app.post("/runs", status_code=202)
+    async def submit_run(submission: RunSubmission) -> ServiceRun:
+        try:
+            return await service.submit(submission)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+    @app.get("/runs/{run_id}")
+    async def run_status(run_id: str) -> ServiceRun:
+        return get_run(run_id)
+
+    @app.get("/runs/{run_id}/events")
+    async def run_events(run_id: str) -> StreamingResponse:
+        get_run(run_id)
+
+        async def stream() -> AsyncIterator[str]:
+            async for event in service.events(run_id):
+                yield f"event: {event.type}\ndata: {event.model_dump_json()}\n\n"
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+
+def serve(
+    host: str = DEFAULT_SERVICE_HOST,
+    port: int = DEFAULT_SERVICE_PORT,
+    max_concurrency: int = DEFAULT_SERVICE_CONCURRENCY,
+    runs_dir: str = DEFAULT_RUNS_DIR,
+) -> None:
+    """
+    Run the HTTP service with uvicorn until interrupted.
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to listen on
+        max_concurrency (int): Number of workflows run at once
+        runs_dir (str): Root directory of the per-run output directories
+    """
+    import uvicorn
+
+    service = ResumeService(max_concurrency=max_concurrency, runs_dir=runs_dir)
+    uvicorn.run(create_app(service), host=host, port=port)
@@ -0,0 +1,323 @@
+"""
+Jobfull Resume Analyzer - Streaming Output Validation Module
+
+This module parses a structured task answer (JobRequirements, CompanyResearch,
+...) while the LLM is still streaming it. Each top-level field is validated
+against the Pydantic model the moment its value is complete, so callers see
+e.g. the job title and required skills seconds before the whole answer has
+been generated, and learn about a schema violation at the first bad field
+instead of after the last token.
+
+Parsing:
+    StreamingModelParser consumes arbitrary text chunks. It skips the ReAct
+    preamble ("Thought: ... Final Answer:") and an optional ```json fence,
+    then tracks the top-level JSON object character by character. Tool
+    actions ("Action Input: {...}") are not mistaken for the answer.
+
+    A field is complete when its string, object or array closes, or when
+    the comma or brace after a number, boolean or null arrives. It is then
+    decoded and validated on its own; unknown keys are ignored like
+    model_validate() does. When the object closes, missing required fields
+    are reported and the whole model is validated.
+
+Failures:
+    feed() raises SchemaViolationError at the first invalid JSON value,
+    invalid field or missing required field. The parser stays failed and
+    raises the same error for further chunks.
+
+Example:
+    from cv_opt.models import JobRequirements
+    from cv_opt.streaming import StreamingModelParser
+
+    parser = StreamingModelParser(JobRequirements)
+    for chunk in chunks:
+        for name in parser.feed(chunk):
+            print(name, parser.values[name])
+    job = parser.result
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import functools
+import json
+import re
+from typing import Annotated, Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+# Text right before the answer object: a Final Answer marker and/or a
+# Markdown code fence, or nothing at all
+_ANSWER_PREFIX = re.compile(r"(?:\A|Final Answer:)\s*(?:```(?:json)?\s*)?\Z")
+
+# Characters of the preamble kept to recognize the answer start
+_PREFIX_TAIL = 64
+
+_WHITESPACE = " \t\r\n"
+
+
+class SchemaViolationError(ValueError):
+    """
+    A streamed answer violates the schema of its Pydantic model.
+
+    Attributes:
+        model (str): Name of the Pydantic model
+        field (str, optional): Offending field; None for JSON syntax errors
+            outside a field value
+        errors (List[Dict[str, Any]]): Pydantic validation errors, if any
+    """
+
+    def __init__(
+        self,
+        model: str,
+        field: Optional[str],
+        message: str,
+        errors: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        location = f"{model}.{field}" if field else model
+        super().__init__(f"{location}: {message}")
+        self.model = model
+        self.field = field
+        self.errors = errors or []
+
+
+@functools.lru_cache(maxsize=None)
+def _field_adapters(model: Type[BaseModel]) -> Dict[str, TypeAdapter]:
+    """Return a validator for every field of a model, constraints included."""
+    return {
+        name: TypeAdapter(Annotated[(field.annotation, *field.metadata)])
+        if field.metadata
+        else TypeAdapter(field.annotation)
+        for name, field in model.model_fields.items()
+    }
+
+
+def _first_error(error: ValidationError) -> str:
+    """Describe the first error of a validation failure with its location."""
+    details = error.errors()[0]
+    location = ".".join(str(part) for part in details["loc"])
+    return f"{location}: {details['msg']}" if location else details["msg"]
+
+
+class StreamingModelParser:
+    """
+    Incrementally parse and validate a streamed JSON answer.
+
+    Attributes:
+        model (Type[BaseModel]): Model the answer must satisfy
+        values (Dict[str, Any]): Decoded JSON value of each completed field
+        fields (Dict[str, Any]): Validated value of each completed field
+        result (BaseModel, optional): Validated model once the object closed
+        error (SchemaViolationError, optional): First violation found
+    """
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.model = model
+        self.values: Dict[str, Any] = {}
+        self.fields: Dict[str, Any] = {}
+        self.result: Optional[BaseModel] = None
+        self.error: Optional[SchemaViolationError] = None
+        self._adapters = _field_adapters(model)
+        self._state = "seek"
+        self._prefix = ""
+        self._prefix_truncated = False
+        self._key: List[str] = []
+        self._value: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the answer object has begun."""
+        return self._state != "seek"
+
+    @property
+    def done(self) -> bool:
+        """Whether the answer object closed and validated."""
+        return self.result is not None
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Consume the next chunk of streamed text.
+
+        Args:
+            chunk (str): Text delta of the LLM response
+
+        Returns:
+            List[str]: Names of the fields completed and validated by the
+                chunk, in answer order
+
+        Raises:
+            SchemaViolationError: At the first schema violation
+        """
+        if self.error is not None:
+            raise self.error
+        completed: List[str] = []
+        for char in chunk:
+            if self._state == "done":
+                break
+            try:
+                self._consume(char, completed)
+            except SchemaViolationError as e:
+                self.error = e
+                raise
+        return completed
+
+    # ========================================
+    # CHARACTER STATE MACHINE
+    # ========================================
+
+    def _consume(self, char: str, completed: List[str]) -> None:
+        """Advance the state machine by one character."""
+        state = self._state
+        if state == "seek":
+            if char == "{" and self._at_answer_start():
+                self._state = "key_start"
+            else:
+                self._prefix += char
+                if len(self._prefix) > _PREFIX_TAIL:
+                    self._prefix = self._prefix[-_PREFIX_TAIL:]
+                    self._prefix_truncated = True
+        elif state == "key_start":
+            if char == '"':
+                self._key = []
+                self._state = "key"
+            elif char == "}":
+                self._close()
+            elif char not in _WHITESPACE:
+                self._syntax_error(f"expected a field name, got {char!r}")
+        elif state == "key":
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._state = "colon"
+                return
+            self._key.append(char)
+        elif state == "colon":
+            if char == ":":
+                self._state = "value_start"
+            elif char not in _WHITESPACE:
+                self._syntax_error(f"expected ':', got {char!r}")
+        elif state == "value_start":
+            if char not in _WHITESPACE:
+                self._value = [char]
+                self._depth = 1 if char in "{[" else 0
+                self._in_string = char == '"'
+                self._escaped = False
+                self._state = "value"
+        elif state == "value":
+            self._consume_value(char, completed)
+        elif state == "comma_or_end":
+            if char == ",":
+                self._state = "key_start"
+            elif char == "}":
+                self._close()
+            elif char not in _WHITESPACE:
+                self._syntax_error(f"expected ',' or '}}', got {char!r}")
+
+    def _at_answer_start(self) -> bool:
+        """Whether a "{" at this point opens the answer object."""
+        match = _ANSWER_PREFIX.search(self._prefix)
+        if match is None:
+            return False
+        # A match at the start of a truncated preamble is not a blank preamble
+        return match.start() > 0 or not self._prefix_truncated
+
+    def _consume_value(self, char: str, completed: List[str]) -> None:
+        """Advance through a field value, finishing it when it closes."""
+        if self._in_string:
+            self._value.append(char)
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 0:
+                    self._finish_field(completed)
+                    self._state = "comma_or_end"
+        elif self._depth == 0 and char in ",}":
+            # End of a number, boolean or null
+            self._finish_field(completed)
+            if char == ",":
+                self._state = "key_start"
+            else:
+                self._close()
+        else:
+            self._value.append(char)
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finish_field(completed)
+                    self._state = "comma_or_end"
+
+    # ========================================
+    # VALIDATION
+    # ========================================
+
+    def _current_key(self) -> str:
+        """Decode the name of the field being parsed."""
+        return json.loads('"' + "".join(self._key) + '"')
+
+    def _finish_field(self, completed: List[str]) -> None:
+        """Decode and validate a complete field value."""
+        name = self._current_key()
+        text = "".join(self._value).strip()
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise SchemaViolationError(
+                self.model.__name__, name, f"invalid JSON value ({e.msg})"
+            ) from e
+
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            if self.model.model_config.get("extra") == "forbid":
+                raise SchemaViolationError(
+                    self.model.__name__, name, "unexpected field"
+                )
+            return
+        try:
+            self.fields[name] = adapter.validate_python(value)
+        except ValidationError as e:
+            raise SchemaViolationError(
+                self.model.__name__,
+                name,
+                _first_error(e),
+                errors=e.errors(include_url=False),
+            ) from e
+        self.values[name] = value
+        completed.append(name)
+
+    def _close(self) -> None:
+        """Finish the answer object: check required fields, build the model."""
+        missing = [
+            name
+            for name, field in self.model.model_fields.items()
+            if field.is_required() and name not in self.values
+        ]
+        if missing:
+            raise SchemaViolationError(
+                self.model.__name__, missing[0], "field required"
+            )
+        try:
+            self.result = self.model.model_validate(self.values)
+        except ValidationError as e:
+            raise SchemaViolationError(
+                self.model.__name__,
+                None,
+                _first_error(e),
+                errors=e.errors(include_url=False),
+            ) from e
+        self._state = "done"
+
+    def _syntax_error(self, message: str) -> None:
+        """Raise a violation for malformed JSON between fields."""
+        raise SchemaViolationError(self.model.__name__, None, message)
@@ -0,0 +1,14 @@
+from .job_posting import PostingExtraction, extract_job_posting
+from .scrape_cache import CachedScrapeWebsiteTool, ScrapeCache, get_scrape_cache
+from .serper_cache import CachedSerperDevTool, SearchCache, get_search_cache
+
+__all__ = [
+    "CachedScrapeWebsiteTool",
+    "CachedSerperDevTool",
+    "PostingExtraction",
+    "ScrapeCache",
+    "SearchCache",
+    "extract_job_posting",
+    "get_scrape_cache",
+    "get_search_cache",
+]
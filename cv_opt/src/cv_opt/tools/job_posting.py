@@ -0,0 +1,519 @@
+"""
+Jobfull Resume Analyzer - Job Posting Extraction
+
+This module cuts a career page down to the job posting before an agent reads
+it. ScrapeWebsiteTool returns the text of the whole page, and career sites
+wrap a few hundred words of posting in navigation, footers, cookie banners
+and lists of related jobs. analyze_job_task is the first task of the chain
+and carries the largest context, so every token of boilerplate delays all
+later tasks.
+
+Extraction Order:
+    1. json-ld:     a schema.org JobPosting in <script type="application/
+                    ld+json">, rendered as a short header (title, company,
+                    location, salary, dates) followed by its description
+    2. readability: the densest text block of the page, scored like
+                    Readability: paragraphs and list items score their parent
+                    and grandparent, link-heavy blocks and class/id names
+                    such as "cookie" or "footer" are penalized, names such as
+                    "job-description" are favoured; sibling blocks scoring
+                    close to the best one are kept with it
+    3. full-page:   the cleaned text of the whole page, when no block holds
+                    at least MIN_POSTING_CHARS characters
+
+    List items are rendered as "- " bullets and block elements as separate
+    lines, so section headings and requirements stay recognizable.
+
+Known Fields:
+    A JobPosting also states some JobRequirements fields outright (title,
+    location, salary, posting date, deadline). posting_fields() maps them
+    deterministically, so the job analyzer's LLM does not have to generate
+    them; the crew merges them into the analysis (see crew.py).
+
+Token Reduction:
+    Every extraction reports the estimated tokens of the full page text and
+    of the extracted text (four characters per token, like the run tracer).
+
+Example:
+    from cv_opt.tools.job_posting import extract_job_posting
+
+    posting = extract_job_posting(html)
+    print(posting.method, posting.page_tokens, "->", posting.tokens)
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+from bs4 import BeautifulSoup, Tag
+from pydantic import BaseModel, Field
+
+# Extracted text shorter than this is not trusted to be the whole posting
+MIN_POSTING_CHARS = 400
+
+# Estimated characters per token, the run tracer's estimate
+CHARS_PER_TOKEN = 4
+
+# Share of the best block's score a sibling block needs to be kept with it
+SIBLING_SCORE_RATIO = 0.25
+
+# Elements that never hold the posting text
+_NOISE_TAGS = (
+    "script",
+    "style",
+    "noscript",
+    "template",
+    "svg",
+    "iframe",
+    "nav",
+    "header",
+    "footer",
+    "aside",
+    "form",
+    "button",
+    "select",
+)
+
+# Class/id name parts of page chrome
+_NOISE_HINTS = re.compile(
+    r"(?:^|[\s_-])(?:cookie|consent|gdpr|banner|nav|menu|breadcrumb|footer|"
+    r"sidebar|social|share|newsletter|subscribe|related|recommend|similar|"
+    r"modal|popup|promo|advert|skip)",
+    re.IGNORECASE,
+)
+
+# Class/id name parts of posting containers
+_POSTING_HINTS = re.compile(
+    r"job|posting|vacanc|description|details|position|article|content|main",
+    re.IGNORECASE,
+)
+
+# Elements rendered on their own line
+_BLOCK_TAGS = (
+    "address",
+    "article",
+    "blockquote",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "li",
+    "main",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "td",
+    "th",
+    "tr",
+    "ul",
+)
+
+# Elements whose text scores their ancestors
+_TEXT_TAGS = ("p", "li", "pre", "td", "dd", "h2", "h3", "h4")
+
+# Ancestor levels a text block scores, with the share each receives
+_SCORE_LEVELS = (1.0, 0.5, 0.33)
+
+# JobPosting properties rendered after the description
+_POSTING_LISTS = (
+    ("responsibilities", "Responsibilities"),
+    ("qualifications", "Qualifications"),
+    ("skills", "Skills"),
+    ("experienceRequirements", "Experience"),
+    ("educationRequirements", "Education"),
+    ("jobBenefits", "Benefits"),
+)
+
+
+class PostingExtraction(BaseModel):
+    """
+    Job posting text extracted from a career page.
+
+    Attributes:
+        text (str): Extracted posting text
+        method (str): "json-ld", "readability" or "full-page"
+        page_tokens (int): Estimated tokens of the full page text
+        tokens (int): Estimated tokens of the extracted text
+        fields (Dict[str, Any]): JobRequirements fields known from the
+            page's JobPosting, empty without one
+    """
+
+    text: str = Field(description="Extracted posting text")
+    method: str = Field(description="json-ld, readability or full-page")
+    page_tokens: int = Field(description="Estimated tokens of the full page")
+    tokens: int = Field(description="Estimated tokens of the extracted text")
+    fields: Dict[str, Any] = Field(
+        description="JobRequirements fields known from the JobPosting",
+        default_factory=dict,
+    )
+
+    @property
+    def token_reduction(self) -> float:
+        """Share of the page's tokens removed by the extraction."""
+        return 1 - self.tokens / self.page_tokens if self.page_tokens else 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the tokens of a text."""
+    return len(text) // CHARS_PER_TOKEN
+
+
+def _normalize_lines(text: str) -> str:
+    """Collapse whitespace within lines and drop empty lines."""
+    lines = (re.sub(r"\s+", " ", line).strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def clean_html(html: str) -> str:
+    """
+    Convert an HTML page into whitespace-normalized text.
+
+    Uses the same cleaning as ScrapeWebsiteTool so cached and uncached runs
+    hand identical text to the agent.
+
+    Args:
+        html (str): Raw HTML of the page
+
+    Returns:
+        str: Cleaned page text
+    """
+    text = BeautifulSoup(html, "html.parser").get_text(" ")
+    text = re.sub("[ \t]+", " ", text)
+    text = re.sub("\\s+\n\\s+", "\n", text)
+    return text
+
+
+def html_to_text(element: Any) -> str:
+    """
+    Render HTML with one line per block element and bullets for list items.
+
+    Args:
+        element (Any): HTML string or parsed element; parsed elements are
+            modified in place
+
+    Returns:
+        str: Line-structured text
+    """
+    if isinstance(element, str):
+        element = BeautifulSoup(element, "html.parser")
+    for br in element.find_all("br"):
+        br.replace_with("\n")
+    for tag in element.find_all(_BLOCK_TAGS):
+        tag.insert_before("\n")
+        tag.insert_after("\n")
+        if tag.name == "li":
+            tag.insert(0, "- ")
+    return _normalize_lines(element.get_text(""))
+
+
+# ========================================
+# JSON-LD
+# ========================================
+
+
+def _walk_jsonld(data: Any) -> Iterator[Dict[str, Any]]:
+    """Yield every object of a JSON-LD document, including @graph members."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _walk_jsonld(item)
+    elif isinstance(data, dict):
+        yield data
+        yield from _walk_jsonld(data.get("@graph", []))
+
+
+def find_job_posting(html: Any) -> Optional[Dict[str, Any]]:
+    """
+    Return the schema.org JobPosting embedded in a page as JSON-LD.
+
+    Args:
+        html (Any): HTML string or parsed page
+
+    Returns:
+        Dict[str, Any], optional: The first JobPosting object, if any
+    """
+    soup = BeautifulSoup(html, "html.parser") if isinstance(html, str) else html
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or script.get_text() or "")
+        except ValueError:
+            continue
+        for item in _walk_jsonld(data):
+            types = item.get("@type")
+            types = types if isinstance(types, list) else [types]
+            if "JobPosting" in types:
+                return item
+    return None
+
+
+def _name(value: Any) -> str:
+    """Return the name of a JSON-LD value that may be a string or an object."""
+    if isinstance(value, dict):
+        return str(value.get("name") or "")
+    return str(value or "")
+
+
+def posting_location(posting: Dict[str, Any]) -> str:
+    """
+    Render the location of a JobPosting, e.g. "Santa Clara, CA, US (Remote)".
+
+    Args:
+        posting (Dict[str, Any]): JobPosting object
+
+    Returns:
+        str: Location, empty if unknown
+    """
+    locations = posting.get("jobLocation") or []
+    places = []
+    for location in locations if isinstance(locations, list) else [locations]:
+        if isinstance(location, dict):
+            location = location.get("address", location)
+        if isinstance(location, str):
+            places.append(location)
+        elif isinstance(location, dict):
+            parts = (
+                location.get(key)
+                for key in ("addressLocality", "addressRegion", "addressCountry")
+            )
+            place = ", ".join(_name(part) for part in parts if _name(part))
+            if place:
+                places.append(place)
+    location = "; ".join(dict.fromkeys(places))
+    if str(posting.get("jobLocationType", "")).upper() == "TELECOMMUTE":
+        location = f"{location} (Remote)" if location else "Remote"
+    return location
+
+
+def posting_salary(posting: Dict[str, Any]) -> str:
+    """
+    Render the base salary of a JobPosting, e.g. "USD 150000-200000 per YEAR".
+
+    Args:
+        posting (Dict[str, Any]): JobPosting object
+
+    Returns:
+        str: Salary, empty if not given
+    """
+    salary = posting.get("baseSalary") or posting.get("estimatedSalary")
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if not isinstance(salary, dict):
+        return str(salary or "")
+    value = salary.get("value", {})
+    currency = salary.get("currency") or ""
+    if isinstance(value, dict):
+        currency = currency or value.get("currency") or ""
+        unit = value.get("unitText") or salary.get("unitText") or ""
+        low, high = value.get("minValue"), value.get("maxValue")
+        amount = "-".join(str(part) for part in (low, high) if part is not None)
+        amount = amount or str(value.get("value") or "")
+    else:
+        unit = salary.get("unitText") or ""
+        amount = str(value or "")
+    if not amount:
+        return ""
+    return " ".join(part for part in (currency, amount) if part) + (
+        f" per {unit}" if unit else ""
+    )
+
+
+def _list_text(value: Any) -> List[str]:
+    """Render a JobPosting property that may be text, HTML, a list or objects."""
+    values = value if isinstance(value, list) else [value]
+    lines = []
+    for item in values:
+        if isinstance(item, dict):
+            item = item.get("description") or item.get("name") or ""
+        text = html_to_text(str(item)) if item else ""
+        lines.extend(line for line in text.splitlines() if line)
+    return lines
+
+
+def render_job_posting(posting: Dict[str, Any]) -> str:
+    """
+    Render a JobPosting as posting text.
+
+    Args:
+        posting (Dict[str, Any]): JobPosting object
+
+    Returns:
+        str: Header lines, the description and the list properties
+    """
+    header = [
+        ("Company", _name(posting.get("hiringOrganization"))),
+        ("Location", posting_location(posting)),
+        ("Employment type", ", ".join(_list_text(posting.get("employmentType")))),
+        ("Salary", posting_salary(posting)),
+        ("Posted", str(posting.get("datePosted") or "")),
+        ("Apply by", str(posting.get("validThrough") or "")),
+    ]
+    lines = [_name(posting.get("title"))]
+    lines += [f"{label}: {value}" for label, value in header if value]
+    lines.append(html_to_text(str(posting.get("description") or "")))
+    for key, label in _POSTING_LISTS:
+        items = _list_text(posting.get(key))
+        if items:
+            lines.append(label)
+            lines += [f"- {item}" for item in items]
+    return _normalize_lines("\n".join(lines))
+
+
+def posting_fields(posting: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map the explicit properties of a JobPosting to JobRequirements fields.
+
+    Args:
+        posting (Dict[str, Any]): JobPosting object
+
+    Returns:
+        Dict[str, Any]: job_title, location_requirements, compensation,
+            work_schedule, posting_date and application_deadline, each only
+            if the posting states it
+    """
+    location = posting_location(posting)
+    salary = posting_salary(posting)
+    employment = ", ".join(_list_text(posting.get("employmentType")))
+    fields: Dict[str, Any] = {
+        "job_title": _name(posting.get("title")).strip(),
+        "location_requirements": {"location": location} if location else {},
+        "compensation": {"base_salary": salary} if salary else {},
+        "work_schedule": employment.replace("_", " ").lower(),
+        "posting_date": str(posting.get("datePosted") or ""),
+        "application_deadline": str(posting.get("validThrough") or ""),
+    }
+    return {name: value for name, value in fields.items() if value}
+
+
+# ========================================
+# READABILITY
+# ========================================
+
+
+def _hints(tag: Tag) -> str:
+    """Return the class and id names of an element."""
+    classes = tag.get("class") or []
+    return " ".join([*classes, tag.get("id") or ""])
+
+
+def _remove_noise(soup: BeautifulSoup) -> None:
+    """Remove page chrome from a parsed page in place."""
+    for tag in soup.find_all(_NOISE_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(True):
+        if tag.decomposed or tag.name in ("html", "body", "main", "article"):
+            continue
+        hints = _hints(tag)
+        if _NOISE_HINTS.search(hints) and not _POSTING_HINTS.search(hints):
+            tag.decompose()
+
+
+def _link_density(tag: Tag) -> float:
+    text = len(tag.get_text(" ", strip=True))
+    links = sum(len(a.get_text(" ", strip=True)) for a in tag.find_all("a"))
+    return links / text if text else 1.0
+
+
+def _score_blocks(soup: BeautifulSoup) -> Dict[Tag, float]:
+    """Score the containers of the page's text blocks."""
+    scores: Dict[Tag, float] = {}
+    for block in soup.find_all(_TEXT_TAGS):
+        text = block.get_text(" ", strip=True)
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        ancestors = [parent for parent in block.parents if parent.name != "[document]"]
+        for parent, share in zip(ancestors, _SCORE_LEVELS):
+            if parent not in scores:
+                hints = _hints(parent)
+                scores[parent] = (
+                    25.0 * bool(_POSTING_HINTS.search(hints))
+                    - 25.0 * bool(_NOISE_HINTS.search(hints))
+                )
+            scores[parent] += score * share
+    return {tag: score * (1 - _link_density(tag)) for tag, score in scores.items()}
+
+
+def _readable_blocks(soup: BeautifulSoup) -> List[Tag]:
+    """
+    Return the best scoring block with its strong siblings and the sibling
+    holding the page heading (title, location), in page order.
+    """
+    scores = _score_blocks(soup)
+    if not scores:
+        return []
+    best = max(scores, key=scores.get)
+    if best.parent is None:
+        return [best]
+    threshold = max(10.0, scores[best] * SIBLING_SCORE_RATIO)
+    heading = soup.find("h1")
+    heading_blocks = [heading, *heading.parents] if heading is not None else []
+    return [
+        sibling
+        for sibling in best.parent.find_all(True, recursive=False)
+        if sibling is best
+        or scores.get(sibling, 0.0) >= threshold
+        or any(sibling is block for block in heading_blocks)
+    ]
+
+
+def _page_title(soup: BeautifulSoup) -> str:
+    heading = soup.find("h1") or soup.find("title")
+    return heading.get_text(" ", strip=True) if heading else ""
+
+
+# ========================================
+# EXTRACTION
+# ========================================
+
+
+def extract_job_posting(html: str) -> PostingExtraction:
+    """
+    Extract the job posting from the HTML of a career page.
+
+    Args:
+        html (str): Raw HTML of the page
+
+    Returns:
+        PostingExtraction: Posting text, the method that found it, the
+            estimated tokens before and after and the known fields
+    """
+    page_text = clean_html(html)
+    page_tokens = estimate_tokens(page_text)
+
+    soup = BeautifulSoup(html, "html.parser")
+    posting = find_job_posting(soup)
+    fields = posting_fields(posting) if posting is not None else {}
+
+    def result(text: str, method: str) -> PostingExtraction:
+        return PostingExtraction(
+            text=text,
+            method=method,
+            page_tokens=page_tokens,
+            tokens=estimate_tokens(text),
+            fields=fields,
+        )
+
+    if posting is not None:
+        text = render_job_posting(posting)
+        if len(text) >= MIN_POSTING_CHARS:
+            return result(text, "json-ld")
+
+    title = _page_title(soup)
+    _remove_noise(soup)
+    blocks = _readable_blocks(soup)
+    text = "\n".join(html_to_text(block) for block in blocks)
+    if len(text) >= MIN_POSTING_CHARS:
+        if title and not text.startswith(title):
+            text = f"{title}\n{text}"
+        return result(text, "readability")
+    return result(page_text, "full-page")
@@ -0,0 +1,496 @@
+"""
+Jobfull Resume Analyzer - Cached Website Scraping Tool
+
+This module provides a disk-backed, content-addressed cache for job posting
+fetches and a drop-in replacement for crewai_tools' ScrapeWebsiteTool that
+uses it. Re-running a job, or analyzing a posting a teammate already fetched,
+returns the cleaned page text straight from disk without any network I/O.
+By default the tool returns only the job posting of the page (see
+cv_opt.tools.job_posting), not the text of the whole page.
+
+Cache Layout (.cache/scrape/):
+    entries/<key>.json  # ScrapeCacheEntry metadata of one normalized URL
+    content/<sha>.txt   # Cleaned page text, stored once per content hash
+
+    Entries are separate files written atomically, so processes sharing the
+    directory add and refresh entries without overwriting each other's.
+
+Freshness:
+    - Entries younger than the TTL are served without touching the network
+    - Stale entries with an ETag or Last-Modified header are revalidated with a
+      conditional request; a 304 response refreshes the entry in place
+    - The cache is capped in bytes and evicts least recently used entries;
+      access times are recorded with a resolution of one hour, so cache hits
+      do not write to disk
+
+Token Reduction:
+    Entries record how the posting was extracted and the estimated tokens of
+    the full page and of the stored text. Every page served adds both to the
+    cache's page_tokens and posting_tokens counters.
+
+Known Fields:
+    Entries of pages with a schema.org JobPosting also keep the
+    JobRequirements fields it states (see posting_fields()), which
+    CachedScrapeWebsiteTool.posting_fields() returns without an agent.
+
+Example:
+    from cv_opt.tools import CachedScrapeWebsiteTool
+
+    tool = CachedScrapeWebsiteTool(ttl_seconds=6 * 3600)
+    text = tool.run(website_url="https://company.com/careers/job-123")
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from crewai_tools import ScrapeWebsiteTool
+from pydantic import BaseModel, Field, PrivateAttr
+
+from ..cache import atomic_write_text, cache_dir, sha256_text
+from .job_posting import PostingExtraction, clean_html, extract_job_posting
+
+# Serve cached pages without revalidation for one day by default
+DEFAULT_SCRAPE_TTL_SECONDS = 24 * 3600
+
+# Total size cap of cached page text
+DEFAULT_SCRAPE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Granularity of the recorded last access of an entry; reads within it
+# leave the entry file untouched
+_ACCESS_RESOLUTION_SECONDS = 3600
+
+# Query parameters that never change the page content
+_TRACKING_PARAMS = re.compile(r"^(utm_.*|gclid|fbclid|mc_cid|mc_eid|ref|src)$")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent links share one cache entry.
+
+    Lowercases the scheme and host, drops default ports, fragments and
+    tracking parameters, sorts the remaining query parameters and removes a
+    trailing slash from non-root paths.
+
+    Args:
+        url (str): URL as provided to the tool
+
+    Returns:
+        str: Canonical form of the URL
+
+    Example:
+        normalize_url("HTTPS://Jobs.Example.com:443/a/?utm_source=x&b=2&a=1#top")
+        # "https://jobs.example.com/a?a=1&b=2"
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not _TRACKING_PARAMS.match(key.lower())
+        )
+    )
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+# ========================================
+# SCRAPE CACHE
+# ========================================
+
+
+class ScrapeCacheEntry(BaseModel):
+    """
+    Metadata of one cached page.
+
+    Attributes:
+        url (str): Normalized URL of the page
+        content_hash (str): SHA-256 of the cleaned text (content file name)
+        size (int): Size of the cleaned text in bytes
+        etag (str, optional): ETag response header for revalidation
+        last_modified (str, optional): Last-Modified response header
+        fetched_at (float): Time of the last fetch or successful revalidation
+        last_accessed (float): Time of the last cache read (LRU ordering)
+        method (str, optional): Posting extraction method ("json-ld",
+            "readability" or "full-page"); None for unextracted page text
+        page_tokens (int, optional): Estimated tokens of the full page
+        tokens (int, optional): Estimated tokens of the stored text
+        fields (Dict[str, Any]): JobRequirements fields known from the
+            page's JobPosting
+    """
+
+    url: str = Field(description="Normalized URL of the page")
+    content_hash: str = Field(description="SHA-256 of the cleaned text")
+    size: int = Field(description="Size of the cleaned text in bytes")
+    etag: Optional[str] = Field(description="ETag response header", default=None)
+    last_modified: Optional[str] = Field(
+        description="Last-Modified response header", default=None
+    )
+    fetched_at: float = Field(description="Time of the last fetch or revalidation")
+    last_accessed: float = Field(description="Time of the last cache read")
+    method: Optional[str] = Field(
+        description="Posting extraction method", default=None
+    )
+    page_tokens: Optional[int] = Field(
+        description="Estimated tokens of the full page", default=None
+    )
+    tokens: Optional[int] = Field(
+        description="Estimated tokens of the stored text", default=None
+    )
+    fields: Dict[str, Any] = Field(
+        description="JobRequirements fields known from the JobPosting",
+        default_factory=dict,
+    )
+
+
+class ScrapeCache:
+    """
+    Disk-backed, content-addressed LRU cache of cleaned page text.
+
+    Every entry is a small JSON file of its own, written atomically, and is
+    read from disk on every lookup. Processes sharing the cache directory
+    (see CV_OPT_CACHE_DIR) therefore see each other's entries and never
+    overwrite unrelated ones. Use get_scrape_cache() to obtain the shared
+    instance for a directory within a process.
+
+    Attributes:
+        directory (Path): Cache directory
+        max_bytes (int): Total size cap of cached text
+        stats (Dict[str, int]): Counters for hits, misses, revalidations
+            and evictions, and the estimated tokens of the full pages and of
+            the extracted postings served
+    """
+
+    def __init__(
+        self, directory: Path, max_bytes: int = DEFAULT_SCRAPE_CACHE_MAX_BYTES
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "revalidated": 0,
+            "evictions": 0,
+            "page_tokens": 0,
+            "posting_tokens": 0,
+        }
+        self._content_dir = self.directory / "content"
+        self._content_dir.mkdir(parents=True, exist_ok=True)
+        self._entry_dir = self.directory / "entries"
+        self._entry_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Bytes of cached text, counted on disk by the first put() and kept
+        # up to date with this process's writes; None until then
+        self._total_bytes: Optional[int] = None
+
+    def _entry_path(self, key: str) -> Path:
+        return self._entry_dir / f"{key}.json"
+
+    def _content_path(self, content_hash: str) -> Path:
+        return self._content_dir / f"{content_hash}.txt"
+
+    def _read_entry(self, path: Path) -> Optional[ScrapeCacheEntry]:
+        """Read an entry file; None if it is missing or unreadable."""
+        try:
+            return ScrapeCacheEntry.model_validate_json(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_entry(self, key: str, entry: ScrapeCacheEntry) -> None:
+        atomic_write_text(self._entry_path(key), entry.model_dump_json())
+
+    @staticmethod
+    def key(url: str) -> str:
+        """Return the cache key of a URL (hash of its normalized form)."""
+        return sha256_text(normalize_url(url))
+
+    def get(self, url: str) -> Optional[ScrapeCacheEntry]:
+        """
+        Return the entry for a URL, if cached, and mark it as used.
+
+        The access time is persisted lazily: the entry file is only
+        rewritten when its recorded access is older than
+        _ACCESS_RESOLUTION_SECONDS, so hits do not write to disk.
+        """
+        key = self.key(url)
+        entry = self._read_entry(self._entry_path(key))
+        if entry is None or not self._content_path(entry.content_hash).exists():
+            return None
+        now = time.time()
+        if now - entry.last_accessed >= _ACCESS_RESOLUTION_SECONDS:
+            entry.last_accessed = now
+            with self._lock:
+                self._write_entry(key, entry)
+        return entry
+
+    def read(self, entry: ScrapeCacheEntry) -> str:
+        """Return the cleaned text of an entry."""
+        return self._content_path(entry.content_hash).read_text(encoding="utf-8")
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        extraction: Optional[PostingExtraction] = None,
+    ) -> ScrapeCacheEntry:
+        """
+        Store the cleaned text of a page and evict entries over the size cap.
+
+        Identical content fetched from different URLs is stored only once.
+        When `extraction` is given, `text` is its posting text and the entry
+        records the method, token counts and known fields.
+        """
+        content_hash = sha256_text(text)
+        content_path = self._content_path(content_hash)
+        size = len(text.encode("utf-8"))
+        added = 0
+        if not content_path.exists():
+            atomic_write_text(content_path, text)
+            added = size
+
+        now = time.time()
+        entry = ScrapeCacheEntry(
+            url=normalize_url(url),
+            content_hash=content_hash,
+            size=size,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=now,
+            last_accessed=now,
+            method=extraction.method if extraction else None,
+            page_tokens=extraction.page_tokens if extraction else None,
+            tokens=extraction.tokens if extraction else None,
+            fields=extraction.fields if extraction else {},
+        )
+        with self._lock:
+            self._write_entry(self.key(url), entry)
+            if self._total_bytes is None:
+                self._evict()
+            else:
+                self._total_bytes += added
+                if self._total_bytes > self.max_bytes:
+                    self._evict()
+        return entry
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment one of the stats counters."""
+        with self._lock:
+            self.stats[name] += amount
+
+    def record_served(self, entry: ScrapeCacheEntry) -> None:
+        """Count the tokens of an extracted entry handed to an agent."""
+        if entry.page_tokens is not None and entry.tokens is not None:
+            with self._lock:
+                self.stats["page_tokens"] += entry.page_tokens
+                self.stats["posting_tokens"] += entry.tokens
+
+    def refresh(self, url: str, entry: ScrapeCacheEntry) -> None:
+        """Mark the entry of a URL as freshly revalidated (HTTP 304)."""
+        with self._lock:
+            entry.fetched_at = entry.last_accessed = time.time()
+            self._write_entry(self.key(url), entry)
+
+    def _evict(self) -> None:
+        """
+        Drop least recently used entries until the size cap is met.
+
+        Entry files of all processes sharing the directory are considered.
+        A content file is only deleted once no entry on disk references it.
+        put() only scans the directory when its running total exceeds the
+        cap, so text added by other processes is counted at the next scan.
+        """
+        entries = {}
+        for path in self._entry_dir.glob("*.json"):
+            entry = self._read_entry(path)
+            if entry is not None:
+                entries[path] = entry
+        unique_sizes = {e.content_hash: e.size for e in entries.values()}
+        total = sum(unique_sizes.values())
+        for path, entry in sorted(
+            entries.items(), key=lambda item: item[1].last_accessed
+        ):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            del entries[path]
+            self.stats["evictions"] += 1
+            shared = any(
+                other.content_hash == entry.content_hash for other in entries.values()
+            )
+            if not shared:
+                total -= entry.size
+                self._content_path(entry.content_hash).unlink(missing_ok=True)
+        self._total_bytes = total
+
+
+_caches: Dict[Path, ScrapeCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_scrape_cache(
+    directory: Optional[str] = None, max_bytes: int = DEFAULT_SCRAPE_CACHE_MAX_BYTES
+) -> ScrapeCache:
+    """
+    Return the process-wide ScrapeCache for a directory.
+
+    Args:
+        directory (str, optional): Cache directory; defaults to .cache/scrape
+        max_bytes (int): Total size cap, applied when the cache is created
+
+    Returns:
+        ScrapeCache: Shared cache instance
+    """
+    path = Path(directory) if directory else cache_dir("scrape")
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ScrapeCache(path, max_bytes=max_bytes)
+        return _caches[path]
+
+
+# ========================================
+# CACHED SCRAPE TOOL
+# ========================================
+
+
+class CachedScrapeWebsiteTool(ScrapeWebsiteTool):
+    """
+    Drop-in ScrapeWebsiteTool that serves job postings from the scrape cache.
+
+    The tool keeps the name, description and argument schema of
+    ScrapeWebsiteTool, so agents use it exactly like the original. Fresh cache
+    hits return the cleaned text without network I/O; stale entries are
+    revalidated with If-None-Match / If-Modified-Since when possible.
+
+    Attributes:
+        ttl_seconds (int): Age below which cached pages are served directly
+        cache_dir (str, optional): Cache directory (default .cache/scrape)
+        max_cache_bytes (int): Total size cap of the cache
+        extract_posting (bool): Return only the job posting of the page
+            instead of the text of the whole page
+    """
+
+    ttl_seconds: int = DEFAULT_SCRAPE_TTL_SECONDS
+    cache_dir: Optional[str] = None
+    max_cache_bytes: int = DEFAULT_SCRAPE_CACHE_MAX_BYTES
+    extract_posting: bool = True
+
+    _cache: ScrapeCache = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._cache = get_scrape_cache(self.cache_dir, self.max_cache_bytes)
+
+    @property
+    def cache(self) -> ScrapeCache:
+        """The ScrapeCache used by this tool."""
+        return self._cache
+
+    def _serves(self, entry: ScrapeCacheEntry) -> bool:
+        """Whether an entry holds text this tool may return while fresh."""
+        return self.extract_posting or entry.method in (None, "full-page")
+
+    def _revalidates(self, entry: ScrapeCacheEntry) -> bool:
+        """Whether an entry was stored the way this tool extracts pages."""
+        if self.extract_posting:
+            return entry.method is not None
+        return entry.method in (None, "full-page")
+
+    def _load(self, website_url: str) -> Tuple[Optional[ScrapeCacheEntry], str]:
+        """
+        Return the page's fresh entry and its text, or None and an error page.
+
+        Eviction (by another thread or process) can delete the content file
+        between the lookup and the read; the page is then fetched again.
+        """
+        for _ in range(2):
+            entry, text = self._fetch(website_url)
+            if entry is None:
+                return None, text
+            try:
+                return entry, self._cache.read(entry)
+            except FileNotFoundError:
+                continue
+        raise FileNotFoundError(f"Cached text of {website_url} was evicted twice")
+
+    def posting_fields(self, website_url: str) -> Dict[str, Any]:
+        """
+        Return the JobRequirements fields stated by a page's JobPosting.
+
+        The page is fetched (or served from the cache) like a tool call, so
+        the agent reading it afterwards gets a cache hit.
+
+        Args:
+            website_url (str): URL of the job posting
+
+        Returns:
+            Dict[str, Any]: Known fields, empty if the page has no JobPosting
+                or could not be fetched
+        """
+        entry, _ = self._load(website_url)
+        return dict(entry.fields) if entry is not None else {}
+
+    def _run(self, **kwargs: Any) -> Any:
+        entry, text = self._load(kwargs.get("website_url", self.website_url))
+        if entry is not None:
+            self._cache.record_served(entry)
+        return text
+
+    def _fetch(self, website_url: str) -> Tuple[Optional[ScrapeCacheEntry], str]:
+        """Return the page's fresh entry, or None and the text of an error page."""
+        entry = self._cache.get(website_url)
+        if entry is not None and not self._serves(entry):
+            entry = None
+
+        if entry is not None and time.time() - entry.fetched_at < self.ttl_seconds:
+            self._cache.count("hits")
+            return entry, ""
+
+        # Entries stored without extraction are fetched again in full
+        if entry is not None and not self._revalidates(entry):
+            entry = None
+        headers = dict(self.headers or {})
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        page = requests.get(
+            website_url,
+            timeout=15,
+            headers=headers,
+            cookies=self.cookies if self.cookies else {},
+        )
+
+        if entry is not None and page.status_code == 304:
+            self._cache.count("revalidated")
+            self._cache.refresh(website_url, entry)
+            return entry, ""
+
+        self._cache.count("misses")
+        page.encoding = page.apparent_encoding
+        if not page.ok:
+            return None, clean_html(page.text)
+        extraction = extract_job_posting(page.text) if self.extract_posting else None
+        entry = self._cache.put(
+            website_url,
+            extraction.text if extraction else clean_html(page.text),
+            etag=page.headers.get("ETag"),
+            last_modified=page.headers.get("Last-Modified"),
+            extraction=extraction,
+        )
+        return entry, ""
@@ -0,0 +1,372 @@
+"""
+Jobfull Resume Analyzer - Cached Serper Search Tool
+
+This module provides a persistent SQLite cache for Serper search results and a
+drop-in replacement for crewai_tools' SerperDevTool that uses it. The company
+researcher issues many near-identical queries ("NVIDIA culture", "NVIDIA recent
+news", ...) for every run about the same employer; with the cache, those
+results are reused across runs until they go stale.
+
+Cache Keys:
+    Results are keyed on (company, normalized query), where the normalized
+    query ignores case, punctuation, extra whitespace and common stop words
+    (but keeps the word order), and includes the search type and result
+    parameters.
+
+Freshness Windows:
+    Each query is classified into a category with its own freshness window:
+        - news:    ~1 day   (recent news, press releases, earnings, funding)
+        - culture: ~30 days (culture, values, benefits, reviews, mission)
+        - general: ~7 days  (everything else, e.g. products or competitors)
+    Windows are configurable globally and per company.
+
+Request Coalescing:
+    Concurrent searches for the same key within one process (e.g. batch runs
+    for the same company) share a single in-flight Serper request.
+
+Example:
+    from cv_opt.tools import CachedSerperDevTool
+
+    tool = CachedSerperDevTool(company_name="NVIDIA")
+    results = tool.run(search_query="NVIDIA company culture")
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from crewai_tools import SerperDevTool
+from pydantic import PrivateAttr
+
+from ..cache import cache_dir, stable_hash
+
+# Default freshness window per query category, in seconds
+DEFAULT_FRESHNESS_WINDOWS: Dict[str, int] = {
+    "news": 24 * 3600,
+    "culture": 30 * 24 * 3600,
+    "general": 7 * 24 * 3600,
+}
+
+# Keywords that assign a query to a freshness category (checked in order)
+CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "news": (
+        "news",
+        "latest",
+        "recent",
+        "announcement",
+        "announces",
+        "press",
+        "earnings",
+        "funding",
+        "layoffs",
+        "acquisition",
+        "today",
+    ),
+    "culture": (
+        "culture",
+        "values",
+        "mission",
+        "benefits",
+        "reviews",
+        "glassdoor",
+        "employee",
+        "employees",
+        "diversity",
+        "inclusion",
+        "workplace",
+        "interview",
+    ),
+}
+
+# Words ignored when normalizing queries
+_STOP_WORDS = {"a", "an", "the", "of", "for", "in", "at", "on", "and", "to", "about"}
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query so near-identical queries share a cache entry.
+
+    Args:
+        query (str): Search query as issued by the agent
+
+    Returns:
+        str: Lowercased, punctuation-free, stop-word-free tokens in their
+            original order
+
+    Example:
+        normalize_query("The culture of  NVIDIA!")  # "culture nvidia"
+    """
+    tokens = re.sub(r"[^a-z0-9]+", " ", query.lower()).split()
+    return " ".join(token for token in tokens if token not in _STOP_WORDS)
+
+
+def classify_query(query: str, search_type: str = "search") -> str:
+    """
+    Return the freshness category of a query.
+
+    Args:
+        query (str): Search query
+        search_type (str): Serper search type; "news" searches are always news
+
+    Returns:
+        str: "news", "culture" or "general"
+    """
+    if search_type == "news":
+        return "news"
+    tokens = set(normalize_query(query).split())
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if tokens.intersection(keywords):
+            return category
+    return "general"
+
+
+# ========================================
+# SEARCH CACHE
+# ========================================
+
+
+class SearchCache:
+    """
+    SQLite-backed cache of Serper results with in-flight request coalescing.
+
+    Each operation opens its own connection, so one SearchCache can be shared
+    by tools running in different threads. Use get_search_cache() to obtain
+    the shared instance for a database path.
+
+    Attributes:
+        path (Path): SQLite database file
+        stats (Dict[str, int]): Counters for hits, misses and coalesced calls
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "coalesced": 0}
+        self._in_flight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS search_results (
+                    company TEXT NOT NULL,
+                    query_key TEXT NOT NULL,
+                    query TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (company, query_key)
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def lookup(
+        self, company: str, query_key: str, max_age: float
+    ) -> Optional[Dict[str, Any]]:
+        """Return cached results younger than `max_age` seconds, if any."""
+        with closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT results, fetched_at FROM search_results "
+                "WHERE company = ? AND query_key = ?",
+                (company, query_key),
+            ).fetchone()
+        if row is None or time.time() - row[1] >= max_age:
+            return None
+        return json.loads(row[0])
+
+    def store(
+        self,
+        company: str,
+        query_key: str,
+        query: str,
+        category: str,
+        results: Dict[str, Any],
+    ) -> None:
+        """Insert or replace the results for a key."""
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO search_results "
+                "(company, query_key, query, category, results, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (company, query_key, query, category, json.dumps(results), time.time()),
+            )
+
+    def invalidate(self, company: str) -> int:
+        """Delete all cached results for a company; returns the row count."""
+        with closing(self._connect()) as connection, connection:
+            cursor = connection.execute(
+                "DELETE FROM search_results WHERE company = ?", (company,)
+            )
+        return cursor.rowcount
+
+    def count(self, name: str) -> None:
+        """Increment one of the stats counters."""
+        with self._lock:
+            self.stats[name] += 1
+
+    def get_or_fetch(
+        self,
+        company: str,
+        query_key: str,
+        query: str,
+        category: str,
+        max_age: float,
+        fetch: Any,
+    ) -> Dict[str, Any]:
+        """
+        Return fresh cached results or fetch them once for all waiting callers.
+
+        Args:
+            company (str): Normalized company name
+            query_key (str): Key of the normalized query and search parameters
+            query (str): Original query text (stored for inspection)
+            category (str): Freshness category of the query
+            max_age (float): Freshness window in seconds
+            fetch (Callable[[], Dict[str, Any]]): Performs the Serper request
+
+        Returns:
+            Dict[str, Any]: Formatted Serper results
+        """
+        cached = self.lookup(company, query_key, max_age)
+        if cached is not None:
+            self.count("hits")
+            return cached
+
+        key = (company, query_key)
+        with self._lock:
+            in_flight = self._in_flight.get(key)
+            owner = in_flight is None
+            if owner:
+                in_flight = self._in_flight[key] = Future()
+
+        if not owner:
+            self.count("coalesced")
+            return in_flight.result()
+
+        try:
+            # A previous owner may have stored the results after our lookup
+            results = self.lookup(company, query_key, max_age)
+            if results is not None:
+                self.count("hits")
+                in_flight.set_result(results)
+                return results
+            self.count("misses")
+            results = fetch()
+            self.store(company, query_key, query, category, results)
+            in_flight.set_result(results)
+            return results
+        except BaseException as e:
+            in_flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+
+_caches: Dict[Path, SearchCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_search_cache(path: Optional[str] = None) -> SearchCache:
+    """
+    Return the process-wide SearchCache for a database path.
+
+    Args:
+        path (str, optional): SQLite file; defaults to .cache/serper/search.db
+
+    Returns:
+        SearchCache: Shared cache instance
+    """
+    db_path = Path(path) if path else cache_dir("serper") / "search.db"
+    with _caches_lock:
+        if db_path not in _caches:
+            _caches[db_path] = SearchCache(db_path)
+        return _caches[db_path]
+
+
+# ========================================
+# CACHED SERPER TOOL
+# ========================================
+
+
+class CachedSerperDevTool(SerperDevTool):
+    """
+    Drop-in SerperDevTool that serves repeated searches from the SQLite cache.
+
+    The tool keeps SerperDevTool's name, description and argument schema.
+    Results are partitioned by company (set per run through `company_name`)
+    and expire according to the freshness window of the query's category.
+
+    Attributes:
+        company_name (str, optional): Company the current run researches
+        cache_path (str, optional): SQLite file (default .cache/serper/search.db)
+        freshness_windows (Dict[str, int]): Seconds per category
+        company_freshness (Dict[str, Dict[str, int]]): Per-company overrides
+            of the freshness windows, keyed by lowercased company name
+
+    Example:
+        tool = CachedSerperDevTool(
+            company_freshness={"nvidia": {"news": 6 * 3600}}
+        )
+        tool.company_name = "NVIDIA"
+    """
+
+    company_name: Optional[str] = None
+    cache_path: Optional[str] = None
+    freshness_windows: Dict[str, int] = dict(DEFAULT_FRESHNESS_WINDOWS)
+    company_freshness: Dict[str, Dict[str, int]] = {}
+
+    _cache: SearchCache = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._cache = get_search_cache(self.cache_path)
+
+    @property
+    def cache(self) -> SearchCache:
+        """The SearchCache used by this tool."""
+        return self._cache
+
+    def freshness_window(self, company: str, category: str) -> int:
+        """Return the freshness window in seconds for a company and category."""
+        overrides = self.company_freshness.get(company, {})
+        return overrides.get(category, self.freshness_windows.get(category, 0))
+
+    def query_key(self, search_query: str, search_type: str) -> str:
+        """Return the cache key of a query and this tool's search parameters."""
+        return stable_hash(
+            {
+                "query": normalize_query(search_query),
+                "type": search_type,
+                "n_results": self.n_results,
+                "country": self.country,
+                "location": self.location,
+                "locale": self.locale,
+            }
+        )
+
+    def _run(self, **kwargs: Any) -> Any:
+        search_query = kwargs.get("search_query") or kwargs.get("query")
+        search_type = kwargs.get("search_type", self.search_type)
+        company = (self.company_name or "").strip().lower()
+        category = classify_query(search_query, search_type)
+        return self._cache.get_or_fetch(
+            company,
+            self.query_key(search_query, search_type),
+            search_query,
+            category,
+            self.freshness_window(company, category),
+            lambda: super(CachedSerperDevTool, self)._run(**kwargs),
+        )
@@ -0,0 +1,671 @@
+"""
+Jobfull Resume Analyzer - Run Tracing Module
+
+This module instruments ResumeCrew runs. A RunTracer listens to CrewAI's event
+bus while a crew executes and records, for every task and every tool call,
+where the time, tokens and money went:
+
+    - wall time and queue time (time between the task becoming ready, i.e.
+      all of its context tasks finishing, and the task actually starting)
+    - number and total duration of LLM calls
+    - prompt/completion tokens and the estimated cost of the task
+    - retries (failed LLM calls and guardrail retries)
+    - tool calls with their duration, cache hits and errors
+
+Outputs:
+    output/run_trace.json           # RunTrace: structured per-task metrics
+    output/run_trace.trace.json     # Chrome trace event format
+
+    The second file opens in chrome://tracing or https://ui.perfetto.dev and
+    shows one lane per task, with queue time, LLM calls and tool calls as
+    nested slices, so the critical path of a run is visible at a glance.
+
+Token Accounting:
+    Token counts come from the usage metrics reported by the LLM provider
+    (CrewAI's per-agent token counter). LLMs that report no usage, such as
+    custom or stub LLMs, fall back to an estimate of four characters per token.
+    Costs use MODEL_PRICING and are 0.0 for unknown models. Both reported and
+    estimated tokens are priced per call at the model that answered it, so
+    calls escalated to a stronger model (cv_opt.routing) are charged at its
+    price; reported usage that cannot be attributed to a call is priced at
+    the task's routed model. Calls answered from the LLM response cache
+    (cv_opt.llm_cache) are counted as cache hits and cost no tokens.
+
+Example:
+    from cv_opt.tracing import RunTracer
+
+    crew_instance = ResumeCrew()
+    with RunTracer(crew_instance.workflow_tasks()) as tracer:
+        crew_instance.crew().kickoff(inputs=inputs)
+    print(tracer.trace.summary())
+
+Author: Jobfull Team
+Version: 1.0.0
+"""
+
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from crewai import Task
+from crewai.utilities.events import (
+    LLMCallCompletedEvent,
+    LLMCallFailedEvent,
+    LLMCallStartedEvent,
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    TaskStartedEvent,
+    ToolUsageErrorEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageStartedEvent,
+    crewai_event_bus,
+)
+from pydantic import BaseModel, Field
+
+from .cache import atomic_write_text
+from .routing import routed_model
+from .scheduler import build_task_graph, critical_path
+
+# USD price per million (prompt, completion) tokens
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1": (2.00, 8.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1-nano": (0.10, 0.40),
+}
+
+# Characters per token used when the LLM reports no usage
+CHARS_PER_TOKEN = 4
+
+# Default base name of the trace files written to the output directory
+DEFAULT_TRACE_NAME = "run_trace"
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """
+    Estimate the cost of an amount of tokens for a model.
+
+    Args:
+        model (str): Model name, with or without a provider prefix
+            (e.g. "gpt-4o-mini" or "openai/gpt-4o-mini")
+        prompt_tokens (int): Prompt tokens
+        completion_tokens (int): Completion tokens
+
+    Returns:
+        float: Estimated cost in USD, 0.0 for models without pricing
+    """
+    prompt_price, completion_price = MODEL_PRICING.get(
+        model.split("/")[-1], (0.0, 0.0)
+    )
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1e6
+
+
+def _message_chars(messages: Any) -> int:
+    """Number of characters in an LLM prompt (string or chat messages)."""
+    if isinstance(messages, str):
+        return len(messages)
+    return sum(len(str(message.get("content") or "")) for message in messages)
+
+
+# ========================================
+# TRACE MODELS
+# ========================================
+
+
+class ToolCallTrace(BaseModel):
+    """
+    A single tool call made during a task.
+
+    Attributes:
+        tool (str): Tool name
+        started_at (float): Start offset in seconds from the run start
+        duration (float): Call duration in seconds
+        from_cache (bool): Whether CrewAI served the result from its tool cache
+        error (str, optional): Error message if the call failed
+    """
+
+    tool: str = Field(description="Tool name")
+    started_at: float = Field(description="Start offset from run start (seconds)")
+    duration: float = Field(description="Call duration (seconds)")
+    from_cache: bool = Field(description="Served from the tool cache", default=False)
+    error: Optional[str] = Field(description="Error message if failed", default=None)
+
+
+class TaskTrace(BaseModel):
+    """
+    Latency, token and cost metrics of one task.
+
+    Attributes:
+        task (str): Task name from tasks.yaml
+        agent (str): Role of the agent that executed the task
+        model (str): Model routed to the task
+        status (str): "pending", "running", "succeeded" or "failed"
+        ready_at (float): Offset at which all context tasks had finished
+        started_at (float): Start offset in seconds from the run start
+        finished_at (float): Finish offset in seconds from the run start
+        queue_time (float): Seconds between becoming ready and starting
+        wall_time (float): Task execution time in seconds
+        llm_calls (int): Number of completed LLM calls
+        llm_cache_hits (int): LLM calls answered from the LLM response cache
+        escalated_calls (int): LLM calls answered by a model other than the
+            task's routed model, i.e. escalations after failed validation
+        llm_time (float): Total time spent waiting on the LLM in seconds
+        prompt_tokens (int): Prompt tokens
+        completion_tokens (int): Completion tokens
+        token_source (str): "usage" (reported by the provider) or "estimate"
+        retries (int): Failed LLM calls plus guardrail retries
+        cost_usd (float): Estimated cost in USD
+        tool_calls (List[ToolCallTrace]): Tool calls in call order
+        error (str, optional): Error message if the task failed
+    """
+
+    task: str = Field(description="Task name from tasks.yaml")
+    agent: str = Field(description="Role of the executing agent", default="")
+    model: str = Field(description="Model routed to the task", default="")
+    status: str = Field(description="pending, running, succeeded or failed")
+    ready_at: float = Field(description="Ready offset from run start", default=0.0)
+    started_at: float = Field(description="Start offset from run start", default=0.0)
+    finished_at: float = Field(description="Finish offset from run start", default=0.0)
+    queue_time: float = Field(description="Ready-to-start delay (seconds)", default=0.0)
+    wall_time: float = Field(description="Task execution time (seconds)", default=0.0)
+    llm_calls: int = Field(description="Completed LLM calls", default=0)
+    llm_cache_hits: int = Field(
+        description="LLM calls answered from the response cache", default=0
+    )
+    escalated_calls: int = Field(
+        description="LLM calls answered by an escalation model", default=0
+    )
+    llm_time: float = Field(description="Time waiting on the LLM", default=0.0)
+    prompt_tokens: int = Field(description="Prompt tokens", default=0)
+    completion_tokens: int = Field(description="Completion tokens", default=0)
+    token_source: str = Field(description="usage or estimate", default="usage")
+    retries: int = Field(description="Failed LLM calls and retries", default=0)
+    cost_usd: float = Field(description="Estimated cost (USD)", default=0.0)
+    tool_calls: List[ToolCallTrace] = Field(
+        description="Tool calls in call order", default_factory=list
+    )
+    error: Optional[str] = Field(description="Error message if failed", default=None)
+
+
+class RunTrace(BaseModel):
+    """
+    Metrics of a complete crew run.
+
+    Attributes:
+        started_at (str): ISO timestamp of the run start
+        wall_time (float): Observed end-to-end time in seconds
+        critical_path (List[str]): Longest duration-weighted dependency chain
+        critical_path_time (float): Total wall time of the critical path
+        llm_calls (int): LLM calls across all tasks
+        llm_cache_hits (int): LLM calls answered from the response cache
+        escalated_calls (int): LLM calls answered by an escalation model
+        prompt_tokens (int): Prompt tokens across all tasks
+        completion_tokens (int): Completion tokens across all tasks
+        cost_usd (float): Estimated cost of the run in USD
+        tasks (List[TaskTrace]): Per-task metrics in workflow order
+    """
+
+    started_at: str = Field(description="ISO timestamp of the run start")
+    wall_time: float = Field(description="End-to-end time (seconds)", default=0.0)
+    critical_path: List[str] = Field(
+        description="Longest duration-weighted dependency chain", default_factory=list
+    )
+    critical_path_time: float = Field(
+        description="Total wall time of the critical path (seconds)", default=0.0
+    )
+    llm_calls: int = Field(description="LLM calls across all tasks", default=0)
+    llm_cache_hits: int = Field(
+        description="LLM calls answered from the response cache", default=0
+    )
+    escalated_calls: int = Field(
+        description="LLM calls answered by an escalation model", default=0
+    )
+    prompt_tokens: int = Field(description="Prompt tokens", default=0)
+    completion_tokens: int = Field(description="Completion tokens", default=0)
+    cost_usd: float = Field(description="Estimated cost (USD)", default=0.0)
+    tasks: List[TaskTrace] = Field(
+        description="Per-task metrics in workflow order", default_factory=list
+    )
+
+    def summary(self) -> str:
+        """Return a one-line human readable summary of the run."""
+        slowest = max(self.tasks, key=lambda task: task.wall_time, default=None)
+        notes = [
+            f"{count} {label}"
+            for count, label in (
+                (self.llm_cache_hits, "cached"),
+                (self.escalated_calls, "escalated"),
+            )
+            if count
+        ]
+        calls = f"{self.llm_calls} LLM calls" + (
+            f" ({', '.join(notes)})" if notes else ""
+        )
+        return (
+            f"wall {self.wall_time:.1f}s, {calls}, "
+            f"{self.prompt_tokens + self.completion_tokens} tokens "
+            f"(${self.cost_usd:.4f}); slowest task: "
+            + (f"{slowest.task} {slowest.wall_time:.1f}s" if slowest else "-")
+        )
+
+
+# ========================================
+# RUN TRACER
+# ========================================
+
+# Tracers currently receiving events
+_active_tracers: List["RunTracer"] = []
+_tracer_handlers_registered = False
+_tracer_registration_lock = threading.Lock()
+
+_TRACED_EVENTS = (
+    TaskStartedEvent,
+    TaskCompletedEvent,
+    TaskFailedEvent,
+    LLMCallStartedEvent,
+    LLMCallCompletedEvent,
+    LLMCallFailedEvent,
+    ToolUsageStartedEvent,
+    ToolUsageFinishedEvent,
+    ToolUsageErrorEvent,
+)
+
+
+def _dispatch_trace_event(source: Any, event: Any) -> None:
+    """Event handler forwarding CrewAI events to all active tracers."""
+    for tracer in list(_active_tracers):
+        tracer.handle(source, event)
+
+
+def _register_trace_handlers() -> None:
+    """Register the tracing handler on the CrewAI event bus once."""
+    global _tracer_handlers_registered
+    with _tracer_registration_lock:
+        if not _tracer_handlers_registered:
+            for event_type in _TRACED_EVENTS:
+                crewai_event_bus.register_handler(event_type, _dispatch_trace_event)
+            _tracer_handlers_registered = True
+
+
+class RunTracer:
+    """
+    Record per-task latency, token and cost metrics of a crew run.
+
+    Works for sequential crews, the parallel scheduler and concurrent batch
+    jobs alike: every tracer only records events of its own tasks. Events are
+    handled synchronously in the thread that emits them, so LLM and tool
+    calls are attributed to the task running in the same thread.
+
+    Attributes:
+        tasks (List[Task]): Traced tasks in workflow order
+        output_dir (str): Directory the trace files are written to
+        trace_name (str): Base name of the trace files
+        trace (RunTrace): Metrics collected so far
+
+    Example:
+        with RunTracer(crew_instance.workflow_tasks(), output_dir="output"):
+            crew_instance.kickoff_parallel(inputs)
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[Task],
+        output_dir: str = "output",
+        trace_name: str = DEFAULT_TRACE_NAME,
+    ) -> None:
+        self.tasks = list(tasks)
+        self.output_dir = output_dir
+        self.trace_name = trace_name
+        self._graph = build_task_graph(self.tasks)
+        self._task_names = {str(task.id): task.name for task in self.tasks}
+        self._tasks_by_name = {task.name: task for task in self.tasks}
+        self._lock = threading.Lock()
+        self._run_start = time.perf_counter()
+        self._thread_tasks: Dict[int, str] = {}
+        self._llm_calls: Dict[int, Tuple[str, float, int, str, Any]] = {}
+        self._tool_calls: Dict[int, Tuple[str, str, float]] = {}
+        self._usage_start: Dict[str, Any] = {}
+        self._estimated_chars: Dict[str, List[int]] = {}
+        self._estimated_cost: Dict[str, float] = {}
+        # Reported (prompt, completion) tokens and their cost per task, summed
+        # over the LLM calls they could be attributed to
+        self._usage_cost: Dict[str, Tuple[int, int, float]] = {}
+        self._spans: List[Tuple[str, str, str, float, float, Dict[str, Any]]] = []
+        self.trace = self._new_trace()
+
+    def _new_trace(self) -> RunTrace:
+        return RunTrace(
+            started_at=datetime.now().isoformat(timespec="seconds"),
+            tasks=[
+                TaskTrace(
+                    task=task.name,
+                    agent=task.agent.role if task.agent else "",
+                    model=routed_model(getattr(task.agent, "llm", None), task.name),
+                    status="pending",
+                )
+                for task in self.tasks
+            ],
+        )
+
+    def __enter__(self) -> "RunTracer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+        self.write()
+
+    # ----------------------------------------
+    # Lifecycle
+    # ----------------------------------------
+
+    def start(self) -> None:
+        """Reset the trace and start receiving events."""
+        _register_trace_handlers()
+        with self._lock:
+            self._run_start = time.perf_counter()
+            self._spans = []
+            self.trace = self._new_trace()
+        _active_tracers.append(self)
+
+    def stop(self) -> RunTrace:
+        """
+        Stop receiving events and compute the run totals.
+
+        Returns:
+            RunTrace: The completed trace
+        """
+        if self in _active_tracers:
+            _active_tracers.remove(self)
+        with self._lock:
+            trace = self.trace
+            trace.wall_time = self._now()
+            executed = [task for task in trace.tasks if task.status != "pending"]
+            durations = {task.task: task.wall_time for task in executed}
+            trace.critical_path = critical_path(self._graph, durations)
+            trace.critical_path_time = sum(
+                durations.get(name, 0.0) for name in trace.critical_path
+            )
+            trace.llm_calls = sum(task.llm_calls for task in executed)
+            trace.llm_cache_hits = sum(task.llm_cache_hits for task in executed)
+            trace.escalated_calls = sum(task.escalated_calls for task in executed)
+            trace.prompt_tokens = sum(task.prompt_tokens for task in executed)
+            trace.completion_tokens = sum(task.completion_tokens for task in executed)
+            trace.cost_usd = sum(task.cost_usd for task in executed)
+        return trace
+
+    def write(self, output_dir: Optional[str] = None) -> Tuple[Path, Path]:
+        """
+        Write the structured trace and the Chrome trace file.
+
+        Args:
+            output_dir (str, optional): Target directory, defaults to
+                `self.output_dir`
+
+        Returns:
+            Tuple[Path, Path]: Paths of run_trace.json and the Chrome trace
+        """
+        directory = Path(output_dir or self.output_dir)
+        trace_path = directory / f"{self.trace_name}.json"
+        chrome_path = directory / f"{self.trace_name}.trace.json"
+        atomic_write_text(trace_path, self.trace.model_dump_json(indent=2))
+        atomic_write_text(chrome_path, json.dumps(self.chrome_trace()))
+        return trace_path, chrome_path
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Return the run in Chrome trace event format.
+
+        Every task gets its own lane (thread). Queue time, the task itself,
+        LLM calls and tool calls are complete ("X") events in microseconds.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable trace with a `traceEvents` list
+        """
+        lanes = {task.name: index for index, task in enumerate(self.tasks, start=1)}
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": "ResumeCrew"},
+            }
+        ]
+        for name, lane in lanes.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": lane,
+                    "args": {"name": name},
+                }
+            )
+        with self._lock:
+            spans = list(self._spans)
+        for task_name, category, name, start, end, args in spans:
+            events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": lanes[task_name],
+                    "ts": round(start * 1e6),
+                    "dur": round(max(end - start, 0.0) * 1e6),
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    # ----------------------------------------
+    # Event handling
+    # ----------------------------------------
+
+    def _now(self) -> float:
+        return time.perf_counter() - self._run_start
+
+    def _task_trace(self, name: str) -> TaskTrace:
+        return next(task for task in self.trace.tasks if task.task == name)
+
+    def _task_of(self, task: Any) -> Optional[str]:
+        """Name of a traced task, or None for tasks of other crews."""
+        return self._task_names.get(str(task.id)) if task is not None else None
+
+    def handle(self, source: Any, event: Any) -> None:
+        """
+        Record one CrewAI event if it belongs to a traced task.
+
+        Args:
+            source (Any): Object that emitted the event
+            event (Any): One of the traced CrewAI events
+        """
+        thread = threading.get_ident()
+        with self._lock:
+            if isinstance(event, TaskStartedEvent):
+                self._on_task_started(self._task_of(event.task), event.task, thread)
+            elif isinstance(event, (TaskCompletedEvent, TaskFailedEvent)):
+                self._on_task_finished(self._task_of(event.task), event, thread)
+            elif isinstance(event, LLMCallStartedEvent):
+                name = self._task_names.get(str(event.task_id or ""))
+                name = name or self._thread_tasks.get(thread)
+                if name:
+                    prompt_chars = _message_chars(event.messages)
+                    model = str(getattr(source, "model", ""))
+                    usage = self._token_usage(self._tasks_by_name[name])
+                    self._llm_calls[thread] = (
+                        name,
+                        self._now(),
+                        prompt_chars,
+                        model,
+                        usage,
+                    )
+            elif isinstance(event, (LLMCallCompletedEvent, LLMCallFailedEvent)):
+                self._on_llm_finished(event, thread)
+            elif isinstance(event, ToolUsageStartedEvent):
+                name = self._task_of(getattr(source, "task", None))
+                name = name or self._thread_tasks.get(thread)
+                if name:
+                    self._tool_calls[thread] = (name, event.tool_name, self._now())
+            elif isinstance(event, (ToolUsageFinishedEvent, ToolUsageErrorEvent)):
+                self._on_tool_finished(event, thread)
+
+    def _on_task_started(self, name: Optional[str], task: Task, thread: int) -> None:
+        if name is None:
+            return
+        trace = self._task_trace(name)
+        now = self._now()
+        upstream = [self._task_trace(dep).finished_at for dep in self._graph[name]]
+        trace.status = "running"
+        trace.ready_at = max(upstream, default=0.0)
+        trace.started_at = now
+        trace.queue_time = max(now - trace.ready_at, 0.0)
+        self._thread_tasks[thread] = name
+        self._usage_start[name] = self._token_usage(task)
+        self._estimated_chars[name] = [0, 0]
+        self._estimated_cost[name] = 0.0
+        self._usage_cost[name] = (0, 0, 0.0)
+
+    def _on_task_finished(self, name: Optional[str], event: Any, thread: int) -> None:
+        if name is None:
+            return
+        trace = self._task_trace(name)
+        trace.finished_at = self._now()
+        trace.wall_time = trace.finished_at - trace.started_at
+        trace.retries += event.task.retry_count
+        if isinstance(event, TaskFailedEvent):
+            trace.status = "failed"
+            trace.error = event.error
+        else:
+            trace.status = "succeeded"
+        self._thread_tasks.pop(thread, None)
+
+        start = self._usage_start.pop(name, None)
+        end = self._token_usage(event.task)
+        if start is not None and end.successful_requests > start.successful_requests:
+            trace.prompt_tokens = end.prompt_tokens - start.prompt_tokens
+            trace.completion_tokens = end.completion_tokens - start.completion_tokens
+            trace.token_source = "usage"
+            priced_prompt, priced_completion, cost = self._usage_cost.get(
+                name, (0, 0, 0.0)
+            )
+            trace.cost_usd = cost + estimate_cost(
+                trace.model,
+                max(trace.prompt_tokens - priced_prompt, 0),
+                max(trace.completion_tokens - priced_completion, 0),
+            )
+        else:
+            prompt_chars, completion_chars = self._estimated_chars.get(name, (0, 0))
+            trace.prompt_tokens = prompt_chars // CHARS_PER_TOKEN
+            trace.completion_tokens = completion_chars // CHARS_PER_TOKEN
+            trace.token_source = "estimate"
+            trace.cost_usd = self._estimated_cost.get(name, 0.0)
+        self._spans.append(
+            (name, "queue", "queued", trace.ready_at, trace.started_at, {})
+        )
+        self._spans.append(
+            (
+                name,
+                "task",
+                name,
+                trace.started_at,
+                trace.finished_at,
+                {
+                    "agent": trace.agent,
+                    "status": trace.status,
+                    "llm_calls": trace.llm_calls,
+                    "prompt_tokens": trace.prompt_tokens,
+                    "completion_tokens": trace.completion_tokens,
+                    "cost_usd": trace.cost_usd,
+                },
+            )
+        )
+
+    def _on_llm_finished(self, event: Any, thread: int) -> None:
+        call = self._llm_calls.pop(thread, None)
+        if call is None:
+            return
+        name, started, prompt_chars, model, usage_start = call
+        trace = self._task_trace(name)
+        finished = self._now()
+        if isinstance(event, LLMCallFailedEvent):
+            trace.retries += 1
+            args = {"error": event.error}
+        else:
+            trace.llm_calls += 1
+            trace.llm_time += finished - started
+            args = {"prompt_chars": prompt_chars}
+            if model and trace.model and model != trace.model:
+                trace.escalated_calls += 1
+                args["model"] = model
+            if getattr(event, "from_cache", False):
+                # Cached completions cost no tokens
+                trace.llm_cache_hits += 1
+                args["from_cache"] = True
+            else:
+                completion_chars = len(str(event.response or ""))
+                chars = self._estimated_chars.setdefault(name, [0, 0])
+                chars[0] += prompt_chars
+                chars[1] += completion_chars
+                self._estimated_cost[name] = self._estimated_cost.get(
+                    name, 0.0
+                ) + estimate_cost(
+                    model or trace.model,
+                    prompt_chars // CHARS_PER_TOKEN,
+                    completion_chars // CHARS_PER_TOKEN,
+                )
+                self._price_usage(name, model or trace.model, usage_start)
+        self._spans.append((name, "llm", "llm_call", started, finished, args))
+
+    def _price_usage(self, name: str, model: str, usage_start: Any) -> None:
+        """Price the usage reported since an LLM call started at its model."""
+        usage = self._token_usage(self._tasks_by_name[name])
+        if usage.successful_requests <= usage_start.successful_requests:
+            return
+        prompt_tokens = usage.prompt_tokens - usage_start.prompt_tokens
+        completion_tokens = usage.completion_tokens - usage_start.completion_tokens
+        priced_prompt, priced_completion, cost = self._usage_cost.get(
+            name, (0, 0, 0.0)
+        )
+        self._usage_cost[name] = (
+            priced_prompt + prompt_tokens,
+            priced_completion + completion_tokens,
+            cost + estimate_cost(model, prompt_tokens, completion_tokens),
+        )
+
+    def _on_tool_finished(self, event: Any, thread: int) -> None:
+        call = self._tool_calls.pop(thread, None)
+        if call is None:
+            return
+        name, tool, started = call
+        finished = self._now()
+        error = str(event.error) if isinstance(event, ToolUsageErrorEvent) else None
+        from_cache = bool(getattr(event, "from_cache", False))
+        self._task_trace(name).tool_calls.append(
+            ToolCallTrace(
+                tool=tool,
+                started_at=started,
+                duration=finished - started,
+                from_cache=from_cache,
+                error=error,
+            )
+        )
+        self._spans.append(
+            (
+                name,
+                "tool",
+                tool,
+                started,
+                finished,
+                {"from_cache": from_cache, "error": error},
+            )
+        )
+
+    @staticmethod
+    def _token_usage(task: Task) -> Any:
+        """Cumulative UsageMetrics of the agent executing a task."""
+        return task.agent._token_process.get_summary()
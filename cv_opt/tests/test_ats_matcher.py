@@ -0,0 +1,68 @@
+"""Tests for the deterministic keyword matching of cv_opt.ats_matcher."""
+
+import pytest
+
+from cv_opt.ats_matcher import match_keywords
+from cv_opt.models import ATSKeyword
+
+
+def _keyword(keyword, category="technical", importance=5, required=True):
+    return ATSKeyword(
+        keyword=keyword,
+        importance=importance,
+        category=category,
+        required=required,
+        frequency=1,
+    )
+
+
+def _match(keyword, text, category="technical"):
+    return match_keywords([_keyword(keyword, category)], text)
+
+
+def test_exact_stemmed_and_synonym_matches():
+    result = match_keywords(
+        [_keyword("Python"), _keyword("Kubernetes"), _keyword("deploying")],
+        "Python services deployed on k8s. Wrote Python tooling.",
+    )
+    python, kubernetes, deploying = result.matches
+
+    assert (python.exact, python.stemmed, python.synonym) == (2, 0, 0)
+    assert (kubernetes.exact, kubernetes.synonym, kubernetes.credit) == (0, 1, 0.75)
+    assert (deploying.exact, deploying.stemmed, deploying.credit) == (0, 1, 0.9)
+
+
+def test_synonyms_stemming_alike_count_once():
+    match = _match("Large Language Models", "Built an LLM evaluation harness.")
+
+    assert match.matches[0].synonym == 1
+    assert match.keyword_density["Large Language Models"] == pytest.approx(20.0)
+
+
+def test_nested_synonyms_count_once():
+    match = _match("GCP", "Migrated services to Google Cloud Platform.")
+
+    assert match.matches[0].synonym == 1
+
+
+@pytest.mark.parametrize(
+    "keyword, category, text",
+    [
+        ("Master", "education", "Expert in MS Office and Excel."),
+        ("Project Management", "soft", "Available until 5 PM on weekdays."),
+        ("Computer Vision", "technical", "Attached my CV for your review."),
+        ("Continuous Integration", "technical", "Worked with the CI team lead."),
+        ("Bachelor", "education", "Cut through the BS in status reports."),
+    ],
+)
+def test_ambiguous_short_aliases_do_not_match(keyword, category, text):
+    result = _match(keyword, text, category)
+
+    assert result.matches[0].credit == 0.0
+    assert result.match_score.overall_match == 0.0
+
+
+def test_dotted_degree_abbreviations_match():
+    result = _match("Master", "M.S. in Electrical Engineering", "education")
+
+    assert result.matches[0].credit == 0.75
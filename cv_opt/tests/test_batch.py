@@ -0,0 +1,49 @@
+"""Tests for the per-batch LLM rate limiting of cv_opt.batch."""
+
+from types import SimpleNamespace
+
+from cv_opt import batch
+from cv_opt.batch import RateLimiter, _throttle_llm_call
+
+
+def _event(task_id, from_cache=False):
+    return SimpleNamespace(task_id=task_id, from_cache=from_cache)
+
+
+def test_concurrent_batches_keep_their_own_limiters(monkeypatch):
+    first, second = RateLimiter(100), RateLimiter(100)
+    first.track([SimpleNamespace(id="task-a")])
+    second.track([SimpleNamespace(id="task-b")])
+    monkeypatch.setattr(batch, "_active_limiters", [first, second])
+
+    _throttle_llm_call(None, _event("task-a"))
+    _throttle_llm_call(None, _event("task-b"))
+    _throttle_llm_call(None, _event("task-b"))
+
+    assert len(first._calls) == 1
+    assert len(second._calls) == 2
+
+
+def test_finished_batch_does_not_lift_the_other_limit(monkeypatch):
+    first, second = RateLimiter(100), RateLimiter(100)
+    first.track([SimpleNamespace(id="task-a")])
+    second.track([SimpleNamespace(id="task-b")])
+    active = [first, second]
+    monkeypatch.setattr(batch, "_active_limiters", active)
+
+    active.remove(first)
+    _throttle_llm_call(None, _event("task-b"))
+
+    assert len(second._calls) == 1
+
+
+def test_cached_and_foreign_calls_are_not_limited(monkeypatch):
+    limiter = RateLimiter(100)
+    limiter.track([SimpleNamespace(id="task-a")])
+    monkeypatch.setattr(batch, "_active_limiters", [limiter])
+
+    _throttle_llm_call(None, _event("task-a", from_cache=True))
+    _throttle_llm_call(None, _event("task-z"))
+    _throttle_llm_call(None, _event(None))
+
+    assert not limiter._calls
@@ -0,0 +1,169 @@
+"""Tests for the resume parsing of cv_opt.candidate_profile."""
+
+import pytest
+
+from cv_opt.candidate_profile import (
+    extract_candidate_profile,
+    merge_wrapped_lines,
+    split_resume_sections,
+)
+
+# Single-line role headings in several orders, marked bullets, one column
+INLINE_RESUME = """Jane Doe
+Senior Data Analyst
+jane.doe@example.com | +1 (555) 123-4567 | linkedin.com/in/janedoe | Austin, TX
+Analyst with eight years of experience turning data into decisions.
+PROFESSIONAL EXPERIENCE
+Senior Data Analyst | Initech 01/2021 - Present Austin, TX
+- Built the revenue dashboard used by the
+  leadership team every week
+- Cut reporting time by 40%
+Globex, Data Analyst, Jun 2018 - Dec 2020
+- Automated the monthly churn report
+Data Analyst at Hooli, 2016 - 2018
+- Cleaned CRM data
+EDUCATION
+Master of Science in Statistics, University of Texas at Austin 2016
+Bachelor of Arts in Economics, Rice University 2014
+SKILLS
+SQL, Python, Tableau
+Statistics and A/B testing
+Page 1 of 1
+"""
+
+# Employer and title on their own lines, unmarked wrapped bullets, all-caps
+# name and a two-column education block
+STACKED_RESUME = """JOHN SMITH
+Backend Engineer
+john@smith.dev  github.com/jsmith
+Berlin, Germany
+Work Experience
+Acme Corp
+Staff Engineer
+Mar 2019 – Present
+Led the migration of the billing service to Go.
+Reduced p99 latency by half.
+Umbrella Labs
+Software Engineer
+Jan 2015 – Feb 2019
+Achievements:
+Designed the event pipeline processing millions of events
+per day.
+Education
+Master of Science Bachelor of Science
+The University of Edinburgh University of Leeds
+2014 2012
+PUBLICATIONS
+Streaming joins at scale, 2018
+"""
+
+
+def _roles(profile):
+    return [
+        (role.title, role.organization, role.start_date, role.end_date)
+        for role in profile.experience
+    ]
+
+
+def test_inline_layout_contact_and_summary():
+    profile = extract_candidate_profile(INLINE_RESUME)
+
+    contact = profile.contact
+    assert (contact.name, contact.headline) == ("Jane Doe", "Senior Data Analyst")
+    assert contact.email == "jane.doe@example.com"
+    assert contact.phone == "+1 (555) 123-4567"
+    assert contact.linkedin == "linkedin.com/in/janedoe"
+    assert contact.location == "Austin, TX"
+    assert profile.summary.startswith("Analyst with eight years")
+
+
+def test_inline_layout_roles_in_any_heading_order():
+    profile = extract_candidate_profile(INLINE_RESUME)
+
+    assert _roles(profile) == [
+        ("Senior Data Analyst", "Initech", "01/2021", "Present"),
+        ("Data Analyst", "Globex", "Jun 2018", "Dec 2020"),
+        ("Data Analyst", "Hooli", "2016", "2018"),
+    ]
+    assert profile.experience[0].location == "Austin, TX"
+    assert profile.experience[0].bullets == [
+        "Built the revenue dashboard used by the leadership team every week",
+        "Cut reporting time by 40%",
+    ]
+
+
+def test_inline_layout_education_and_skills():
+    profile = extract_candidate_profile(INLINE_RESUME)
+
+    assert [(e.degree, e.institution, e.dates) for e in profile.education] == [
+        ("Master of Science in Statistics", "University of Texas at Austin", "2016"),
+        ("Bachelor of Arts in Economics", "Rice University", "2014"),
+    ]
+    assert profile.skills == ["SQL, Python, Tableau", "Statistics and A/B testing"]
+
+
+def test_stacked_layout_roles_and_bullets():
+    profile = extract_candidate_profile(STACKED_RESUME)
+
+    assert _roles(profile) == [
+        ("Staff Engineer", "Acme Corp", "Mar 2019", "Present"),
+        ("Software Engineer", "Umbrella Labs", "Jan 2015", "Feb 2019"),
+    ]
+    assert profile.experience[0].bullets == [
+        "Led the migration of the billing service to Go.",
+        "Reduced p99 latency by half.",
+    ]
+    assert profile.experience[1].bullets == [
+        "Designed the event pipeline processing millions of events per day."
+    ]
+
+
+def test_stacked_layout_header_and_two_column_education():
+    profile = extract_candidate_profile(STACKED_RESUME)
+
+    assert profile.contact.name == "JOHN SMITH"
+    assert profile.contact.links == ["github.com/jsmith"]
+    assert profile.contact.location == "Berlin, Germany"
+    assert [(e.degree, e.institution, e.dates) for e in profile.education] == [
+        ("Master of Science", "The University of Edinburgh", "2014"),
+        ("Bachelor of Science", "University of Leeds", "2012"),
+    ]
+    assert profile.other_sections == {
+        "Publications": ["Streaming joins at scale, 2018"]
+    }
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "Data Analyst, Globex Inc., 2018 - 2020",
+        "Globex Inc., Data Analyst, 2018 - 2020",
+        "Globex Inc. | Data Analyst 2018 - 2020",
+        "Data Analyst - Globex Inc. 2018 - 2020",
+    ],
+)
+def test_title_and_employer_are_told_apart(line):
+    profile = extract_candidate_profile(f"Jane Doe\nExperience\n{line}\n")
+
+    assert _roles(profile) == [("Data Analyst", "Globex Inc.", "2018", "2020")]
+
+
+def test_experience_headings_above_dates_are_not_sections():
+    header, sections = split_resume_sections(
+        "Jane Doe\nEXPERIENCE\nGLOBEX CORP\n2018 - 2020\nTECHNICAL SKILLS\nSQL\n"
+    )
+
+    assert header == ["Jane Doe"]
+    assert sections == {"experience": ["GLOBEX CORP", "2018 - 2020"], "skills": ["SQL"]}
+
+
+def test_merge_wrapped_lines():
+    assert merge_wrapped_lines(["- one", "  continued", "- two"]) == [
+        "one continued",
+        "two",
+    ]
+    assert merge_wrapped_lines(["First item wraps", "here.", "Second."]) == [
+        "First item wraps here.",
+        "Second.",
+    ]
+    assert merge_wrapped_lines(["Python", "SQL"]) == ["Python", "SQL"]
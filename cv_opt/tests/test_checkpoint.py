@@ -0,0 +1,122 @@
+"""Tests for the run checkpoints and resuming of cv_opt.checkpoint."""
+
+import pytest
+from crewai import Agent, Task
+
+from cv_opt.benchmark import StubLLM
+from cv_opt.checkpoint import (
+    RunCheckpointer,
+    RunCheckpoints,
+    latest_incomplete_run,
+    resume_tasks,
+)
+from cv_opt.scheduler import ParallelScheduler
+
+INPUTS = {"topic": "resumes"}
+
+
+class _FailingLLM(StubLLM):
+    """Stub LLM failing every call of one task, like a provider outage."""
+
+    def __init__(self, failing_task: str) -> None:
+        super().__init__()
+        self.failing_task = failing_task
+
+    def call(self, messages, *args, from_task=None, **kwargs):
+        if from_task is not None and from_task.name == self.failing_task:
+            raise RuntimeError("rate limited")
+        return super().call(messages, *args, from_task=from_task, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _workdir(tmp_path, monkeypatch):
+    # CrewAI resolves output files relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def _workflow(llm, run_dir="runs/run-1"):
+    """Three chained tasks: research -> summary -> report."""
+    agent = Agent(
+        role="Analyst",
+        goal="Analyze {topic}",
+        backstory="An analyst.",
+        llm=llm,
+        max_retry_limit=0,
+        verbose=False,
+    )
+    tasks, context = [], []
+    for name in ("research", "summary", "report"):
+        task = Task(
+            name=name,
+            description=f"Write the {name} on {{topic}}.",
+            expected_output=name.title(),
+            agent=agent,
+            context=context,
+            output_file=f"{run_dir}/{name}.md",
+        )
+        tasks.append(task)
+        context = [task]
+    return tasks
+
+
+def _interrupted_run():
+    checkpoints = RunCheckpoints.create("run-1", INPUTS, runs_dir="runs")
+    tasks = _workflow(_FailingLLM("summary"))
+    with pytest.raises(Exception):
+        with RunCheckpointer(tasks, checkpoints):
+            ParallelScheduler(verbose=False).run(tasks, inputs=INPUTS)
+    return checkpoints
+
+
+def test_failed_run_keeps_checkpoints_of_completed_tasks():
+    checkpoints = _interrupted_run()
+
+    manifest = RunCheckpoints.load("run-1", runs_dir="runs").manifest
+    assert manifest.status == "failed"
+    assert "rate limited" in manifest.error
+    assert manifest.completed == ["research"]
+    assert manifest.pending == ["summary", "report"]
+    assert checkpoints.load_task("research").raw
+    assert checkpoints.load_task("summary") is None
+    assert latest_incomplete_run("runs") == "run-1"
+
+
+def test_resume_restores_checkpoints_and_runs_the_rest():
+    _interrupted_run()
+    checkpoints = RunCheckpoints.load("run-1", runs_dir="runs")
+    llm = StubLLM()
+    tasks = _workflow(llm)
+
+    with RunCheckpointer(tasks, checkpoints):
+        report = resume_tasks(tasks, checkpoints, verbose=False)
+
+    assert report.reused == ["research"]
+    assert llm.calls == 2
+    manifest = RunCheckpoints.load("run-1", runs_dir="runs").manifest
+    assert manifest.status == "completed"
+    assert manifest.completed == ["research", "summary", "report"]
+    assert latest_incomplete_run("runs") is None
+
+
+def test_unreadable_checkpoint_is_executed_again(tmp_path):
+    _interrupted_run()
+    (tmp_path / "runs" / "run-1" / "checkpoints" / "research.json").write_text(
+        "{", encoding="utf-8"
+    )
+    checkpoints = RunCheckpoints.load("run-1", runs_dir="runs")
+    llm = StubLLM()
+    tasks = _workflow(llm)
+
+    report = resume_tasks(tasks, checkpoints, verbose=False)
+
+    assert report.reused == []
+    assert llm.calls == 3
+
+
+def test_existing_run_id_is_rejected():
+    RunCheckpoints.create("run-1", INPUTS, runs_dir="runs")
+
+    with pytest.raises(FileExistsError):
+        RunCheckpoints.create("run-1", INPUTS, runs_dir="runs")
+    with pytest.raises(FileNotFoundError):
+        RunCheckpoints.load("run-2", runs_dir="runs")
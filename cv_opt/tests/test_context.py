@@ -0,0 +1,150 @@
+"""Tests for the context projection and known fields of cv_opt.context."""
+
+import json
+from typing import List
+
+import pytest
+from crewai import Agent
+from crewai.tasks.task_output import TaskOutput
+from pydantic import BaseModel, Field
+
+from cv_opt.benchmark import StubLLM
+from cv_opt.context import (
+    CONTEXT_DIVIDER,
+    ProjectedContextTask,
+    project_output,
+    render_context,
+)
+from cv_opt.scheduler import execute_single_task
+
+
+class _Analysis(BaseModel):
+    title: str = Field(description="Job title")
+    skills: List[str] = Field(description="Required skills")
+    match_score: int = Field(description="Match score")
+
+
+def _output(raw, name="analysis"):
+    return TaskOutput(description=name, raw=raw, agent="Analyst")
+
+
+def _task(name, raw=None, **kwargs):
+    task = ProjectedContextTask(
+        name=name, description=f"Run {name}.", expected_output=name, **kwargs
+    )
+    if raw is not None:
+        task.output = _output(raw, name)
+    return task
+
+
+def test_project_output_keeps_selected_fields_compactly():
+    raw = json.dumps({"title": "Analyst", "skills": ["SQL", "Excel"], "extra": 1})
+
+    projected = project_output(
+        "analyze_job_task", _output(raw), ["skills", "title", "match_score"]
+    )
+
+    assert projected.splitlines() == [
+        "Output of analyze_job_task (selected fields):",
+        'skills: ["SQL","Excel"]',
+        "title: Analyst",
+    ]
+
+
+def test_project_output_passes_unstructured_output_unchanged():
+    assert project_output("report", _output("# Report\n"), ["title"]) == "# Report\n"
+
+
+def test_render_context_projects_only_listed_tasks():
+    analysis = _task("analysis", json.dumps({"title": "Analyst", "skills": []}))
+    letter = _task("letter", "Dear hiring manager")
+    pending = _task("pending")
+
+    context = render_context([analysis, letter, pending], {"analysis": ["title"]})
+
+    assert context.split(CONTEXT_DIVIDER) == [
+        "Output of analysis (selected fields):\ntitle: Analyst",
+        "Dear hiring manager",
+    ]
+
+
+def test_context_fields_must_name_context_tasks():
+    analysis = _task("analysis")
+
+    with pytest.raises(ValueError, match="outside its context"):
+        _task("report", context=[analysis], context_fields={"letter": ["title"]})
+
+
+def test_project_context_orders_profile_layout_context_and_known_fields():
+    task = _task(
+        "report",
+        output_pydantic=_Analysis,
+        candidate_profile=True,
+        profile_context="PROFILE",
+        resume_layout=True,
+        layout_context="LAYOUT",
+    )
+    task.set_known_fields({"title": "Analyst"})
+
+    blocks = task.project_context("CONTEXT").split(CONTEXT_DIVIDER)
+
+    assert blocks[:3] == ["PROFILE", "LAYOUT", "CONTEXT"]
+    assert blocks[3].endswith("\ntitle: Analyst")
+
+
+def test_project_context_ignores_blocks_the_task_did_not_ask_for():
+    task = _task("report", profile_context="PROFILE", layout_context="LAYOUT")
+
+    assert task.project_context("CONTEXT") == "CONTEXT"
+
+
+def test_known_fields_trim_the_output_model_until_cleared():
+    task = _task("analysis", output_pydantic=_Analysis)
+
+    task.set_known_fields({"title": "Analyst", "salary": "unknown"})
+
+    assert task.known_fields == {"title": "Analyst"}
+    assert list(task.output_pydantic.model_fields) == ["skills", "match_score"]
+    task.set_known_fields({})
+    assert task.output_pydantic is _Analysis
+
+
+def test_merge_known_fields_completes_the_output():
+    task = _task("analysis", output_pydantic=_Analysis)
+    task.set_known_fields({"title": "Analyst"})
+    output = _output("{}")
+    output.pydantic = task.output_pydantic(skills=["SQL"], match_score=80)
+
+    task.merge_known_fields(output)
+
+    assert isinstance(output.pydantic, _Analysis)
+    assert output.pydantic.title == "Analyst"
+    assert json.loads(output.raw)["title"] == "Analyst"
+
+
+def test_known_fields_reach_the_output_file(tmp_path, monkeypatch):
+    # CrewAI resolves output files relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    agent = Agent(
+        role="Analyst",
+        goal="Analyze jobs",
+        backstory="An analyst.",
+        llm=StubLLM(),
+        verbose=False,
+    )
+    task = ProjectedContextTask(
+        name="analysis",
+        description="Analyze the job.",
+        expected_output="Analysis",
+        agent=agent,
+        output_pydantic=_Analysis,
+        output_file="output/analysis.json",
+    )
+    task.callback = task.merge_known_fields
+    task.set_known_fields({"title": "Analyst"})
+
+    execute_single_task(task, {}, verbose=False)
+
+    written = json.loads((tmp_path / "output" / "analysis.json").read_text())
+    assert written["title"] == "Analyst"
+    assert set(written) == {"title", "skills", "match_score"}
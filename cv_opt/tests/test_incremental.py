@@ -0,0 +1,164 @@
+"""Tests for the memoized task execution of cv_opt.incremental."""
+
+from pathlib import Path
+
+import pytest
+from crewai import Agent, Task
+
+from cv_opt.benchmark import StubLLM
+from cv_opt.incremental import (
+    IncrementalRunner,
+    TaskMemo,
+    TaskMemoEntry,
+    restore_task_output,
+    task_memo_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def _workdir(tmp_path, monkeypatch):
+    # CrewAI resolves output files relative to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def _agent(llm=None):
+    return Agent(
+        role="Analyst",
+        goal="Analyze {topic}",
+        backstory="An analyst.",
+        llm=llm or StubLLM(),
+        verbose=False,
+    )
+
+
+def _workflow(llm=None):
+    """Three chained tasks: research -> summary -> report."""
+    agent = _agent(llm)
+    research = Task(
+        name="research",
+        description="Research {topic}.",
+        expected_output="Notes",
+        agent=agent,
+        output_file="output/research.md",
+    )
+    summary = Task(
+        name="summary",
+        description="Summarize the research.",
+        expected_output="Summary",
+        agent=agent,
+        context=[research],
+        output_file="output/summary.md",
+    )
+    report = Task(
+        name="report",
+        description="Write the report.",
+        expected_output="Report",
+        agent=agent,
+        context=[summary],
+        output_file="output/report.md",
+    )
+    return [research, summary, report]
+
+
+def _run(tasks, **kwargs):
+    runner = IncrementalRunner(memo=TaskMemo(Path("memo")), verbose=False)
+    return runner.run(tasks, {"topic": "resumes"}, **kwargs)
+
+
+def _entry(task, raw):
+    return TaskMemoEntry(task=task.name, agent="Analyst", raw=raw, created_at=0.0)
+
+
+def _with_output(task, raw):
+    restore_task_output(task, _entry(task, raw))
+    return task
+
+
+def test_memo_key_is_stable_for_identical_inputs():
+    first, second = _workflow(), _workflow()
+    _with_output(first[0], "notes")
+    _with_output(second[0], "notes")
+
+    assert task_memo_key(first[1]) == task_memo_key(second[1])
+    assert task_memo_key(first[1], {"resume": "a"}) == task_memo_key(
+        second[1], {"resume": "a"}
+    )
+
+
+def test_memo_key_changes_with_description_context_and_salt():
+    tasks = _workflow()
+    summary = tasks[1]
+    _with_output(tasks[0], "notes")
+    key = task_memo_key(summary, {"resume": "a"})
+
+    assert task_memo_key(summary, {"resume": "b"}) != key
+    _with_output(tasks[0], "other notes")
+    assert task_memo_key(summary, {"resume": "a"}) != key
+    _with_output(tasks[0], "notes")
+    summary.description = "Summarize the research briefly."
+    assert task_memo_key(summary, {"resume": "a"}) != key
+
+
+def test_restore_sets_output_runs_callback_and_writes_file(tmp_path):
+    task = _workflow()[0]
+    seen = []
+    task.callback = seen.append
+
+    output = restore_task_output(task, _entry(task, "# Notes"))
+
+    assert task.output is output
+    assert output.raw == "# Notes"
+    assert seen == [output]
+    written = tmp_path / "output" / "research.md"
+    assert written.read_text(encoding="utf-8") == "# Notes"
+
+
+def test_second_run_reuses_every_task():
+    _run(_workflow())
+    llm = StubLLM()
+
+    report = _run(_workflow(llm))
+
+    assert report.reused == ["research", "summary", "report"]
+    assert llm.calls == 0
+
+
+def test_from_task_reruns_the_task_and_its_downstream():
+    _run(_workflow())
+
+    report = _run(_workflow(), from_task="summary")
+
+    assert report.reused == ["research"]
+
+
+def test_only_reruns_the_selection_and_skips_downstream():
+    _run(_workflow())
+    llm = StubLLM()
+    tasks = _workflow(llm)
+
+    report = _run(tasks, only=["summary"])
+
+    assert report.reused == ["research"]
+    assert llm.calls == 1
+    assert tasks[2].output is None
+
+
+def test_only_uses_existing_output_files_of_upstream_tasks(tmp_path):
+    (tmp_path / "output").mkdir()
+    (tmp_path / "output" / "research.md").write_text("# Notes", encoding="utf-8")
+    tasks = _workflow()
+
+    report = _run(tasks, only=["summary"])
+
+    assert report.reused == ["research"]
+    assert tasks[0].output.raw == "# Notes"
+
+
+def test_only_without_upstream_output_raises():
+    with pytest.raises(ValueError, match="No stored output for 'research'"):
+        _run(_workflow(), only=["summary"])
+
+
+def test_unknown_task_selection_raises():
+    with pytest.raises(ValueError, match="Unknown task"):
+        _run(_workflow(), from_task="missing")
@@ -0,0 +1,132 @@
+"""Tests for the job posting extraction of cv_opt.tools.job_posting."""
+
+import json
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from cv_opt.tools.job_posting import (
+    MIN_POSTING_CHARS,
+    _readable_blocks,
+    _remove_noise,
+    extract_job_posting,
+    find_job_posting,
+    posting_fields,
+)
+
+PAGES = Path(__file__).parent / "fixtures" / "job_pages"
+
+
+def _page(name):
+    return (PAGES / name).read_text(encoding="utf-8")
+
+
+def test_json_ld_posting_is_rendered_with_its_header():
+    posting = extract_job_posting(_page("jsonld.html"))
+
+    assert posting.method == "json-ld"
+    lines = posting.text.splitlines()
+    assert lines[:3] == [
+        "Senior Data Engineer",
+        "Company: Globex Corporation",
+        "Location: Austin, TX, US (Remote)",
+    ]
+    assert "Salary: USD 150000-185000 per YEAR" in lines
+    assert "- Model data in Snowflake with dbt" in lines
+    assert lines[-2:] == ["Benefits", "- Remote-first team, 401(k) matching"]
+    assert "cookies" not in posting.text
+
+
+def test_json_ld_posting_states_known_fields():
+    posting = extract_job_posting(_page("jsonld.html"))
+
+    assert posting.fields == {
+        "job_title": "Senior Data Engineer",
+        "location_requirements": {"location": "Austin, TX, US (Remote)"},
+        "compensation": {"base_salary": "USD 150000-185000 per YEAR"},
+        "work_schedule": "full time",
+        "posting_date": "2025-03-01",
+        "application_deadline": "2025-04-15",
+    }
+
+
+def test_posting_fields_skip_what_the_posting_does_not_state():
+    posting = {
+        "@type": "JobPosting",
+        "title": " Data Analyst ",
+        "jobLocation": ["Berlin", "Berlin"],
+        "baseSalary": {"currency": "EUR", "value": 60000},
+    }
+
+    assert posting_fields(posting) == {
+        "job_title": "Data Analyst",
+        "location_requirements": {"location": "Berlin"},
+        "compensation": {"base_salary": "EUR 60000"},
+    }
+
+
+def test_readability_keeps_the_posting_and_its_heading():
+    posting = extract_job_posting(_page("readability.html"))
+
+    assert posting.method == "readability"
+    lines = posting.text.splitlines()
+    assert lines[:3] == ["Product Analyst", "Chicago, IL · Hybrid", "About the role"]
+    assert "- Working knowledge of statistics and A/B testing" in lines
+    for boilerplate in ("cookie", "Similar jobs", "All rights reserved"):
+        assert boilerplate not in posting.text
+    assert posting.tokens < posting.page_tokens
+    assert posting.fields == {}
+
+
+def test_readable_blocks_are_the_best_block_and_the_heading_sibling():
+    soup = BeautifulSoup(_page("readability.html"), "html.parser")
+    _remove_noise(soup)
+
+    blocks = _readable_blocks(soup)
+
+    assert [block.get("class") for block in blocks] == [
+        ["job-header"],
+        ["job-description"],
+    ]
+
+
+def test_readable_blocks_of_a_page_without_text_blocks():
+    soup = BeautifulSoup("<html><body><h1>Jobs</h1></body></html>", "html.parser")
+
+    assert _readable_blocks(soup) == []
+
+
+def test_short_pages_fall_back_to_the_full_page():
+    html = _page("closed.html")
+
+    posting = extract_job_posting(html)
+
+    assert posting.method == "full-page"
+    assert "This job is no longer available" in posting.text
+    assert "Search jobs" in posting.text
+    assert posting.tokens == posting.page_tokens
+    assert posting.token_reduction == 0.0
+
+
+def test_short_json_ld_falls_back_but_keeps_known_fields():
+    posting_ld = {
+        "@context": "https://schema.org",
+        "@type": "JobPosting",
+        "title": "Product Analyst",
+        "datePosted": "2025-02-10",
+        "description": "See below.",
+    }
+    html = _page("readability.html").replace(
+        "</head>",
+        '<script type="application/ld+json">'
+        f"{json.dumps(posting_ld)}</script></head>",
+    )
+
+    posting = extract_job_posting(html)
+
+    assert len(find_job_posting(html)["description"]) < MIN_POSTING_CHARS
+    assert posting.method == "readability"
+    assert posting.fields == {
+        "job_title": "Product Analyst",
+        "posting_date": "2025-02-10",
+    }
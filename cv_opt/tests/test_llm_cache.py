@@ -0,0 +1,125 @@
+"""Tests for the cache keys and replay of cv_opt.llm_cache."""
+
+import itertools
+
+from pydantic import BaseModel
+
+from cv_opt import llm_cache
+from cv_opt.benchmark import StubLLM
+from cv_opt.llm_cache import CachedLLM, LLMResponseCache, llm_cache_key
+
+MESSAGES = [
+    {"role": "system", "content": "You are a resume analyzer."},
+    {"role": "user", "content": "Analyze the job posting.\n\nReturn JSON."},
+]
+TOOLS = [
+    {"type": "function", "function": {"name": "search", "parameters": {}}},
+    {"type": "function", "function": {"name": "scrape", "parameters": {}}},
+]
+
+
+class _Answer(BaseModel):
+    summary: str
+
+
+def _llm(**kwargs) -> StubLLM:
+    llm = StubLLM(**kwargs)
+    llm.temperature = 0
+    return llm
+
+
+def _cached(tmp_path, llm: StubLLM, **kwargs) -> CachedLLM:
+    return CachedLLM(llm, cache=LLMResponseCache(tmp_path / "responses.db"), **kwargs)
+
+
+def _clock(monkeypatch) -> None:
+    """Make every time.time() call of the cache one second later."""
+    ticks = itertools.count(1)
+    monkeypatch.setattr(llm_cache.time, "time", lambda: float(next(ticks)))
+
+
+def test_equivalent_requests_share_a_key():
+    llm = _llm()
+    spaced = [
+        {"role": "system", "content": "You are a  resume\tanalyzer.  "},
+        {"role": "user", "content": "Analyze the job posting.\n\n\n\nReturn JSON.\n"},
+    ]
+
+    assert llm_cache_key(llm, spaced, TOOLS) == llm_cache_key(llm, MESSAGES, TOOLS)
+    assert llm_cache_key(llm, MESSAGES, TOOLS[::-1]) == llm_cache_key(
+        llm, MESSAGES, TOOLS
+    )
+
+
+def test_sampling_model_and_response_format_change_the_key():
+    llm = _llm()
+    key = llm_cache_key(llm, MESSAGES)
+
+    warm = _llm()
+    warm.temperature = 0.7
+    structured = _llm()
+    structured.response_format = _Answer
+
+    assert llm_cache_key(warm, MESSAGES) != key
+    assert llm_cache_key(_llm(model="gpt-4o"), MESSAGES) != key
+    assert llm_cache_key(structured, MESSAGES) != key
+    assert llm_cache_key(llm, MESSAGES[:1]) != key
+
+
+def test_identical_call_is_answered_from_the_cache(tmp_path):
+    llm = _llm()
+    cached = _cached(tmp_path, llm)
+
+    first = cached.call(MESSAGES)
+    second = cached.call(MESSAGES)
+
+    assert second == first
+    assert llm.calls == 1
+    assert cached.cache.stats["hits"] == 1
+    assert cached.cache.stats["stores"] == 1
+
+
+def test_function_calls_and_sampled_requests_bypass_the_cache(tmp_path):
+    llm = _llm()
+    cached = _cached(tmp_path, llm)
+
+    cached.call(MESSAGES, available_functions={"search": print})
+    cached.call(MESSAGES, available_functions={"search": print})
+    llm.temperature = 0.7
+    cached.call(MESSAGES)
+    cached.call(MESSAGES)
+
+    assert llm.calls == 4
+    assert cached.cache.stats["bypassed"] == 4
+    assert cached.cache.usage()["entries"] == 0
+
+    replaying = _cached(tmp_path / "sampled", llm, reuse_sampled=True)
+    replaying.call(MESSAGES)
+    replaying.call(MESSAGES)
+    assert llm.calls == 5
+
+
+def test_least_recently_used_entries_are_evicted_by_count(tmp_path, monkeypatch):
+    _clock(monkeypatch)
+    cache = LLMResponseCache(tmp_path / "responses.db", max_entries=2)
+    cache.store("a", "stub", "answer a")
+    cache.store("b", "stub", "answer b")
+    cache.lookup("a")
+    cache.store("c", "stub", "answer c")
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a") == "answer a"
+    assert cache.lookup("c") == "answer c"
+    assert cache.stats["evictions"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_by_size(tmp_path, monkeypatch):
+    _clock(monkeypatch)
+    cache = LLMResponseCache(tmp_path / "responses.db", max_bytes=20)
+    cache.store("a", "stub", "x" * 8)
+    cache.store("b", "stub", "y" * 8)
+    cache.store("c", "stub", "z" * 8)
+
+    assert cache.usage() == {"entries": 2, "bytes": 16}
+    assert cache.lookup("a") is None
+    assert cache.stats["evictions"] == 1
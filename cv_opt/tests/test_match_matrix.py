@@ -0,0 +1,121 @@
+"""Tests for the vectorized job × resume matrix of cv_opt.match_matrix."""
+
+import numpy as np
+import pytest
+
+from cv_opt.ats_matcher import match_keywords
+from cv_opt.match_matrix import build_match_matrix, screen
+from cv_opt.models import ATSKeyword
+
+
+def _keywords(*specs):
+    return [
+        ATSKeyword(
+            keyword=keyword,
+            importance=importance,
+            category=category,
+            required=required,
+            frequency=1,
+        )
+        for keyword, category, importance, required in specs
+    ]
+
+
+JOBS = {
+    "ml": _keywords(
+        ("Python", "technical", 5, True),
+        ("Large Language Models", "technical", 4, True),
+        ("Kubernetes", "tools", 3, False),
+        ("Master", "education", 3, False),
+        ("leadership", "soft", 2, False),
+    ),
+    "cloud": _keywords(
+        ("GCP", "technical", 5, True),
+        ("deploying", "technical", 4, True),
+        ("5+ years", "experience", 4, True),
+        ("communication", "soft", 3, False),
+    ),
+    "web": _keywords(
+        ("JavaScript", "technical", 5, True),
+        ("User Experience", "technical", 3, False),
+        ("fintech", "industry", 2, False),
+    ),
+}
+
+RESUMES = {
+    "alice": "Python engineer. Fine-tuned LLMs and an LLM judge. Led a team. "
+    "M.S. in Computer Science. Deployed on k8s.",
+    "bob": "Deployed services to Google Cloud Platform for 5+ years. "
+    "Presentation skills. MS Office.",
+    "carol": "JS and UX work for a fintech startup. Communicating with clients.",
+    "dave": "Attached my CV. Available until 5 PM.",
+}
+
+
+def test_scores_match_the_per_pair_matcher():
+    matrix = build_match_matrix(JOBS, RESUMES)
+
+    for row, (job_id, keywords) in enumerate(JOBS.items()):
+        for col, (resume_id, text) in enumerate(RESUMES.items()):
+            expected = match_keywords(keywords, text).match_score.overall_match
+            assert matrix.scores[row, col] == pytest.approx(expected, abs=0.1), (
+                job_id,
+                resume_id,
+            )
+
+
+def test_shortlist_is_the_union_of_per_job_and_per_resume_top_k():
+    matrix = build_match_matrix(JOBS, RESUMES)
+
+    expected = {
+        (pair.job_id, pair.resume_id)
+        for job_id in matrix.job_ids
+        for pair in matrix.top_resumes(job_id, 1)
+    } | {
+        (pair.job_id, pair.resume_id)
+        for resume_id in matrix.resume_ids
+        for pair in matrix.top_jobs(resume_id, 1)
+    }
+    shortlist = matrix.shortlist(1)
+
+    assert {(pair.job_id, pair.resume_id) for pair in shortlist} == expected
+    scores = [pair.overall_match for pair in shortlist]
+    assert scores == sorted(scores, reverse=True)
+    assert [pair.rank for pair in shortlist] == list(range(1, len(shortlist) + 1))
+
+
+def test_top_resumes_orders_by_score():
+    matrix = build_match_matrix(JOBS, RESUMES)
+
+    top = matrix.top_resumes("web", k=2)
+
+    assert top[0].resume_id == "carol"
+    assert top[0].overall_match == round(float(np.max(matrix.scores[2])), 1)
+
+
+def test_empty_inputs():
+    matrix = build_match_matrix({}, {})
+
+    assert matrix.scores.shape == (0, 0)
+    assert matrix.shortlist(3) == []
+
+
+@pytest.mark.parametrize(
+    "jobs, resumes, message",
+    [
+        (
+            ["a/acme/job_analysis.json", "b/acme/job_analysis.json"],
+            ["cvs/alice.pdf"],
+            "Job ID 'acme' is shared by a/acme/job_analysis.json and "
+            "b/acme/job_analysis.json",
+        ),
+        (
+            ["acme/job_analysis.json"],
+            ["a/cv.pdf", "b/cv.pdf"],
+            "Resume ID 'cv' is shared by a/cv.pdf and b/cv.pdf",
+        ),
+    ],
+)
+def test_screen_rejects_duplicate_ids(jobs, resumes, message):
+    with pytest.raises(ValueError, match=message):
+        screen(jobs, resumes)
@@ -0,0 +1,317 @@
+"""Tests for the layout measurement and format diagnostics of cv_opt.pdf_layout."""
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+import yaml
+
+from cv_opt.crew import replace_step
+from cv_opt.pdf_layout import (
+    PDFSyntaxError,
+    analyze_pdf_layout,
+    get_resume_layout,
+    render_layout_diagnostics,
+)
+
+TASKS_YAML = Path(__file__).parents[1] / "src" / "cv_opt" / "config" / "tasks.yaml"
+
+# Page resources shared by every generated PDF: a standard font, an
+# uncommon one and a one-pixel image
+RESOURCES = b"<< /Font << /F1 3 0 R /F2 4 0 R >> /XObject << /Im1 5 0 R >> >>"
+SHARED_OBJECTS = [
+    b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    b"<< /Type /Font /Subtype /TrueType /BaseFont /ABCDEF+ComicSansMS >>",
+    b"<< /Type /XObject /Subtype /Image /Width 1 /Height 1 /ColorSpace /DeviceGray"
+    b" /BitsPerComponent 8 /Length 1 >>\nstream\n\x00\nendstream",
+]
+
+
+def _text(x: float, y: float, text: str, font: str = "F1", size: int = 11) -> bytes:
+    """Return the content operators that set one line of text."""
+    return f"BT /{font} {size} Tf {x} {y} Td ({text}) Tj ET\n".encode("latin-1")
+
+
+def _resume(*extra: bytes, top: float = 740) -> bytes:
+    """Return the content of a single-column page with the standard sections."""
+    lines = [
+        "JANE DOE",
+        "EXPERIENCE",
+        "Data Engineer, Acme Corp, 2020 - 2024",
+        "Built batch pipelines for the reporting team",
+        "EDUCATION",
+        "BSc Computer Science, State University, 2019",
+        "SKILLS",
+        "Python, SQL, Airflow, Spark",
+    ]
+    content = b"".join(_text(72, top - 18 * i, line) for i, line in enumerate(lines))
+    return content + b"".join(extra)
+
+
+def _pdf(
+    path: Path,
+    pages: List[bytes],
+    trailer: bytes = b"",
+    xref_offset: int = 0,
+) -> Path:
+    """
+    Write a PDF with one content stream per page.
+
+    Args:
+        path (Path): File to write
+        pages (List[bytes]): Content stream of every page
+        trailer (bytes): Extra trailer entries, e.g. an /Encrypt reference
+        xref_offset (int): Amount by which to corrupt every object offset
+            of the cross-reference table
+
+    Returns:
+        Path: The written file
+    """
+    kids = " ".join(f"{6 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>".encode(),
+        *SHARED_OBJECTS,
+    ]
+    for index, content in enumerate(pages):
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources "
+            + RESOURCES
+            + f" /Contents {7 + 2 * index} 0 R >>".encode()
+        )
+        objects.append(
+            f"<< /Length {len(content)} >>\nstream\n".encode()
+            + content
+            + b"\nendstream"
+        )
+    data = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(data))
+        data += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(data)
+    data += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        data += f"{offset + xref_offset:010d} 00000 n \n".encode()
+    data += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R ".encode()
+    data += trailer + f">>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(data))
+    return path
+
+
+def _source(path: Path, pdf_hash: str) -> SimpleNamespace:
+    """Return a loaded resume source for one PDF."""
+    return SimpleNamespace(content={path: ""}, pdf_hash=pdf_hash)
+
+
+def _warnings(layout, keyword: str) -> List[str]:
+    """Return the parsing warnings mentioning a keyword."""
+    return [warning for warning in layout.parsing_warnings if keyword in warning]
+
+
+def _failed(compliance: Dict[str, bool]) -> List[str]:
+    """Return the names of the failed checks."""
+    return [name for name, passed in compliance.items() if not passed]
+
+
+def test_single_column_resume_passes_every_check(tmp_path):
+    layout = analyze_pdf_layout(_pdf(tmp_path / "plain.pdf", [_resume()]))
+
+    assert _failed(layout.format_compliance) == []
+    assert layout.parsing_warnings == []
+    page = layout.pages[0]
+    assert (page.number, page.width, page.height) == (1, 612.0, 792.0)
+    assert (page.lines, page.columns, page.column_lines) == (8, 1, 0)
+    assert layout.sections == ["experience", "education", "skills"]
+    assert page.text.splitlines()[:2] == ["JANE DOE", "EXPERIENCE"]
+
+
+def test_two_columns_are_detected_and_read_column_by_column(tmp_path):
+    sidebar = b"".join(
+        _text(x, y, text)
+        for y, left, right in (
+            (500, "Led the migration of reports", "Fluent in German and French"),
+            (482, "Mentored three junior engineers", "Tutored math on weekends"),
+        )
+        for x, text in ((72, left), (340, right))
+    )
+    layout = analyze_pdf_layout(_pdf(tmp_path / "columns.pdf", [_resume(sidebar)]))
+
+    page = layout.pages[0]
+    assert (page.columns, page.column_lines) == (2, 2)
+    assert layout.format_compliance["single_column"] is False
+    assert _warnings(layout, "Multi-column layout: lines split into 2 columns")
+    assert page.text.splitlines()[-4:] == [
+        "Led the migration of reports",
+        "Mentored three junior engineers",
+        "Fluent in German and French",
+        "Tutored math on weekends",
+    ]
+
+
+def test_fonts_are_measured_and_uncommon_families_flagged(tmp_path):
+    layout = analyze_pdf_layout(
+        _pdf(tmp_path / "fonts.pdf", [_resume(_text(72, 560, "Portfolio", "F2", 14))])
+    )
+
+    helvetica, comic = layout.fonts
+    assert (helvetica.name, helvetica.standard, helvetica.sizes) == (
+        "Helvetica",
+        True,
+        [11.0],
+    )
+    assert (comic.name, comic.family, comic.standard, comic.embedded) == (
+        "ComicSansMS",
+        "ComicSansMS",
+        False,
+        False,
+    )
+    assert comic.characters == len("Portfolio")
+    assert layout.format_compliance["standard_fonts"] is False
+    assert _warnings(layout, "Uncommon font family ComicSansMS")
+    assert _warnings(layout, "Fonts not embedded (ComicSansMS)")
+    assert "ComicSansMS 14pt (9 chars)" in render_layout_diagnostics(layout)
+
+
+def test_ruled_tables_and_images_are_counted(tmp_path):
+    grid = b"".join(
+        f"{x0} {y0} m {x1} {y1} l S\n".encode()
+        for x0, y0, x1, y1 in (
+            (72, 500, 372, 500),
+            (72, 480, 372, 480),
+            (72, 460, 372, 460),
+            (72, 460, 72, 500),
+            (222, 460, 222, 500),
+            (372, 460, 372, 500),
+        )
+    )
+    photo = b"q 80 0 0 80 460 660 cm /Im1 Do Q\n"
+    layout = analyze_pdf_layout(_pdf(tmp_path / "table.pdf", [_resume(grid, photo)]))
+
+    page = layout.pages[0]
+    assert (page.tables, page.images) == (1, 1)
+    assert layout.format_compliance["no_tables"] is False
+    assert layout.format_compliance["no_images"] is False
+    assert _warnings(layout, "Tables on page 1")
+    assert _warnings(layout, "1 image(s) on page 1")
+
+
+def test_repeated_margin_text_and_page_numbers_are_headers_and_footers(tmp_path):
+    def page(number: int) -> bytes:
+        return _resume(
+            _text(72, 770, "Jane Doe - Resume"),
+            _text(280, 20, f"Page {number} of 2"),
+            top=700,
+        )
+
+    layout = analyze_pdf_layout(_pdf(tmp_path / "margins.pdf", [page(1), page(2)]))
+
+    assert [page.header_footer for page in layout.pages] == [
+        ["Jane Doe - Resume", "Page 1 of 2"],
+        ["Jane Doe - Resume", "Page 2 of 2"],
+    ]
+    assert layout.format_compliance["no_headers_footers"] is False
+    assert _warnings(layout, "Header/footer text ('Jane Doe - Resume'")
+
+
+def test_missing_sections_and_text_layer_fail_their_checks(tmp_path):
+    layout = analyze_pdf_layout(
+        _pdf(tmp_path / "scan.pdf", [b"q 612 0 0 792 0 0 cm /Im1 Do Q\n"])
+    )
+
+    assert layout.fonts == []
+    assert layout.format_compliance["doc_format"] is False
+    assert layout.format_compliance["standard_sections"] is False
+    assert _warnings(layout, "No standard section heading for Experience")
+    assert _warnings(layout, "No text layer")
+
+
+def test_encrypted_pdf_reports_only_its_encryption(tmp_path):
+    path = _pdf(tmp_path / "locked.pdf", [_resume()], trailer=b"/Encrypt 3 0 R ")
+    layout = analyze_pdf_layout(path)
+
+    assert layout.encrypted is True
+    assert layout.pages == []
+    assert layout.format_compliance == {"doc_format": False}
+    assert layout.parsing_warnings == [
+        "The PDF is encrypted; ATS parsers may be unable to read its text"
+    ]
+    assert "Failed checks: doc_format" in render_layout_diagnostics(layout)
+
+
+def test_damaged_cross_reference_is_recovered_by_scanning(tmp_path):
+    intact = analyze_pdf_layout(_pdf(tmp_path / "intact.pdf", [_resume()]))
+    damaged = analyze_pdf_layout(
+        _pdf(tmp_path / "damaged.pdf", [_resume()], xref_offset=7)
+    )
+
+    assert damaged.model_dump() == intact.model_dump()
+
+
+def test_unreadable_files_raise_syntax_errors(tmp_path):
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    text = tmp_path / "resume.pdf"
+    text.write_text("Jane Doe\nExperience\n", encoding="utf-8")
+
+    for path in (empty, text):
+        with pytest.raises(PDFSyntaxError):
+            analyze_pdf_layout(path)
+    with pytest.raises(OSError):
+        analyze_pdf_layout(tmp_path / "missing.pdf")
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        (b"/MediaBox [0 0 612 792]", b"/MediaBox [0 0 6x2 792]"),
+        (b"/MediaBox [0 0 612 792]", b"/MediaBox [0 0 612    ]"),
+        (b"/Kids [6 0 R]", b"/Kids 1234567"),
+        (b"/Font << /F1", b"/Font <<[]F1"),
+        (b"/Resources " + RESOURCES, b"/Resources 7".ljust(11 + len(RESOURCES))),
+    ],
+)
+def test_malformed_objects_raise_syntax_errors_or_are_skipped(tmp_path, damage):
+    path = _pdf(tmp_path / "damaged.pdf", [_resume()])
+    data = path.read_bytes()
+    assert len(damage[0]) == len(damage[1]) and damage[0] in data
+    path.write_bytes(data.replace(*damage))
+
+    try:
+        layout = analyze_pdf_layout(path)
+    except PDFSyntaxError:
+        return
+    assert layout.format_compliance
+
+
+def test_get_resume_layout_falls_back_to_none_and_caches(tmp_path):
+    broken = tmp_path / "broken.pdf"
+    broken.write_text("not a PDF", encoding="utf-8")
+    path = _pdf(tmp_path / "resume.pdf", [_resume()])
+
+    assert get_resume_layout(_source(broken, "test-broken")) is None
+    assert get_resume_layout(_source(tmp_path / "missing.pdf", "test-missing")) is None
+    corrupt = _pdf(tmp_path / "corrupt.pdf", [_resume()])
+    data = corrupt.read_bytes()
+    corrupt.write_bytes(data.replace(b"[0 0 612 792]", b"[0 0 6x2 792]"))
+    assert get_resume_layout(_source(corrupt, "test-corrupt")) is None
+    layout = get_resume_layout(_source(path, "test-resume"))
+    assert layout is not None and layout.pages
+    path.unlink()
+    assert get_resume_layout(_source(path, "test-resume")) is layout
+
+
+@pytest.mark.parametrize(
+    "task_name", ["optimize_resume_task", "analyze_resume_format_task"]
+)
+def test_measured_layout_step_replaces_the_format_checklist(task_name):
+    config = yaml.safe_load(TASKS_YAML.read_text(encoding="utf-8"))[task_name]
+    description = replace_step(config["description"], config["measured_layout_step"])
+
+    assert "Verify single-column layout" in config["description"]
+    assert "Verify single-column layout" not in description
+    assert "measured from the PDF" in description
+    assert description.count("**STEP 1:") == 1
+    assert "**STEP 2:" in description
+    assert replace_step(description, "**STEP 9: Missing**\n") == description
@@ -0,0 +1,106 @@
+"""Tests for the shared on-disk scrape cache of cv_opt.tools.scrape_cache."""
+
+from types import SimpleNamespace
+
+from cv_opt.tools import scrape_cache
+from cv_opt.tools.scrape_cache import CachedScrapeWebsiteTool, ScrapeCache
+
+
+def test_processes_sharing_a_directory_keep_each_others_entries(tmp_path):
+    first, second = ScrapeCache(tmp_path), ScrapeCache(tmp_path)
+
+    first.put("https://jobs.example.com/a", "posting a")
+    second.put("https://jobs.example.com/b", "posting b")
+
+    for cache in (first, second):
+        assert cache.read(cache.get("https://jobs.example.com/a")) == "posting a"
+        assert cache.read(cache.get("https://jobs.example.com/b")) == "posting b"
+
+
+def test_hits_do_not_rewrite_the_entry(tmp_path):
+    cache = ScrapeCache(tmp_path)
+    cache.put("https://jobs.example.com/a", "posting a")
+    entry_file = next((tmp_path / "entries").iterdir())
+    before = entry_file.stat().st_mtime_ns
+
+    for _ in range(3):
+        assert cache.get("https://jobs.example.com/a?utm_source=x") is not None
+
+    assert entry_file.stat().st_mtime_ns == before
+
+
+def test_stale_access_time_is_persisted(tmp_path):
+    cache = ScrapeCache(tmp_path)
+    entry = cache.put("https://jobs.example.com/a", "posting a")
+    entry.last_accessed -= 2 * 3600
+    cache._write_entry(cache.key("https://jobs.example.com/a"), entry)
+
+    refreshed = cache.get("https://jobs.example.com/a").last_accessed
+
+    assert ScrapeCache(tmp_path).get("https://jobs.example.com/a").last_accessed == (
+        refreshed
+    )
+    assert refreshed > entry.last_accessed
+
+
+def test_eviction_keeps_content_referenced_by_another_entry(tmp_path):
+    cache, other = ScrapeCache(tmp_path, max_bytes=20), ScrapeCache(tmp_path)
+    cache.put("https://jobs.example.com/a", "shared posting")
+    other.put("https://jobs.example.com/b", "shared posting")
+    cache.put("https://jobs.example.com/c", "another posting text")
+
+    assert cache.get("https://jobs.example.com/c") is not None
+    assert cache.get("https://jobs.example.com/a") is None
+    assert cache.get("https://jobs.example.com/b") is None
+    assert len(list((tmp_path / "content").iterdir())) == 1
+    assert cache.stats["evictions"] == 2
+
+
+def test_puts_under_the_cap_do_not_scan_the_entries(tmp_path, monkeypatch):
+    cache = ScrapeCache(tmp_path, max_bytes=40)
+    cache.put("https://jobs.example.com/a", "posting a")
+    scans = []
+    read_entry = cache._read_entry
+    monkeypatch.setattr(
+        cache, "_read_entry", lambda path: scans.append(path) or read_entry(path)
+    )
+
+    cache.put("https://jobs.example.com/b", "posting b")
+    cache.put("https://jobs.example.com/c", "posting c")
+    assert scans == []
+
+    cache.put("https://jobs.example.com/d", "a posting over the size cap")
+    assert len(scans) == 4
+    assert cache.get("https://jobs.example.com/d") is not None
+    assert cache.stats["evictions"] == 2
+
+
+def test_text_evicted_before_it_is_read_is_fetched_again(tmp_path, monkeypatch):
+    pages = []
+
+    def fetch(url, **kwargs):
+        pages.append(url)
+        return SimpleNamespace(
+            status_code=200,
+            ok=True,
+            text="<html><body><p>Data Engineer posting</p></body></html>",
+            apparent_encoding="utf-8",
+            headers={},
+        )
+
+    monkeypatch.setattr(scrape_cache.requests, "get", fetch)
+    tool = CachedScrapeWebsiteTool(cache_dir=str(tmp_path), extract_posting=False)
+    url = "https://jobs.example.com/a"
+    tool.run(website_url=url)
+    get = tool.cache.get
+
+    def get_then_evict(website_url):
+        entry = get(website_url)
+        if entry is not None and len(pages) == 1:
+            (tmp_path / "content" / f"{entry.content_hash}.txt").unlink()
+        return entry
+
+    monkeypatch.setattr(tool.cache, "get", get_then_evict)
+
+    assert "Data Engineer posting" in tool.run(website_url=url)
+    assert len(pages) == 2
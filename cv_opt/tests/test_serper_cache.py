@@ -0,0 +1,146 @@
+"""Tests for the cached Serper search of cv_opt.tools.serper_cache."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+from crewai_tools import SerperDevTool
+
+from cv_opt.tools.serper_cache import (
+    DEFAULT_FRESHNESS_WINDOWS,
+    CachedSerperDevTool,
+    SearchCache,
+    normalize_query,
+)
+
+DAY = 24 * 3600
+
+
+class _Fetch:
+    """Stub Serper request that counts its calls."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.calls = 0
+        self.delay = delay
+        self._lock = threading.Lock()
+
+    def __call__(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        return {"organic": [{"title": f"result {call}"}], **kwargs}
+
+
+def _tool(tmp_path, monkeypatch, fetch, **kwargs) -> CachedSerperDevTool:
+    monkeypatch.setenv("SERPER_API_KEY", "test")
+    monkeypatch.setattr(SerperDevTool, "_run", lambda self, **kw: fetch(**kw))
+    return CachedSerperDevTool(cache_path=str(tmp_path / "search.db"), **kwargs)
+
+
+def _age(cache: SearchCache, seconds: float) -> None:
+    """Move every stored result `seconds` into the past."""
+    with closing(cache._connect()) as connection, connection:
+        connection.execute(
+            "UPDATE search_results SET fetched_at = fetched_at - ?", (seconds,)
+        )
+
+
+def test_normalization_keeps_word_order():
+    assert normalize_query("Apple acquires Google") == "apple acquires google"
+    assert normalize_query("Google acquires Apple") == "google acquires apple"
+    assert normalize_query("  The culture of NVIDIA! ") == "culture nvidia"
+
+
+def test_results_expire_per_category(tmp_path, monkeypatch):
+    fetch = _Fetch()
+    tool = _tool(tmp_path, monkeypatch, fetch, company_name="NVIDIA")
+
+    tool.run(search_query="NVIDIA latest news")
+    tool.run(search_query="NVIDIA company culture")
+    _age(tool.cache, 2 * DAY)
+    tool.run(search_query="NVIDIA latest news")
+    tool.run(search_query="NVIDIA company culture")
+
+    # Only the news result is older than its one-day window
+    assert fetch.calls == 3
+    assert tool.cache.stats == {"hits": 1, "misses": 3, "coalesced": 0}
+
+
+def test_company_freshness_overrides_the_default_window(tmp_path, monkeypatch):
+    fetch = _Fetch()
+    tool = _tool(
+        tmp_path,
+        monkeypatch,
+        fetch,
+        company_freshness={"nvidia": {"culture": 3600}},
+    )
+
+    assert tool.freshness_window("nvidia", "culture") == 3600
+    assert tool.freshness_window("nvidia", "news") == DEFAULT_FRESHNESS_WINDOWS["news"]
+    assert tool.freshness_window("amd", "culture") == 30 * DAY
+
+    for company in ("NVIDIA", "AMD"):
+        tool.company_name = company
+        tool.run(search_query="company culture")
+    _age(tool.cache, 2 * 3600)
+    for company in ("NVIDIA", "AMD"):
+        tool.company_name = company
+        tool.run(search_query="company culture")
+
+    assert fetch.calls == 3
+
+
+def test_results_are_partitioned_by_company(tmp_path):
+    cache = SearchCache(tmp_path / "search.db")
+    fetch = _Fetch()
+
+    first = cache.get_or_fetch("nvidia", "key", "culture", "culture", DAY, fetch)
+    second = cache.get_or_fetch("amd", "key", "culture", "culture", DAY, fetch)
+    again = cache.get_or_fetch("nvidia", "key", "culture", "culture", DAY, fetch)
+
+    assert fetch.calls == 2
+    assert first != second
+    assert again == first
+    assert cache.invalidate("nvidia") == 1
+    assert cache.lookup("amd", "key", DAY) == second
+
+
+def test_concurrent_identical_searches_fetch_once(tmp_path):
+    cache = SearchCache(tmp_path / "search.db")
+    fetch = _Fetch(delay=0.2)
+    start = threading.Barrier(8)
+
+    def search(_):
+        start.wait()
+        return cache.get_or_fetch("nvidia", "key", "news", "news", DAY, fetch)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(search, range(8)))
+
+    assert fetch.calls == 1
+    assert all(result == results[0] for result in results)
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] + cache.stats["coalesced"] == 7
+
+
+def test_late_owner_reuses_results_stored_by_the_previous_owner(tmp_path):
+    cache = SearchCache(tmp_path / "search.db")
+    fetch = _Fetch()
+    lookup = cache.lookup
+    calls = []
+
+    def stale_first_lookup(*args):
+        # The first lookup misses, as if it ran before another owner stored
+        calls.append(args)
+        return None if len(calls) == 1 else lookup(*args)
+
+    cache.store("nvidia", "key", "news", "news", {"organic": []})
+    cache.lookup = stale_first_lookup
+
+    assert cache.get_or_fetch("nvidia", "key", "news", "news", DAY, fetch) == {
+        "organic": []
+    }
+    assert fetch.calls == 0
+    assert cache.stats["hits"] == 1
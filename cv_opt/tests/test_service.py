@@ -0,0 +1,153 @@
+"""Tests for the bounded run and resume state of cv_opt.service."""
+
+import asyncio
+import base64
+import time
+
+import pytest
+
+from cv_opt import service as service_module
+from cv_opt.benchmark import StubLLM
+from cv_opt.progress import ProgressEvent
+from cv_opt.service import ResumeService, RunSubmission
+
+PDF = b"%PDF-1.4\n%%EOF\n"
+
+
+@pytest.fixture(autouse=True)
+def _cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("CV_OPT_CACHE_DIR", str(tmp_path / "cache"))
+
+
+def _service(monkeypatch, **kwargs):
+    """A started service without workers whose resumes load instantly."""
+    service = ResumeService(llm=StubLLM(), **kwargs)
+    service._queue = asyncio.Queue()
+    service._default_resume = "default"
+    released = []
+
+    def load_resume(file_path):
+        key = f"upload-{file_path[0].stem[:8]}"
+        service._resumes[key] = file_path[0]
+        return key
+
+    monkeypatch.setattr(service, "_load_resume", load_resume)
+    monkeypatch.setattr(service_module, "release_resume_knowledge", released.append)
+    return service, released
+
+
+def _submit(service, resume=None):
+    submission = RunSubmission(
+        job_url="https://example.com/job",
+        company_name="TechCorp",
+        resume_pdf_base64=base64.b64encode(resume).decode() if resume else None,
+    )
+    return asyncio.run(service.submit(submission))
+
+
+def _finish(service, run, finished_at=None):
+    run.status = "succeeded"
+    service._record(
+        run.run_id,
+        ProgressEvent(
+            run_id=run.run_id,
+            type="task_started",
+            task="analyze_job_task",
+            timestamp=time.time(),
+        ),
+    )
+    service._record(
+        run.run_id,
+        ProgressEvent(
+            run_id=run.run_id,
+            type="run_finished",
+            timestamp=finished_at or time.time(),
+        ),
+    )
+
+
+async def _collect(service, run_id):
+    return [event.type async for event in service.events(run_id)]
+
+
+def test_events_of_finished_runs_are_dropped(monkeypatch):
+    service, _ = _service(monkeypatch)
+    run = _submit(service)
+
+    _finish(service, run)
+
+    assert [event.type for event in service._events[run.run_id]] == ["run_finished"]
+    assert asyncio.run(_collect(service, run.run_id)) == ["run_finished"]
+
+
+def test_events_are_kept_until_subscribers_drain(monkeypatch):
+    service, _ = _service(monkeypatch)
+    run = _submit(service)
+
+    async def scenario():
+        subscriber = asyncio.create_task(_collect(service, run.run_id))
+        await asyncio.sleep(0)
+        _finish(service, run)
+        assert len(service._events[run.run_id]) == 3
+        return await subscriber
+
+    assert asyncio.run(scenario()) == ["queued", "task_started", "run_finished"]
+    assert len(service._events[run.run_id]) == 1
+
+
+def test_expired_and_excess_finished_runs_are_forgotten(monkeypatch):
+    service, _ = _service(monkeypatch, run_retention=60, max_finished_runs=2)
+    expired, old, recent, running = (_submit(service) for _ in range(4))
+    _finish(service, expired, finished_at=time.time() - 120)
+    _finish(service, old, finished_at=time.time() - 30)
+    _finish(service, recent)
+    running.status = "running"
+
+    newest = _submit(service)
+
+    assert set(service.runs) == {
+        old.run_id,
+        recent.run_id,
+        running.run_id,
+        newest.run_id,
+    }
+    assert expired.run_id not in service._events
+
+    service.max_finished_runs = 1
+    service._prune_runs()
+    assert old.run_id not in service.runs
+
+
+def test_uploaded_resumes_are_capped(monkeypatch):
+    service, released = _service(monkeypatch, max_uploaded_resumes=2)
+    first = _submit(service, PDF + b"1")
+    second = _submit(service, PDF + b"2")
+    for run in (first, second):
+        _finish(service, run)
+    first_pdf = service._resumes[first.resume]
+
+    third = _submit(service, PDF + b"3")
+
+    assert released == [first.resume]
+    assert set(service._resumes) == {second.resume, third.resume}
+    assert not first_pdf.exists()
+
+
+def test_resumes_of_queued_runs_are_kept(monkeypatch):
+    service, released = _service(monkeypatch, max_uploaded_resumes=1)
+    queued = _submit(service, PDF + b"1")
+
+    _submit(service, PDF + b"2")
+
+    assert released == []
+    assert queued.resume in service._resumes
+
+
+def test_uploads_are_stored_by_content(monkeypatch, tmp_path):
+    service, _ = _service(monkeypatch)
+
+    run = _submit(service, PDF)
+
+    uploads = list((tmp_path / "cache" / "uploads").iterdir())
+    assert [path.read_bytes() for path in uploads] == [PDF]
+    assert service._resumes[run.resume] == uploads[0].resolve()
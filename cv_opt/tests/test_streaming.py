@@ -0,0 +1,147 @@
+"""Tests for the streamed answer validation of cv_opt.streaming."""
+
+import json
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel, Field
+
+from cv_opt.benchmark import schema_example
+from cv_opt.models import JobRequirements
+from cv_opt.streaming import SchemaViolationError, StreamingModelParser
+
+PREAMBLE = "Thought: I now know the final answer\nFinal Answer: "
+
+
+class _Posting(BaseModel):
+    title: str
+    skills: List[str]
+    details: Dict[str, Any] = {}
+    score: float = Field(ge=0, le=100)
+
+
+POSTING = {
+    "title": 'Lead {data} [platform] "ops"\\ engineer',
+    "skills": ["Python", "SQL}", "[Spark]"],
+    "details": {"location": {"city": "Zürich"}, "tags": ["a", "{b}"]},
+    "score": 87.5,
+}
+
+
+def _feed(parser: StreamingModelParser, text: str, size: int) -> List[str]:
+    """Feed text in chunks of `size` characters; return the completed fields."""
+    completed = []
+    for start in range(0, len(text), size):
+        completed.extend(parser.feed(text[start : start + size]))
+    return completed
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_fields_complete_in_order_at_any_chunk_boundary(size):
+    parser = StreamingModelParser(_Posting)
+
+    completed = _feed(parser, PREAMBLE + json.dumps(POSTING), size)
+
+    assert completed == ["title", "skills", "details", "score"]
+    assert parser.done
+    assert parser.result == _Posting(**POSTING)
+    assert parser.values == POSTING
+
+
+def test_braces_brackets_and_escaped_quotes_stay_inside_strings():
+    parser = StreamingModelParser(_Posting)
+
+    completed = parser.feed(PREAMBLE + json.dumps(POSTING)[:-1])
+
+    # The number is not complete until the closing brace arrives
+    assert completed == ["title", "skills", "details"]
+    assert parser.values["title"] == POSTING["title"]
+    assert parser.values["skills"] == ["Python", "SQL}", "[Spark]"]
+    assert not parser.done
+    assert parser.feed("}") == ["score"]
+    assert parser.fields["score"] == 87.5
+
+
+def test_unicode_escapes_are_decoded_in_names_and_values():
+    text = '{"titl\\u0065": "Data Engineer \\u2013 Z\\u00fcrich", ' + (
+        '"skills": ["\\ud83d\\ude80"], "score": 1}'
+    )
+    parser = StreamingModelParser(_Posting)
+
+    assert parser.feed(text) == ["title", "skills", "score"]
+    assert parser.result.title == "Data Engineer – Zürich"
+    assert parser.result.skills == ["\U0001f680"]
+
+
+def test_tool_action_input_is_not_taken_for_the_answer():
+    text = (
+        "Thought: I need the posting\n"
+        "Action: Read website content\n"
+        'Action Input: {"website_url": "https://jobs.example.com/1"}\n'
+        "Observation: Lead data engineer ...\n"
+        f"{PREAMBLE}{json.dumps(POSTING)}"
+    )
+    parser = StreamingModelParser(_Posting)
+
+    assert _feed(parser, text, 5) == ["title", "skills", "details", "score"]
+    assert "website_url" not in parser.values
+
+
+def test_json_code_fence_is_skipped():
+    parser = StreamingModelParser(_Posting)
+
+    parser.feed(f"{PREAMBLE}```json\n{json.dumps(POSTING, indent=2)}\n```")
+
+    assert parser.result == _Posting(**POSTING)
+
+
+def test_first_invalid_field_fails_fast():
+    text = PREAMBLE + json.dumps({"title": "Engineer", "skills": "Python", "score": 1})
+    parser = StreamingModelParser(_Posting)
+
+    with pytest.raises(SchemaViolationError) as error:
+        _feed(parser, text, 4)
+
+    assert error.value.field == "skills"
+    assert error.value.errors[0]["type"] == "list_type"
+    assert list(parser.fields) == ["title"]
+    with pytest.raises(SchemaViolationError) as again:
+        parser.feed('"score": 1}')
+    assert again.value is error.value
+
+
+def test_invalid_json_and_out_of_range_numbers_fail_their_field():
+    parser = StreamingModelParser(_Posting)
+    with pytest.raises(SchemaViolationError, match=r"_Posting\.score: invalid JSON"):
+        parser.feed('{"title": "Engineer", "skills": [], "score": 9x}')
+
+    parser = StreamingModelParser(_Posting)
+    with pytest.raises(SchemaViolationError, match="less than or equal to 100"):
+        parser.feed('{"score": 101,')
+
+
+def test_missing_required_field_fails_when_the_object_closes():
+    parser = StreamingModelParser(_Posting)
+    parser.feed('{"title": "Engineer", "score": 1')
+
+    with pytest.raises(SchemaViolationError) as error:
+        parser.feed("}")
+
+    assert (error.value.field, str(error.value)) == (
+        "skills",
+        "_Posting.skills: field required",
+    )
+    assert not parser.done
+
+
+def test_full_job_requirements_answer_streams_to_a_result():
+    answer = JobRequirements.model_validate(
+        schema_example(JobRequirements.model_json_schema(), list_items=2)
+    )
+    parser = StreamingModelParser(JobRequirements)
+
+    completed = _feed(parser, PREAMBLE + answer.model_dump_json(), 13)
+
+    assert completed == list(answer.model_dump())
+    assert parser.done
+    assert parser.result == answer
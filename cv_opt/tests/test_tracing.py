@@ -0,0 +1,111 @@
+"""Tests for the per-call cost attribution of cv_opt.tracing."""
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+from crewai import Agent, Task
+from pydantic import BaseModel, Field
+
+from cv_opt.benchmark import StubLLM
+from cv_opt.routing import ModelRouter, RoutedLLM, RoutingTable
+from cv_opt.scheduler import execute_single_task
+from cv_opt.tracing import RunTracer, estimate_cost
+
+
+class _Skills(BaseModel):
+    skills: List[str] = Field(description="Required skills")
+
+
+class _UsageLLM(StubLLM):
+    """Stub LLM reporting provider usage for every answer, like LiteLLM."""
+
+    def __init__(self, prompt_tokens: int, completion_tokens: int, **kwargs):
+        super().__init__(**kwargs)
+        self.usage = SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            prompt_tokens_details=None,
+        )
+        self._callbacks: List = []
+
+    def call(self, messages, tools=None, callbacks=None, *args, **kwargs):
+        self._callbacks = callbacks or []
+        return super().call(messages, tools, callbacks, *args, **kwargs)
+
+    def final_answer(self, task):
+        for callback in self._callbacks:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs={},
+                    response_obj={"usage": self.usage},
+                    start_time=0,
+                    end_time=0,
+                )
+        return super().final_answer(task)
+
+
+@pytest.fixture(autouse=True)
+def _workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def _traced_run(llm):
+    agent = Agent(
+        role="Analyst",
+        goal="Extract skills",
+        backstory="An analyst.",
+        llm=llm,
+        verbose=False,
+    )
+    task = Task(
+        name="skills_task",
+        description="List the skills.",
+        expected_output="Skills",
+        agent=agent,
+        output_pydantic=_Skills,
+    )
+    with RunTracer([task]) as tracer:
+        execute_single_task(task, {}, verbose=False)
+    return tracer.trace.tasks[0]
+
+
+def test_escalated_calls_are_priced_at_the_escalation_model():
+    table = RoutingTable(
+        default_policy="hybrid",
+        models={"mini": {"model": "gpt-4o-mini"}, "strong": {"model": "gpt-4o"}},
+        policies={
+            "hybrid": {
+                "default": {
+                    "model": "mini",
+                    "escalate_to": "strong",
+                    "require": ["skills"],
+                }
+            }
+        },
+    )
+    router = ModelRouter(
+        table,
+        llms={
+            # The mini model finds no skills, so its answer is escalated
+            "mini": _UsageLLM(1000, 100, model="gpt-4o-mini", list_items=0),
+            "strong": _UsageLLM(2000, 200, model="gpt-4o"),
+        },
+    )
+
+    trace = _traced_run(RoutedLLM("analyst", router))
+
+    assert trace.model == "gpt-4o-mini"
+    assert trace.escalated_calls == 1
+    assert trace.token_source == "usage"
+    assert (trace.prompt_tokens, trace.completion_tokens) == (3000, 300)
+    assert trace.cost_usd == pytest.approx(
+        estimate_cost("gpt-4o-mini", 1000, 100) + estimate_cost("gpt-4o", 2000, 200)
+    )
+
+
+def test_reported_usage_is_priced_at_the_answering_model():
+    trace = _traced_run(_UsageLLM(1000, 100, model="gpt-4o"))
+
+    assert trace.escalated_calls == 0
+    assert trace.cost_usd == pytest.approx(estimate_cost("gpt-4o", 1000, 100))